@@ -0,0 +1,51 @@
+"""Micro-benchmark of the per-call overhead of operator evaluation.
+
+For small problems, the cost of an operator call is dominated by Python
+overhead, in particular the checks ``x in op.domain`` and
+``out in op.range``. For a `DiscretizedSpace`, a full comparison includes
+the grid coordinate vectors. This example compares
+
+- a full space comparison, as done in each membership check before
+  comparisons were memoized, with the memoized check ``x in space``,
+- the evaluation of a composite operator through ``__call__`` with the
+  internal fast path ``_call_trusted``, which skips the argument checks.
+"""
+
+import numpy as np
+import odl
+from odl.set.space import _SPACE_EQ_CACHE
+from odl.util.testutils import timer
+
+n = 10 ** 5
+
+# Two equal, but distinct spaces, as created, e.g., by different operators
+space = odl.uniform_discr([0, 0], [1, 1], [16, 16])
+space_copy = odl.uniform_discr([0, 0], [1, 1], [16, 16])
+x = space_copy.element(np.random.rand(16, 16))
+
+print('Membership check `x in space`, {} calls:'.format(n))
+with timer('full comparison'):
+    for _ in range(n):
+        x.space == space
+with timer('memoized comparison'):
+    for _ in range(n):
+        x in space
+
+# Composite operator on small images
+grad = odl.Gradient(space)
+op = 2 * grad.adjoint * grad + odl.IdentityOperator(space)
+y = op.range.element()
+
+n = 10 ** 4
+print('Evaluation of `2 * grad.adjoint * grad + I`, {} calls:'.format(n))
+with timer('__call__, not memoized'):
+    for _ in range(n):
+        _SPACE_EQ_CACHE.clear()
+        op(x, out=y)
+with timer('__call__'):
+    for _ in range(n):
+        op(x, out=y)
+x_in_domain = space.element(x)
+with timer('_call_trusted'):
+    for _ in range(n):
+        op._call_trusted(x_in_domain, out=y)
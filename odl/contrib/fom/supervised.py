@@ -10,16 +10,19 @@
 
 from __future__ import division
 
+from functools import lru_cache
+
 import numpy as np
 
 import odl
 from odl.contrib.fom.util import spherical_sum
-from odl.discr.grid import sparse_meshgrid
 
 __all__ = ('mean_squared_error', 'mean_absolute_error',
            'mean_value_difference', 'standard_deviation_difference',
            'range_difference', 'blurring', 'false_structures_mask', 'ssim',
-           'psnr', 'haarpsi', 'noise_power_spectrum')
+           'psnr', 'haarpsi', 'noise_power_spectrum',
+           'mean_squared_error_batch', 'ssim_batch', 'psnr_batch',
+           'haarpsi_batch', 'noise_power_spectrum_batch', 'FOMAccumulator')
 
 
 def mean_squared_error(data, ground_truth, mask=None,
@@ -621,51 +624,12 @@ def ssim(data, ground_truth, size=11, sigma=1.5, K1=0.01, K2=0.03,
     *Image Quality Assessment: From Error Visibility to Structural Similarity*.
     IEEE Transactions on Image Processing, 13.4 (2004), pp 600--612.
     """
-    from scipy.signal import fftconvolve
-
     data = np.asarray(data)
     ground_truth = np.asarray(ground_truth)
-
-    # Compute gaussian on a `size`-sized grid in each axis
-    coords = np.linspace(-(size - 1) / 2, (size - 1) / 2, size)
-    grid = sparse_meshgrid(*([coords] * data.ndim))
-
-    window = np.exp(-(sum(xi ** 2 for xi in grid) / (2.0 * sigma ** 2)))
-    window /= np.sum(window)
-
-    def smoothen(img):
-        """Smoothes an image by convolving with a window function."""
-        return fftconvolve(window, img, mode='valid')
-
-    if dynamic_range is None:
-        dynamic_range = np.max(ground_truth) - np.min(ground_truth)
-
-    C1 = (K1 * dynamic_range) ** 2
-    C2 = (K2 * dynamic_range) ** 2
-    mu1 = smoothen(data)
-    mu2 = smoothen(ground_truth)
-
-    mu1_sq = mu1 * mu1
-    mu2_sq = mu2 * mu2
-    mu1_mu2 = mu1 * mu2
-
-    sigma1_sq = smoothen(data * data) - mu1_sq
-    sigma2_sq = smoothen(ground_truth * ground_truth) - mu2_sq
-    sigma12 = smoothen(data * ground_truth) - mu1_mu2
-
-    num = (2 * mu1_mu2 + C1) * (2 * sigma12 + C2)
-    denom = (mu1_sq + mu2_sq + C1) * (sigma1_sq + sigma2_sq + C2)
-    pointwise_ssim = num / denom
-
-    result = np.mean(pointwise_ssim)
-
-    if force_lower_is_better:
-        result = -result
-
-    if normalized:
-        result = (result + 1.0) / 2.0
-
-    return result
+    return ssim_batch(data[None], ground_truth[None], size=size, sigma=sigma,
+                      K1=K1, K2=K2, dynamic_range=dynamic_range,
+                      normalized=normalized,
+                      force_lower_is_better=force_lower_is_better)[0]
 
 
 def psnr(data, ground_truth, use_zscore=False, force_lower_is_better=False):
@@ -870,7 +834,13 @@ def noise_power_spectrum(data, ground_truth, radial=False,
         data = space.element(data)
 
     ft = odl.trafos.FourierTransform(space, halfcomplex=False)
-    nps = np.abs(ft(data - ground_truth)).real ** 2
+    return _noise_power_spectrum(ft, data - ground_truth, radial,
+                                 radial_binning_factor)
+
+
+def _noise_power_spectrum(ft, noise, radial, radial_binning_factor):
+    """Return the (radial) NPS of ``noise`` using the Fourier transform."""
+    nps = np.abs(ft(noise)).real ** 2
 
     if radial:
         return spherical_sum(nps, binning_factor=radial_binning_factor)
@@ -878,6 +848,499 @@ def noise_power_spectrum(data, ground_truth, radial=False,
         return nps
 
 
+# --- Batched and streaming evaluation --- #
+
+
+def _as_batches(data, ground_truth):
+    """Return ``data`` and ``ground_truth`` as stacks of equal shape."""
+    data = np.asarray(data)
+    ground_truth = np.asarray(ground_truth)
+    if data.shape != ground_truth.shape:
+        raise ValueError('`data` and `ground_truth` must have the same '
+                         'shape, got {} != {}'
+                         ''.format(data.shape, ground_truth.shape))
+    if data.ndim < 2:
+        raise ValueError('expected stacks of images with `ndim >= 2`, the '
+                         'first axis being the batch axis, got shape {}'
+                         ''.format(data.shape))
+    return data, ground_truth
+
+
+@lru_cache(maxsize=64)
+def _gaussian_window_ft(n, size, sigma):
+    """Return the FFT of the normalized 1D Gaussian window of length ``n``.
+
+    The window is zero-padded from ``size`` to ``n`` elements. The result
+    is cached and read-only.
+    """
+    coords = np.linspace(-(size - 1) / 2, (size - 1) / 2, size)
+    window = np.exp(-coords ** 2 / (2.0 * sigma ** 2))
+    window /= np.sum(window)
+    window_ft = np.fft.rfft(window, n=n)
+    window_ft.flags.writeable = False
+    return window_ft
+
+
+def _gaussian_smooth_valid(arr, axes, size, sigma):
+    """Convolve ``arr`` with a Gaussian window in ``axes``, valid part only.
+
+    The nD Gaussian window is the outer product of 1D windows, hence the
+    convolution is done axis by axis. Along an axis of length ``n``, a
+    circular convolution of length ``max(n, size)`` coincides with the
+    linear one from index ``min(n, size) - 1`` on, which is exactly the
+    ``'valid'`` part.
+    """
+    for axis in axes:
+        n = arr.shape[axis]
+        num = max(n, size)
+        window_ft = _gaussian_window_ft(num, size, float(sigma))
+        bcast_shape = [1] * arr.ndim
+        bcast_shape[axis] = -1
+
+        arr_ft = np.fft.rfft(arr, n=num, axis=axis)
+        arr_ft *= window_ft.reshape(bcast_shape)
+        arr = np.fft.irfft(arr_ft, n=num, axis=axis)
+
+        valid = [slice(None)] * arr.ndim
+        valid[axis] = slice(min(n, size) - 1, None)
+        arr = arr[tuple(valid)]
+
+    return arr
+
+
+def mean_squared_error_batch(data, ground_truth, mask=None,
+                             normalized=False, force_lower_is_better=True):
+    """Return the mean squared errors of a stack of images.
+
+    Parameters
+    ----------
+    data : `array-like`
+        Stack of input images, the first axis being the batch axis.
+    ground_truth : `array-like`
+        Stack of reference images, of the same shape as ``data``.
+    mask : `array-like`, optional
+        If given, ``data * mask`` is compared to ``ground_truth * mask``.
+        It must be broadcastable to the shape of ``data``, i.e., it can
+        be a single mask for all images.
+    normalized  : bool, optional
+        If ``True``, the output values are mapped to the interval
+        :math:`[0, 1]`, see `mean_squared_error`.
+    force_lower_is_better : bool, optional
+        Only present for compatibility to other figures of merit.
+
+    Returns
+    -------
+    mse : `numpy.ndarray`
+        FOM value for each image pair, where a lower value means a better
+        match.
+
+    See Also
+    --------
+    mean_squared_error : Unbatched variant, which takes the weighting
+        of the space into account.
+
+    Examples
+    --------
+    >>> data = np.zeros((2, 4))
+    >>> ground_truth = [[1, 1, 1, 1], [0, 0, 0, 2]]
+    >>> mean_squared_error_batch(data, ground_truth)
+    array([ 1.,  1.])
+    """
+    data, ground_truth = _as_batches(data, ground_truth)
+    if mask is not None:
+        data = data * mask
+        ground_truth = ground_truth * mask
+
+    axes = tuple(range(1, data.ndim))
+    fom = np.sum(np.abs(data - ground_truth) ** 2, axis=axes, dtype=float)
+
+    if normalized:
+        norm_data = np.sqrt(np.sum(np.abs(data) ** 2, axis=axes))
+        norm_truth = np.sqrt(np.sum(np.abs(ground_truth) ** 2, axis=axes))
+        fom /= (norm_data + norm_truth) ** 2
+    else:
+        fom /= np.prod(data.shape[1:])
+
+    # Ignore `force_lower_is_better` since that's already the case
+
+    return fom
+
+
+def ssim_batch(data, ground_truth, size=11, sigma=1.5, K1=0.01, K2=0.03,
+               dynamic_range=None, normalized=False,
+               force_lower_is_better=False):
+    """Structural SIMilarity of a stack of images.
+
+    Parameters
+    ----------
+    data : `array-like`
+        Stack of input images, the first axis being the batch axis.
+    ground_truth : `array-like`
+        Stack of reference images, of the same shape as ``data``.
+    size : odd int, optional
+        Size in elements per axis of the Gaussian window that is used
+        for all smoothing operations.
+    sigma : positive float, optional
+        Width of the Gaussian function used for smoothing.
+    K1, K2 : positive float, optional
+        Small constants to stabilize the result.
+    dynamic_range : nonnegative float or `array-like`, optional
+        Difference between the maximum and minimum value that the pixels
+        can attain, either for all images or per image. Default: `None`,
+        obtain maximum and minimum from each ground truth image.
+    normalized  : bool, optional
+        If ``True``, the output values are mapped to the interval
+        :math:`[0, 1]`.
+    force_lower_is_better : bool, optional
+        If ``True``, it is ensured that lower values correspond to better
+        matches.
+
+    Returns
+    -------
+    ssim : `numpy.ndarray`
+        FOM value for each image pair.
+
+    See Also
+    --------
+    ssim : Unbatched variant, and definition of the FOM.
+
+    Notes
+    -----
+    The Gaussian window is separable, hence the smoothing is done axis by
+    axis with 1D FFTs. The transforms of the 1D windows are cached per
+    axis length, and all five smoothed quantities of all images are
+    computed in a single pass. Memory usage is about 5 times the size of
+    the stack; for large datasets, feed the images in chunks through a
+    `FOMAccumulator`.
+
+    Examples
+    --------
+    >>> images = np.random.rand(3, 16, 16)
+    >>> ssim_batch(images, images)
+    array([ 1.,  1.,  1.])
+    """
+    data, ground_truth = _as_batches(data, ground_truth)
+    batch_size = data.shape[0]
+    bcast_shape = (batch_size,) + (1,) * (data.ndim - 1)
+
+    if dynamic_range is None:
+        dynamic_range = np.ptp(ground_truth.reshape(batch_size, -1), axis=1)
+    dynamic_range = np.broadcast_to(dynamic_range, (batch_size,))
+    C1 = ((K1 * dynamic_range) ** 2).reshape(bcast_shape)
+    C2 = ((K2 * dynamic_range) ** 2).reshape(bcast_shape)
+
+    moments = np.stack([data, ground_truth, data * data,
+                        ground_truth * ground_truth, data * ground_truth])
+    smooth_axes = range(2, moments.ndim)
+    mu1, mu2, mom11, mom22, mom12 = _gaussian_smooth_valid(
+        moments, smooth_axes, size, sigma)
+
+    mu1_sq = mu1 * mu1
+    mu2_sq = mu2 * mu2
+    mu1_mu2 = mu1 * mu2
+
+    sigma1_sq = mom11 - mu1_sq
+    sigma2_sq = mom22 - mu2_sq
+    sigma12 = mom12 - mu1_mu2
+
+    num = (2 * mu1_mu2 + C1) * (2 * sigma12 + C2)
+    denom = (mu1_sq + mu2_sq + C1) * (sigma1_sq + sigma2_sq + C2)
+    pointwise_ssim = num / denom
+
+    result = np.mean(pointwise_ssim.reshape(batch_size, -1), axis=1)
+
+    if force_lower_is_better:
+        result = -result
+
+    if normalized:
+        result = (result + 1.0) / 2.0
+
+    return result
+
+
+def psnr_batch(data, ground_truth, use_zscore=False,
+               force_lower_is_better=False):
+    """Return the Peak Signal-to-Noise Ratios of a stack of images.
+
+    Parameters
+    ----------
+    data : `array-like`
+        Stack of input images, the first axis being the batch axis.
+    ground_truth : `array-like`
+        Stack of reference images, of the same shape as ``data``.
+    use_zscore : bool
+        If ``True``, normalize each image in ``data`` and ``ground_truth``
+        to have zero mean and unit variance before comparison.
+    force_lower_is_better : bool
+        If ``True``, then lower value indicates better fit. In this case the
+        output is negated.
+
+    Returns
+    -------
+    psnr : `numpy.ndarray`
+        FOM value for each image pair, where a higher value means a better
+        match.
+
+    See Also
+    --------
+    psnr : Unbatched variant.
+
+    Examples
+    --------
+    >>> data = np.ones((2, 5))
+    >>> ground_truth = [[1, 1, 1, 1, 2], [1, 1, 1, 1, 1]]
+    >>> result = psnr_batch(data, ground_truth)
+    >>> print('{:.3f}'.format(result[0]))
+    13.010
+    >>> result[1]
+    inf
+    """
+    data, ground_truth = _as_batches(data, ground_truth)
+    batch_size = data.shape[0]
+
+    if use_zscore:
+        def zscore(arr):
+            """Apply `odl.util.zscore` to each image of a stack."""
+            arr = arr.reshape(batch_size, -1)
+            arr = arr - np.mean(arr, axis=1, keepdims=True)
+            std = np.std(arr, axis=1, keepdims=True)
+            return arr / np.where(std == 0, 1, std)
+
+        data = zscore(data)
+        ground_truth = zscore(ground_truth)
+
+    mse = mean_squared_error_batch(data, ground_truth)
+    max_true = np.max(np.abs(ground_truth.reshape(batch_size, -1)), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = 20 * np.log10(max_true) - 10 * np.log10(mse)
+    result = np.where(max_true == 0, -np.inf, result)
+    result = np.where(mse == 0, np.inf, result)
+
+    if force_lower_is_better:
+        return -result
+    else:
+        return result
+
+
+def haarpsi_batch(data, ground_truth, a=4.2, c=None):
+    """Haar-Wavelet based perceptual similarity index of a stack of images.
+
+    Parameters
+    ----------
+    data : `array-like`
+        Stack of 2D input images, the first axis being the batch axis.
+    ground_truth : `array-like`
+        Stack of 2D reference images, of the same shape as ``data``.
+    a : positive float, optional
+        Parameter in the logistic function, see `haarpsi`.
+    c : positive float, optional
+        Constant determining the score of maximally dissimilar values,
+        see `haarpsi`. For ``None``, it is chosen per image as
+        ``3 * sqrt(max(abs(ground_truth)))``.
+
+    Returns
+    -------
+    haarpsi : `numpy.ndarray`
+        The similarity score for each image pair, where a higher score
+        means a better match.
+
+    See Also
+    --------
+    haarpsi : Unbatched variant, and definition of the FOM.
+    """
+    data, ground_truth = _as_batches(data, ground_truth)
+    if data.ndim != 3:
+        raise ValueError('expected stacks of 2D images, got shape {}'
+                         ''.format(data.shape))
+
+    return np.array([haarpsi(img, true_img, a=a, c=c)
+                     for img, true_img in zip(data, ground_truth)])
+
+
+def noise_power_spectrum_batch(data, ground_truth, radial=False,
+                               radial_binning_factor=2.0):
+    """Return the Noise Power Spectra of a stack of images.
+
+    Parameters
+    ----------
+    data : sequence of `DiscretizedSpaceElement` or `array-like`
+        Stack of input images, the first axis being the batch axis.
+        If the images are not `DiscretizedSpaceElement`'s, a default
+        space with cell size 1 will be assumed.
+    ground_truth : `array-like`
+        Stack of reference images, of the same shape as ``data``.
+    radial : bool
+        If ``True``, compute the radial NPS.
+    radial_binning_factor : positive float, optional
+        Reduce the number of radial bins by this factor, see
+        `noise_power_spectrum`.
+
+    Returns
+    -------
+    noise_power_spectra : list of `DiscretizedSpace`-element
+        The NPS for each image pair.
+
+    See Also
+    --------
+    noise_power_spectrum : Unbatched variant.
+
+    Notes
+    -----
+    The Fourier transform is created only once and then applied to all
+    image pairs.
+    """
+    space = getattr(data[0], 'space', None)
+    if not isinstance(space, odl.DiscretizedSpace):
+        data = np.asarray(data)
+        space = odl.uniform_discr(
+            [0] * (data.ndim - 1), data.shape[1:], data.shape[1:], data.dtype
+        )
+
+    if len(data) != len(ground_truth):
+        raise ValueError('`data` and `ground_truth` must have the same '
+                         'length, got {} != {}'
+                         ''.format(len(data), len(ground_truth)))
+
+    ft = odl.trafos.FourierTransform(space, halfcomplex=False)
+    return [_noise_power_spectrum(ft, space.element(img) - true_img, radial,
+                                  radial_binning_factor)
+            for img, true_img in zip(data, ground_truth)]
+
+
+class FOMAccumulator(object):
+
+    """Streaming statistics of a figure of merit over a dataset.
+
+    The FOM values of the image pairs passed to `update` are not stored.
+    Instead, count, mean, variance, minimum and maximum are updated with
+    the numerically stable parallel variant of Welford's algorithm, see
+    [CGL1983]. Hence, arbitrarily large datasets can be evaluated in
+    chunks of any size.
+
+    References
+    ----------
+    [CGL1983] Chan, T F, Golub, G H, and LeVeque, R J. *Algorithms for
+    computing the sample variance: analysis and recommendations*.
+    The American Statistician, 37.3 (1983), pp 242--247.
+    """
+
+    def __init__(self, fom, **kwargs):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        fom : callable
+            Figure of merit, called as ``fom(data, ground_truth, **kwargs)``.
+            It can either be a batched variant like `ssim_batch`, returning
+            one value per image pair in a stack, or an unbatched variant
+            like `ssim`, returning a single value.
+        kwargs :
+            Further keyword arguments passed to ``fom``.
+
+        Examples
+        --------
+        >>> acc = FOMAccumulator(psnr_batch)
+        >>> for i in range(3):
+        ...     data = np.full((2, 4), i + 1)
+        ...     ground_truth = np.full((2, 4), 2 * (i + 1))
+        ...     values = acc.update(data, ground_truth)
+        >>> acc.count
+        6
+        >>> print('{:.3f}'.format(acc.mean))
+        6.021
+        >>> print('{:.3f}'.format(acc.std))
+        0.000
+        """
+        if not callable(fom):
+            raise TypeError('`fom` {!r} is not callable'.format(fom))
+        self.__fom = fom
+        self.__kwargs = kwargs
+        self.reset()
+
+    @property
+    def fom(self):
+        """The figure of merit that is evaluated."""
+        return self.__fom
+
+    @property
+    def count(self):
+        """Number of FOM values accumulated so far."""
+        return self.__count
+
+    @property
+    def mean(self):
+        """Mean of the FOM values, ``nan`` if none were accumulated."""
+        return self.__mean if self.__count > 0 else float('nan')
+
+    @property
+    def variance(self):
+        """Population variance of the FOM values."""
+        return self.__m2 / self.__count if self.__count > 0 else float('nan')
+
+    @property
+    def std(self):
+        """Population standard deviation of the FOM values."""
+        return np.sqrt(self.variance)
+
+    @property
+    def min(self):
+        """Minimum of the FOM values."""
+        return self.__min if self.__count > 0 else float('nan')
+
+    @property
+    def max(self):
+        """Maximum of the FOM values."""
+        return self.__max if self.__count > 0 else float('nan')
+
+    def reset(self):
+        """Discard all accumulated values."""
+        self.__count = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__min = float('inf')
+        self.__max = -float('inf')
+
+    def update(self, data, ground_truth):
+        """Evaluate the FOM and accumulate the values.
+
+        Parameters
+        ----------
+        data, ground_truth :
+            Arguments passed to the FOM, either single images or stacks
+            of images, depending on the FOM.
+
+        Returns
+        -------
+        values : `numpy.ndarray`
+            The FOM values of this update as a 1D array.
+        """
+        values = self.fom(data, ground_truth, **self.__kwargs)
+        values = np.atleast_1d(np.asarray(values, dtype=float)).ravel()
+        num_new = values.size
+        if num_new == 0:
+            return values
+
+        mean_new = np.mean(values)
+        m2_new = np.sum((values - mean_new) ** 2)
+        total = self.__count + num_new
+        delta = mean_new - self.__mean
+
+        self.__m2 += m2_new + delta ** 2 * self.__count * num_new / total
+        self.__mean += delta * num_new / total
+        self.__count = total
+        self.__min = min(self.__min, float(np.min(values)))
+        self.__max = max(self.__max, float(np.max(values)))
+        return values
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        inner_parts = [getattr(self.fom, '__name__', repr(self.fom))]
+        inner_parts += ['{}={!r}'.format(key, val)
+                        for key, val in sorted(self.__kwargs.items())]
+        return '{}({})'.format(self.__class__.__name__, ', '.join(inner_parts))
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -256,5 +256,107 @@ def test_range_difference(space):
     assert eval0 == pytest.approx(eval1, abs=1e-5)
 
 
+def test_ssim_batch():
+    """Test the batched SSIM against a direct nD window convolution."""
+    images = np.random.rand(3, 20, 17)
+    noisy = images + 0.1 * np.random.rand(3, 20, 17)
+
+    # Reference implementation with the full 2D window
+    size, sigma = 7, 1.2
+    coords = np.linspace(-(size - 1) / 2, (size - 1) / 2, size)
+    window = np.exp(-(coords[:, None] ** 2 + coords[None, :] ** 2)
+                    / (2.0 * sigma ** 2))
+    window /= np.sum(window)
+
+    def smoothen(img):
+        return scipy.signal.convolve(window, img, mode='valid')
+
+    expected = []
+    for data, ground_truth in zip(noisy, images):
+        dyn_range = np.max(ground_truth) - np.min(ground_truth)
+        C1 = (0.01 * dyn_range) ** 2
+        C2 = (0.03 * dyn_range) ** 2
+        mu1 = smoothen(data)
+        mu2 = smoothen(ground_truth)
+        sigma1_sq = smoothen(data * data) - mu1 * mu1
+        sigma2_sq = smoothen(ground_truth * ground_truth) - mu2 * mu2
+        sigma12 = smoothen(data * ground_truth) - mu1 * mu2
+        num = (2 * mu1 * mu2 + C1) * (2 * sigma12 + C2)
+        denom = (mu1 ** 2 + mu2 ** 2 + C1) * (sigma1_sq + sigma2_sq + C2)
+        expected.append(np.mean(num / denom))
+
+    result = fom.ssim_batch(noisy, images, size=size, sigma=sigma)
+    assert result.shape == (3,)
+    assert np.allclose(result, expected)
+
+    # Unbatched variant gives the same values
+    for i in range(3):
+        assert fom.ssim(noisy[i], images[i], size=size, sigma=sigma) == (
+            pytest.approx(expected[i]))
+
+    # Window larger than the image
+    assert fom.ssim_batch(images[:, :5, :5], images[:, :5, :5]) == (
+        pytest.approx(1))
+
+
+def test_psnr_batch():
+    """Test the batched PSNR against the unbatched variant."""
+    images = np.random.rand(4, 8, 8)
+    noisy = images + 0.1 * np.random.rand(4, 8, 8)
+
+    for use_zscore in [False, True]:
+        result = fom.psnr_batch(noisy, images, use_zscore=use_zscore)
+        expected = [fom.psnr(data, ground_truth, use_zscore=use_zscore)
+                    for data, ground_truth in zip(noisy, images)]
+        assert np.allclose(result, expected)
+
+    # Corner cases per image
+    zero = np.zeros((8, 8))
+    result = fom.psnr_batch([images[0], zero, noisy[0]],
+                            [images[0], zero, zero])
+    assert np.array_equal(result, [np.inf, np.inf, -np.inf])
+
+
+def test_mean_squared_error_batch():
+    """Test the batched MSE against the unbatched variant."""
+    images = np.random.rand(4, 6, 5)
+    noisy = images + np.random.rand(4, 6, 5)
+
+    for normalized in [False, True]:
+        result = fom.mean_squared_error_batch(noisy, images,
+                                              normalized=normalized)
+        expected = [fom.mean_squared_error(data, ground_truth,
+                                           normalized=normalized)
+                    for data, ground_truth in zip(noisy, images)]
+        assert np.allclose(result, expected)
+
+
+def test_fom_accumulator():
+    """Test that streaming statistics match the statistics of all values."""
+    images = np.random.rand(10, 16, 16)
+    noisy = images + 0.2 * np.random.rand(10, 16, 16)
+    values = fom.ssim_batch(noisy, images, size=5)
+
+    acc = fom.FOMAccumulator(fom.ssim_batch, size=5)
+    for chunk in [slice(0, 3), slice(3, 4), slice(4, 10)]:
+        acc.update(noisy[chunk], images[chunk])
+
+    assert acc.count == 10
+    assert acc.mean == pytest.approx(np.mean(values))
+    assert acc.std == pytest.approx(np.std(values))
+    assert acc.min == pytest.approx(np.min(values))
+    assert acc.max == pytest.approx(np.max(values))
+
+    # Unbatched FOMs are accumulated one value at a time
+    acc_single = fom.FOMAccumulator(fom.ssim, size=5)
+    for data, ground_truth in zip(noisy, images):
+        acc_single.update(data, ground_truth)
+    assert acc_single.mean == pytest.approx(acc.mean)
+
+    acc.reset()
+    assert acc.count == 0
+    assert np.isnan(acc.mean)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -11,6 +11,8 @@
 from __future__ import print_function, division
 import numpy as np
 import odl
+from odl.solvers.util import (
+    load_solver_state, restore_solver_state, save_solver_state)
 
 __all__ = ('pdhg', 'spdhg', 'pa_spdhg', 'spdhg_generic', 'da_spdhg',
            'spdhg_pesquet')
@@ -291,6 +293,19 @@ def spdhg_generic(x, f, g, A, tau, sigma, niter, **kwargs):
         i \in {1,...,n} with probability 1/n.
     callback : callable, optional
         Function called with the current iterate after each iteration.
+    checkpoint : str, optional
+        File to which the complete iteration state, i.e., the variables
+        x, y, z, z_relax, the step sizes, theta and the state of the global
+        NumPy random number generator, is written every checkpoint_step
+        iterations.
+    checkpoint_step : int, optional
+        Number of iterations between two checkpoints. By default 1.
+    resume_from : str, optional
+        Checkpoint file from which the iteration state is restored. The
+        iteration then continues exactly as the run that wrote the
+        checkpoint, provided that fun_select only uses the global NumPy
+        random number generator. In this case, niter counts all
+        iterations, including those before the checkpoint.
 
     References
     ----------
@@ -343,18 +358,33 @@ def spdhg_generic(x, f, g, A, tau, sigma, niter, **kwargs):
         def fun_select(x):
             return [int(np.random.choice(len(A), 1, p=1 / len(A)))]
 
+    # Checkpointing
+    checkpoint = kwargs.pop('checkpoint', None)
+    checkpoint_step = int(kwargs.pop('checkpoint_step', 1))
+    resume_from = kwargs.pop('resume_from', None)
+
     # Initialize variables
     z_relax = z.copy()
     dz = A.domain.element()
     y_old = A.range.element()
 
+    start = 0
+    if resume_from is not None:
+        state = load_solver_state(resume_from)
+        start = state['iteration']
+        tau, sigma, theta = state['tau'], state['sigma'], state['theta']
+        for var, name in [(x, 'x'), (y, 'y'), (z, 'z'),
+                          (z_relax, 'z_relax')]:
+            restore_solver_state(var, state[name])
+        np.random.set_state(tuple(state['rng']))
+
     # Save proximal operators
     proximal_dual_sigma = [fi.convex_conj.proximal(si)
                            for fi, si in zip(f, sigma)]
     proximal_primal_tau = g.proximal(tau)
 
     # run the iterations
-    for k in range(niter):
+    for k in range(start, niter):
 
         # select block
         selected = fun_select(k)
@@ -406,6 +436,12 @@ def spdhg_generic(x, f, g, A, tau, sigma, niter, **kwargs):
         if callback is not None:
             callback([x, y])
 
+        if checkpoint is not None and (k + 1) % checkpoint_step == 0:
+            save_solver_state(checkpoint, {
+                'iteration': k + 1, 'x': x, 'y': y, 'z': z,
+                'z_relax': z_relax, 'tau': tau, 'sigma': sigma,
+                'theta': theta, 'rng': np.random.get_state()})
+
 
 def da_spdhg(x, f, g, A, tau, sigma_tilde, niter, mu, **kwargs):
     r"""Computes a saddle point with a PDHG and dual acceleration.
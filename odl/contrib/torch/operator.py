@@ -22,6 +22,7 @@ import torch
 from packaging.version import parse as parse_version
 
 from odl import Operator
+from odl.util.npy_compat import AVOID_UNNECESSARY_COPY
 
 if parse_version(torch.__version__) < parse_version('0.4'):
     warnings.warn("This interface is designed to work with Pytorch >= 0.4",
@@ -230,17 +231,16 @@ class OperatorFunction(torch.autograd.Function):
         ctx.op_in_dtype = operator.domain.dtype
         ctx.op_out_dtype = op_out_dtype
 
-        # Evaluate the operator on all inputs in a loop
+        # Evaluate the operator on all inputs at once
         if extra_shape:
-            # Multiple inputs: flatten extra axes, then do one entry at a time
+            # Multiple inputs: flatten extra axes and evaluate as a batch
             input_arr_flat_extra = input_arr.reshape((-1,) + op_in_shape)
-            results = []
-            for inp in input_arr_flat_extra:
-                results.append(operator(inp))
+            result_arr = operator.batch_call(input_arr_flat_extra)
 
-            # Stack results, reshape to the expected output shape and enforce
-            # correct dtype
-            result_arr = np.stack(results).astype(op_out_dtype, copy=AVOID_UNNECESSARY_COPY)
+            # Reshape to the expected output shape and enforce correct dtype
+            result_arr = result_arr.astype(
+                op_out_dtype, copy=AVOID_UNNECESSARY_COPY
+            )
             result_arr = result_arr.reshape(extra_shape + op_out_shape)
         else:
             # Single input: evaluate directly
@@ -346,31 +346,42 @@ class OperatorFunction(torch.autograd.Function):
                 ''.format(extra_shape + op_out_shape, grad_output_arr.shape)
             )
 
-        # Evaluate the (derivative) adjoint on all inputs in a loop
+        # Evaluate the (derivative) adjoint on all inputs
         if extra_shape:
-            # Multiple gradients: flatten extra axes, then do one entry
-            # at a time
+            # Multiple gradients: flatten extra axes
             grad_output_arr_flat_extra = grad_output_arr.reshape(
                 (-1,) + op_out_shape
             )
 
-            results = []
-            if operator.is_linear:
-                for ograd in grad_output_arr_flat_extra:
-                    results.append(np.asarray(operator.adjoint(ograd)))
+            if (operator.is_linear and
+                    hasattr(operator.adjoint.domain, 'shape')):
+                # The same adjoint for all gradients, evaluate as a batch
+                result_arr = operator.adjoint.batch_call(
+                    grad_output_arr_flat_extra
+                )
             else:
-                # Need inputs, flattened in the same way as the gradients
-                input_arr_flat_extra = input_arr.reshape((-1,) + op_in_shape)
-                for ograd, inp in zip(
-                    grad_output_arr_flat_extra, input_arr_flat_extra
-                ):
-                    results.append(
-                        np.asarray(operator.derivative(inp).adjoint(ograd))
+                # Do one entry at a time
+                results = []
+                if operator.is_linear:
+                    for ograd in grad_output_arr_flat_extra:
+                        results.append(np.asarray(operator.adjoint(ograd)))
+                else:
+                    # Need inputs, flattened in the same way as the gradients
+                    input_arr_flat_extra = input_arr.reshape(
+                        (-1,) + op_in_shape
                     )
-
-            # Stack results, reshape to the expected output shape and enforce
-            # correct dtype
-            result_arr = np.stack(results).astype(op_in_dtype, copy=AVOID_UNNECESSARY_COPY)
+                    for ograd, inp in zip(
+                        grad_output_arr_flat_extra, input_arr_flat_extra
+                    ):
+                        results.append(
+                            np.asarray(operator.derivative(inp).adjoint(ograd))
+                        )
+                result_arr = np.stack(results)
+
+            # Reshape to the expected output shape and enforce correct dtype
+            result_arr = result_arr.astype(
+                op_in_dtype, copy=AVOID_UNNECESSARY_COPY
+            )
             result_arr = result_arr.reshape(extra_shape + op_in_shape)
         else:
             # Single gradient: evaluate directly
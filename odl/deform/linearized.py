@@ -14,16 +14,85 @@ import numpy as np
 
 from odl.discr import DiscretizedSpace, Divergence, Gradient
 from odl.discr.discr_space import DiscretizedSpaceElement
-from odl.discr.discr_utils import _normalize_interp, per_axis_interpolator
+from odl.discr.discr_utils import (
+    _apply_interp_tables, _compact_interp_tables, _interp_tables,
+    _normalize_interp)
 from odl.operator import Operator, PointwiseInner
 from odl.space import ProductSpace
 from odl.space.pspace import ProductSpaceElement
-from odl.util import indent, signature_string
+from odl.util import (
+    indent, is_floating_dtype, real_dtype, signature_string, writable_array)
+from odl.util.parallel import parallel_map
 
 __all__ = ('LinDeformFixedTempl', 'LinDeformFixedDisp', 'linear_deform')
 
 
-def linear_deform(template, displacement, interp='linear', out=None):
+# Approximate number of grid points deformed in one block
+_BLOCK_SIZE = 2 ** 18
+
+
+def _deform_blocks(shape):
+    """Return slices along the first axis covering about `_BLOCK_SIZE`."""
+    row_size = int(np.prod(shape[1:]))
+    step = max(1, _BLOCK_SIZE // max(row_size, 1))
+    return [slice(i, min(i + step, shape[0]))
+            for i in range(0, shape[0], step)]
+
+
+def _deform_tables(grid, disp_arrs, interp, rows):
+    """Return interpolation indices and weights for a block of points.
+
+    The deformed points ``x + v(x)`` for the grid points ``x`` in the
+    slice ``rows`` along the first axis are computed from the coordinate
+    vectors and the displacement, such that no array larger than the
+    block is allocated.
+
+    Parameters
+    ----------
+    grid : `RectGrid`
+        Grid of the template.
+    disp_arrs : sequence of `numpy.ndarray`
+        Components of the displacement field, one per axis.
+    interp : sequence of str
+        Interpolation scheme per axis.
+    rows : slice
+        Block of the grid along the first axis.
+
+    Returns
+    -------
+    tables : list of tuple
+        Indices and weights for the points in the block, see
+        `odl.discr.discr_utils.InterpolationPlan`.
+    """
+    ndim = grid.ndim
+    indices = []
+    norm_distances = []
+    for i, (cvec, vi) in enumerate(zip(grid.coord_vectors, disp_arrs)):
+        bcast_shape = [1] * ndim
+        bcast_shape[i] = -1
+        ci = cvec[rows] if i == 0 else cvec
+        xi = np.add(vi[rows], ci.reshape(bcast_shape), dtype=float)
+
+        if grid.is_uniform_byaxis[i] and cvec.size >= 2:
+            # Direct index computation, avoiding the binary search
+            xi -= cvec[0]
+            xi /= cvec[1] - cvec[0]
+            idcs = np.floor(xi).astype(int)
+            np.clip(idcs, 0, cvec.size - 2, out=idcs)
+            xi -= idcs
+            norm_distances.append(xi)
+        else:
+            idcs = np.searchsorted(cvec, xi) - 1
+            np.clip(idcs, 0, cvec.size - 2, out=idcs)
+            norm_distances.append((xi - cvec[idcs]) /
+                                  (cvec[idcs + 1] - cvec[idcs]))
+        indices.append(idcs)
+
+    return _interp_tables(grid.shape, indices, norm_distances, interp)
+
+
+def linear_deform(template, displacement, interp='linear', out=None,
+                  num_threads=None):
     """Linearized deformation of a template with a displacement field.
 
     The function maps a given template ``I`` and a given displacement
@@ -47,6 +116,9 @@ def linear_deform(template, displacement, interp='linear', out=None):
         Array to which the function values of the deformed template
         are written. It must have the same shape as ``template`` and
         a data type compatible with ``template.dtype``.
+    num_threads : positive int, optional
+        Number of threads among which the blocks of the grid are
+        distributed. For ``None``, the blocks are processed serially.
 
     Returns
     -------
@@ -76,15 +148,39 @@ def linear_deform(template, displacement, interp='linear', out=None):
     >>> displacement_field = disp_field_space.element([[0, 0, 0, -0.1, 0]])
     >>> linear_deform(template, displacement_field, interp='linear')
     array([ 0. ,  0. ,  1. ,  0.5,  0. ])
+
+    Notes
+    -----
+    The deformed points ``x + v(x)`` are never stored for the whole grid.
+    Instead, the grid is processed in blocks along the first axis, and
+    interpolation indices and weights are computed per block directly
+    from the coordinate vectors of the grid and the displacement.
     """
-    points = template.space.points()
-    for i, vi in enumerate(displacement):
-        points[:, i] += vi.asarray().ravel()
-    templ_interpolator = per_axis_interpolator(
-        template, coord_vecs=template.space.grid.coord_vectors, interp=interp
-    )
-    values = templ_interpolator(points.T, out=out)
-    return values.reshape(template.space.shape)
+    space = template.space
+    interp = _normalize_interp(interp, space.ndim)
+    disp_arrs = [np.asarray(vi) for vi in displacement]
+    blocks = _deform_blocks(space.shape)
+
+    def tables(i):
+        return _deform_tables(space.grid, disp_arrs, interp, blocks[i])
+
+    return _linear_deform_blocks(template, blocks, tables, out, num_threads)
+
+
+def _linear_deform_blocks(template, blocks, tables, out, num_threads):
+    """Deform ``template`` block by block using ``tables(i)``."""
+    space = template.space
+    flat_values = np.asarray(template).ravel()
+    if out is None:
+        out = np.empty(space.shape, dtype=flat_values.dtype)
+
+    with writable_array(out) as out_arr:
+        def deform_block(i):
+            _apply_interp_tables(flat_values, tables(i), out_arr[blocks[i]])
+
+        parallel_map(deform_block, range(len(blocks)), num_threads)
+
+    return out
 
 
 class LinDeformFixedTempl(Operator):
@@ -130,7 +226,8 @@ class LinDeformFixedTempl(Operator):
     i.e., :math:`W_I'(v)^*(J)(x) = J(x) \, \nabla I(x + v(x))`.
     """
 
-    def __init__(self, template, domain=None, interp='linear'):
+    def __init__(self, template, domain=None, interp='linear',
+                 num_threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -161,6 +258,10 @@ class LinDeformFixedTempl(Operator):
                 is to be used, a differentiable interpolation scheme (e.g.,
                 ``'linear'``) should be chosen.
 
+        num_threads : positive int, optional
+            Number of threads used for the deformation, see
+            `linear_deform`.
+
         Examples
         --------
         Create a simple 1D template to initialize the operator and
@@ -216,6 +317,7 @@ class LinDeformFixedTempl(Operator):
             domain=domain, range=template.space, linear=False)
 
         self.__interp_byaxis = _normalize_interp(interp, template.space.ndim)
+        self.__num_threads = num_threads
 
     @property
     def template(self):
@@ -238,9 +340,15 @@ class LinDeformFixedTempl(Operator):
         else:
             return self.interp_byaxis
 
+    @property
+    def num_threads(self):
+        """Number of threads used for the deformation."""
+        return self.__num_threads
+
     def _call(self, displacement, out=None):
         """Implementation of ``self(displacement[, out])``."""
-        return linear_deform(self.template, displacement, self.interp, out)
+        return linear_deform(self.template, displacement, self.interp, out,
+                             num_threads=self.num_threads)
 
     def derivative(self, displacement):
         """Derivative of the operator at ``displacement``.
@@ -268,7 +376,9 @@ class LinDeformFixedTempl(Operator):
                         pad_mode='symmetric')
         grad_templ = grad(self.template)
         def_grad = self.domain.element(
-            [linear_deform(gf, displacement, self.interp) for gf in grad_templ]
+            [linear_deform(gf, displacement, self.interp,
+                           num_threads=self.num_threads)
+             for gf in grad_templ]
         )
 
         return PointwiseInner(self.domain, def_grad)
@@ -279,6 +389,7 @@ class LinDeformFixedTempl(Operator):
         optargs = [
             ('domain', self.domain, self.template.space.tangent_bundle),
             ('interp', self.interp, 'linear'),
+            ('num_threads', self.num_threads, None),
         ]
         inner_str = signature_string(posargs, optargs, mod='!r', sep=',\n')
         return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
@@ -317,7 +428,8 @@ class LinDeformFixedDisp(Operator):
     i.e., :math:`W_v^*(I)(x) \approx \exp(-\mathrm{div}\,v(x))\, I(x - v(x))`.
     """
 
-    def __init__(self, displacement, templ_space=None, interp='linear'):
+    def __init__(self, displacement, templ_space=None, interp='linear',
+                 precompute=False, num_threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -341,6 +453,15 @@ class LinDeformFixedDisp(Operator):
 
             Supported values: ``'nearest'``, ``'linear'``
 
+        precompute : bool, optional
+            If ``True``, compute the interpolation indices and weights for
+            the fixed displacement once and reuse them in each call.
+            This makes evaluation considerably faster, at the cost of
+            storing ``4 * ndim`` arrays of the size of the template.
+        num_threads : positive int, optional
+            Number of threads used for the deformation, see
+            `linear_deform`.
+
         Examples
         --------
         Create a simple 1D template to initialize the operator and
@@ -402,6 +523,23 @@ class LinDeformFixedDisp(Operator):
             domain=templ_space, range=templ_space, linear=True)
 
         self.__interp_byaxis = _normalize_interp(interp, templ_space.ndim)
+        self.__num_threads = num_threads
+
+        if precompute:
+            disp_arrs = [np.asarray(vi) for vi in displacement]
+            self.__blocks = _deform_blocks(templ_space.shape)
+            if is_floating_dtype(templ_space.dtype):
+                weight_dtype = real_dtype(templ_space.dtype)
+            else:
+                weight_dtype = float
+            self.__tables = [
+                _compact_interp_tables(
+                    _deform_tables(templ_space.grid, disp_arrs,
+                                   self.interp_byaxis, rows),
+                    templ_space.size, weight_dtype)
+                for rows in self.__blocks]
+        else:
+            self.__blocks = self.__tables = None
 
     @property
     def interp_byaxis(self):
@@ -424,9 +562,25 @@ class LinDeformFixedDisp(Operator):
         """Fixed displacement field of this deformation operator."""
         return self.__displacement
 
+    @property
+    def precompute(self):
+        """``True`` if interpolation indices and weights are precomputed."""
+        return self.__tables is not None
+
+    @property
+    def num_threads(self):
+        """Number of threads used for the deformation."""
+        return self.__num_threads
+
     def _call(self, template, out=None):
         """Implementation of ``self(template[, out])``."""
-        return linear_deform(template, self.displacement, self.interp, out)
+        if self.precompute:
+            return _linear_deform_blocks(
+                template, self.__blocks, self.__tables.__getitem__, out,
+                self.num_threads)
+        else:
+            return linear_deform(template, self.displacement, self.interp,
+                                 out, num_threads=self.num_threads)
 
     @property
     def inverse(self):
@@ -436,7 +590,8 @@ class LinDeformFixedDisp(Operator):
         valid for small displacements.
         """
         return LinDeformFixedDisp(
-            -self.displacement, templ_space=self.domain, interp=self.interp
+            -self.displacement, templ_space=self.domain, interp=self.interp,
+            precompute=self.precompute, num_threads=self.num_threads
         )
 
     @property
@@ -459,6 +614,8 @@ class LinDeformFixedDisp(Operator):
         optargs = [
             ('templ_space', self.domain, self.displacement.space[0]),
             ('interp', self.interp, 'linear'),
+            ('precompute', self.precompute, False),
+            ('num_threads', self.num_threads, None),
         ]
         inner_str = signature_string(posargs, optargs, mod='!r', sep=',\n')
         return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
@@ -202,6 +202,9 @@ class Gradient(PointwiseTensorFieldOperator):
     resulting product space element. For the adjoint of the `Gradient`
     operator, zero padding is assumed to match the negative `Divergence`
     operator
+
+    For NumPy-based spaces, all components are computed slab by slab
+    along the first axis, using ``domain.tspace.num_threads`` threads.
     """
 
     def __init__(self, domain=None, range=None, method='forward',
@@ -351,6 +354,14 @@ class Gradient(PointwiseTensorFieldOperator):
         ndim = self.domain.ndim
         dx = self.domain.cell_sides
 
+        if self.domain.impl == self.range[0].impl == 'numpy':
+            # All components slab by slab, directly into the parts of `out`
+            _gradient_stencil(x_arr, _field_arrays(out), dx,
+                              num_threads=_stencil_num_threads(self.domain),
+                              method=self.method, pad_mode=self.pad_mode,
+                              pad_const=self.pad_const)
+            return out
+
         for axis in range(ndim):
             with writable_array(out[axis]) as out_arr:
                 finite_diff(x_arr, axis=axis, dx=dx[axis], method=self.method,
@@ -359,6 +370,15 @@ class Gradient(PointwiseTensorFieldOperator):
                             out=out_arr)
         return out
 
+    def _batch_call(self, x, out, **kwargs):
+        """Calculate the spatial gradients of all ``x[i]`` at once."""
+        dx = self.domain.cell_sides
+        for axis in range(self.domain.ndim):
+            # Axis 0 is the batch axis, axis 1 of ``out`` the component axis
+            finite_diff(x, axis=axis + 1, dx=dx[axis], method=self.method,
+                        pad_mode=self.pad_mode, pad_const=self.pad_const,
+                        out=out[:, axis])
+
     def derivative(self, point=None):
         """Return the derivative operator.
 
@@ -425,6 +445,10 @@ class Divergence(PointwiseTensorFieldOperator):
     Calls helper function `finite_diff` for each component of the input
     product space vector. For the adjoint of the `Divergence` operator to
     match the negative `Gradient` operator implicit zero is assumed.
+
+    For NumPy-based spaces, the components are differentiated and summed
+    slab by slab along the first axis, using ``range.tspace.num_threads``
+    threads.
     """
 
     def __init__(self, domain=None, range=None, method='forward',
@@ -560,6 +584,16 @@ class Divergence(PointwiseTensorFieldOperator):
         ndim = self.range.ndim
         dx = self.range.cell_sides
 
+        if self.range.impl == self.domain[0].impl == 'numpy':
+            # Sum of all components slab by slab, without full temporaries
+            with writable_array(out) as out_arr:
+                _divergence_stencil(
+                    _field_arrays(x), out_arr, dx,
+                    num_threads=_stencil_num_threads(self.range),
+                    method=self.method, pad_mode=self.pad_mode,
+                    pad_const=self.pad_const)
+            return out
+
         tmp = np.empty(out.shape, out.dtype, order=out.space.default_order)
         with writable_array(out) as out_arr:
             for axis in range(ndim):
@@ -574,6 +608,19 @@ class Divergence(PointwiseTensorFieldOperator):
 
         return out
 
+    def _batch_call(self, x, out, **kwargs):
+        """Calculate the divergences of all ``x[i]`` at once."""
+        dx = self.range.cell_sides
+        tmp = np.empty_like(out)
+        for axis in range(self.range.ndim):
+            # Axis 0 is the batch axis, axis 1 of ``x`` the component axis
+            finite_diff(x[:, axis], axis=axis + 1, dx=dx[axis],
+                        method=self.method, pad_mode=self.pad_mode,
+                        pad_const=self.pad_const,
+                        out=out if axis == 0 else tmp)
+            if axis > 0:
+                out += tmp
+
     def derivative(self, point=None):
         """Return the derivative operator.
 
@@ -635,6 +682,10 @@ class Laplacian(PointwiseTensorFieldOperator):
     resulting product space vector.
 
     Outside the domain zero padding is assumed.
+
+    For NumPy-based spaces, the second differences are computed and summed
+    slab by slab along the first axis, using ``domain.tspace.num_threads``
+    threads.
     """
 
     def __init__(self, domain, range=None, pad_mode='constant', pad_const=0):
@@ -709,18 +760,27 @@ class Laplacian(PointwiseTensorFieldOperator):
 
     def _call(self, x, out=None):
         """Calculate the spatial Laplacian of ``x``."""
+        ndim = self.domain.ndim
+        dx = self.domain.cell_sides
+
+        if self.domain.impl == self.range.impl == 'numpy':
+            if out is None:
+                out = self.range.element()
+            with writable_array(out) as out_arr:
+                _laplacian_stencil(
+                    x.asarray(), out_arr, dx,
+                    num_threads=_stencil_num_threads(self.domain),
+                    pad_mode=self.pad_mode, pad_const=self.pad_const)
+            return out
+
         if out is None:
             out = self.range.zero()
         else:
             out.set_zero()
 
         x_arr = x.asarray()
-        out_arr = out.asarray()
         tmp = np.empty(out.shape, out.dtype, order=out.space.default_order)
 
-        ndim = self.domain.ndim
-        dx = self.domain.cell_sides
-
         with writable_array(out) as out_arr:
             for axis in range(ndim):
                 # TODO: this can be optimized
@@ -947,6 +1007,40 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None,
         np.subtract(f_arr[1:-1], f_arr[:-2], out=out[1:-1])
 
     # Boundaries
+    first, last, incs = _diff_boundary(f_arr, method, pad_mode, pad_const)
+    out[0] = first
+    out[-1] = last
+    for i, inc in incs:
+        out[i] += inc
+
+    # divide by step size
+    out /= dx
+
+    return out_in
+
+
+def _diff_boundary(f_arr, method, pad_mode, pad_const):
+    """Return the boundary values of `finite_diff` along axis 0.
+
+    Parameters
+    ----------
+    f_arr : `numpy.ndarray`
+        Array whose axis 0 is the axis of differentiation.
+    method, pad_mode :
+        Same as in `finite_diff`.
+    pad_const : scalar
+        Padding constant of the same dtype as ``f_arr``.
+
+    Returns
+    -------
+    first, last : `numpy.ndarray` or float
+        Differences at the first and the last index, not divided by the
+        step size.
+    incs : list of tuple
+        Pairs ``(index, value)`` of increments that the adjoint pad modes
+        add to the result after ``first`` and ``last`` have been set.
+    """
+    incs = []
     if pad_mode == 'constant':
         # Assume constant value c for indices outside the domain of ``f``
 
@@ -954,16 +1048,16 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None,
         # interior of the domain of f
 
         if method == 'central':
-            out[0] = (f_arr[1] - pad_const) / 2.0
-            out[-1] = (pad_const - f_arr[-2]) / 2.0
+            first = (f_arr[1] - pad_const) / 2.0
+            last = (pad_const - f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1] - f_arr[0]
-            out[-1] = pad_const - f_arr[-1]
+            first = f_arr[1] - f_arr[0]
+            last = pad_const - f_arr[-1]
 
         elif method == 'backward':
-            out[0] = f_arr[0] - pad_const
-            out[-1] = f_arr[-1] - f_arr[-2]
+            first = f_arr[0] - pad_const
+            last = f_arr[-1] - f_arr[-2]
 
     elif pad_mode == 'symmetric':
         # Values of f for indices outside the domain of f are replicates of
@@ -973,79 +1067,79 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None,
         # interior of the domain of f
 
         if method == 'central':
-            out[0] = (f_arr[1] - f_arr[0]) / 2.0
-            out[-1] = (f_arr[-1] - f_arr[-2]) / 2.0
+            first = (f_arr[1] - f_arr[0]) / 2.0
+            last = (f_arr[-1] - f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1] - f_arr[0]
-            out[-1] = 0
+            first = f_arr[1] - f_arr[0]
+            last = 0
 
         elif method == 'backward':
-            out[0] = 0
-            out[-1] = f_arr[-1] - f_arr[-2]
+            first = 0
+            last = f_arr[-1] - f_arr[-2]
 
     elif pad_mode == 'symmetric_adjoint':
         # The adjoint case of symmetric
 
         if method == 'central':
-            out[0] = (f_arr[1] + f_arr[0]) / 2.0
-            out[-1] = (-f_arr[-1] - f_arr[-2]) / 2.0
+            first = (f_arr[1] + f_arr[0]) / 2.0
+            last = (-f_arr[-1] - f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1]
-            out[-1] = -f_arr[-1]
+            first = f_arr[1]
+            last = -f_arr[-1]
 
         elif method == 'backward':
-            out[0] = f_arr[0]
-            out[-1] = -f_arr[-2]
+            first = f_arr[0]
+            last = -f_arr[-2]
 
     elif pad_mode == 'periodic':
         # Values of f for indices outside the domain of f are replicates of
         # the edge values on the other side
 
         if method == 'central':
-            out[0] = (f_arr[1] - f_arr[-1]) / 2.0
-            out[-1] = (f_arr[0] - f_arr[-2]) / 2.0
+            first = (f_arr[1] - f_arr[-1]) / 2.0
+            last = (f_arr[0] - f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1] - f_arr[0]
-            out[-1] = f_arr[0] - f_arr[-1]
+            first = f_arr[1] - f_arr[0]
+            last = f_arr[0] - f_arr[-1]
 
         elif method == 'backward':
-            out[0] = f_arr[0] - f_arr[-1]
-            out[-1] = f_arr[-1] - f_arr[-2]
+            first = f_arr[0] - f_arr[-1]
+            last = f_arr[-1] - f_arr[-2]
 
     elif pad_mode == 'order0':
         # Values of f for indices outside the domain of f are replicates of
         # the edge value.
 
         if method == 'central':
-            out[0] = (f_arr[1] - f_arr[0]) / 2.0
-            out[-1] = (f_arr[-1] - f_arr[-2]) / 2.0
+            first = (f_arr[1] - f_arr[0]) / 2.0
+            last = (f_arr[-1] - f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1] - f_arr[0]
-            out[-1] = 0
+            first = f_arr[1] - f_arr[0]
+            last = 0
 
         elif method == 'backward':
-            out[0] = 0
-            out[-1] = f_arr[-1] - f_arr[-2]
+            first = 0
+            last = f_arr[-1] - f_arr[-2]
 
     elif pad_mode == 'order0_adjoint':
         # Values of f for indices outside the domain of f are replicates of
         # the edge value.
 
         if method == 'central':
-            out[0] = (f_arr[0] + f_arr[1]) / 2.0
-            out[-1] = -(f_arr[-1] + f_arr[-2]) / 2.0
+            first = (f_arr[0] + f_arr[1]) / 2.0
+            last = -(f_arr[-1] + f_arr[-2]) / 2.0
 
         elif method == 'forward':
-            out[0] = f_arr[1]
-            out[-1] = -f_arr[-1]
+            first = f_arr[1]
+            last = -f_arr[-1]
 
         elif method == 'backward':
-            out[0] = f_arr[0]
-            out[-1] = -f_arr[-2]
+            first = f_arr[0]
+            last = -f_arr[-2]
 
     elif pad_mode == 'order1':
         # Values of f for indices outside the domain of f are linearly
@@ -1053,81 +1147,318 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None,
 
         # independent of ``method``
 
-        out[0] = f_arr[1] - f_arr[0]
-        out[-1] = f_arr[-1] - f_arr[-2]
+        first = f_arr[1] - f_arr[0]
+        last = f_arr[-1] - f_arr[-2]
 
     elif pad_mode == 'order1_adjoint':
         # Values of f for indices outside the domain of f are linearly
         # extrapolated from the inside.
 
         if method == 'central':
-            out[0] = f_arr[0] + f_arr[1] / 2.0
-            out[-1] = -f_arr[-1] - f_arr[-2] / 2.0
+            first = f_arr[0] + f_arr[1] / 2.0
+            last = -f_arr[-1] - f_arr[-2] / 2.0
 
-            # Increment in case array is very short and we get aliasing
-            out[1] -= f_arr[0] / 2.0
-            out[-2] += f_arr[-1] / 2.0
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((1, -f_arr[0] / 2.0))
+            incs.append((-2, f_arr[-1] / 2.0))
 
         elif method == 'forward':
-            out[0] = f_arr[0] + f_arr[1]
-            out[-1] = -f_arr[-1]
+            first = f_arr[0] + f_arr[1]
+            last = -f_arr[-1]
 
-            # Increment in case array is very short and we get aliasing
-            out[1] -= f_arr[0]
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((1, -f_arr[0]))
 
         elif method == 'backward':
-            out[0] = f_arr[0]
-            out[-1] = -f_arr[-1] - f_arr[-2]
+            first = f_arr[0]
+            last = -f_arr[-1] - f_arr[-2]
 
-            # Increment in case array is very short and we get aliasing
-            out[-2] += f_arr[-1]
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((-2, f_arr[-1]))
 
     elif pad_mode == 'order2':
         # 2nd order edges
 
-        out[0] = -(3.0 * f_arr[0] - 4.0 * f_arr[1] + f_arr[2]) / 2.0
-        out[-1] = (3.0 * f_arr[-1] - 4.0 * f_arr[-2] + f_arr[-3]) / 2.0
+        first = -(3.0 * f_arr[0] - 4.0 * f_arr[1] + f_arr[2]) / 2.0
+        last = (3.0 * f_arr[-1] - 4.0 * f_arr[-2] + f_arr[-3]) / 2.0
 
     elif pad_mode == 'order2_adjoint':
         # Values of f for indices outside the domain of f are quadratically
         # extrapolated from the inside.
 
         if method == 'central':
-            out[0] = 1.5 * f_arr[0] + 0.5 * f_arr[1]
-            out[-1] = -1.5 * f_arr[-1] - 0.5 * f_arr[-2]
+            first = 1.5 * f_arr[0] + 0.5 * f_arr[1]
+            last = -1.5 * f_arr[-1] - 0.5 * f_arr[-2]
 
-            # Increment in case array is very short and we get aliasing
-            out[1] -= 1.5 * f_arr[0]
-            out[2] += 0.5 * f_arr[0]
-            out[-3] -= 0.5 * f_arr[-1]
-            out[-2] += 1.5 * f_arr[-1]
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((1, -1.5 * f_arr[0]))
+            incs.append((2, 0.5 * f_arr[0]))
+            incs.append((-3, -0.5 * f_arr[-1]))
+            incs.append((-2, 1.5 * f_arr[-1]))
 
         elif method == 'forward':
-            out[0] = 1.5 * f_arr[0] + 1.0 * f_arr[1]
-            out[-1] = -1.5 * f_arr[-1]
+            first = 1.5 * f_arr[0] + 1.0 * f_arr[1]
+            last = -1.5 * f_arr[-1]
 
-            # Increment in case array is very short and we get aliasing
-            out[1] -= 2.0 * f_arr[0]
-            out[2] += 0.5 * f_arr[0]
-            out[-3] -= 0.5 * f_arr[-1]
-            out[-2] += 1.0 * f_arr[-1]
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((1, -2.0 * f_arr[0]))
+            incs.append((2, 0.5 * f_arr[0]))
+            incs.append((-3, -0.5 * f_arr[-1]))
+            incs.append((-2, 1.0 * f_arr[-1]))
 
         elif method == 'backward':
-            out[0] = 1.5 * f_arr[0]
-            out[-1] = -1.0 * f_arr[-2] - 1.5 * f_arr[-1]
-
-            # Increment in case array is very short and we get aliasing
-            out[1] -= 1.0 * f_arr[0]
-            out[2] += 0.5 * f_arr[0]
-            out[-3] -= 0.5 * f_arr[-1]
-            out[-2] += 2.0 * f_arr[-1]
+            first = 1.5 * f_arr[0]
+            last = -1.0 * f_arr[-2] - 1.5 * f_arr[-1]
+
+            # Increments, applied after `first` and `last` in case the array
+            # is very short and we get aliasing
+            incs.append((1, -1.0 * f_arr[0]))
+            incs.append((2, 0.5 * f_arr[0]))
+            incs.append((-3, -0.5 * f_arr[-1]))
+            incs.append((-2, 2.0 * f_arr[-1]))
     else:
         raise NotImplementedError('unknown pad_mode')
 
-    # divide by step size
-    out /= dx
+    return first, last, incs
 
-    return out_in
+
+# --- Fused stencil kernels --- #
+
+# Target number of entries of one slab along axis 0. The stencils along all
+# axes are evaluated slab by slab, such that each input slab is read from
+# memory once and then reused from cache.
+_SLAB_SIZE = 2 ** 15
+
+
+def _stencil_slabs(shape):
+    """Return slices along axis 0 splitting ``shape`` into slabs."""
+    n = shape[0]
+    row_size = max(int(np.prod(shape[1:])), 1)
+    rows = max(_SLAB_SIZE // row_size, 1)
+    return [slice(start, min(start + rows, n)) for start in range(0, n, rows)]
+
+
+def _run_slabs(slab_func, shape, tmp_dtype, num_threads):
+    """Call ``slab_func(slc, tmp)`` for all slabs of an array of ``shape``.
+
+    Consecutive slabs are grouped into one chunk per thread. Each chunk
+    uses its own scratch array ``tmp`` with the shape of the slab, or
+    ``None`` if ``tmp_dtype`` is ``None``.
+    """
+    from odl.util.parallel import parallel_map
+
+    slabs = _stencil_slabs(shape)
+    num_chunks = max(min(int(num_threads), len(slabs)), 1)
+    bounds = [len(slabs) * i // num_chunks for i in range(num_chunks + 1)]
+    chunks = [slabs[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def run_chunk(chunk):
+        if tmp_dtype is None:
+            tmp = None
+        else:
+            rows = max(slc.stop - slc.start for slc in chunk)
+            tmp = np.empty((rows,) + tuple(shape[1:]), dtype=tmp_dtype)
+        for slc in chunk:
+            slab_func(slc, None if tmp is None else tmp[:slc.stop - slc.start])
+
+    parallel_map(run_chunk, chunks, num_chunks)
+
+
+def _check_stencil_shape(shape, pad_mode):
+    """Raise if ``shape`` is too small for the boundary rules of
+    ``pad_mode``, as in `finite_diff`."""
+    min_size = 3 if pad_mode == 'order2' else 2
+    for axis, n in enumerate(shape):
+        if n < min_size:
+            raise ValueError('in axis {}: at least {} elements required, '
+                             'got {}'.format(axis, min_size, n))
+
+
+def _stencil_interior(f, out, scale, method, tmp=None):
+    """Set or add the scaled interior differences of ``f`` along axis 0.
+
+    ``f`` has one more row than ``out`` on each side, i.e., ``out[i]`` is
+    the difference at ``f[i + 1]``. Without ``tmp``, ``out`` is
+    overwritten, otherwise the differences are computed in ``tmp`` and
+    added to ``out``. The ``'second'`` method is the forward minus the
+    backward difference.
+    """
+    res = out if tmp is None else tmp
+    if method == 'central':
+        np.subtract(f[2:], f[:-2], out=res)
+        scale = scale / 2.0
+    elif method == 'forward':
+        np.subtract(f[2:], f[1:-1], out=res)
+    elif method == 'backward':
+        np.subtract(f[1:-1], f[:-2], out=res)
+    elif method == 'second':
+        np.subtract(f[2:], f[1:-1], out=res)
+        res -= f[1:-1]
+        res += f[:-2]
+    res *= scale
+    if tmp is not None:
+        out += res
+
+
+def _stencil_boundary(f, out, scale, method, pad_mode, pad_const, add):
+    """Set or add the scaled boundary differences of ``f`` along axis 0.
+
+    The boundary rules are those of `finite_diff`, see `_diff_boundary`.
+    For the ``'second'`` method, the values are always added.
+    """
+    if method == 'second':
+        _stencil_boundary(f, out, scale, 'forward', pad_mode, pad_const,
+                          add=True)
+        _stencil_boundary(f, out, -scale, 'backward', pad_mode, pad_const,
+                          add=True)
+        return
+
+    first, last, incs = _diff_boundary(f, method, pad_mode, pad_const)
+    if add:
+        out[0] += np.multiply(first, scale)
+        out[-1] += np.multiply(last, scale)
+    else:
+        out[0] = np.multiply(first, scale)
+        out[-1] = np.multiply(last, scale)
+    for i, inc in incs:
+        out[i] += inc * scale
+
+
+def _slab_diff(f, out, axis, slc, scale, method, tmp=None):
+    """Set or add the interior differences along ``axis`` in rows ``slc``.
+
+    Without ``tmp``, ``out[slc]`` is overwritten, otherwise the differences
+    are computed in ``tmp`` and added to it. Along axis 0, the neighboring
+    rows are read from ``f`` directly. The first and last index along
+    ``axis`` are left to `_stencil_boundary` on the full arrays.
+    """
+    if axis == 0:
+        lo, hi = max(slc.start, 1), min(slc.stop, f.shape[0] - 1)
+        if lo < hi:
+            if tmp is not None:
+                tmp = tmp[lo - slc.start:hi - slc.start]
+            _stencil_interior(f[lo - 1:hi + 1], out[lo:hi], scale, method,
+                              tmp)
+        return
+
+    f_slab = f[slc]
+    res = out[slc] if tmp is None else tmp
+    if f_slab.flags.c_contiguous and res.flags.c_contiguous:
+        # Treat the slab as rows of length `stride`, such that the
+        # differences along `axis` are differences of contiguous rows.
+        # This also writes the first and last index along `axis`, where
+        # wrong values are overwritten by `_stencil_boundary` afterwards.
+        stride = int(np.prod(f_slab.shape[axis + 1:]))
+        _stencil_interior(f_slab.reshape(-1, stride),
+                          res.reshape(-1, stride)[1:-1], scale, method)
+    else:
+        _stencil_interior(np.swapaxes(f_slab, 0, axis),
+                          np.swapaxes(res, 0, axis)[1:-1], scale, method)
+
+    if tmp is not None:
+        # Only the interior differences may be added
+        tmp_ax = np.swapaxes(tmp, 0, axis)
+        tmp_ax[0] = 0
+        tmp_ax[-1] = 0
+        out[slc] += tmp
+
+
+def _stencil_boundaries(fs, outs, scales, method, pad_mode, pad_const, add):
+    """Apply `_stencil_boundary` to ``fs[i], outs[i]`` along axis ``i``."""
+    for axis, (f, out, scale) in enumerate(zip(fs, outs, scales)):
+        _stencil_boundary(np.swapaxes(f, 0, axis), np.swapaxes(out, 0, axis),
+                          scale, method, pad_mode, pad_const, add)
+
+
+def _stencil_sum(fs, out, scales, method, pad_mode, pad_const, num_threads):
+    """Write ``sum_i D_i(fs[i]) * scales[i]`` to ``out`` in a single pass.
+
+    ``D_i`` is the difference along axis ``i``. Slab by slab, the interior
+    axis-0 term is assigned and the other terms are added. The boundary
+    values of all terms are added at the end.
+    """
+    n = out.shape[0]
+
+    def sum_slab(slc, tmp):
+        _slab_diff(fs[0], out, 0, slc, scales[0], method)
+        if slc.start == 0:
+            out[0] = 0
+        if slc.stop == n:
+            out[-1] = 0
+        for axis in range(1, len(fs)):
+            _slab_diff(fs[axis], out, axis, slc, scales[axis], method, tmp)
+
+    _run_slabs(sum_slab, out.shape, out.dtype, num_threads)
+    _stencil_boundaries(fs, [out] * len(fs), scales, method, pad_mode,
+                        pad_const, add=True)
+
+
+def _gradient_stencil(f, outs, dx, num_threads=1, method='forward',
+                      pad_mode='constant', pad_const=0):
+    """Write ``finite_diff(f, axis=i, dx=dx[i])`` to ``outs[i]``.
+
+    The interior differences of all components are computed slab by slab
+    in one pass over ``f``, in parallel for ``num_threads > 1``.
+    """
+    _check_stencil_shape(f.shape, pad_mode)
+    pad_const = f.dtype.type(pad_const)
+    # Python floats, such that float32 arrays are not scaled in float64
+    scales = [1.0 / float(dxi) for dxi in dx]
+
+    def gradient_slab(slc, tmp):
+        for axis, out in enumerate(outs):
+            _slab_diff(f, out, axis, slc, scales[axis], method)
+
+    _run_slabs(gradient_slab, f.shape, None, num_threads)
+    _stencil_boundaries([f] * f.ndim, outs, scales, method, pad_mode,
+                        pad_const, add=False)
+
+
+def _divergence_stencil(fs, out, dx, num_threads=1, method='forward',
+                        pad_mode='constant', pad_const=0):
+    """Write ``sum_i finite_diff(fs[i], axis=i, dx=dx[i])`` to ``out``.
+
+    The sum is accumulated slab by slab, without full-size temporaries.
+    """
+    _check_stencil_shape(out.shape, pad_mode)
+    pad_const = out.dtype.type(pad_const)
+    _stencil_sum(fs, out, [1.0 / float(dxi) for dxi in dx], method, pad_mode,
+                 pad_const, num_threads)
+
+
+def _laplacian_stencil(f, out, dx, num_threads=1, pad_mode='constant',
+                       pad_const=0):
+    """Write the sum of second differences of ``f`` to ``out``.
+
+    Along each axis ``i``, this is the forward minus the backward
+    difference with step ``dx[i] ** 2``.
+    """
+    _check_stencil_shape(f.shape, pad_mode)
+    pad_const = f.dtype.type(pad_const)
+    _stencil_sum([f] * f.ndim, out, [1.0 / float(dxi) ** 2 for dxi in dx],
+                 'second', pad_mode, pad_const, num_threads)
+
+
+def _stencil_num_threads(space):
+    """Return the number of threads for the stencil kernels on ``space``."""
+    return getattr(space.tspace, 'num_threads', 1)
+
+
+def _field_arrays(x):
+    """Return the arrays of the parts of the vector field ``x``.
+
+    For contiguous product space elements, these are views into the
+    stacked array ``x.data``.
+    """
+    data = getattr(x, 'data', None)
+    if data is not None:
+        return list(data)
+    return [xi.asarray() for xi in x]
 
 
 if __name__ == '__main__':
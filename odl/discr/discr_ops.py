@@ -13,13 +13,13 @@ from __future__ import absolute_import, division, print_function
 import numpy as np
 
 from odl.discr.discr_space import DiscretizedSpace
-from odl.discr.discr_utils import (
-    _normalize_interp, per_axis_interpolator, point_collocation)
+from odl.discr.discr_utils import InterpolationPlan, _normalize_interp
 from odl.discr.partition import uniform_partition
 from odl.operator import Operator
 from odl.space import tensor_space
 from odl.util import (
-    normalized_scalar_param_list, resize_array, safe_int_conv, writable_array)
+    is_floating_dtype, normalized_scalar_param_list, real_dtype, resize_array,
+    safe_int_conv, writable_array)
 from odl.util.numerics import _SUPPORTED_RESIZE_PAD_MODES
 from odl.util.utility import nullcontext
 
@@ -72,6 +72,10 @@ class Resampling(Operator):
         >>> resampling = odl.Resampling(coarse_discr, fine_discr, 'linear')
         >>> print(resampling([0, 1, 0]))
         [ 0.  ,  0.25,  0.75,  0.75,  0.25,  0.  ]
+
+        The interpolation indices and weights are computed once at
+        initialization and reused in each call, see
+        `odl.discr.discr_utils.InterpolationPlan`.
         """
         if domain.domain != range.domain:
             raise ValueError(
@@ -84,6 +88,14 @@ class Resampling(Operator):
 
         self.__interp_byaxis = _normalize_interp(interp, domain.ndim)
 
+        if is_floating_dtype(domain.dtype):
+            weight_dtype = real_dtype(domain.dtype)
+        else:
+            weight_dtype = float
+        self.__plan = InterpolationPlan(
+            domain.grid.coord_vectors, range.meshgrid, self.interp_byaxis,
+            weight_dtype=weight_dtype)
+
     @property
     def interp_byaxis(self):
         """Tuple of per-axis interpolation schemes."""
@@ -106,15 +118,9 @@ class Resampling(Operator):
         The element ``x`` is resampled using the sampling and interpolation
         operators of the underlying spaces.
         """
-        interpolator = per_axis_interpolator(
-            x, self.domain.grid.coord_vectors, self.interp
-        )
-
         out_ctx = nullcontext() if out is None else writable_array(out)
         with out_ctx as out_arr:
-            return point_collocation(
-                interpolator, self.range.meshgrid, out=out_arr
-            )
+            return self.__plan(x.asarray(), out=out_arr)
 
     @property
     def inverse(self):
@@ -123,24 +129,6 @@ class Resampling(Operator):
         The returned operator is resampling defined in the opposite
         direction.
 
-        See Also
-        --------
-        adjoint : resampling is unitary, so the adjoint is the inverse.
-        """
-        return Resampling(self.range, self.domain, self.interp)
-
-    @property
-    def adjoint(self):
-        """Return an (approximate) adjoint.
-
-        The result is only exact if the interpolation and sampling
-        operators of the underlying spaces match exactly.
-
-        Returns
-        -------
-        adjoint : Resampling
-            Resampling operator defined in the opposite direction.
-
         Examples
         --------
         Create resampling operator and inverse:
@@ -163,7 +151,58 @@ class Resampling(Operator):
         >>> print(resampling(resampling_inv(y)))
         [ 0.,  0.,  1.,  1.,  0.,  0.]
         """
-        return self.inverse
+        return Resampling(self.range, self.domain, self.interp)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator.
+
+        The adjoint distributes the values of a ``range`` element to the
+        ``domain`` grid with the interpolation weights, taking the
+        weightings of both spaces into account. In contrast to `inverse`,
+        it satisfies ``<A x, y> = <x, A^* y>`` exactly.
+
+        Examples
+        --------
+        >>> coarse_discr = odl.uniform_discr(0, 1, 3)
+        >>> fine_discr = odl.uniform_discr(0, 1, 6)
+        >>> resampling = odl.Resampling(coarse_discr, fine_discr, 'nearest')
+        >>> print(resampling.adjoint([0, 0, 0, 1, 0, 0]))
+        [ 0. ,  0.5,  0. ]
+        """
+        op = self
+        plan = self.__plan
+        dom_weights = _weighting_values(self.domain)
+        ran_weights = _weighting_values(self.range)
+
+        class ResamplingAdjoint(Operator):
+
+            """Adjoint of `Resampling`."""
+
+            def _call(self, x, out):
+                """Implement ``self(x, out)``."""
+                with writable_array(out) as out_arr:
+                    plan.adjoint(x.asarray() * ran_weights, out=out_arr)
+                    out_arr /= dom_weights
+
+            @property
+            def adjoint(self):
+                """Adjoint of the adjoint, i.e. the original operator."""
+                return op
+
+        return ResamplingAdjoint(self.range, self.domain, linear=True)
+
+
+def _weighting_values(space):
+    """Return the constant or array of weights of ``space``."""
+    weighting = space.weighting
+    if hasattr(weighting, 'const'):
+        return weighting.const
+    elif hasattr(weighting, 'array'):
+        return weighting.array
+    else:
+        raise NotImplementedError('adjoint not implemented for weighting '
+                                  '{!r}'.format(weighting))
 
 
 class ResizingOperator(Operator):
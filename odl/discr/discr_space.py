@@ -381,6 +381,22 @@ class DiscretizedSpace(TensorSpace):
                 self, self.tspace.element(inp, order=order)
             )
 
+    def memmap_element(self, filename=None, mode='w+', order=None):
+        """Create an element backed by a memory-mapped file.
+
+        See `NumpyTensorSpace.memmap_element` for details.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr(0, 1, 4)
+        >>> x = space.memmap_element()
+        >>> x[:] = [1, 2, 3, 4]
+        >>> x.norm()
+        2.7386127875258306
+        """
+        return self.element_type(
+            self, self.tspace.memmap_element(filename, mode, order))
+
     def zero(self):
         """Return the element of all zeros."""
         return self.element_type(self, self.tspace.zero())
@@ -515,23 +531,29 @@ class DiscretizedSpace(TensorSpace):
 
     # --- Space functions
 
+    # In-place variants write to `out.tensor` directly; wrapping the `None`
+    # they return in a new element would allocate a useless array.
+
     def _lincomb(self, a, x1, b, x2, out):
         """Raw linear combination."""
-        return self.element(
-            self.tspace._lincomb(a, x1.tensor, b, x2.tensor,
-                                 out.tensor if out is not None else None))
+        if out is None:
+            return self.element(
+                self.tspace._lincomb(a, x1.tensor, b, x2.tensor, None))
+        self.tspace._lincomb(a, x1.tensor, b, x2.tensor, out.tensor)
 
     def _multiply(self, x1, x2, out):
         """Raw pointwise multiplication of two elements."""
-        return self.element(
-                self.tspace._multiply(x1.tensor, x2.tensor,
-                                      out.tensor if out is not None else None))
+        if out is None:
+            return self.element(
+                self.tspace._multiply(x1.tensor, x2.tensor, None))
+        self.tspace._multiply(x1.tensor, x2.tensor, out.tensor)
 
     def _divide(self, x1, x2, out):
         """Raw pointwise multiplication of two elements."""
-        return self.element(
-                self.tspace._divide(x1.tensor, x2.tensor,
-                                    out.tensor if out is not None else None))
+        if out is None:
+            return self.element(
+                self.tspace._divide(x1.tensor, x2.tensor, None))
+        self.tspace._divide(x1.tensor, x2.tensor, out.tensor)
 
     # The inherited methods by default use a weighting by a constant
     # (the grid cell size). In dimensions where the partitioned set contains
@@ -708,6 +730,11 @@ class DiscretizedSpaceElement(Tensor):
         """Create an identical (deep) copy of this element."""
         return self.space.element(self.tensor.copy())
 
+    def set_zero(self):
+        """Set this element to zero, regardless of its current values."""
+        self.tensor.set_zero()
+        return self
+
     def asarray(self, out=None):
         """Extract the data of this array as a numpy array.
 
@@ -1593,8 +1620,16 @@ def uniform_discr_frompartition(partition, dtype=None, impl='numpy', **kwargs):
         else:
             weighting = partition.cell_volume
 
+    tspace_kwargs = {}
+    memmap_dir = kwargs.pop('memmap_dir', None)
+    if memmap_dir is not None:
+        tspace_kwargs['memmap_dir'] = memmap_dir
+    num_threads = kwargs.pop('num_threads', None)
+    if num_threads is not None:
+        tspace_kwargs['num_threads'] = num_threads
+
     tspace = tspace_type(partition.shape, dtype, exponent=exponent,
-                         weighting=weighting)
+                         weighting=weighting, **tspace_kwargs)
     return DiscretizedSpace(partition, tspace, **kwargs)
 
 
@@ -1684,6 +1719,15 @@ def uniform_discr(min_pt, max_pt, shape, dtype=None, impl='numpy', **kwargs):
         - `Weighting`: Use weighting class as-is. Compatibility
           with this space's elements is not checked during init.
 
+    memmap_dir : str, optional
+        Directory for temporary files backing new elements, see
+        `NumpyTensorSpace.memmap_element`. ``None`` means that new elements
+        are kept in memory.
+    num_threads : positive int, optional
+        Number of threads for arithmetic of large arrays and for the
+        stencil kernels of `Gradient`, `Divergence` and `Laplacian`, see
+        `NumpyTensorSpace`.
+
     Returns
     -------
     discr : `DiscretizedSpace`
@@ -36,6 +36,7 @@ __all__ = (
     'nearest_interpolator',
     'linear_interpolator',
     'per_axis_interpolator',
+    'InterpolationPlan',
     'sampling_function',
 )
 
@@ -831,6 +832,243 @@ class _PerAxisInterpolator(_Interpolator):
         return np.array(out, copy=AVOID_UNNECESSARY_COPY, ndmin=1)
 
 
+def _interp_tables(shape, indices, norm_distances, interp):
+    """Return per-axis tables of flat indices and weights.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the grid of interpolated values.
+    indices, norm_distances : sequence of `numpy.ndarray`
+        Lower neighbor indices and normalized distances per axis, as
+        computed in `_Interpolator._find_indices`. They are modified
+        in-place.
+    interp : sequence of str
+        Interpolation scheme per axis.
+
+    Returns
+    -------
+    tables : list of tuple
+        For each axis, the tuple ``(lo_idx, hi_idx, lo_weight, hi_weight)``.
+        The indices are multiplied with the C-order stride of the axis,
+        such that the flat index of a neighbor is the sum of the indices
+        over all axes.
+    """
+    low_weights, high_weights, edge_indices = _create_weight_edge_lists(
+        indices, norm_distances, interp)
+
+    tables = []
+    stride = 1
+    for n, (lo, hi), w_lo, w_hi in reversed(list(zip(
+            shape, edge_indices, low_weights, high_weights))):
+        # Out-of-bounds nodes use -1 for the last grid point
+        lo[lo < 0] += n
+        tables.append((lo * stride, hi * stride, w_lo, w_hi))
+        stride *= n
+    return tables[::-1]
+
+
+def _compact_interp_tables(tables, size, weight_dtype):
+    """Return ``tables`` with 32-bit indices if ``size`` allows."""
+    idx_dtype = np.int32 if size < 2 ** 31 else np.intp
+    return [(lo.astype(idx_dtype), hi.astype(idx_dtype),
+             w_lo.astype(weight_dtype), w_hi.astype(weight_dtype))
+            for lo, hi, w_lo, w_hi in tables]
+
+
+def _interp_corners(tables):
+    """Yield flat indices and weights for all neighbor combinations.
+
+    This results in ``2 ** ndim`` pairs, with arrays broadcasting to the
+    shape of the interpolation points.
+    """
+    for corner in product(*([(0, 1)] * len(tables))):
+        flat_idx = weight = None
+        for upper, (lo, hi, w_lo, w_hi) in zip(corner, tables):
+            idx, w = (hi, w_hi) if upper else (lo, w_lo)
+            flat_idx = idx if flat_idx is None else flat_idx + idx
+            weight = w if weight is None else weight * w
+        yield flat_idx, weight
+
+
+def _apply_interp_tables(flat_values, tables, out):
+    """Write the values interpolated with ``tables`` to ``out``."""
+    out.fill(0)
+    for flat_idx, weight in _interp_corners(tables):
+        out += np.take(flat_values, flat_idx) * weight
+    return out
+
+
+def _scatter_interp_tables(values, tables, size):
+    """Return the adjoint of `_apply_interp_tables` as a flat array."""
+    values = np.asarray(values)
+    result = np.zeros(size, dtype=np.result_type(values.dtype, float))
+    for flat_idx, weight in _interp_corners(tables):
+        flat_idx = np.broadcast_to(flat_idx, values.shape).ravel()
+        contrib = (values * weight).ravel()
+        if np.iscomplexobj(contrib):
+            result.real += np.bincount(flat_idx, contrib.real, size)
+            result.imag += np.bincount(flat_idx, contrib.imag, size)
+        else:
+            result += np.bincount(flat_idx, contrib, size)
+    return result
+
+
+class InterpolationPlan(object):
+
+    """Precomputed interpolation of grid values at fixed points.
+
+    Interpolating values on a grid at given points requires to locate the
+    points in the grid and to compute interpolation weights. If the points
+    stay the same for many different values, e.g., in `Resampling`, this
+    work can be done once. The plan stores the neighbor indices as 32-bit
+    integers (if the grid size allows) and the weights in a selectable
+    floating point type, and applies them with a gather operation.
+
+    Since interpolation is linear in the values, the plan also provides
+    the exact `adjoint`, a scatter operation from the points to the grid.
+
+    The interpolation is equivalent to `per_axis_interpolator`, including
+    the treatment of points outside the grid.
+    """
+
+    def __init__(self, coord_vecs, x, interp, weight_dtype=float):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        coord_vecs : sequence of `numpy.ndarray`
+            Coordinate vectors of the rectangular grid on which the
+            values are given. They must be sorted in ascending order.
+        x : `meshgrid` or `numpy.ndarray`
+            Points at which the values are interpolated, in the same
+            format as for `per_axis_interpolator`.
+        interp : str or sequence of str
+            Interpolation scheme, globally or per axis.
+
+            Supported values: ``'nearest'``, ``'linear'``
+
+        weight_dtype : optional
+            Floating point data type in which the weights are stored.
+            Using ``'float32'`` halves the memory of the weights at the
+            cost of accuracy.
+
+        Examples
+        --------
+        >>> part = odl.uniform_partition(0, 1, 4)
+        >>> plan = InterpolationPlan(part.coord_vectors, [0.25, 0.5],
+        ...                          'linear')
+        >>> plan([1.0, 2.0, 3.0, 4.0])
+        array([ 1.5,  2.5])
+
+        The adjoint distributes values with the interpolation weights:
+
+        >>> plan.adjoint([1.0, 1.0])
+        array([ 0.5,  1. ,  0.5,  0. ])
+        """
+        coord_vecs = tuple(np.asarray(c, dtype=float) for c in coord_vecs)
+        ndim = len(coord_vecs)
+        self.__grid_shape = tuple(c.size for c in coord_vecs)
+        self.__interp = _normalize_interp(interp, ndim)
+
+        x, x_type, _ = _check_interp_input(x, np.empty((0,) * ndim))
+        if x_type == 'meshgrid':
+            self.__shape = out_shape_from_meshgrid(x)
+        else:
+            self.__shape = out_shape_from_array(x)
+
+        indices = []
+        norm_distances = []
+        for xi, cvec in zip(x, coord_vecs):
+            xi = np.asarray(xi, dtype=float)
+            idcs = np.searchsorted(cvec, xi) - 1
+            np.clip(idcs, 0, cvec.size - 2, out=idcs)
+            indices.append(idcs)
+            norm_distances.append((xi - cvec[idcs]) /
+                                  (cvec[idcs + 1] - cvec[idcs]))
+
+        tables = _interp_tables(self.grid_shape, indices, norm_distances,
+                                self.interp_byaxis)
+        self.__tables = _compact_interp_tables(
+            tables, int(np.prod(self.grid_shape)), weight_dtype)
+
+    @property
+    def grid_shape(self):
+        """Shape of the grid of interpolated values."""
+        return self.__grid_shape
+
+    @property
+    def shape(self):
+        """Shape of the result of the interpolation."""
+        return self.__shape
+
+    @property
+    def interp_byaxis(self):
+        """Tuple of per-axis interpolation schemes."""
+        return self.__interp
+
+    def __call__(self, values, out=None):
+        """Interpolate ``values`` at the points of this plan.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values on the grid, of shape `grid_shape`.
+        out : `numpy.ndarray`, optional
+            Array of shape `shape` to which the result is written.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Interpolated values. If ``out`` was given, the returned
+            object is a reference to it.
+        """
+        values = np.asarray(values)
+        if values.shape != self.grid_shape:
+            raise ValueError('`values` must have shape {}, got {}'
+                             ''.format(self.grid_shape, values.shape))
+        if out is None:
+            out = np.empty(self.shape, dtype=values.dtype)
+        elif out.shape != self.shape:
+            raise ValueError('`out` must have shape {}, got {}'
+                             ''.format(self.shape, out.shape))
+        return _apply_interp_tables(values.ravel(), self.__tables, out)
+
+    def adjoint(self, values, out=None):
+        """Apply the adjoint (transpose) of the interpolation.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values at the points of this plan, of shape `shape`.
+        out : `numpy.ndarray`, optional
+            Array of shape `grid_shape` to which the result is written.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Values on the grid. If ``out`` was given, the returned
+            object is a reference to it.
+        """
+        values = np.asarray(values)
+        if values.shape != self.shape:
+            raise ValueError('`values` must have shape {}, got {}'
+                             ''.format(self.shape, values.shape))
+        result = _scatter_interp_tables(
+            values, self.__tables, int(np.prod(self.grid_shape)))
+        result = result.reshape(self.grid_shape)
+        if out is None:
+            return result
+        out[:] = result
+        return out
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}(grid_shape={}, shape={}, interp={})'.format(
+            self.__class__.__name__, self.grid_shape, self.shape,
+            self.interp_byaxis)
+
+
 class _LinearInterpolator(_PerAxisInterpolator):
     """Linear (i.e. bi-/tri-/multi-linear) interpolator.
 
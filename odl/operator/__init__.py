@@ -10,6 +10,7 @@
 
 from __future__ import absolute_import
 
+from .compiled import *
 from .default_ops import *
 from .operator import *
 from .oputils import *
@@ -17,6 +18,7 @@ from .pspace_ops import *
 from .tensor_ops import *
 
 __all__ = ()
+__all__ += compiled.__all__
 __all__ += default_ops.__all__
 __all__ += operator.__all__
 __all__ += oputils.__all__
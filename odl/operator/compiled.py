@@ -0,0 +1,452 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Compilation of operator expressions into reusable evaluation graphs.
+
+Operator arithmetic like ``2 * A + B * C`` builds a tree of expression
+operators (`OperatorSum`, `OperatorComp`, `OperatorLeftScalarMult`, ...).
+Evaluating such a tree allocates new temporaries in each node and call, and
+every scaling is done in a separate pass over the data.
+
+`compile_operator` walks the tree once and creates an equivalent operator
+that
+
+- collects sums, scalings and vector additions into a flat linear
+  combination that is evaluated with one `LinearSpaceElement.lincomb`
+  pass per term,
+- pulls scalar factors through linear operators so that they are applied
+  as part of such a linear combination,
+- preallocates all temporaries needed during evaluation and reuses them
+  in subsequent calls.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from odl.operator.default_ops import ScalingOperator
+from odl.operator.operator import (
+    Operator, OperatorComp, OperatorLeftScalarMult, OperatorLeftVectorMult,
+    OperatorPointwiseProduct, OperatorRightScalarMult,
+    OperatorRightVectorMult, OperatorSum, OperatorVectorSum)
+from odl.set import LinearSpace
+from odl.set.space import LinearSpaceElement
+
+__all__ = ('CompiledOperator', 'compile_operator')
+
+
+def compile_operator(op):
+    """Return a compiled version of an operator expression.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Operator to compile, usually the result of operator arithmetic.
+        Operators whose `Operator.range` is not a `LinearSpace`, e.g.,
+        functionals, cannot be evaluated in-place and are returned as-is.
+
+    Returns
+    -------
+    compiled : `CompiledOperator` or `Operator`
+        Operator that evaluates the same expression as ``op`` without
+        allocating temporaries in in-place calls.
+
+    Examples
+    --------
+    >>> r3 = odl.rn(3)
+    >>> A = odl.MatrixOperator([[1.0, 0, 0], [0, 2, 0], [0, 0, 3]])
+    >>> op = 2 * A + A * 3 - odl.IdentityOperator(r3)
+    >>> compiled = odl.compile_operator(op)
+    >>> x = r3.element([1, 1, 1])
+    >>> out = r3.element()
+    >>> result = compiled(x, out=out)
+    >>> out
+    rn(3).element([  4.,   9.,  14.])
+    >>> op(x)
+    rn(3).element([  4.,   9.,  14.])
+    """
+    if isinstance(op, CompiledOperator):
+        return op
+    if not isinstance(op, Operator):
+        raise TypeError('`op` {!r} is not an `Operator` instance'
+                        ''.format(op))
+    if not isinstance(op.range, LinearSpace):
+        return op
+    return CompiledOperator(op)
+
+
+class CompiledOperator(Operator):
+
+    """Operator evaluating a compiled operator expression.
+
+    Instances should be created with `compile_operator`. All temporaries
+    are allocated when the operator is created, hence in-place evaluation
+    ``op(x, out=out)`` does not allocate new space elements, except for
+    allocations done by the non-expression operators that form the leaves
+    of the expression.
+    """
+
+    def __init__(self, operator):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        operator : `Operator`
+            Operator expression to compile. Its `Operator.range` must be
+            a `LinearSpace`.
+        """
+        if not isinstance(operator.range, LinearSpace):
+            raise TypeError('`operator.range` {!r} is not a `LinearSpace`'
+                            ''.format(operator.range))
+        super(CompiledOperator, self).__init__(
+            operator.domain, operator.range, linear=operator.is_linear)
+        self.__operator = operator
+        self.__root = _LinCombNode(operator.range, *_compile(operator))
+        self.__adjoint = None
+
+    @property
+    def operator(self):
+        """The compiled operator expression."""
+        return self.__operator
+
+    @property
+    def num_temporaries(self):
+        """Number of preallocated temporary space elements."""
+        return self.__root.num_temporaries
+
+    def _call(self, x, out):
+        """Implement ``self(x, out)``."""
+        self.__root(x, out)
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``."""
+        self.operator.batch_call(x, out=out, **kwargs)
+
+    @property
+    def adjoint(self):
+        """Compiled adjoint of the operator expression."""
+        if self.__adjoint is None:
+            self.__adjoint = compile_operator(self.operator.adjoint)
+        return self.__adjoint
+
+    @property
+    def inverse(self):
+        """Compiled inverse of the operator expression."""
+        return compile_operator(self.operator.inverse)
+
+    def derivative(self, point):
+        """Return the derivative of the operator expression at ``point``.
+
+        For linear operators, this is the operator itself.
+        """
+        if self.is_linear:
+            return self
+        else:
+            return self.operator.derivative(point)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}({!r})'.format(self.__class__.__name__, self.operator)
+
+    def __str__(self):
+        """Return ``str(self)``."""
+        return '{}({})'.format(self.__class__.__name__, self.operator)
+
+
+# --- Compilation --- #
+
+
+# Expressions are compiled into a "linear combination form"
+# ``(terms, vector)``, representing ``sum(c * node(x) for c, node in terms)
+# + vector``. A node ``None`` stands for the identity, ``vector`` may be
+# ``None``.
+
+
+def _compile(op):
+    """Return the linear combination form of ``op``."""
+    if not isinstance(op.range, LinearSpace):
+        # No temporaries possible, use as opaque leaf
+        return [(1, _LeafNode(op))], None
+
+    if isinstance(op, ScalingOperator):
+        return [(op.scalar, None)], None
+
+    elif isinstance(op, OperatorSum):
+        left_terms, left_vec = _compile(op.left)
+        right_terms, right_vec = _compile(op.right)
+        return (left_terms + right_terms,
+                _add_vectors(left_vec, right_vec))
+
+    elif isinstance(op, OperatorVectorSum):
+        terms, vector = _compile(op.operator)
+        return terms, _add_vectors(vector, op.vector)
+
+    elif isinstance(op, OperatorLeftScalarMult):
+        terms, vector = _compile(op.operator)
+        terms = [(op.scalar * c, node) for c, node in terms]
+        if vector is not None:
+            vector = op.scalar * vector
+        return terms, vector
+
+    elif isinstance(op, OperatorRightScalarMult):
+        return _compile_comp(op.operator, [(op.scalar, None)], None,
+                             op.domain)
+
+    elif isinstance(op, OperatorComp):
+        if not isinstance(op.right.range, LinearSpace):
+            return [(1, _LeafNode(op))], None
+        right_terms, right_vec = _compile(op.right)
+        return _compile_comp(op.left, right_terms, right_vec,
+                             op.right.range)
+
+    elif isinstance(op, OperatorPointwiseProduct):
+        left_coeff, left_node = _split(op.range, *_compile(op.left))
+        right_coeff, right_node = _split(op.range, *_compile(op.right))
+        node = _ProductNode(op.range, left_node, right_node)
+        return [(left_coeff * right_coeff, node)], None
+
+    elif isinstance(op, OperatorLeftVectorMult):
+        coeff, node = _split(op.range, *_compile(op.operator))
+        return [(coeff, _ProductNode(op.range, node, op.vector))], None
+
+    elif isinstance(op, OperatorRightVectorMult):
+        node = _ProductNode(op.domain, None, op.vector)
+        return _compile_comp(op.operator, [(1, node)], None, op.domain)
+
+    else:
+        return [(1, _LeafNode(op))], None
+
+
+def _compile_comp(left, right_terms, right_vec, space):
+    """Return the linear combination form of ``left(right(x))``.
+
+    ``space`` is the intermediate space ``right.range == left.domain``.
+    """
+    right_coeff, right_node = _split(space, right_terms, right_vec)
+    left_coeff, left_node = _split(left.range, *_compile(left))
+    if left_node is None:
+        # Scaled identity, no intermediate result needed
+        return [(left_coeff * right_coeff, right_node)], None
+
+    if left.is_linear:
+        # Pull the scaling through `left`
+        coeff, scale = left_coeff * right_coeff, 1
+    else:
+        coeff, scale = left_coeff, right_coeff
+
+    if right_node is None and scale == 1:
+        # Composition with the identity
+        return [(coeff, left_node)], None
+    else:
+        return [(coeff, _CompNode(space, left_node, right_node, scale))], None
+
+
+def _split(space, terms, vector):
+    """Return ``(coeff, node)`` for a linear combination form.
+
+    The node is ``None`` for a scaled identity. Proper linear combinations
+    are wrapped into a `_LinCombNode`.
+    """
+    if len(terms) == 1 and vector is None:
+        return terms[0]
+    else:
+        return 1, _LinCombNode(space, terms, vector)
+
+
+def _add_vectors(vec1, vec2):
+    """Return ``vec1 + vec2``, where ``None`` is treated as zero."""
+    if vec1 is None:
+        return vec2
+    elif vec2 is None:
+        return vec1
+    else:
+        return vec1 + vec2
+
+
+# --- Evaluation nodes --- #
+
+
+# A node is called as ``node(x, out)`` and writes its result to ``out``.
+# Each node owns its temporaries, so nested nodes never share them.
+
+
+class _LeafNode(object):
+
+    """Node evaluating an operator that is not compiled any further."""
+
+    num_temporaries = 0
+
+    def __init__(self, op):
+        self.op = op
+
+    def __call__(self, x, out):
+        self.op._call_trusted(x, out=out)
+
+
+class _LinCombNode(object):
+
+    """Node evaluating ``sum(c * node(x) for c, node in terms) + vector``."""
+
+    def __init__(self, space, terms, vector=None):
+        self.space = space
+        self.vector = vector
+
+        # Merge all identity terms into one coefficient
+        self.ident_coeff = None
+        self.terms = []
+        for coeff, node in terms:
+            if node is not None:
+                self.terms.append((coeff, node))
+            elif self.ident_coeff is None:
+                self.ident_coeff = coeff
+            else:
+                self.ident_coeff += coeff
+
+        if self.ident_coeff is None and not self.terms:
+            raise ValueError('empty linear combination')
+
+        # One temporary for all terms except the one written to `out`
+        if (len(self.terms) > 1 or
+                (self.ident_coeff is not None and self.terms)):
+            self.tmp = space.element()
+        else:
+            self.tmp = None
+        # Used when `x` and `out` are aliased, created on demand
+        self.scratch = None
+
+    @property
+    def num_temporaries(self):
+        return (int(self.tmp is not None) + int(self.scratch is not None) +
+                sum(node.num_temporaries for _, node in self.terms))
+
+    def __call__(self, x, out):
+        if self.ident_coeff is None and len(self.terms) == 1:
+            # Single scaled term, can be aliased safely
+            coeff, node = self.terms[0]
+            node(x, out)
+            if coeff != 1:
+                out.lincomb(coeff, out)
+            if self.vector is not None:
+                out += self.vector
+            return
+
+        if out is x:
+            if self.scratch is None:
+                self.scratch = self.space.element()
+            acc = self.scratch
+        else:
+            acc = out
+
+        terms = self.terms
+        if self.ident_coeff is not None:
+            if terms:
+                coeff, node = terms[0]
+                node(x, self.tmp)
+                acc.lincomb(self.ident_coeff, x, coeff, self.tmp)
+                terms = terms[1:]
+            else:
+                acc.lincomb(self.ident_coeff, x)
+        else:
+            # At least 2 terms, fuse scaling of the first into the second
+            coeff0, node0 = terms[0]
+            coeff1, node1 = terms[1]
+            node0(x, acc)
+            node1(x, self.tmp)
+            acc.lincomb(coeff0, acc, coeff1, self.tmp)
+            terms = terms[2:]
+
+        for coeff, node in terms:
+            node(x, self.tmp)
+            acc.lincomb(1, acc, coeff, self.tmp)
+
+        if self.vector is not None:
+            acc += self.vector
+
+        if acc is not out:
+            out.assign(acc)
+
+
+class _CompNode(object):
+
+    """Node evaluating ``left(scale * right(x))``."""
+
+    def __init__(self, space, left, right, scale=1):
+        self.left = left
+        self.right = right
+        self.scale = scale
+        self.tmp = space.element()
+
+    @property
+    def num_temporaries(self):
+        right_tmps = 0 if self.right is None else self.right.num_temporaries
+        return 1 + self.left.num_temporaries + right_tmps
+
+    def __call__(self, x, out):
+        if self.right is None:
+            self.tmp.lincomb(self.scale, x)
+        else:
+            self.right(x, self.tmp)
+            if self.scale != 1:
+                self.tmp.lincomb(self.scale, self.tmp)
+        self.left(self.tmp, out)
+
+
+class _ProductNode(object):
+
+    """Node evaluating ``left(x) * right(x)``.
+
+    ``left`` and ``right`` are nodes, where ``None`` stands for the
+    identity. ``right`` can also be a fixed space element.
+    """
+
+    def __init__(self, space, left, right):
+        self.space = space
+        self.left = left
+        self.right = right
+        self.right_is_node = not (right is None or
+                                  isinstance(right, LinearSpaceElement))
+        self.tmp = space.element() if self.right_is_node else None
+        # Used when `x` and `out` are aliased, created on demand
+        self.scratch = None
+
+    @property
+    def num_temporaries(self):
+        ntmps = int(self.tmp is not None) + int(self.scratch is not None)
+        if self.left is not None:
+            ntmps += self.left.num_temporaries
+        if self.right_is_node:
+            ntmps += self.right.num_temporaries
+        return ntmps
+
+    def __call__(self, x, out):
+        if out is x and self.left is not None:
+            if self.scratch is None:
+                self.scratch = self.space.element()
+            acc = self.scratch
+        else:
+            acc = out
+
+        if self.right is None:
+            factor = x
+        elif self.right_is_node:
+            self.right(x, self.tmp)
+            factor = self.tmp
+        else:
+            factor = self.right
+
+        if self.left is None:
+            self.space.multiply(x, factor, out=acc)
+        else:
+            self.left(x, acc)
+            self.space.multiply(acc, factor, out=acc)
+
+        if acc is not out:
+            out.assign(acc)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -80,6 +80,10 @@ class ScalingOperator(Operator):
             out.lincomb(self.scalar, x)
         return out
 
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)`` in a single multiplication."""
+        np.multiply(x, self.scalar, out=out)
+
     @property
     def inverse(self):
         """Return the inverse operator.
@@ -15,8 +15,11 @@ import sys
 from builtins import object
 from numbers import Integral, Number
 
-from odl.set import Field, LinearSpace, Set
+import numpy as np
+
+from odl.set import Field, LinearSpace, RealNumbers, Set
 from odl.set.space import LinearSpaceElement
+from odl.util.buffer_pool import acquire_element, release_element
 
 __all__ = (
     'Operator',
@@ -409,6 +412,10 @@ class Operator(object):
                 cls._call_in_place = cls._call
                 cls._call_out_of_place = _default_call_out_of_place
 
+        # Subclasses overriding `__call__` must not be bypassed by the
+        # `_call_trusted` fast path
+        cls._has_custom_call = cls.__call__ is not Operator.__call__
+
         return object.__new__(cls)
 
     def __init__(self, domain, range, linear=False):
@@ -636,6 +643,7 @@ class Operator(object):
         See Also
         --------
         _call : Implementation of the method
+        _call_trusted : Evaluation without argument checks
         """
         if x not in self.domain:
             try:
@@ -645,12 +653,55 @@ class Operator(object):
                     'unable to cast {!r} to an element of '
                     'the domain {!r}'.format(x, self.domain))
 
-        if out is not None:  # In-place evaluation
-            if out not in self.range:
-                raise OpRangeError('`out` {!r} not an element of the range '
-                                   '{!r} of {!r}'
-                                   ''.format(out, self.range, self))
+        if out is not None and out not in self.range:
+            raise OpRangeError('`out` {!r} not an element of the range '
+                               '{!r} of {!r}'
+                               ''.format(out, self.range, self))
+
+        return self.__evaluate(x, out, **kwargs)
+
+    def _call_trusted(self, x, out=None, **kwargs):
+        """Return ``self(x[, out, **kwargs])`` without checking arguments.
+
+        This is the internal fast path for callers that guarantee that
+        ``x`` is an element of `domain` and ``out`` is ``None`` or an
+        element of `range`. Composite operators, whose parts are checked
+        for compatibility on construction, use it to evaluate their parts,
+        such that the membership checks are done only once in the
+        outermost call. The result is still validated.
 
+        Parameters
+        ----------
+        x : `domain` element
+            Point in which to evaluate the operator. It is not converted.
+        out : `range` element, optional
+            Element to which the result is written.
+        kwargs :
+            Passed on to the underlying implementation in `_call`.
+
+        Returns
+        -------
+        out : `range` element
+            Result of the operator evaluation.
+
+        Examples
+        --------
+        >>> op = odl.ScalingOperator(odl.rn(3), 2.0)
+        >>> x = op.domain.element([1, 2, 3])
+        >>> op._call_trusted(x)
+        rn(3).element([ 2.,  4.,  6.])
+        """
+        if self._has_custom_call:
+            if out is None:
+                return self(x, **kwargs)
+            else:
+                return self(x, out=out, **kwargs)
+
+        return self.__evaluate(x, out, **kwargs)
+
+    def __evaluate(self, x, out, **kwargs):
+        """Evaluate the operator and validate the result."""
+        if out is not None:  # In-place evaluation
             if self.is_functional:
                 raise TypeError('`out` parameter cannot be used '
                                 'when range is a field')
@@ -674,6 +725,95 @@ class Operator(object):
                         'the range {!r}'.format(out, self.range))
         return out
 
+    def batch_call(self, x, out=None, **kwargs):
+        """Return ``self`` applied to each entry of a stack of inputs.
+
+        The inputs and outputs are stacked along a new first axis, i.e.,
+        ``out[i]`` is the result of ``self(x[i])``. Subclasses can provide
+        a vectorized implementation by overriding `_batch_call`, the
+        default evaluates the operator in a loop.
+
+        Parameters
+        ----------
+        x : `array-like`
+            Stack of inputs of shape ``(N,) + domain.shape``.
+        out : `numpy.ndarray`, optional
+            Array of shape ``(N,) + range.shape`` to which the results
+            are written. For functionals, the shape is ``(N,)``.
+        kwargs :
+            Passed on to the underlying implementation in `_batch_call`.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Stack of results. If ``out`` was provided, the returned
+            object is a reference to it.
+
+        Examples
+        --------
+        >>> op = odl.ScalingOperator(odl.rn(3), 2.0)
+        >>> op.batch_call([[1, 2, 3],
+        ...                [4, 5, 6]])
+        array([[  2.,   4.,   6.],
+               [  8.,  10.,  12.]])
+
+        Functionals produce one value per input:
+
+        >>> func = odl.solvers.L1Norm(odl.rn(3))
+        >>> func.batch_call([[1, -2, 3],
+        ...                  [0, 0, -1]])
+        array([ 6.,  1.])
+        """
+        try:
+            dom_shape = tuple(self.domain.shape)
+        except AttributeError:
+            raise TypeError('batched evaluation requires a domain with '
+                            '`shape`, got {!r}'.format(self.domain))
+        try:
+            x = np.asarray(x, dtype=self.domain.dtype)
+        except AttributeError:
+            x = np.asarray(x)
+        if x.shape[1:] != dom_shape:
+            raise OpDomainError(
+                'expected input of shape (N,) + {}, got {}'
+                ''.format(dom_shape, x.shape))
+
+        if self.is_functional:
+            out_shape = (x.shape[0],)
+            out_dtype = float if self.range == RealNumbers() else complex
+        else:
+            out_shape = (x.shape[0],) + tuple(self.range.shape)
+            out_dtype = self.range.dtype
+
+        if out is None:
+            out = np.empty(out_shape, dtype=out_dtype)
+        elif not isinstance(out, np.ndarray) or out.shape != out_shape:
+            raise OpRangeError(
+                '`out` must be a `numpy.ndarray` of shape {}, got {!r}'
+                ''.format(out_shape, out))
+
+        self._batch_call(x, out, **kwargs)
+        return out
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out[, **kwargs])``.
+
+        The default implementation evaluates the operator once per entry.
+        Operators whose evaluation can be vectorized over an additional
+        leading axis should override this method.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Stack of inputs, shape ``(N,) + domain.shape``.
+        out : `numpy.ndarray`
+            Array to which the stacked results are written.
+        kwargs :
+            Passed on to the operator evaluation.
+        """
+        for i in range(x.shape[0]):
+            out[i] = self(x[i], **kwargs)
+
     def norm(self, estimate=False, **kwargs):
         """Return the operator norm of this operator.
 
@@ -1129,15 +1269,24 @@ class OperatorSum(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.left(x) + self.right(x)
+            return self.left._call_trusted(x) + self.right._call_trusted(x)
         else:
             tmp = (self.__tmp_ran if self.__tmp_ran is not None
-                   else self.range.element())
+                   else acquire_element(self.range))
             # Write to `tmp` first, otherwise aliased `x` and `out` lead
             # to wrong result
-            self.left(x, out=tmp)
-            self.right(x, out=out)
+            self.left._call_trusted(x, out=tmp)
+            self.right._call_trusted(x, out=out)
             out += tmp
+            if tmp is not self.__tmp_ran:
+                release_element(tmp)
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``."""
+        # Evaluate `left` first to allow aliased `x` and `out`
+        tmp = self.left.batch_call(x, **kwargs)
+        self.right.batch_call(x, out=out, **kwargs)
+        out += tmp
 
     def derivative(self, x):
         """Return the operator derivative at ``x``.
@@ -1246,9 +1395,9 @@ class OperatorVectorSum(Operator):
     def _call(self, x, out=None):
         """Evaluate the residual at ``x`` and write to ``out`` if given."""
         if out is None:
-            out = self.operator(x)
+            out = self.operator._call_trusted(x)
         else:
-            self.operator(x, out=out)
+            self.operator._call_trusted(x, out=out)
 
         out += self.vector
         return out
@@ -1341,12 +1490,24 @@ class OperatorComp(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.left(self.right(x))
+            return self.left._call_trusted(self.right._call_trusted(x))
         else:
             tmp = (self.__tmp if self.__tmp is not None
-                   else self.right.range.element())
-            self.right(x, out=tmp)
-            return self.left(tmp, out=out)
+                   else acquire_element(self.right.range))
+            self.right._call_trusted(x, out=tmp)
+            self.left._call_trusted(tmp, out=out)
+            if tmp is not self.__tmp:
+                release_element(tmp)
+            return out
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``."""
+        if not hasattr(self.right.range, 'shape'):
+            # Intermediate results cannot be stacked, e.g., scalars in a
+            # field; use the default implementation
+            return super(OperatorComp, self)._batch_call(x, out, **kwargs)
+        self.left.batch_call(self.right.batch_call(x, **kwargs), out=out,
+                             **kwargs)
 
     @property
     def inverse(self):
@@ -1470,13 +1631,13 @@ class OperatorPointwiseProduct(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.left(x) * self.right(x)
+            return self.left._call_trusted(x) * self.right._call_trusted(x)
         else:
             tmp = self.right.range.element()
             # Write to `tmp` first, otherwise aliased `x` and `out` lead
             # to wrong result
-            self.left(x, out=tmp)
-            self.right(x, out=out)
+            self.left._call_trusted(x, out=tmp)
+            self.right._call_trusted(x, out=out)
             out *= tmp
 
     def derivative(self, x):
@@ -1562,11 +1723,16 @@ class OperatorLeftScalarMult(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.scalar * self.operator(x)
+            return self.scalar * self.operator._call_trusted(x)
         else:
-            self.operator(x, out=out)
+            self.operator._call_trusted(x, out=out)
             out *= self.scalar
 
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``."""
+        self.operator.batch_call(x, out=out, **kwargs)
+        out *= self.scalar
+
     @property
     def inverse(self):
         """Inverse of this operator.
@@ -1733,14 +1899,20 @@ class OperatorRightScalarMult(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.operator(self.scalar * x)
+            return self.operator._call_trusted(self.scalar * x)
         else:
             if self.__tmp is not None:
                 tmp = self.__tmp
             else:
-                tmp = self.domain.element()
+                tmp = acquire_element(self.domain)
             tmp.lincomb(self.scalar, x)
-            self.operator(tmp, out=out)
+            self.operator._call_trusted(tmp, out=out)
+            if tmp is not self.__tmp:
+                release_element(tmp)
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``."""
+        self.operator.batch_call(self.scalar * x, out=out, **kwargs)
 
     def __mul__(self, other):
         """Implement ``self * other``.
@@ -1903,9 +2075,9 @@ class FunctionalLeftVectorMult(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.vector * self.functional(x)
+            return self.vector * self.functional._call_trusted(x)
         else:
-            scalar = self.functional(x)
+            scalar = self.functional._call_trusted(x)
             out.lincomb(scalar, self.vector)
 
     def derivative(self, x):
@@ -1997,9 +2169,9 @@ class OperatorLeftVectorMult(Operator):
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
-            return self.operator(x) * self.vector
+            return self.operator._call_trusted(x) * self.vector
         else:
-            self.operator(x, out=out)
+            self.operator._call_trusted(x, out=out)
             out *= self.vector
 
     @property
@@ -2121,7 +2293,7 @@ class OperatorRightVectorMult(Operator):
         else:
             tmp = self.domain.element()
             x.multiply(self.vector, out=tmp)
-            self.operator(tmp, out=out)
+            self.operator._call_trusted(tmp, out=out)
 
     @property
     def inverse(self):
@@ -1,4 +1,4 @@
-# Copyright 2014-2019 The ODL contributors
+# Copyright 2014-2020 The ODL contributors
 #
 # This file is part of ODL.
 #
@@ -14,8 +14,9 @@ import numpy as np
 
 from odl.operator.operator import Operator
 from odl.operator.default_ops import ZeroOperator
+from odl.set.space import LinearSpaceElement
 from odl.space import ProductSpace
-from odl.util import COOMatrix
+from odl.util import COOMatrix, parallel_map
 
 
 __all__ = ('ProductSpaceOperator',
@@ -23,6 +24,64 @@ __all__ = ('ProductSpaceOperator',
            'BroadcastOperator', 'ReductionOperator', 'DiagonalOperator')
 
 
+def _operator_instances(op, found=None):
+    """Return the ids of ``op`` and of all instances it is built from.
+
+    Sub-operators are collected from the attributes of ``op``, including
+    sequences and operator matrices. Space elements stored by an operator,
+    e.g. preallocated temporaries, are collected as well. ``op`` may also
+    be a sequence of operators.
+    """
+    if found is None:
+        found = set()
+
+    stack = [op]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Operator):
+            if id(value) not in found:
+                found.add(id(value))
+                stack.extend(getattr(value, '__dict__', {}).values())
+        elif isinstance(value, LinearSpaceElement):
+            found.add(id(value))
+        elif isinstance(value, COOMatrix):
+            stack.extend(value.data)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return found
+
+
+def _thread_groups(ops):
+    """Return groups of indices of ``ops`` that can run concurrently.
+
+    Operators can hold state such as preallocated temporaries, hence
+    two operators that share an instance, directly or as part of their
+    building blocks, are put into the same group. An entry of ``ops`` can
+    also be a sequence of operators that are evaluated together. Each
+    group is sorted, and the groups are ordered by their first index.
+    """
+    group_of = {}  # operator id -> group id
+    groups = []
+    for k, op in enumerate(ops):
+        shared = sorted(set(group_of[i] for i in _operator_instances(op)
+                            if i in group_of))
+        if shared:
+            target = shared[0]
+            for other in shared[1:]:
+                groups[target].extend(groups[other])
+                groups[other] = []
+                for key, value in group_of.items():
+                    if value == other:
+                        group_of[key] = target
+        else:
+            target = len(groups)
+            groups.append([])
+        groups[target].append(k)
+        for i in _operator_instances(op):
+            group_of[i] = target
+    return [sorted(group) for group in groups if group]
+
+
 class ProductSpaceOperator(Operator):
 
     r"""A "matrix of operators" on product spaces.
@@ -89,7 +148,7 @@ class ProductSpaceOperator(Operator):
     DiagonalOperator : Case where the 'matrix' is diagonal.
     """
 
-    def __init__(self, operators, domain=None, range=None):
+    def __init__(self, operators, domain=None, range=None, num_threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -104,6 +163,14 @@ class ProductSpaceOperator(Operator):
             Range of the operator. If not provided, it is tried to be
             inferred from the operators. This requires each **row**
             to contain at least one operator.
+        num_threads : positive int, optional
+            Number of threads used to evaluate the sub-operators
+            concurrently. The results in each row are summed in the
+            order of the sub-operators, hence results do not depend
+            on this value. ``None`` means serial evaluation.
+            Sub-operators that share an operator instance, e.g., a
+            `CompiledOperator` with preallocated temporaries, are
+            evaluated one after the other in the same thread.
 
         Examples
         --------
@@ -230,6 +297,14 @@ class ProductSpaceOperator(Operator):
 
             range = ProductSpace(*ranges)
 
+        if num_threads is not None:
+            num_threads = int(num_threads)
+            if num_threads < 1:
+                raise ValueError('`num_threads` must be positive, got {}'
+                                 ''.format(num_threads))
+        self.__num_threads = num_threads
+        self.__thread_groups = None
+
         # Set linearity
         linear = all(op.is_linear for op in self.__ops.data)
 
@@ -298,22 +373,31 @@ class ProductSpaceOperator(Operator):
         """The sparse operator matrix representing this operator."""
         return self.__ops
 
+    @property
+    def num_threads(self):
+        """Number of threads for evaluating sub-operators, or ``None``."""
+        return self.__num_threads
+
     def _call(self, x, out=None):
         """Call the operators on the parts of ``x``."""
+        if (self.num_threads is not None and self.num_threads > 1 and
+                len(self.ops.data) > 1 and out is not x):
+            return self._call_parallel(x, out)
+
         # TODO: add optimization in case an operator appears repeatedly in a
         # row
         if out is None:
             out = self.range.zero()
             for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
-                out[i] += op(x[j])
+                out[i] += op._call_trusted(x[j])
         else:
             has_evaluated_row = np.zeros(len(self.range), dtype=bool)
             for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
                 if not has_evaluated_row[i]:
-                    op(x[j], out=out[i])
+                    op._call_trusted(x[j], out=out[i])
                 else:
                     # TODO: optimize
-                    out[i] += op(x[j])
+                    out[i] += op._call_trusted(x[j])
 
                 has_evaluated_row[i] = True
 
@@ -323,6 +407,52 @@ class ProductSpaceOperator(Operator):
 
         return out
 
+    def _call_parallel(self, x, out):
+        """Evaluate the sub-operators concurrently and sum up in order.
+
+        The first operator of each row writes into ``out``, the others
+        return new elements that are added afterwards, in the same order
+        as in the serial evaluation.
+        """
+        if out is None:
+            out = self.range.element()
+
+        entries = list(zip(self.ops.row, self.ops.col, self.ops.data))
+        first_in_row = {}
+        for k, (i, _, _) in enumerate(entries):
+            first_in_row.setdefault(i, k)
+
+        if self.__thread_groups is None:
+            self.__thread_groups = _thread_groups(self.ops.data)
+
+        def evaluate(k):
+            i, j, op = entries[k]
+            if first_in_row[i] == k:
+                op._call_trusted(x[j], out=out[i])
+                return None
+            else:
+                return op._call_trusted(x[j])
+
+        def evaluate_group(group):
+            return [(k, evaluate(k)) for k in group]
+
+        results = [None] * len(entries)
+        for group_results in parallel_map(evaluate_group,
+                                          self.__thread_groups,
+                                          self.num_threads):
+            for k, result in group_results:
+                results[k] = result
+
+        for (i, _, _), result in zip(entries, results):
+            if result is not None:
+                out[i] += result
+
+        for i in range(len(self.range)):
+            if i not in first_in_row:
+                out[i].set_zero()
+
+        return out
+
     def derivative(self, x):
         """Derivative of the product space operator.
 
@@ -394,7 +524,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.row, self.ops.col]
         shape = self.ops.shape
         deriv_matrix = COOMatrix(data, indices, shape)
-        return ProductSpaceOperator(deriv_matrix, self.domain, self.range)
+        return ProductSpaceOperator(deriv_matrix, self.domain, self.range,
+                                    num_threads=self.num_threads)
 
     @property
     def adjoint(self):
@@ -443,7 +574,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.col, self.ops.row]  # Swap col/row -> transpose
         shape = (self.ops.shape[1], self.ops.shape[0])
         adj_matrix = COOMatrix(data, indices, shape)
-        return ProductSpaceOperator(adj_matrix, self.range, self.domain)
+        return ProductSpaceOperator(adj_matrix, self.range, self.domain,
+                                    num_threads=self.num_threads)
 
     def __getitem__(self, index):
         """Get sub-operator by index.
@@ -743,7 +875,7 @@ class BroadcastOperator(Operator):
     DiagonalOperator : Case where each operator should have its own argument.
     """
 
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance
 
         Parameters
@@ -752,6 +884,9 @@ class BroadcastOperator(Operator):
             The individual operators that should be evaluated.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        num_threads : positive int, optional
+            Number of threads used to evaluate the operators concurrently.
+            ``None`` means serial evaluation.
 
         Examples
         --------
@@ -785,8 +920,14 @@ class BroadcastOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        num_threads = kwargs.pop('num_threads', None)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments: {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([[op] for op in operators])
+        self.__prod_op = ProductSpaceOperator([[op] for op in operators],
+                                              num_threads=num_threads)
         super(BroadcastOperator, self).__init__(
             self.prod_op.domain[0], self.prod_op.range,
             linear=self.prod_op.is_linear)
@@ -796,6 +937,11 @@ class BroadcastOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    @property
+    def num_threads(self):
+        """Number of threads for evaluating the operators, or ``None``."""
+        return self.prod_op.num_threads
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -858,7 +1004,8 @@ class BroadcastOperator(Operator):
         ])
         """
         return BroadcastOperator(*[op.derivative(x) for op in
-                                   self.operators])
+                                   self.operators],
+                                 num_threads=self.num_threads)
 
     @property
     def adjoint(self):
@@ -875,7 +1022,8 @@ class BroadcastOperator(Operator):
         >>> op.adjoint([[1, 2, 3], [2, 3, 4]])
         rn(3).element([  5.,   8.,  11.])
         """
-        return ReductionOperator(*[op.adjoint for op in self.operators])
+        return ReductionOperator(*[op.adjoint for op in self.operators],
+                                 num_threads=self.num_threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -914,7 +1062,7 @@ class ReductionOperator(Operator):
     SeparableSum : Corresponding construction for functionals.
     """
 
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance.
 
         Parameters
@@ -923,6 +1071,10 @@ class ReductionOperator(Operator):
             The individual operators that should be evaluated and summed.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        num_threads : positive int, optional
+            Number of threads used to evaluate the operators concurrently.
+            The results are summed in the order of the operators.
+            ``None`` means serial evaluation.
 
         Examples
         --------
@@ -962,8 +1114,14 @@ class ReductionOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        num_threads = kwargs.pop('num_threads', None)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments: {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([operators])
+        self.__prod_op = ProductSpaceOperator([operators],
+                                              num_threads=num_threads)
 
         super(ReductionOperator, self).__init__(
             self.prod_op.domain, self.prod_op.range[0],
@@ -974,6 +1132,11 @@ class ReductionOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    @property
+    def num_threads(self):
+        """Number of threads for evaluating the operators, or ``None``."""
+        return self.prod_op.num_threads
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -1044,7 +1207,8 @@ class ReductionOperator(Operator):
         rn(3).element([  9.,  14.,  19.])
         """
         return ReductionOperator(*[op.derivative(xi)
-                                   for op, xi in zip(self.operators, x)])
+                                   for op, xi in zip(self.operators, x)],
+                                 num_threads=self.num_threads)
 
     @property
     def adjoint(self):
@@ -1064,7 +1228,8 @@ class ReductionOperator(Operator):
             [ 2.,  4.,  6.]
         ])
         """
-        return BroadcastOperator(*[op.adjoint for op in self.operators])
+        return BroadcastOperator(*[op.adjoint for op in self.operators],
+                                 num_threads=self.num_threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -1214,7 +1379,8 @@ class DiagonalOperator(ProductSpaceOperator):
 
         derivs = [op.derivative(p) for op, p in zip(self.operators, point)]
         return DiagonalOperator(*derivs,
-                                domain=self.domain, range=self.range)
+                                domain=self.domain, range=self.range,
+                                num_threads=self.num_threads)
 
     @property
     def adjoint(self):
@@ -1243,7 +1409,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         adjoints = [op.adjoint for op in self.operators]
         return DiagonalOperator(*adjoints,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                num_threads=self.num_threads)
 
     @property
     def inverse(self):
@@ -1272,7 +1439,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         inverses = [op.inverse for op in self.operators]
         return DiagonalOperator(*inverses,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                num_threads=self.num_threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
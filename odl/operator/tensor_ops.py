@@ -226,6 +226,12 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
 
     def _call(self, f, out):
         """Implement ``self(f, out)``."""
+        if getattr(f, 'data', None) is not None:
+            # Contiguous vector field, reduce over all components at once
+            with writable_array(out) as out_arr:
+                self._batch_call(f.data[None], out_arr[None])
+            return
+
         if self.exponent == 1.0:
             self._call_vecfield_1(f, out)
         elif self.exponent == float('inf'):
@@ -233,6 +239,36 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
         else:
             self._call_vecfield_p(f, out)
 
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``.
+
+        The components are stacked along axis 1 of ``x``, hence the
+        reduction is done over that axis for all batch entries at once.
+        """
+        wshape = (1, len(self.domain)) + (1,) * (x.ndim - 2)
+        weights = self.weights.reshape(wshape)
+        absx = np.abs(x)
+        if self.exponent == 1.0:
+            if self.is_weighted:
+                absx *= weights
+            out[:] = np.sum(absx, axis=1)
+        elif self.exponent == float('inf'):
+            if self.is_weighted:
+                absx *= weights
+            out[:] = np.max(absx, axis=1)
+        elif len(self.domain) == 1:
+            if self.is_weighted:
+                absx *= weights ** (1 / self.exponent)
+            out[:] = absx[:, 0]
+        else:
+            if self.exponent == 2.0:
+                absx *= absx
+            else:
+                np.power(absx, self.exponent, out=absx)
+            if self.is_weighted:
+                absx *= weights
+            out[:] = np.power(np.sum(absx, axis=1), 1 / self.exponent)
+
     def _call_vecfield_1(self, vf, out):
         """Implement ``self(vf, out)`` for exponent 1."""
         vf[0].ufuncs.absolute(out=out)
@@ -521,6 +557,20 @@ class PointwiseInner(PointwiseInnerBase):
 
     def _call(self, vf, out):
         """Implement ``self(vf, out)``."""
+        if (getattr(vf, 'data', None) is not None and
+                getattr(self.vecfield, 'data', None) is not None):
+            # Contiguous vector fields, reduce over all components at once
+            wshape = (len(self.domain),) + (1,) * (vf.data.ndim - 1)
+            if self.domain.field == ComplexNumbers():
+                prod = vf.data * self.vecfield.data.conj()
+            else:
+                prod = vf.data * self.vecfield.data
+            if self.is_weighted:
+                prod *= self.weights.reshape(wshape)
+            with writable_array(out) as out_arr:
+                np.sum(prod, axis=0, out=out_arr)
+            return
+
         if self.domain.field == ComplexNumbers():
             vf[0].multiply(self._vecfield[0].conj(), out=out)
         else:
@@ -938,6 +988,20 @@ class MatrixOperator(Operator):
 
         return out
 
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)`` with one matrix product."""
+        # Lazy import to improve `import odl` time
+        import scipy.sparse
+
+        if scipy.sparse.isspmatrix(self.matrix):
+            # Sparse matrices only act on 1D spaces, i.e., ``x`` is 2D and
+            # the batch can be treated as a matrix of column vectors
+            out[:] = self.matrix.dot(x.T).T
+        else:
+            dot = np.tensordot(self.matrix, x, axes=(1, self.axis + 1))
+            # New axis ends up as first, need to move it behind the batch axis
+            out[:] = np.moveaxis(dot, 0, self.axis + 1)
+
     def __repr__(self):
         """Return ``repr(self)``."""
         # Lazy import to improve `import odl` time
@@ -13,6 +13,7 @@ from __future__ import absolute_import, division, print_function
 import numpy as np
 
 from odl.discr.discr_space import uniform_discr_fromdiscr
+from odl.util import npy_random_seed
 from odl.util.numerics import resize_array
 
 __all__ = (
@@ -20,6 +21,8 @@ __all__ = (
     'defrise',
     'ellipsoid_phantom',
     'indicate_proj_axis',
+    'random_ellipsoids',
+    'random_ellipsoid_phantoms',
     'smooth_cuboid',
     'tgv_phantom',
 )
@@ -314,267 +317,146 @@ def indicate_proj_axis(space, scale_structures=0.5):
     return space.element(phan)
 
 
-def _getshapes_2d(center, max_radius, shape):
-    """Calculate indices and slices for the bounding box of a disk."""
-    index_mean = shape * center
-    index_radius = max_radius / 2.0 * np.array(shape)
+# Approximate number of grid points rasterized at once
+_RASTER_BLOCK_SIZE = 2 ** 20
 
-    # Avoid negative indices
-    min_idx = np.maximum(np.floor(index_mean - index_radius), 0).astype(int)
-    max_idx = np.ceil(index_mean + index_radius).astype(int)
-    idx = [slice(minx, maxx) for minx, maxx in zip(min_idx, max_idx)]
-    shapes = [(idx[0], slice(None)),
-              (slice(None), idx[1])]
-    return tuple(idx), tuple(shapes)
 
+def _ellipsoid_quadratic_form(ellip, ndim):
+    """Return value, center, form matrix and half extents of an ellipsoid.
 
-def _ellipse_phantom_2d(space, ellipses):
-    """Create a phantom of ellipses in 2d space.
-
-    Parameters
-    ----------
-    space : `DiscretizedSpace`
-        Uniformly discretized space in which the phantom should be generated.
-        If ``space.shape`` is 1 in an axis, a corresponding slice of the
-        phantom is created (instead of squashing the whole phantom into the
-        slice).
-    ellipses : list of lists
-        Each row should contain the entries ::
-
-            'value',
-            'axis_1', 'axis_2',
-            'center_x', 'center_y',
-            'rotation'
-
-        The provided ellipses need to be specified relative to the
-        reference rectangle ``[-1, -1] x [1, 1]``. Angles are to be given
-        in radians.
-
-    Returns
-    -------
-    phantom : ``space`` element
-        2D ellipse phantom in ``space``.
-
-    See Also
-    --------
-    shepp_logan : The typical use-case for this function.
+    A point ``x`` lies in the ellipsoid if and only if
+    ``(x - center)^T A (x - center) <= 1``. The half extents are the
+    distances from the center to the faces of the tightest axis-aligned
+    bounding box, given by ``sqrt(diag(A^{-1}))``.
     """
-    # Blank image
-    p = np.zeros(space.shape, dtype=space.dtype)
-
-    minp = space.grid.min_pt
-    maxp = space.grid.max_pt
-
-    # Create the pixel grid
-    grid_in = space.grid.meshgrid
-
-    # move points to [-1, 1]
-    grid = []
-    for i in range(2):
-        mean_i = (minp[i] + maxp[i]) / 2.0
-        # Where space.shape = 1, we have minp = maxp, so we set diff_i = 1
-        # to avoid division by zero. Effectively, this allows constructing
-        # a slice of a 2D phantom.
-        diff_i = (maxp[i] - minp[i]) / 2.0 or 1.0
-        grid.append((grid_in[i] - mean_i) / diff_i)
-
-    for ellip in ellipses:
-        assert len(ellip) == 6
-
-        intensity = ellip[0]
-        a_squared = ellip[1] ** 2
-        b_squared = ellip[2] ** 2
-        x0 = ellip[3]
-        y0 = ellip[4]
-        theta = ellip[5]
-
-        scales = [1 / a_squared, 1 / b_squared]
-        center = (np.array([x0, y0]) + 1.0) / 2.0
-
-        # Create the offset x,y and z values for the grid
-        if theta != 0:
-            # Rotate the points to the expected coordinate system.
-            ctheta = np.cos(theta)
-            stheta = np.sin(theta)
-
-            mat = np.array([[ctheta, stheta],
-                            [-stheta, ctheta]])
-
-            # Calculate the points that could possibly be inside the volume
-            # Since the points are rotated, we cannot do anything directional
-            # without more logic
-            max_radius = np.sqrt(
-                np.abs(mat).dot([a_squared, b_squared]))
-            idx, shapes = _getshapes_2d(center, max_radius, space.shape)
-
-            subgrid = [g[idi] for g, idi in zip(grid, shapes)]
-            offset_points = [vec * (xi - x0i)[..., None]
-                             for xi, vec, x0i in zip(subgrid,
-                                                     mat.T,
-                                                     [x0, y0])]
-            rotated = offset_points[0] + offset_points[1]
-            np.square(rotated, out=rotated)
-            radius = np.dot(rotated, scales)
-        else:
-            # Calculate the points that could possibly be inside the volume
-            max_radius = np.sqrt([a_squared, b_squared])
-            idx, shapes = _getshapes_2d(center, max_radius, space.shape)
-
-            subgrid = [g[idi] for g, idi in zip(grid, shapes)]
-            squared_dist = [ai * (xi - x0i) ** 2
-                            for xi, ai, x0i in zip(subgrid,
-                                                   scales,
-                                                   [x0, y0])]
-
-            # Parentheses to get best order for broadcasting
-            radius = squared_dist[0] + squared_dist[1]
-
-        # Find the points within the ellipse
-        inside = radius <= 1
-
-        # Add the ellipse intensity to those points
-        p[idx][inside] += intensity
-
-    return space.element(p)
-
+    ellip = [float(e) for e in ellip]
+    if ndim == 2:
+        if len(ellip) != 6:
+            raise ValueError('ellipses in 2d need 6 entries, got {}'
+                             ''.format(len(ellip)))
+        value, axes, center = ellip[0], ellip[1:3], ellip[3:5]
+        ctheta, stheta = np.cos(ellip[5]), np.sin(ellip[5])
+        mat = np.array([[ctheta, stheta],
+                        [-stheta, ctheta]])
+    elif ndim == 3:
+        if len(ellip) != 10:
+            raise ValueError('ellipsoids in 3d need 10 entries, got {}'
+                             ''.format(len(ellip)))
+        value, axes, center = ellip[0], ellip[1:4], ellip[4:7]
+        cphi, sphi = np.cos(ellip[7]), np.sin(ellip[7])
+        ctheta, stheta = np.cos(ellip[8]), np.sin(ellip[8])
+        cpsi, spsi = np.cos(ellip[9]), np.sin(ellip[9])
+        mat = np.array([[cpsi * cphi - ctheta * sphi * spsi,
+                         cpsi * sphi + ctheta * cphi * spsi,
+                         spsi * stheta],
+                        [-spsi * cphi - ctheta * sphi * cpsi,
+                         -spsi * sphi + ctheta * cphi * cpsi,
+                         cpsi * stheta],
+                        [stheta * sphi,
+                         -stheta * cphi,
+                         ctheta]])
+    else:
+        raise ValueError('dimension not 2 or 3, no phantom available')
 
-def _getshapes_3d(center, max_radius, shape):
-    """Calculate indices and slices for the bounding box of a ball."""
-    index_mean = shape * center
-    index_radius = max_radius / 2.0 * np.array(shape)
+    axes_squared = np.square(axes)
+    form = mat.T.dot(mat / axes_squared[:, None])
+    half_extent = np.sqrt(np.square(mat).T.dot(axes_squared))
+    return value, np.array(center), form, half_extent
 
-    min_idx = np.floor(index_mean - index_radius).astype(int)
-    min_idx = np.maximum(min_idx, 0)  # avoid negative indices
-    max_idx = np.ceil(index_mean + index_radius).astype(int)
-    idx = [slice(minx, maxx) for minx, maxx in zip(min_idx, max_idx)]
-    shapes = [(idx[0], slice(None), slice(None)),
-              (slice(None), idx[1], slice(None)),
-              (slice(None), slice(None), idx[2])]
-    return tuple(idx), tuple(shapes)
 
+def _ellipsoid_phantom_array(grid, dtype, ellipsoids):
+    """Rasterize ellipsoids on a grid and return the array of values.
 
-def _ellipsoid_phantom_3d(space, ellipsoids):
-    """Create an ellipsoid phantom in 3d space.
+    The grid is processed in blocks along the first axis. In each block,
+    only the ellipsoids whose bounding box intersects the block are
+    evaluated, and only on the intersection. Within the bounding box, the
+    quadratic form is evaluated in Horner form along the last axis, with
+    all other terms computed on the lower-dimensional cross section.
 
     Parameters
     ----------
-    space : `DiscretizedSpace`
-        Space in which the phantom should be generated. If ``space.shape`` is
-        1 in an axis, a corresponding slice of the phantom is created
-        (instead of squashing the whole phantom into the slice).
-    ellipsoids : list of lists
-        Each row should contain the entries ::
-
-            'value',
-            'axis_1', 'axis_2', 'axis_3',
-            'center_x', 'center_y', 'center_z',
-            'rotation_phi', 'rotation_theta', 'rotation_psi'
-
-        The provided ellipsoids need to be specified relative to the
-        reference cube ``[-1, -1, -1] x [1, 1, 1]``. Angles are to be given
-        in radians.
+    grid : `RectGrid`
+        Grid on which the phantom is rasterized. It is mapped to the
+        reference cube ``[-1, 1]^ndim``.
+    dtype :
+        Data type of the returned array.
+    ellipsoids : sequence of sequences
+        Ellipsoid parameters as in `ellipsoid_phantom`.
 
     Returns
     -------
-    phantom : ``space`` element
-        3D ellipsoid phantom in ``space``.
-
-    See Also
-    --------
-    shepp_logan : The typical use-case for this function.
+    phantom : `numpy.ndarray`
+        Array of shape ``grid.shape`` with the sum of the ellipsoid values.
     """
-    # Blank volume
-    p = np.zeros(space.shape, dtype=space.dtype)
-
-    minp = space.grid.min_pt
-    maxp = space.grid.max_pt
-
-    # Create the pixel grid
-    grid_in = space.grid.meshgrid
-
-    # Move points to [-1, 1]
-    grid = []
-    for i in range(3):
-        mean_i = (minp[i] + maxp[i]) / 2.0
-        # Where space.shape = 1, we have minp = maxp, so we set diff_i = 1
-        # to avoid division by zero. Effectively, this allows constructing
-        # a slice of a 3D phantom.
-        diff_i = (maxp[i] - minp[i]) / 2.0 or 1.0
-        grid.append((grid_in[i] - mean_i) / diff_i)
-
+    ndim = grid.ndim
+    phantom = np.zeros(grid.shape, dtype=dtype)
+
+    # Move points to [-1, 1]. Where grid.shape = 1, we have min_pt = max_pt,
+    # so we set the half width to 1 to avoid division by zero. Effectively,
+    # this allows constructing a slice of the phantom.
+    coord_vecs = []
+    for cvec, minp, maxp in zip(grid.coord_vectors, grid.min_pt, grid.max_pt):
+        half_width = (maxp - minp) / 2.0 or 1.0
+        coord_vecs.append((cvec - (minp + maxp) / 2.0) / half_width)
+
+    # Bounding box index ranges, slightly enlarged such that boundary
+    # points are decided by the exact test below
+    shapes = []
     for ellip in ellipsoids:
-        assert len(ellip) == 10
-
-        intensity = ellip[0]
-        a_squared = ellip[1] ** 2
-        b_squared = ellip[2] ** 2
-        c_squared = ellip[3] ** 2
-        x0 = ellip[4]
-        y0 = ellip[5]
-        z0 = ellip[6]
-        phi = ellip[7]
-        theta = ellip[8]
-        psi = ellip[9]
-
-        scales = [1 / a_squared, 1 / b_squared, 1 / c_squared]
-        center = (np.array([x0, y0, z0]) + 1.0) / 2.0
-
-        # Create the offset x,y and z values for the grid
-        if any([phi, theta, psi]):
-            # Rotate the points to the expected coordinate system.
-            cphi = np.cos(phi)
-            sphi = np.sin(phi)
-            ctheta = np.cos(theta)
-            stheta = np.sin(theta)
-            cpsi = np.cos(psi)
-            spsi = np.sin(psi)
-
-            mat = np.array([[cpsi * cphi - ctheta * sphi * spsi,
-                             cpsi * sphi + ctheta * cphi * spsi,
-                             spsi * stheta],
-                            [-spsi * cphi - ctheta * sphi * cpsi,
-                             -spsi * sphi + ctheta * cphi * cpsi,
-                             cpsi * stheta],
-                            [stheta * sphi,
-                             -stheta * cphi,
-                             ctheta]])
-
-            # Calculate the points that could possibly be inside the volume
-            # Since the points are rotated, we cannot do anything directional
-            # without more logic
-            max_radius = np.sqrt(
-                np.abs(mat).dot([a_squared, b_squared, c_squared]))
-            idx, shapes = _getshapes_3d(center, max_radius, space.shape)
-
-            subgrid = [g[idi] for g, idi in zip(grid, shapes)]
-            offset_points = [vec * (xi - x0i)[..., None]
-                             for xi, vec, x0i in zip(subgrid,
-                                                     mat.T,
-                                                     [x0, y0, z0])]
-            rotated = offset_points[0] + offset_points[1] + offset_points[2]
-            np.square(rotated, out=rotated)
-            radius = np.dot(rotated, scales)
-        else:
-            # Calculate the points that could possibly be inside the volume
-            max_radius = np.sqrt([a_squared, b_squared, c_squared])
-            idx, shapes = _getshapes_3d(center, max_radius, space.shape)
-
-            subgrid = [g[idi] for g, idi in zip(grid, shapes)]
-            squared_dist = [ai * (xi - x0i) ** 2
-                            for xi, ai, x0i in zip(subgrid,
-                                                   scales,
-                                                   [x0, y0, z0])]
-
-            # Parentheses to get best order for broadcasting
-            radius = squared_dist[0] + (squared_dist[1] + squared_dist[2])
-
-        # Find the points within the ellipse
-        inside = radius <= 1
-
-        # Add the ellipse intensity to those points
-        p[idx][inside] += intensity
-
-    return space.element(p)
+        value, center, form, half_extent = _ellipsoid_quadratic_form(
+            ellip, ndim)
+        margin = 1e-10 * (1 + half_extent)
+        box = [(np.searchsorted(cvec, c - h - m, side='left'),
+                np.searchsorted(cvec, c + h + m, side='right'))
+               for cvec, c, h, m in zip(coord_vecs, center, half_extent,
+                                        margin)]
+        if all(lo < hi for lo, hi in box):
+            shapes.append((value, center, form, box))
+
+    row_size = int(np.prod(grid.shape[1:]))
+    step = max(1, _RASTER_BLOCK_SIZE // max(row_size, 1))
+    for start in range(0, grid.shape[0], step):
+        stop = min(start + step, grid.shape[0])
+        for value, center, form, box in shapes:
+            first = (max(box[0][0], start), min(box[0][1], stop))
+            if first[0] >= first[1]:
+                continue
+            idx = tuple(slice(lo, hi) for lo, hi in [first] + box[1:])
+
+            # Offsets from the center, as sparse broadcasting arrays
+            diffs = []
+            for i, (cvec, c, sl) in enumerate(zip(coord_vecs, center, idx)):
+                bcast_shape = [1] * ndim
+                bcast_shape[i] = -1
+                diffs.append((cvec[sl] - c).reshape(bcast_shape))
+
+            # (x - c)^T A (x - c) = alpha + t * (beta + gamma * t), where t
+            # is the offset in the last axis
+            alpha = 0
+            beta = 0
+            for i in range(ndim - 1):
+                alpha = alpha + form[i, i] * diffs[i] ** 2
+                for j in range(i + 1, ndim - 1):
+                    alpha = alpha + 2 * form[i, j] * diffs[i] * diffs[j]
+                beta = beta + 2 * form[i, -1] * diffs[i]
+            t = diffs[-1]
+            radius = alpha + t * (beta + form[-1, -1] * t)
+
+            block = phantom[idx]
+            np.add(block, value, out=block, where=radius <= 1)
+
+    return phantom
+
+
+def _random_ellipsoid_phantom_array(grid, dtype, num_ellipsoids, seed,
+                                    kwargs):
+    """Draw ellipsoids with ``seed`` and rasterize them.
+
+    Module-level helper such that it can be run in worker processes.
+    """
+    ellipsoids = random_ellipsoids(grid.ndim, num_ellipsoids, seed=seed,
+                                   **kwargs)
+    return _ellipsoid_phantom_array(grid, dtype, ellipsoids)
 
 
 def ellipsoid_phantom(space, ellipsoids, min_pt=None, max_pt=None):
@@ -633,14 +515,12 @@ def ellipsoid_phantom(space, ellipsoids, min_pt=None, max_pt=None):
     faster than "trivial" implementations. It is therefore recommended to use
     it in all phantoms where applicable.
 
-    The main optimization is that it only considers a subset of all the
-    points when updating for each ellipse. It does this by first finding
-    a subset of points that could possibly be inside the ellipse. This
-    optimization is very good for "spherical" ellipsoids, but not so
-    much for elongated or rotated ones.
-
-    It also does calculations wherever possible on the meshgrid instead of
-    individual points.
+    Each ellipsoid is only evaluated in its tightest axis-aligned bounding
+    box, which is exact also for elongated and rotated ellipsoids. The
+    grid is processed in blocks along the first axis to limit the size of
+    temporary arrays, and the quadratic form defining an ellipsoid is
+    evaluated in Horner form along the last axis, with all other terms
+    computed on the lower-dimensional cross section.
 
     Examples
     --------
@@ -665,13 +545,13 @@ def ellipsoid_phantom(space, ellipsoids, min_pt=None, max_pt=None):
     odl.phantom.geometric.defrise_ellipses : Ellipses for the
         Defrise phantom
     """
-    if space.ndim == 2:
-        _phantom = _ellipse_phantom_2d
-    elif space.ndim == 3:
-        _phantom = _ellipsoid_phantom_3d
-    else:
+    if space.ndim not in (2, 3):
         raise ValueError('dimension not 2 or 3, no phantom available')
 
+    def _phantom(space, ellipsoids):
+        return space.element(
+            _ellipsoid_phantom_array(space.grid, space.dtype, ellipsoids))
+
     if min_pt is None and max_pt is None:
         return _phantom(space, ellipsoids)
 
@@ -710,6 +590,117 @@ def ellipsoid_phantom(space, ellipsoids, min_pt=None, max_pt=None):
             resize_array(tmp_phantom, space.shape, offset))
 
 
+def random_ellipsoids(ndim, num_ellipsoids, value_range=(0.0, 1.0),
+                      axis_range=(0.05, 0.5), seed=None):
+    """Return parameters of randomly drawn ellipses or ellipsoids.
+
+    Parameters
+    ----------
+    ndim : {2, 3}
+        Dimension of the space for the ellipses/ellipsoids.
+    num_ellipsoids : int
+        Number of ellipsoids to draw.
+    value_range : 2-tuple of float, optional
+        The values are drawn uniformly from this interval.
+    axis_range : 2-tuple of float, optional
+        The lengths of the principal axes are drawn uniformly from this
+        interval, relative to the reference cube ``[-1, 1]^ndim``.
+    seed : int, optional
+        Random seed to use for drawing the parameters.
+        For ``None``, use the current seed.
+
+    Returns
+    -------
+    ellipsoids : `numpy.ndarray`
+        Array with one row per ellipsoid, in the format expected by
+        `ellipsoid_phantom`. The centers are drawn uniformly from
+        ``[-0.5, 0.5]^ndim`` and the rotation angles from ``[0, 2 pi)``.
+
+    Examples
+    --------
+    >>> ellipses = random_ellipsoids(2, 5, seed=42)
+    >>> ellipses.shape
+    (5, 6)
+    >>> np.array_equal(ellipses, random_ellipsoids(2, 5, seed=42))
+    True
+    """
+    if ndim not in (2, 3):
+        raise ValueError('dimension not 2 or 3, no phantom available')
+    num_angles = 1 if ndim == 2 else 3
+
+    with npy_random_seed(seed):
+        values = np.random.uniform(*value_range, size=(num_ellipsoids, 1))
+        axes = np.random.uniform(*axis_range, size=(num_ellipsoids, ndim))
+        centers = np.random.uniform(-0.5, 0.5, size=(num_ellipsoids, ndim))
+        angles = np.random.uniform(0, 2 * np.pi,
+                                   size=(num_ellipsoids, num_angles))
+
+    return np.hstack([values, axes, centers, angles])
+
+
+def random_ellipsoid_phantoms(space, num_phantoms, num_ellipsoids=10,
+                              seed=None, num_workers=None, **kwargs):
+    """Return a batch of phantoms made of random ellipsoids.
+
+    Parameters
+    ----------
+    space : `DiscretizedSpace`
+        Space in which the phantoms are created, must be 2- or
+        3-dimensional.
+    num_phantoms : int
+        Number of phantoms to create.
+    num_ellipsoids : int, optional
+        Number of ellipsoids per phantom.
+    seed : int, optional
+        Random seed from which the seeds of the individual phantoms are
+        drawn. For ``None``, use the current seed.
+    num_workers : positive int, optional
+        Number of worker processes among which the phantoms are
+        distributed. For ``None`` or 1, the phantoms are created serially
+        in the calling process.
+    kwargs :
+        Further keyword arguments passed to `random_ellipsoids`.
+
+    Returns
+    -------
+    phantoms : list of ``space`` elements
+        The created phantoms. They do not depend on ``num_workers``.
+
+    See Also
+    --------
+    random_ellipsoids : Parameters of the ellipsoids in each phantom.
+    ellipsoid_phantom : Phantom from given ellipsoids.
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr([-1, -1], [1, 1], [32, 32])
+    >>> phantoms = random_ellipsoid_phantoms(space, 3, seed=0)
+    >>> len(phantoms)
+    3
+    >>> phantoms[0] == random_ellipsoid_phantoms(space, 1, seed=0)[0]
+    True
+    """
+    if space.ndim not in (2, 3):
+        raise ValueError('dimension not 2 or 3, no phantom available')
+
+    # One seed per phantom makes the result independent of the scheduling
+    with npy_random_seed(seed):
+        seeds = np.random.randint(0, 2 ** 31 - 1, size=num_phantoms)
+
+    args = [(space.grid, space.dtype, num_ellipsoids, int(phantom_seed),
+             kwargs)
+            for phantom_seed in seeds]
+    if num_workers is None or num_workers <= 1 or num_phantoms <= 1:
+        arrays = [_random_ellipsoid_phantom_array(*arg) for arg in args]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=int(num_workers)) as executor:
+            arrays = list(executor.map(_random_ellipsoid_phantom_array,
+                                       *zip(*args)))
+
+    return [space.element(arr) for arr in arrays]
+
+
 def smooth_cuboid(space, min_pt=None, max_pt=None, axis=0):
     """Cuboid with smooth variations.
 
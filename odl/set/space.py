@@ -12,6 +12,7 @@ from __future__ import print_function, division, absolute_import
 from builtins import object
 from enum import Enum
 from dataclasses import dataclass
+import weakref
 import numpy as np
 
 from odl.set.sets import Field, Set, UniversalSet
@@ -20,6 +21,46 @@ from odl.set.sets import Field, Set, UniversalSet
 __all__ = ('LinearSpace', 'UniversalSpace')
 
 
+# Maps `(id(space), id(other))` to `(weakref(space), weakref(other), equal)`
+_SPACE_EQ_CACHE = {}
+
+
+def _spaces_equal(space, other):
+    """Return ``space == other``, memoized per pair of space objects.
+
+    Spaces are immutable, hence the result of comparing two space objects
+    never changes. It is stored together with weak references to both
+    spaces, such that repeated checks, e.g., ``x in op.domain`` in each
+    operator call, take constant time after the first comparison. The
+    entry is dropped when one of the spaces is deleted.
+    """
+    if space is other:
+        return True
+    if (not isinstance(space, LinearSpace) or
+            not isinstance(other, LinearSpace)):
+        return space == other
+
+    key = (id(space), id(other))
+    entry = _SPACE_EQ_CACHE.get(key)
+    if entry is not None and entry[0]() is space and entry[1]() is other:
+        return entry[2]
+
+    equal = bool(space == other)
+
+    def drop(ref, key=key):
+        """Remove the entry when one of its spaces is deleted."""
+        entry = _SPACE_EQ_CACHE.get(key)
+        if entry is not None and (entry[0] is ref or entry[1] is ref):
+            _SPACE_EQ_CACHE.pop(key, None)
+
+    try:
+        _SPACE_EQ_CACHE[key] = (weakref.ref(space, drop),
+                                weakref.ref(other, drop), equal)
+    except TypeError:
+        pass
+    return equal
+
+
 class NumOperationParadigmSupport(Enum):
     NOT_SUPPORTED = 0
     SUPPORTED = 1
@@ -187,8 +228,11 @@ class LinearSpace(Set):
         -----
         This is the strict default where spaces must be equal.
         Subclasses may choose to implement a less strict check.
+
+        The comparison is memoized per pair of space objects, see
+        `_spaces_equal`.
         """
-        return getattr(other, 'space', None) == self
+        return _spaces_equal(getattr(other, 'space', None), self)
 
     # Error checking variant of methods
     def lincomb(self, a, x1, b=None, x2=None, out=None):
@@ -363,7 +407,7 @@ class LinearSpace(Set):
         if self.field is None:
             return inner
         else:
-            return self.field.element(self._inner(x1, x2))
+            return self.field.element(inner)
 
     def _binary_num_operation(self, low_level_method, x1, x2, out=None):
         """Apply the numerical operation implemented by `low_level_method` to
@@ -12,7 +12,9 @@ from __future__ import absolute_import
 
 from .iterative import *
 from .statistical import *
+from .subsets import *
 
 __all__ = ()
 __all__ += iterative.__all__
 __all__ += statistical.__all__
+__all__ += subsets.__all__
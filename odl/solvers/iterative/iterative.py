@@ -14,6 +14,7 @@ import numpy as np
 
 from odl.operator import IdentityOperator, OperatorComp, OperatorSum
 from odl.util import normalized_scalar_param_list
+from odl.util.buffer_pool import acquire_element, release_element
 
 
 __all__ = ('landweber', 'conjugate_gradient', 'conjugate_gradient_normal',
@@ -107,10 +108,12 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
     tmp_ran = op.range.element()
     tmp_dom = op.domain.element()
 
+    # `x` and the temporaries are checked above, hence the operators can be
+    # evaluated without argument checks
     for _ in range(niter):
-        op(x, out=tmp_ran)
+        op._call_trusted(x, out=tmp_ran)
         tmp_ran -= rhs
-        op.derivative(x).adjoint(tmp_ran, out=tmp_dom)
+        op.derivative(x).adjoint._call_trusted(tmp_ran, out=tmp_dom)
         x.lincomb(1, x, -omega, tmp_dom)
 
         if projection is not None:
@@ -178,7 +181,7 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         return
 
     for _ in range(niter):
-        op(p, out=d)  # d = A p
+        op._call_trusted(p, out=d)  # d = A p
 
         inner_p_d = p.inner(d)
 
@@ -251,18 +254,23 @@ Conjugate_gradient_on_the_normal_equations>`_.
         raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
                         ''.format(x, op.domain))
 
-    d = op(x)
+    # Temporaries, taken from the active buffer pool if any
+    d = acquire_element(op.range)
+    p = acquire_element(op.domain)
+    s = acquire_element(op.domain)
+    q = acquire_element(op.range)
+
+    op(x, out=d)
     d.lincomb(1, rhs, -1, d)               # d = rhs - A x
-    p = op.derivative(x).adjoint(d)
-    s = p.copy()
-    q = op.range.element()
+    op.derivative(x).adjoint(d, out=p)
+    s.assign(p)
     sqnorm_s_old = s.norm() ** 2  # Only recalculate norm after update
 
     for _ in range(niter):
         op(p, out=q)                       # q = A p
         sqnorm_q = q.norm() ** 2
         if sqnorm_q == 0.0:  # Return if residual is 0
-            return
+            break
 
         a = sqnorm_s_old / sqnorm_q
         x.lincomb(1, x, a, p)               # x = x + a*p
@@ -278,6 +286,8 @@ Conjugate_gradient_on_the_normal_equations>`_.
         if callback is not None:
             callback(x)
 
+    release_element(d, p, s, q)
+
 
 def exp_zero_seq(base):
     """Default exponential zero sequence.
@@ -473,6 +483,7 @@ def kaczmarz(ops, x, rhs, niter, omega=1, projection=None, random=False,
     See Also
     --------
     landweber
+    sart : Normalized variant for nonnegative linear operators.
     """
     domain = ops[0].domain
     if any(domain != opi.domain for opi in ops):
@@ -496,6 +507,10 @@ def kaczmarz(ops, x, rhs, niter, omega=1, projection=None, random=False,
     # Single reusable element in the domain
     tmp_dom = domain.element()
 
+    # The derivative of a linear operator is the operator itself, hence its
+    # adjoint can be created once instead of in every sub-iteration
+    adjoints = [opi.adjoint if opi.is_linear else None for opi in ops]
+
     # Iteratively find solution
     for _ in range(niter):
         if random:
@@ -506,11 +521,14 @@ def kaczmarz(ops, x, rhs, niter, omega=1, projection=None, random=False,
         for i in rng:
             # Find residual
             tmp_ran = tmp_rans[ops[i].range]
-            ops[i](x, out=tmp_ran)
+            ops[i]._call_trusted(x, out=tmp_ran)
             tmp_ran -= rhs[i]
 
             # Update x
-            ops[i].derivative(x).adjoint(tmp_ran, out=tmp_dom)
+            adjoint = adjoints[i]
+            if adjoint is None:
+                adjoint = ops[i].derivative(x).adjoint
+            adjoint._call_trusted(tmp_ran, out=tmp_dom)
             x.lincomb(1, x, -omega[i], tmp_dom)
 
             if projection is not None:
@@ -11,6 +11,10 @@
 from __future__ import print_function, division, absolute_import
 import numpy as np
 
+from odl.solvers.iterative.subsets import subset_sensitivities
+from odl.solvers.util import (
+    load_solver_state, restore_solver_state, save_solver_state)
+
 __all__ = ('mlem', 'osmlem', 'poisson_log_likelihood')
 
 
@@ -109,7 +113,18 @@ def osmlem(op, x, data, niter, callback=None, **kwargs):
     sensitivities : float or ``op.domain`` `element-like`, optional
         The algorithm contains an ``A^T 1``
         term, if this parameter is given, it is replaced by it.
-        Default: ``op[i].adjoint(op[i].range.one())``
+        Default: ``op[i].adjoint(op[i].range.one())``, computed once per
+        operator and cached across calls, see `subset_sensitivities`.
+    checkpoint : str, optional
+        File to which ``x`` and the iteration count are written every
+        ``checkpoint_step`` iterations, see `save_solver_state`.
+    checkpoint_step : positive int, optional
+        Number of iterations between two checkpoints. Default: 1
+    resume_from : str, optional
+        Checkpoint file from which the iteration state is restored.
+        The iteration then continues exactly as the run that wrote the
+        checkpoint. In this case, ``niter`` counts all iterations,
+        including those before the checkpoint.
 
     Notes
     -----
@@ -162,8 +177,7 @@ def osmlem(op, x, data, niter, callback=None, **kwargs):
     # Extract the sensitivites parameter
     sensitivities = kwargs.pop('sensitivities', None)
     if sensitivities is None:
-        sensitivities = [np.maximum(opi.adjoint(opi.range.one()), eps)
-                         for opi in op]
+        sensitivities = subset_sensitivities(op, eps)
     else:
         # Make sure the sensitivities is a list of the correct size.
         try:
@@ -171,10 +185,24 @@ def osmlem(op, x, data, niter, callback=None, **kwargs):
         except TypeError:
             sensitivities = [sensitivities] * n_ops
 
+    checkpoint = kwargs.pop('checkpoint', None)
+    checkpoint_step = int(kwargs.pop('checkpoint_step', 1))
+    if checkpoint_step < 1:
+        raise ValueError('`checkpoint_step` must be positive, got {}'
+                         ''.format(checkpoint_step))
+
+    resume_from = kwargs.pop('resume_from', None)
+    if resume_from is not None:
+        state = load_solver_state(resume_from)
+        start = state['iteration']
+        restore_solver_state(x, state['x'])
+    else:
+        start = 0
+
     tmp_dom = op[0].domain.element()
     tmp_ran = [opi.range.element() for opi in op]
 
-    for _ in range(niter):
+    for k in range(start, niter):
         for i in range(n_ops):
             op[i](x, out=tmp_ran[i])
             tmp_ran[i].ufuncs.maximum(eps, out=tmp_ran[i])
@@ -188,6 +216,9 @@ def osmlem(op, x, data, niter, callback=None, **kwargs):
             if callback is not None:
                 callback(x)
 
+        if checkpoint is not None and (k + 1) % checkpoint_step == 0:
+            save_solver_state(checkpoint, {'iteration': k + 1, 'x': x})
+
 
 def poisson_log_likelihood(x, data):
     """Poisson log-likelihood of ``data`` given noise parametrized by ``x``.
@@ -0,0 +1,382 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Simultaneous and block-iterative methods for subset operators.
+
+The solvers in this module act on a sequence of subset operators
+``ops[i]``, e.g., ray transforms restricted to subsets of the projection
+angles. The sensitivities ``ops[i].adjoint(ops[i].range.one())`` and row
+sums ``ops[i](ops[i].domain.one())`` only depend on the operators, hence
+they are computed once and cached for as long as the operators are alive.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import weakref
+
+import numpy as np
+
+from odl.operator.pspace_ops import _thread_groups
+from odl.util.parallel import parallel_map
+
+__all__ = ('subset_sensitivities', 'subset_row_sums', 'clear_subset_cache',
+           'sart', 'sirt')
+
+
+# Maps `id(op)` to `(weakref(op), {name: value})`
+_SUBSET_CACHE = {}
+_SUBSET_CACHE_LOCK = threading.Lock()
+
+
+def _cached_subset_value(op, name, compute):
+    """Return ``compute()``, cached for ``op`` under ``name``.
+
+    Operators that cannot be weakly referenced are not cached.
+    """
+    key = id(op)
+    with _SUBSET_CACHE_LOCK:
+        entry = _SUBSET_CACHE.get(key)
+        if entry is not None and entry[0]() is op and name in entry[1]:
+            return entry[1][name]
+
+    value = compute()
+
+    def drop(ref, key=key):
+        """Remove the cache entry of a deleted operator."""
+        entry = _SUBSET_CACHE.get(key)
+        if entry is not None and entry[0] is ref:
+            _SUBSET_CACHE.pop(key, None)
+
+    with _SUBSET_CACHE_LOCK:
+        entry = _SUBSET_CACHE.get(key)
+        if entry is None or entry[0]() is not op:
+            try:
+                entry = (weakref.ref(op, drop), {})
+            except TypeError:
+                return value
+            _SUBSET_CACHE[key] = entry
+        entry[1][name] = value
+
+    return value
+
+
+def subset_sensitivities(ops, eps=1e-8):
+    """Return the sensitivities of subset operators.
+
+    Parameters
+    ----------
+    ops : sequence of `Operator`'s
+        Linear subset operators.
+    eps : nonnegative float, optional
+        Lower bound for the sensitivities, to avoid division by zero.
+
+    Returns
+    -------
+    sensitivities : list of ``ops[i].domain`` elements
+        The elements ``max(ops[i].adjoint(ops[i].range.one()), eps)``.
+        They are cached per operator and must not be modified.
+
+    Examples
+    --------
+    >>> op = odl.MatrixOperator([[1.0, 2.0], [0.0, 1.0]])
+    >>> sens = subset_sensitivities([op, op])
+    >>> sens[0]
+    rn(2).element([ 1.,  3.])
+    >>> sens[0] is sens[1]
+    True
+    """
+    eps = float(eps)
+    return [
+        _cached_subset_value(
+            opi, ('sensitivity', eps),
+            lambda opi=opi: opi.domain.element(
+                np.maximum(opi.adjoint(opi.range.one()), eps)))
+        for opi in ops]
+
+
+def subset_row_sums(ops, eps=1e-8):
+    """Return the row sums of subset operators.
+
+    Parameters
+    ----------
+    ops : sequence of `Operator`'s
+        Linear subset operators.
+    eps : nonnegative float, optional
+        Lower bound for the row sums, to avoid division by zero.
+
+    Returns
+    -------
+    row_sums : list of ``ops[i].range`` elements
+        The elements ``max(ops[i](ops[i].domain.one()), eps)``.
+        They are cached per operator and must not be modified.
+
+    Examples
+    --------
+    >>> op = odl.MatrixOperator([[1.0, 2.0], [0.0, 1.0]])
+    >>> subset_row_sums([op])[0]
+    rn(2).element([ 3.,  1.])
+    """
+    eps = float(eps)
+    return [
+        _cached_subset_value(
+            opi, ('row_sums', eps),
+            lambda opi=opi: opi.range.element(
+                np.maximum(opi(opi.domain.one()), eps)))
+        for opi in ops]
+
+
+def clear_subset_cache(ops=None):
+    """Discard cached sensitivities and row sums.
+
+    This is required if an operator is modified in a way that changes
+    the cached quantities.
+
+    Parameters
+    ----------
+    ops : sequence of `Operator`'s, optional
+        Operators whose cached values should be discarded. For ``None``,
+        the whole cache is cleared.
+    """
+    with _SUBSET_CACHE_LOCK:
+        if ops is None:
+            _SUBSET_CACHE.clear()
+            return
+        for opi in ops:
+            entry = _SUBSET_CACHE.get(id(opi))
+            if entry is not None and entry[0]() is opi:
+                del _SUBSET_CACHE[id(opi)]
+
+
+def sart(ops, x, rhs, niter, omega=1, block_size=1, projection=None,
+         random=False, num_threads=None, callback=None,
+         callback_loop='outer'):
+    r"""Simultaneous algebraic reconstruction technique on subsets.
+
+    Solves the inverse problem given by the set of equations::
+
+        A_n(x) = rhs_n
+
+    for linear operators ``A_n`` with nonnegative entries, e.g., ray
+    transforms for subsets of the projection angles.
+
+    Parameters
+    ----------
+    ops : sequence of `Operator`'s
+        Linear operators in the inverse problem, all with the same domain.
+    x : ``ops[i].domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : sequence of ``ops[i].range`` elements
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    omega : positive float, optional
+        Relaxation parameter in the iteration.
+    block_size : positive int, optional
+        Number of subsets that are processed simultaneously in one update.
+        For ``block_size=1``, this is the classical SART, for
+        ``block_size=len(ops)`` it is SIRT.
+    projection : callable, optional
+        Function that can be used to modify the iterates in each iteration,
+        for example enforcing positivity. The function should take one
+        argument and modify it in-place.
+    random : bool, optional
+        If ``True``, the order of the subsets is randomized in each
+        iteration.
+    num_threads : positive int, optional
+        Number of threads among which the subsets of one block are
+        distributed. For ``None`` or 1, they are processed serially.
+        Subsets whose operators share an instance, e.g. a temporary, are
+        always processed serially. The result does not depend on the
+        number of threads.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+    callback_loop : {'inner', 'outer'}
+        Whether the callback should be called after each block or after
+        each full iteration.
+
+    Notes
+    -----
+    For a block :math:`B` of subsets, the update reads
+
+    .. math::
+        x \leftarrow x + \omega \frac{
+            \sum_{i \in B} \mathcal{A}_i^*
+            \big( (y_i - \mathcal{A}_i x) / \mathcal{A}_i 1 \big)}
+            {\sum_{i \in B} \mathcal{A}_i^* 1},
+
+    with pointwise division. For nonnegative operators,
+    :math:`0 < \omega < 2` guarantees convergence, see [AK1984].
+
+    The normalizations :math:`\mathcal{A}_i 1` and :math:`\mathcal{A}_i^* 1`
+    are taken from `subset_row_sums` and `subset_sensitivities`, i.e.,
+    they are computed only on the first call with a given operator.
+    Within a block, the back-projections of the subsets are independent
+    and can be evaluated concurrently with ``num_threads``, except for
+    subsets whose operators share state, which are evaluated one after
+    the other. The back-projections are summed in a fixed order
+    afterwards.
+
+    References
+    ----------
+    [AK1984] Andersen, A H, and Kak, A C. *Simultaneous algebraic
+    reconstruction technique (SART): a superior implementation of the ART
+    algorithm*. Ultrasonic Imaging, 6.1 (1984), pp 81--94.
+
+    See Also
+    --------
+    sirt : All subsets in a single block.
+    kaczmarz : Unnormalized variant for nonlinear operators.
+
+    Examples
+    --------
+    >>> op = odl.MatrixOperator([[2.0, 1.0], [1.0, 3.0]])
+    >>> x = op.domain.zero()
+    >>> sart([op], x, [op.range.element([3, 4])], niter=100)
+    >>> x
+    rn(2).element([ 1.,  1.])
+    """
+    domain = ops[0].domain
+    if any(domain != opi.domain for opi in ops):
+        raise ValueError('domains of `ops` are not all equal')
+
+    if x not in domain:
+        raise TypeError('`x` {!r} is not in the domain of `ops` {!r}'
+                        ''.format(x, domain))
+
+    if len(ops) != len(rhs):
+        raise ValueError('`number of `ops` {} does not match number of '
+                         '`rhs` {}'.format(len(ops), len(rhs)))
+
+    block_size, block_size_in = int(block_size), block_size
+    if block_size < 1:
+        raise ValueError('`block_size` must be positive, got {}'
+                         ''.format(block_size_in))
+    block_size = min(block_size, len(ops))
+
+    omega = float(omega)
+    rhs = [opi.range.element(rhs_i) for opi, rhs_i in zip(ops, rhs)]
+    sensitivities = subset_sensitivities(ops)
+    row_sums = subset_row_sums(ops)
+
+    # One temporary per subset in the range and per block slot in the domain,
+    # such that the subsets of a block can be processed concurrently
+    tmp_rans = [opi.range.element() for opi in ops]
+    tmp_doms = [domain.element() for _ in range(block_size)]
+    adjoints = [opi.adjoint for opi in ops]
+    block_norms = {}
+    block_groups = {}
+
+    def backprojected_residual(slot, i):
+        """Write ``A_i^* ((y_i - A_i x) / A_i 1)`` to a domain temporary."""
+        tmp_ran = tmp_rans[i]
+        ops[i]._call_trusted(x, out=tmp_ran)
+        tmp_ran.lincomb(1, rhs[i], -1, tmp_ran)
+        tmp_ran /= row_sums[i]
+        adjoints[i]._call_trusted(tmp_ran, out=tmp_doms[slot])
+
+    def backprojected_residuals(block_and_slots):
+        """Evaluate `backprojected_residual` for a group of block slots."""
+        block, slots = block_and_slots
+        for slot in slots:
+            backprojected_residual(slot, block[slot])
+
+    for _ in range(niter):
+        if random:
+            order = list(np.random.permutation(len(ops)))
+        else:
+            order = list(range(len(ops)))
+
+        for start in range(0, len(ops), block_size):
+            block = tuple(order[start:start + block_size])
+
+            norm = block_norms.get(block)
+            if norm is None:
+                if len(block) == 1:
+                    norm = sensitivities[block[0]]
+                else:
+                    norm = domain.element()
+                    norm.assign(sensitivities[block[0]])
+                    for i in block[1:]:
+                        norm += sensitivities[i]
+                block_norms[block] = norm
+
+            # Subsets sharing operator instances must not run concurrently
+            groups = block_groups.get(block)
+            if groups is None:
+                groups = _thread_groups([(ops[i], adjoints[i])
+                                         for i in block])
+                block_groups[block] = groups
+
+            parallel_map(backprojected_residuals,
+                         [(block, slots) for slots in groups], num_threads)
+            update = tmp_doms[0]
+            for other in tmp_doms[1:len(block)]:
+                update += other
+            update /= norm
+            x.lincomb(1, x, omega, update)
+
+            if projection is not None:
+                projection(x)
+
+            if callback is not None and callback_loop == 'inner':
+                callback(x)
+
+        if callback is not None and callback_loop == 'outer':
+            callback(x)
+
+
+def sirt(ops, x, rhs, niter, omega=1, projection=None, num_threads=None,
+         callback=None):
+    r"""Simultaneous iterative reconstruction technique on subsets.
+
+    This is `sart` with all subsets processed in a single block, i.e.,
+
+    .. math::
+        x \leftarrow x + \omega \frac{
+            \sum_i \mathcal{A}_i^*
+            \big( (y_i - \mathcal{A}_i x) / \mathcal{A}_i 1 \big)}
+            {\sum_i \mathcal{A}_i^* 1}.
+
+    Parameters
+    ----------
+    ops : sequence of `Operator`'s
+        Linear operators in the inverse problem, all with the same domain.
+    x : ``ops[i].domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : sequence of ``ops[i].range`` elements
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    omega : positive float, optional
+        Relaxation parameter in the iteration.
+    projection : callable, optional
+        Function that can be used to modify the iterates in each iteration,
+        for example enforcing positivity. The function should take one
+        argument and modify it in-place.
+    num_threads : positive int, optional
+        Number of threads among which the subsets are distributed.
+        For ``None`` or 1, they are processed serially.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    sart
+    """
+    sart(ops, x, rhs, niter, omega=omega, block_size=len(ops),
+         projection=projection, num_threads=num_threads, callback=callback)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -12,6 +12,8 @@ from __future__ import division
 from builtins import range
 
 from odl.operator import Operator, OpDomainError
+from odl.solvers.util import PrimalDualStepBalancing
+from odl.util.buffer_pool import acquire_element, release_element
 
 
 __all__ = ('admm_linearized',)
@@ -50,6 +52,17 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     ----------------
     callback : callable, optional
         Function called with the current iterate after each iteration.
+    tol : positive float, optional
+        Stop the iteration early once both the primal and the dual
+        residual are at most ``tol``, see Notes.
+    step_balancing : bool or `PrimalDualStepBalancing`, optional
+        Adaptively change the penalty parameter ``1 / sigma`` based on
+        the residuals, keeping the ratio ``tau / sigma`` fixed. ``True``
+        uses the default `PrimalDualStepBalancing`. A given instance is
+        reset at the start.
+    residuals : list, optional
+        If given, the pair ``(primal_residual, dual_residual)`` is
+        appended to this list after each iteration.
 
     Notes
     -----
@@ -77,6 +90,20 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
 
     to guarantee convergence.
 
+    The residuals used for ``tol`` and ``step_balancing`` are
+
+    .. math::
+        r_k = \|L x^{(k+1)} - z^{(k+1)}\|, \quad
+        s_k = \sigma^{-1} \|z^{(k+1)} - z^{(k)}\|,
+
+    where :math:`r_k` is the usual primal residual and :math:`s_k` is a
+    cheap bound for the dual residual
+    :math:`\sigma^{-1} \|L^*(z^{(k+1)} - z^{(k)})\|` up to the factor
+    :math:`\|L\|`, avoiding an additional evaluation of :math:`L^*`.
+    If :math:`r_k` dominates, the penalty :math:`\sigma^{-1}` is increased
+    as in Section 3.4.1 of [BPCPE2011], and the scaled dual variable
+    :math:`u` is rescaled accordingly.
+
     The name "linearized ADMM" comes from the fact that in the
     minimization subproblem for the :math:`x` variable, this variant
     uses a linearization of a quadratic term in the augmented Lagrangian
@@ -89,6 +116,11 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     ----------
     [PB2014] Parikh, N and Boyd, S. *Proximal Algorithms*. Foundations and
     Trends in Optimization, 1(3) (2014), pp 123-231.
+
+    [BPCPE2011] Boyd, S, Parikh, N, Chu, E, Peleato, B, and Eckstein, J.
+    *Distributed Optimization and Statistical Learning via the Alternating
+    Direction Method of Multipliers*. Foundations and Trends in Machine
+    Learning, 3(1) (2011), pp 1-122.
     """
     if not isinstance(L, Operator):
         raise TypeError('`op` {!r} is not an `Operator` instance'
@@ -116,14 +148,39 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     if callback is not None and not callable(callback):
         raise TypeError('`callback` {} is not callable'.format(callback))
 
-    # Initialize range variables
-    z = L.range.zero()
-    u = L.range.zero()
+    # Residual based stopping and step size balancing
+    tol = kwargs.pop('tol', None)
+    if tol is not None:
+        tol, tol_in = float(tol), tol
+        if tol <= 0:
+            raise ValueError('`tol` must be positive, got {}'.format(tol_in))
+    step_balancing = kwargs.pop('step_balancing', None)
+    if step_balancing is True:
+        step_balancing = PrimalDualStepBalancing()
+    elif step_balancing is False:
+        step_balancing = None
+    if step_balancing is not None:
+        step_balancing.reset()
+    residuals = kwargs.pop('residuals', None)
+    track_residuals = (tol is not None or step_balancing is not None or
+                       residuals is not None)
+
+    # Initialize range variables, using the active buffer pool if any
+    z = acquire_element(L.range)
+    z.set_zero()
+    u = acquire_element(L.range)
+    u.set_zero()
 
     # Temporary for Lx + u [- z]
-    tmp_ran = L(x)
+    tmp_ran = acquire_element(L.range)
+    L(x, out=tmp_ran)
     # Temporary for L^*(Lx + u - z)
-    tmp_dom = L.domain.element()
+    tmp_dom = acquire_element(L.domain)
+    temporaries = [z, u, tmp_ran, tmp_dom]
+    # Previous z, only needed for the dual residual
+    if track_residuals:
+        z_old = acquire_element(L.range)
+        temporaries.append(z_old)
 
     # Store proximals since their initialization may involve computation
     prox_tau_f = f.proximal(tau)
@@ -144,15 +201,40 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
         # tmp_ran <- Lx^(k+1)
         L(x, out=tmp_ran)
         # z^(k+1) <- prox[sigma*g](Lx^(k+1) + u^k)
-        prox_sigma_g(tmp_ran + u, out=z)  # 1 copy here
+        if track_residuals:
+            z_old.assign(z)
+        z.lincomb(1, tmp_ran, 1, u)
+        prox_sigma_g(z, out=z)
 
         # u^(k+1) = u^k + Lx^(k+1) - z^(k+1)
         u += tmp_ran
         u -= z
 
+        if track_residuals:
+            primal_res = tmp_ran.dist(z)
+            dual_res = z.dist(z_old) / sigma
+            if residuals is not None:
+                residuals.append((primal_res, dual_res))
+
+            if step_balancing is not None:
+                factor = step_balancing(primal_res, dual_res)
+                if factor != 1:
+                    # Larger penalty 1 / sigma for dominating primal
+                    # residual; u is scaled with sigma
+                    tau /= factor
+                    sigma /= factor
+                    u /= factor
+                    prox_tau_f = f.proximal(tau)
+                    prox_sigma_g = g.proximal(sigma)
+
         if callback is not None:
             callback(x)
 
+        if tol is not None and primal_res <= tol and dual_res <= tol:
+            break
+
+    release_element(*temporaries)
+
 
 def admm_linearized_simple(x, f, g, L, tau, sigma, niter, **kwargs):
     """Non-optimized version of ``admm_linearized``.
@@ -13,6 +13,9 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.util import (
+    load_solver_state, restore_solver_state, save_solver_state)
+from odl.util.buffer_pool import acquire_element, release_element
 
 
 __all__ = ('douglas_rachford_pd', 'douglas_rachford_pd_stepsize')
@@ -72,6 +75,24 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
     lam : float or callable, optional
         Overrelaxation step size. If callable, it should take an index
         (starting at zero) and return the corresponding step size.
+    checkpoint : str, optional
+        File to which the complete iteration state, i.e., ``x``, the
+        dual variables and the step sizes, is written every
+        ``checkpoint_step`` iterations, see `save_solver_state`.
+    checkpoint_step : positive int, optional
+        Number of iterations between two checkpoints. Default: 1
+    resume_from : str, optional
+        Checkpoint file from which the iteration state is restored.
+        The iteration then continues exactly as the run that wrote the
+        checkpoint. In this case, ``niter`` counts all iterations,
+        including those before the checkpoint. If no iteration is left,
+        ``x`` is set to the primal iterate of the restored state.
+    tol : positive float, optional
+        Stop the iteration early once both the primal and the dual
+        residual are at most ``tol``, see Notes.
+    residuals : list, optional
+        If given, the pair ``(primal_residual, dual_residual)`` is
+        appended to this list after each full iteration.
 
     Notes
     -----
@@ -109,6 +130,20 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
     .. math::
         \sum_{n=1}^\infty \lambda_n (2 - \lambda_n) = +\infty.
 
+    The residuals used for ``tol`` are the scaled changes of the iteration
+    variables,
+
+    .. math::
+        p_k = \|x_{k+1} - x_k\| / \tau, \quad
+        d_k = \Big(\sum_i \|v_{i, k+1} - v_{i, k}\|^2 / \sigma_i^2
+              \Big)^{1/2}.
+
+    The dual increments are already available in the iteration, hence
+    only the primal residual requires an extra copy of ``x``. Since these
+    residuals lack the coupling terms :math:`L_i^* \Delta v_i` and
+    :math:`L_i \Delta x` of the primal-dual residuals in [GLY2015], they
+    are not suited for adaptive step size balancing as in `pdhg`.
+
     See Also
     --------
     odl.solvers.nonsmooth.primal_dual_hybrid_gradient.pdhg :
@@ -123,6 +158,10 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
     primal-dual method for solving inclusions with mixtures of
     composite and parallel-sum type monotone operators*. SIAM Journal
     on Optimization, 23.4 (2013), pp 2541--2565.
+
+    [GLY2015] Goldstein, T, Li, M, and Yuan, X. *Adaptive primal-dual
+    splitting methods for statistical learning and image processing*.
+    Advances in Neural Information Processing Systems, 2015.
     """
     # Validate input
     m = len(L)
@@ -155,25 +194,58 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         raise ValueError('`lam` must callable or a number between 0 and 2')
     lam = lam_in if callable(lam_in) else lambda _: lam_in
 
+    checkpoint = kwargs.pop('checkpoint', None)
+    checkpoint_step = int(kwargs.pop('checkpoint_step', 1))
+    if checkpoint_step < 1:
+        raise ValueError('`checkpoint_step` must be positive, got {}'
+                         ''.format(checkpoint_step))
+    resume_from = kwargs.pop('resume_from', None)
+
+    tol = kwargs.pop('tol', None)
+    if tol is not None:
+        tol, tol_in = float(tol), tol
+        if tol <= 0:
+            raise ValueError('`tol` must be positive, got {}'.format(tol_in))
+    residuals = kwargs.pop('residuals', None)
+    track_residuals = tol is not None or residuals is not None
+
     # Check for unused parameters
     if kwargs:
         raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
 
-    # Pre-allocate values
-    v = [Li.range.zero() for Li in L]
-    p1 = x.space.zero()
-    p2 = [Li.range.zero() for Li in L]
-    z1 = x.space.zero()
+    # Pre-allocate values, using the active buffer pool if any. Only `v`
+    # needs to be initialized, all others are overwritten before use.
+    v = [acquire_element(Li.range) for Li in L]
+    for vi in v:
+        vi.set_zero()
+    p1 = acquire_element(x.space)
+    p2 = [acquire_element(Li.range) for Li in L]
+    z1 = acquire_element(x.space)
     # Save a bit of memory: z2 elements are local to the loop where they
     # are used
     rans = {Li.range for Li in L}
-    z2 = {ran: ran.zero() for ran in rans}
-    w1 = x.space.zero()
-    w2 = [Li.range.zero() for Li in L]
-
-    for k in range(niter):
-        lam_k = lam(k)
+    z2 = {ran: acquire_element(ran) for ran in rans}
+    w1 = acquire_element(x.space)
+    w2 = [acquire_element(Li.range) for Li in L]
+    temporaries = [p1, z1, w1] + v + p2 + w2 + list(z2.values())
+    if track_residuals:
+        x_old = acquire_element(x.space)
+        temporaries.append(x_old)
+
+    if resume_from is not None:
+        state = load_solver_state(resume_from)
+        start = state['iteration']
+        tau = state['tau']
+        restore_solver_state(x, state['x'])
+        if m > 0:
+            # Empty sequences are not stored
+            sigma = state['sigma']
+            restore_solver_state(v, state['v'])
+    else:
+        start = 0
 
+    def primal_iterate():
+        """Compute ``p1 = prox[tau*f](x - tau/2 * sum(Li^* vi))``."""
         if len(L) > 0:
             # Compute z1 = sum(Li.adjoint(vi) for Li, vi in zip(L, v))
             # NB: we abuse z1 as temporary here, in contrast to the algorithm
@@ -181,13 +253,27 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
             L[0].adjoint(v[0], out=z1)
             for Li, vi in zip(L[1:], v[1:]):
                 Li.adjoint(vi, out=p1)
-                z1 += p1
+                z1.lincomb(1, z1, 1, p1)
 
             z1.lincomb(1, x, -tau / 2, z1)
         else:
             z1.assign(x)
 
         f.proximal(tau)(z1, out=p1)
+
+    if resume_from is not None and start >= niter:
+        # No iteration left, but `x` must still be replaced by the primal
+        # iterate, as in the last iteration of a normal run
+        primal_iterate()
+        x.assign(p1)
+
+    converged = False
+    for k in range(start, niter):
+        lam_k = lam(k)
+        if track_residuals:
+            x_old.assign(x)
+
+        primal_iterate()
         # Now p1 = prox[tau*f](x - tau/2 * sum(Li^* vi))
         # Temporary z1 is no longer needed
 
@@ -203,9 +289,9 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         # computation)
         if callback is not None:
             callback(p1)
-        if k == niter - 1:
+        if k == niter - 1 or converged:
             x.assign(p1)
-            return
+            break
 
         for i in range(m):
             # Compute p2[i] = prox[sigma * g^*](v[i] + sigma[i]/2 * L[i](w1))
@@ -234,21 +320,43 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
 
         # p1 = 2 * z1 - w1
         p1.lincomb(2, z1, -1, w1)
+        dual_res_sq = 0.0
         for i in range(m):
             z2i = z2[L[i].range]
             # Compute
             # z2[i] = prox[sigma[i] * l[i]^*](w2[i] + sigma[i]/2 * L[i](p1))
             L[i](p1, out=z2i)
-            z2i.lincomb(1, w2[i], sigma[i] / 2, L[i](p1))
+            z2i.lincomb(1, w2[i], sigma[i] / 2, z2i)
             # prox_cc_l is the identity if `l is None`, thus omitted in that
             # case
             if l is not None:
                 prox_cc_l[i](sigma[i])(z2i, out=z2i)
 
+            if track_residuals:
+                dual_res_sq += (lam_k * z2i.dist(p2[i]) / sigma[i]) ** 2
+
             # Compute v[i] += lam(k) * (z2[i] - p2[i])
             v[i].lincomb(1, v[i], lam_k, z2i)
             v[i].lincomb(1, v[i], -lam_k, p2[i])
 
+        if track_residuals:
+            primal_res = x.dist(x_old) / tau
+            dual_res = np.sqrt(dual_res_sq)
+            if residuals is not None:
+                residuals.append((primal_res, dual_res))
+
+            # Stop in the next iteration, after the primal iterate `p1`
+            # corresponding to `x` has been computed
+            converged = (tol is not None and primal_res <= tol and
+                         dual_res <= tol)
+
+        if checkpoint is not None and (k + 1) % checkpoint_step == 0:
+            save_solver_state(checkpoint, {
+                'iteration': k + 1, 'x': x, 'v': v, 'tau': tau,
+                'sigma': sigma})
+
+    release_element(*temporaries)
+
 
 def _operator_norms(L):
     """Get operator norms if needed.
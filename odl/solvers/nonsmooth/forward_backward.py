@@ -10,7 +10,10 @@
 
 from __future__ import print_function, division, absolute_import
 
+import numpy as np
+
 from odl.operator import Operator
+from odl.util.buffer_pool import acquire_element, release_element
 
 
 __all__ = ('forward_backward_pd',)
@@ -68,6 +71,12 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     l : sequence of `Functional`'s, optional
         The functionals ``l_i``. Needs to have ``g_i.convex_conj.gradient``.
         If omitted, the simpler problem without ``l_i``  will be considered.
+    tol : positive float, optional
+        Stop the iteration early once both the primal and the dual
+        residual are at most ``tol``, see Notes.
+    residuals : list, optional
+        If given, the pair ``(primal_residual, dual_residual)`` is
+        appended to this list after each iteration.
 
     Notes
     -----
@@ -112,6 +121,17 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     where, if the simpler problem is considered, all :math:`\nu_i` can be
     considered to be :math:`\infty`.
 
+    The residuals used for ``tol`` are the scaled changes of the iterates,
+
+    .. math::
+        p_k = \|x_{k+1} - x_k\| / \tau, \quad
+        d_k = \Big(\sum_i \|v_{i, k+1} - v_{i, k}\|^2 / \sigma_i^2
+              \Big)^{1/2}.
+
+    Adaptive step size balancing as in `pdhg` is not offered since the
+    condition above bounds :math:`\tau` and :math:`\sigma_i` separately,
+    not only their product.
+
     For reference on the forward-backward primal-dual algorithm, see [BC2015].
 
     For more on proximal operators and algorithms see [PB2014].
@@ -161,30 +181,84 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
             raise ValueError('`grad_cc_l` not same length as `L`')
         grad_cc_l = [li.convex_conj.gradient for li in l]
 
+    tol = kwargs.pop('tol', None)
+    if tol is not None:
+        tol, tol_in = float(tol), tol
+        if tol <= 0:
+            raise ValueError('`tol` must be positive, got {}'.format(tol_in))
+    residuals = kwargs.pop('residuals', None)
+    track_residuals = tol is not None or residuals is not None
+
     if kwargs:
         raise TypeError('unexpected keyword argument: {}'.format(kwargs))
 
-    # Pre-allocate values
-    v = [Li.range.zero() for Li in L]
-    y = x.space.zero()
+    # Pre-allocate values, using the active buffer pool if any
+    v = [acquire_element(Li.range) for Li in L]
+    for vi in v:
+        vi.set_zero()
 
-    for k in range(niter):
-        x_old = x
+    # Temporaries
+    tmp_1 = acquire_element(x.space)
+    tmp_dom = acquire_element(x.space)
+    rans = {Li.range for Li in L}
+    tmp_ran = {ran: acquire_element(ran) for ran in rans}
+    if l is not None:
+        tmp_grad = {ran: acquire_element(ran) for ran in rans}
+    else:
+        tmp_grad = {}
 
-        tmp_1 = grad_h(x) + sum(Li.adjoint(vi) for Li, vi in zip(L, v))
-        prox_f(tau)(x - tau * tmp_1, out=x)
-        y.lincomb(2.0, x, -1, x_old)
+    # Copy of the previous iterate, only needed for the residuals
+    if track_residuals:
+        x_old = acquire_element(x.space)
+        temporaries = [x_old]
+    else:
+        temporaries = []
 
+    for k in range(niter):
+        if track_residuals:
+            x_old.assign(x)
+
+        # tmp_1 = grad_h(x) + sum(Li.adjoint(vi) for Li, vi in zip(L, v))
+        grad_h(x, out=tmp_1)
+        for Li, vi in zip(L, v):
+            Li.adjoint(vi, out=tmp_dom)
+            tmp_1 += tmp_dom
+        tmp_1.lincomb(1, x, -tau, tmp_1)
+        prox_f(tau)(tmp_1, out=x)
+
+        dual_res_sq = 0.0
         for i in range(m):
+            tmp_2 = tmp_ran[L[i].range]
+            L[i](x, out=tmp_2)
             if l is not None:
                 # In this case gradients were given.
-                tmp_2 = sigma[i] * (L[i](y) - grad_cc_l[i](v[i]))
+                tmp_3 = tmp_grad[L[i].range]
+                grad_cc_l[i](v[i], out=tmp_3)
+                tmp_2 -= tmp_3
+            # Otherwise gradients were not given. Therefore the gradient
+            # step is omitted. For more details, see the documentation.
+
+            tmp_2.lincomb(1, v[i], sigma[i], tmp_2)
+            if track_residuals:
+                # Keep the old dual variable to compute the residual
+                prox_cc_g[i](sigma[i])(tmp_2, out=tmp_2)
+                dual_res_sq += (v[i].dist(tmp_2) / sigma[i]) ** 2
+                v[i].assign(tmp_2)
             else:
-                # In this case gradients were not given. Therefore the gradient
-                # step is omitted. For more details, see the documentation.
-                tmp_2 = sigma[i] * L[i](y)
+                prox_cc_g[i](sigma[i])(tmp_2, out=v[i])
 
-            prox_cc_g[i](sigma[i])(v[i] + tmp_2, out=v[i])
+        if track_residuals:
+            primal_res = x.dist(x_old) / tau
+            dual_res = np.sqrt(dual_res_sq)
+            if residuals is not None:
+                residuals.append((primal_res, dual_res))
 
         if callback is not None:
             callback(x)
+
+        if tol is not None and primal_res <= tol and dual_res <= tol:
+            break
+
+    release_element(tmp_1, tmp_dom, *(v + temporaries))
+    release_element(*tmp_ran.values())
+    release_element(*tmp_grad.values())
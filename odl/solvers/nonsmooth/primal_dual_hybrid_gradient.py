@@ -16,6 +16,10 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.util import (
+    PrimalDualStepBalancing, load_solver_state, restore_solver_state,
+    save_solver_state)
+from odl.util.buffer_pool import acquire_element, release_element
 
 
 __all__ = ('pdhg', 'pdhg_stepsize')
@@ -95,6 +99,36 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         Required to resume iteration. For ``None``, ``op.range.zero()``
         is used.
         Default: ``None``
+    checkpoint : str, optional
+        File to which the complete iteration state, i.e., ``x``,
+        ``x_relax``, ``y``, step sizes and relaxation parameter, is
+        written every ``checkpoint_step`` iterations, see
+        `save_solver_state`.
+        Default: ``None``
+    checkpoint_step : positive int, optional
+        Number of iterations between two checkpoints.
+        Default: 1
+    resume_from : str, optional
+        Checkpoint file from which the iteration state is restored.
+        The iteration then continues exactly as the run that wrote the
+        checkpoint. In this case, ``niter`` counts all iterations,
+        including those before the checkpoint.
+        Default: ``None``
+    tol : positive float, optional
+        Stop the iteration early once both the primal and the dual
+        residual are at most ``tol``, see Notes.
+        Default: ``None``
+    step_balancing : bool or `PrimalDualStepBalancing`, optional
+        Adaptively balance ``tau`` and ``sigma`` based on the residuals,
+        keeping their product fixed. ``True`` uses the default
+        `PrimalDualStepBalancing`. A given instance is reset at the start
+        unless the iteration is resumed from a checkpoint. Cannot be
+        combined with acceleration.
+        Default: ``None``
+    residuals : list, optional
+        If given, the pair ``(primal_residual, dual_residual)`` is
+        appended to this list after each iteration.
+        Default: ``None``
 
     Notes
     -----
@@ -118,6 +152,24 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
 
     where :math:`\|L\|` is the operator norm of :math:`L`.
 
+    The residuals used for ``tol`` and ``step_balancing`` are the
+    primal-dual residuals of [GLY2015],
+
+    .. math::
+        p_k = \|x_{k+1} - x_k\| / \tau, \quad
+        d_k = \|(y_k - y_{k+1}) / \sigma - L(x_{k+1} - \bar{x}_k)\|,
+
+    where :math:`\bar{x}_k` is the relaxed primal iterate used in the dual
+    update. They measure how far :math:`(x_{k+1}, y_{k+1})` is from
+    satisfying the optimality conditions. For linear :math:`L`, the
+    iteration then evaluates :math:`L x_{k+1}` instead of
+    :math:`L \bar{x}_{k+1}` and obtains the latter by linearity as
+    :math:`(1 + \theta) L x_{k+1} - \theta L x_k`, such that the
+    residuals come without additional evaluations of :math:`L`, at the
+    cost of two more temporaries in the range. For nonlinear :math:`L`,
+    the derivative at :math:`x_{k+1}` is used in the dual residual, which
+    costs one additional evaluation per iteration.
+
     It is often of interest to study problems that involve several operators,
     for example the classical TV regularized problem
 
@@ -176,6 +228,10 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     [Val2014] Valkonen, T.
     *A primal-dual hybrid gradient method for non-linear operators with
     applications to MRI*. Inverse Problems, 30 (2014).
+
+    [GLY2015] Goldstein, T, Li, M, and Yuan, X. *Adaptive primal-dual
+    splitting methods for statistical learning and image processing*.
+    Advances in Neural Information Processing Systems, 2015.
     """
     # Forward operator
     if not isinstance(L, Operator):
@@ -224,6 +280,7 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
 
     if gamma_primal is not None and gamma_dual is not None:
         raise ValueError('Only one acceleration parameter can be used')
+    proximal_constant = (gamma_primal is None) and (gamma_dual is None)
 
     # Callback object
     callback = kwargs.pop('callback', None)
@@ -231,10 +288,55 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         raise TypeError('`callback` {} is not callable'
                         ''.format(callback))
 
+    # Residual based stopping and step size balancing
+    tol = kwargs.pop('tol', None)
+    if tol is not None:
+        tol, tol_in = float(tol), tol
+        if tol <= 0:
+            raise ValueError('`tol` must be positive, got {}'.format(tol_in))
+
+    step_balancing = kwargs.pop('step_balancing', None)
+    if step_balancing is True:
+        step_balancing = PrimalDualStepBalancing()
+    elif step_balancing is False:
+        step_balancing = None
+    if step_balancing is not None and not proximal_constant:
+        raise ValueError('`step_balancing` cannot be combined with '
+                         'acceleration')
+
+    residuals = kwargs.pop('residuals', None)
+    track_residuals = (tol is not None or step_balancing is not None or
+                       residuals is not None)
+
+    # Checkpointing
+    checkpoint = kwargs.pop('checkpoint', None)
+    checkpoint_step = int(kwargs.pop('checkpoint_step', 1))
+    if checkpoint_step < 1:
+        raise ValueError('`checkpoint_step` must be positive, got {}'
+                         ''.format(checkpoint_step))
+
+    # Restore step sizes first since the proximals depend on them
+    resume_from = kwargs.pop('resume_from', None)
+    if resume_from is not None:
+        state = load_solver_state(resume_from)
+        start = state['iteration']
+        tau, sigma, theta = state['tau'], state['sigma'], state['theta']
+        if step_balancing is not None and 'balancing_alpha' in state:
+            step_balancing.alpha = state['balancing_alpha']
+    else:
+        start = 0
+        if step_balancing is not None:
+            step_balancing.reset()
+
+    # Temporaries taken from the active buffer pool, if any
+    temporaries = []
+
     # Initialize the relaxation variable
     x_relax = kwargs.pop('x_relax', None)
     if x_relax is None:
-        x_relax = x.copy()
+        x_relax = acquire_element(x.space)
+        x_relax.assign(x)
+        temporaries.append(x_relax)
     elif x_relax not in L.domain:
         raise TypeError('`x_relax` {} is not in the domain of '
                         '`L` {}'.format(x_relax.space, L.domain))
@@ -242,35 +344,65 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     # Initialize the dual variable
     y = kwargs.pop('y', None)
     if y is None:
-        y = L.range.zero()
+        y = acquire_element(L.range)
+        y.set_zero()
+        temporaries.append(y)
     elif y not in L.range:
         raise TypeError('`y` {} is not in the range of `L` '
                         '{}'.format(y.space, L.range))
 
+    if resume_from is not None:
+        restore_solver_state(x, state['x'])
+        restore_solver_state(x_relax, state['x_relax'])
+        restore_solver_state(y, state['y'])
+
     # Get the proximals
     proximal_primal = f.proximal
     proximal_dual = g.convex_conj.proximal
-    proximal_constant = (gamma_primal is None) and (gamma_dual is None)
     if proximal_constant:
         # Pre-compute proximals for efficiency
         proximal_dual_sigma = proximal_dual(sigma)
         proximal_primal_tau = proximal_primal(tau)
 
     # Temporary copy to store previous iterate
-    x_old = x.space.element()
+    x_old = acquire_element(x.space)
 
     # Temporaries
-    dual_tmp = L.range.element()
-    primal_tmp = L.domain.element()
-
-    for _ in range(niter):
+    dual_tmp = acquire_element(L.range)
+    primal_tmp = acquire_element(L.domain)
+    temporaries += [x_old, dual_tmp, primal_tmp]
+
+    # Previous dual iterate, only needed for the residuals
+    if track_residuals:
+        y_old = acquire_element(L.range)
+        temporaries.append(y_old)
+
+    # For linear `L`, the residuals are computed from `L x` and `L x_relax`
+    # that are kept up to date by linearity, see Notes
+    linear_residuals = track_residuals and L.is_linear
+    if linear_residuals:
+        L_x = acquire_element(L.range)
+        L_x_relax = acquire_element(L.range)
+        temporaries += [L_x, L_x_relax]
+        L(x_relax, out=L_x_relax)
+        if start == 0 and x_relax == x:
+            L_x.assign(L_x_relax)
+        else:
+            L(x, out=L_x)
+
+    for k in range(start, niter):
         # Copy required for relaxation
         x_old.assign(x)
+        if track_residuals:
+            y_old.assign(y)
 
         # Gradient ascent in the dual variable y
         # Compute dual_tmp = y + sigma * L(x_relax)
-        L(x_relax, out=dual_tmp)
-        dual_tmp.lincomb(1, y, sigma, dual_tmp)
+        if linear_residuals:
+            dual_tmp.lincomb(1, y, sigma, L_x_relax)
+        else:
+            L(x_relax, out=dual_tmp)
+            dual_tmp.lincomb(1, y, sigma, dual_tmp)
 
         # Apply the dual proximal
         if not proximal_constant:
@@ -287,6 +419,25 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
             proximal_primal_tau = proximal_primal(tau)
         proximal_primal_tau(primal_tmp, out=x)
 
+        if track_residuals:
+            # The dual residual includes the coupling term
+            # L(x_{k+1} - x_relax_k), see Notes. `y_old` and the temporaries
+            # are free to use at this point.
+            primal_res = x.dist(x_old) / tau
+            y_old.lincomb(1 / sigma, y_old, -1 / sigma, y)
+            if linear_residuals:
+                # Keep L(x_{k+1}) in `dual_tmp` for the relaxation below
+                L(x, out=dual_tmp)
+                y_old -= dual_tmp
+                y_old += L_x_relax
+                dual_res = y_old.norm()
+            else:
+                primal_tmp.lincomb(1, x, -1, x_relax)
+                L.derivative(x)(primal_tmp, out=dual_tmp)
+                dual_res = y_old.dist(dual_tmp)
+            if residuals is not None:
+                residuals.append((primal_res, dual_res))
+
         # Acceleration
         if gamma_primal is not None:
             theta = float(1 / np.sqrt(1 + 2 * gamma_primal * tau))
@@ -300,10 +451,32 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
 
         # Over-relaxation in the primal variable x
         x_relax.lincomb(1 + theta, x, -theta, x_old)
+        if linear_residuals:
+            L_x_relax.lincomb(1 + theta, dual_tmp, -theta, L_x)
+            L_x, dual_tmp = dual_tmp, L_x
+
+        if step_balancing is not None:
+            factor = step_balancing(primal_res, dual_res)
+            if factor != 1:
+                tau *= factor
+                sigma /= factor
+                proximal_dual_sigma = proximal_dual(sigma)
+                proximal_primal_tau = proximal_primal(tau)
 
         if callback is not None:
             callback(x)
 
+        if checkpoint is not None and (k + 1) % checkpoint_step == 0:
+            save_solver_state(checkpoint, {
+                'iteration': k + 1, 'x': x, 'x_relax': x_relax, 'y': y,
+                'tau': tau, 'sigma': sigma, 'theta': theta,
+                'balancing_alpha': getattr(step_balancing, 'alpha', None)})
+
+        if tol is not None and primal_res <= tol and dual_res <= tol:
+            break
+
+    release_element(*temporaries)
+
 
 def pdhg_stepsize(L, tau=None, sigma=None):
     r"""Default step sizes for `pdhg`.
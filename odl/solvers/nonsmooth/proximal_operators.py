@@ -1134,6 +1134,122 @@ def proximal_convex_conj_l1(space, lam=1, g=None):
     return ProximalConvexConjL1
 
 
+# Target number of points per slab in the fused group-L1-L2 kernel. All
+# components of a slab are processed while they are in cache.
+_GROUP_SLAB_SIZE = 2 ** 16
+
+
+def _group_l1_l2_arrays(space, *elems):
+    """Return the component arrays of each of ``elems``, or ``None``.
+
+    The fused group-L1-L2 kernel applies to real NumPy-based power spaces.
+    For other spaces, ``None`` is returned. The arrays of contiguous
+    product space elements are views into their stacked array.
+    """
+    if not (isinstance(space, ProductSpace) and space.is_power_space and
+            getattr(space[0], 'impl', None) == 'numpy' and
+            getattr(space[0], 'is_real', False) and
+            getattr(space[0], 'ndim', 0) >= 1):
+        return None
+
+    arrays = []
+    for x in elems:
+        data = getattr(x, 'data', None)
+        if data is not None:
+            arrays.append(list(data))
+        else:
+            arrays.append([xi.asarray() for xi in x])
+    return arrays
+
+
+def _group_l1_l2_kernel(xs, gs, sigma, lam, outs, dual, num_threads=1):
+    """Fused pointwise kernel of the group-L1-L2 proximals.
+
+    With ``d = x - sigma * g`` for ``dual=True`` and ``d = x - g``
+    otherwise, this computes per point ::
+
+        dual:   out = d / (max(|d|_2, lam) / lam)
+        primal: out = x - d / max(|d|_2 / (sigma * lam), 1)
+
+    The components are processed in slabs along the first axis, each of
+    which is read once and written once. Since all components of a slab
+    are read before any of them is written, ``outs`` may alias ``xs``.
+
+    Parameters
+    ----------
+    xs, outs : sequence of `numpy.ndarray`
+        Components of the input and output vector fields.
+    gs : sequence of `numpy.ndarray` or None
+        Components of the data vector field. ``None`` means zero.
+    sigma : positive float or `numpy.ndarray`
+        Step size, either global or per point.
+    lam : positive float
+        Scaling factor of the functional.
+    dual : bool
+        Whether to compute the proximal of the convex conjugate.
+    num_threads : positive int, optional
+        Number of threads among which the slabs are distributed.
+    """
+    from odl.util.parallel import parallel_map
+
+    shape = xs[0].shape
+    num_rows = shape[0]
+    row_size = max(int(np.prod(shape[1:])), 1)
+    rows = max(_GROUP_SLAB_SIZE // row_size, 1)
+    if num_threads > 1:
+        rows = min(rows, -(-num_rows // num_threads))
+    slabs = [slice(start, min(start + rows, num_rows))
+             for start in range(0, num_rows, rows)]
+
+    def group_slab(slc):
+        x_slab = [x[slc] for x in xs]
+        sig = sigma if np.isscalar(sigma) else sigma[slc]
+        if gs is None:
+            diffs = x_slab
+        elif dual:
+            diffs = [x - sig * g[slc] for x, g in zip(x_slab, gs)]
+        else:
+            diffs = [x - g[slc] for x, g in zip(x_slab, gs)]
+
+        # denom = |d|_2, accumulated without a temporary per component
+        denom = np.multiply(diffs[0], diffs[0])
+        tmp = np.empty_like(denom)
+        for d in diffs[1:]:
+            np.multiply(d, d, out=tmp)
+            denom += tmp
+        np.sqrt(denom, out=denom)
+
+        if dual:
+            np.maximum(denom, lam, out=denom)
+            denom /= lam
+            for d, out in zip(diffs, outs):
+                np.divide(d, denom, out=out[slc])
+        else:
+            denom /= sig * lam
+            np.maximum(denom, 1, out=denom)
+            for x, d, out in zip(x_slab, diffs, outs):
+                np.divide(d, denom, out=tmp)
+                np.subtract(x, tmp, out=out[slc])
+
+    parallel_map(group_slab, slabs, num_threads)
+
+
+def _group_l1_l2_sigma(space, sigma):
+    """Return ``sigma`` as float or as element of ``space[0]``."""
+    if np.isscalar(sigma):
+        return float(sigma)
+    if not (isinstance(space, ProductSpace) and space.is_power_space):
+        raise TypeError('pointwise `sigma` requires a power space, got '
+                        '{!r}'.format(space))
+    return space[0].element(sigma)
+
+
+def _group_l1_l2_num_threads(space):
+    """Return the number of threads of the components of ``space``."""
+    base = getattr(space[0], 'tspace', space[0])
+    return getattr(base, 'num_threads', 1)
+
+
 def proximal_convex_conj_l1_l2(space, lam=1, g=None):
     r"""Proximal operator factory of the L1-L2 norm/distance convex conjugate.
 
@@ -1207,21 +1323,39 @@ def proximal_convex_conj_l1_l2(space, lam=1, g=None):
 
             Parameters
             ----------
-            sigma : positive float
-                Step size parameter
+            sigma : positive float or pointwise positive ``space[0]`` element
+                Step size parameter. If scalar, it contains a global stepsize,
+                otherwise the ``space[0]`` element defines a stepsize for
+                each point, shared by all components.
             """
             super(ProximalConvexConjL1L2, self).__init__(
                 domain=space, range=space, linear=False)
-            self.sigma = float(sigma)
+            self.sigma = _group_l1_l2_sigma(space, sigma)
 
         def _call(self, x, out):
             """Return ``self(x, out=out)``."""
             # lam * (x - sig * g) / max(lam, |x - sig * g|)
 
+            arrays = _group_l1_l2_arrays(self.domain, x, out,
+                                         *([] if g is None else [g]))
+            if arrays is not None:
+                sigma = self.sigma
+                if not np.isscalar(sigma):
+                    sigma = sigma.asarray()
+                _group_l1_l2_kernel(
+                    arrays[0], None if g is None else arrays[2], sigma, lam,
+                    arrays[1], dual=True,
+                    num_threads=_group_l1_l2_num_threads(self.domain))
+                return
+
             # diff = x - sig * g
             if g is not None:
                 diff = self.domain.element()
-                diff.lincomb(1, x, -self.sigma, g)
+                if np.isscalar(self.sigma):
+                    diff.lincomb(1, x, -self.sigma, g)
+                else:
+                    for diff_i, x_i, g_i in zip(diff, x, g):
+                        diff_i.lincomb(1, x_i, -1, self.sigma * g_i)
             else:
                 diff = x
 
@@ -1412,15 +1546,29 @@ def proximal_l1_l2(space, lam=1, g=None):
 
             Parameters
             ----------
-            sigma : positive float
-                Step size parameter.
+            sigma : positive float or pointwise positive ``space[0]`` element
+                Step size parameter. If scalar, it contains a global stepsize,
+                otherwise the ``space[0]`` element defines a stepsize for
+                each point, shared by all components.
             """
             super(ProximalL1L2, self).__init__(
                 domain=space, range=space, linear=False)
-            self.sigma = float(sigma)
+            self.sigma = _group_l1_l2_sigma(space, sigma)
 
         def _call(self, x, out):
             """Return ``self(x, out=out)``."""
+            arrays = _group_l1_l2_arrays(self.domain, x, out,
+                                         *([] if g is None else [g]))
+            if arrays is not None:
+                sigma = self.sigma
+                if not np.isscalar(sigma):
+                    sigma = sigma.asarray()
+                _group_l1_l2_kernel(
+                    arrays[0], None if g is None else arrays[2], sigma, lam,
+                    arrays[1], dual=False,
+                    num_threads=_group_l1_l2_num_threads(self.domain))
+                return
+
             # diff = x - g
             if g is not None:
                 diff = x - g
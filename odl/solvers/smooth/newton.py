@@ -18,7 +18,7 @@ from odl.solvers.iterative.iterative import conjugate_gradient
 __all__ = ('newtons_method', 'bfgs_method', 'broydens_method')
 
 
-def _bfgs_direction(s, y, x, hessinv_estimate=None):
+def _bfgs_direction(s, y, x, hessinv_estimate=None, rhos=None):
     r"""Compute ``Hn^-1(x)`` for the L-BFGS method.
 
     Parameters
@@ -31,6 +31,9 @@ def _bfgs_direction(s, y, x, hessinv_estimate=None):
         Point in which to evaluate the product.
     hessinv_estimate : `Operator`, optional
         Initial estimate of the hessian ``H0^-1``.
+    rhos : sequence of floats, optional
+        Precomputed values ``1 / y[i].inner(s[i])``. For ``None``, they
+        are computed from ``s`` and ``y``.
 
     Returns
     -------
@@ -52,12 +55,13 @@ def _bfgs_direction(s, y, x, hessinv_estimate=None):
     """
     assert len(s) == len(y)
 
+    if rhos is None:
+        rhos = [1.0 / yi.inner(si) for si, yi in zip(s, y)]
+
     r = x.copy()
     alphas = np.zeros(len(s))
-    rhos = np.zeros(len(s))
 
     for i in reversed(range(len(s))):
-        rhos[i] = 1.0 / y[i].inner(s[i])
         alphas[i] = rhos[i] * (s[i].inner(r))
         r.lincomb(1, r, -alphas[i], y[i])
 
@@ -71,6 +75,221 @@ def _bfgs_direction(s, y, x, hessinv_estimate=None):
     return r
 
 
+def _const_inner_weight(space):
+    """Return ``c`` if ``space.inner(x, y) == c * dot(x.ravel(), y.ravel())``.
+
+    For spaces whose inner product is not of this form, e.g., product
+    spaces, complex or non-uniformly weighted spaces, ``None`` is returned.
+    """
+    weighting = getattr(space, 'weighting', None)
+    if (getattr(space, 'is_real', False) is not True or
+            getattr(space, 'impl', None) != 'numpy' or
+            getattr(weighting, 'exponent', None) != 2.0):
+        return None
+    try:
+        return float(weighting.const)
+    except (AttributeError, TypeError):
+        return None
+
+
+class _LBFGSHistory(object):
+
+    """Curvature pairs ``(s_i, y_i)`` of the (limited-memory) BFGS method.
+
+    The pairs are stored in a ring buffer of at most ``num_store`` slots,
+    together with the cached values ``rho_i = 1 / <y_i, s_i>``. Adding a
+    pair to a full history overwrites the oldest one, and its elements are
+    handed back to the caller for reuse.
+
+    If ``contiguous=True``, the pairs are instead copied into the rows of a
+    single ``(2 * num_store, space.size)`` array, and the inner products
+    ``<s_i, y_j>`` and ``<y_i, y_j>`` are cached as well. The product with
+    the inverse Hessian estimate is then computed in the compact
+    representation of [BNS1994], using three passes over the history
+    array per iteration instead of ``4 * num_store`` inner products and
+    linear combinations.
+
+    References
+    ----------
+    [BNS1994] Byrd, R H, Nocedal, J, and Schnabel, R B. *Representations
+    of quasi-Newton matrices and their use in limited memory methods*.
+    Mathematical Programming, 63 (1994), pp 129--156.
+    """
+
+    def __init__(self, space, num_store=None, contiguous=False):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `LinearSpace`
+            Space of the iterates.
+        num_store : positive int, optional
+            Maximum number of stored pairs. For ``None``, the history is
+            unbounded.
+        contiguous : bool, optional
+            If ``True``, store the pairs in one contiguous array. This
+            requires ``num_store`` and a real NumPy-based space with
+            constant weighting.
+        """
+        self.space = space
+        self.num_store = None if num_store is None else int(num_store)
+        if self.num_store is not None and self.num_store < 1:
+            raise ValueError('`num_store` must be positive, got {}'
+                             ''.format(num_store))
+
+        self.contiguous = bool(contiguous)
+        self.start = 0
+        self.size = 0
+        if self.contiguous:
+            self.weight = _const_inner_weight(space)
+            if self.num_store is None or self.weight is None:
+                raise ValueError('`contiguous=True` requires `num_store` and '
+                                 'a real NumPy-based space with constant '
+                                 'weighting, got `num_store={}` and space '
+                                 '{!r}'.format(num_store, space))
+            m = self.num_store
+            self.history = np.zeros((2 * m, space.size), dtype=space.dtype)
+            self.s_dot_y = np.zeros((m, m))
+            self.y_dot_y = np.zeros((m, m))
+            self.rhos = np.zeros(m)
+        else:
+            self.ss = []
+            self.ys = []
+            self.rhos = []
+
+    def __len__(self):
+        """Return ``len(self)``."""
+        return self.size
+
+    def clear(self):
+        """Discard all stored pairs."""
+        self.start = 0
+        self.size = 0
+        if not self.contiguous:
+            self.ss = []
+            self.ys = []
+            self.rhos = []
+
+    def _slots(self):
+        """Return the occupied slots, from oldest to newest pair."""
+        if self.num_store is None:
+            return list(range(self.size))
+        return [(self.start + k) % self.num_store for k in range(self.size)]
+
+    def push(self, s, y, y_inner_s):
+        """Add the pair ``(s, y)`` with precomputed ``<y, s>``.
+
+        Without ``contiguous``, the elements ``s`` and ``y`` are stored
+        by reference and must not be modified by the caller afterwards.
+
+        Returns
+        -------
+        recycled : tuple of 2 ``space`` elements or None
+            Elements that are no longer used by the history and can be
+            reused by the caller. These are the evicted oldest pair, or
+            ``(s, y)`` themselves if the pair was copied.
+        """
+        rho = 1.0 / y_inner_s
+        m = self.num_store
+
+        if self.contiguous:
+            slot = (self.start + self.size) % m
+            self.history[slot] = np.asarray(s).ravel()
+            self.history[m + slot] = np.asarray(y).ravel()
+            # One pass for all <s_i, y> and <y_i, y>
+            prods = self.weight * self.history.dot(self.history[m + slot])
+            self.s_dot_y[:, slot] = prods[:m]
+            self.y_dot_y[:, slot] = self.y_dot_y[slot, :] = prods[m:]
+            self.s_dot_y[slot, slot] = y_inner_s
+            self.rhos[slot] = rho
+            recycled = (s, y)
+        elif m is None or self.size < m:
+            self.ss.append(s)
+            self.ys.append(y)
+            self.rhos.append(rho)
+            recycled = None
+        else:
+            slot = self.start
+            recycled = (self.ss[slot], self.ys[slot])
+            self.ss[slot] = s
+            self.ys[slot] = y
+            self.rhos[slot] = rho
+
+        if m is None or self.size < m:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % m
+        return recycled
+
+    def direction(self, x, hessinv_estimate=None):
+        """Return ``Hn^-1(x)`` for the stored pairs.
+
+        Parameters
+        ----------
+        x : ``space`` element
+            Point in which to evaluate the product.
+        hessinv_estimate : `Operator`, optional
+            Initial estimate of the inverse Hessian ``H0^-1``. The compact
+            representation is only used if it is a `ScalingOperator`.
+
+        Returns
+        -------
+        r : ``space`` element
+            The result of ``Hn^-1(x)``.
+        """
+        from odl.operator import ScalingOperator
+
+        slots = self._slots()
+        if not self.contiguous:
+            return _bfgs_direction(
+                [self.ss[i] for i in slots], [self.ys[i] for i in slots],
+                x, hessinv_estimate, [self.rhos[i] for i in slots])
+
+        if hessinv_estimate is None:
+            gamma = 1.0
+        elif (isinstance(hessinv_estimate, ScalingOperator) and
+              hessinv_estimate.range == self.space):
+            gamma = float(hessinv_estimate.scalar)
+        else:
+            # No compact form, fall back to the two-loop recursion on views
+            m = self.num_store
+            ss = [self.space.element(self.history[i].reshape(self.space.shape))
+                  for i in slots]
+            ys = [self.space.element(
+                self.history[m + i].reshape(self.space.shape))
+                for i in slots]
+            return _bfgs_direction(ss, ys, x, hessinv_estimate,
+                                   self.rhos[slots])
+
+        if not slots:
+            return gamma * x
+
+        from scipy.linalg import solve_triangular
+
+        # With a = S^T x, b = Y^T x and the upper triangle R of S^T Y,
+        # H x = gamma * x + S p - gamma * Y u, where u = R^-1 a and
+        # p = R^-T ((D + gamma * Y^T Y) u - gamma * b)
+        m = self.num_store
+        x_arr = np.asarray(x).ravel()
+        prods = self.weight * self.history.dot(x_arr)
+        slots = np.array(slots)
+        a = prods[slots]
+        b = prods[m + slots]
+        r_mat = np.triu(self.s_dot_y[np.ix_(slots, slots)])
+        yty = self.y_dot_y[np.ix_(slots, slots)]
+
+        u = solve_triangular(r_mat, a)
+        rhs = np.diag(r_mat) * u + gamma * (yty.dot(u) - b)
+        p = solve_triangular(r_mat, rhs, trans='T')
+
+        coeffs = np.zeros(2 * m, dtype=self.history.dtype)
+        coeffs[slots] = p
+        coeffs[m + slots] = -gamma * u
+        r_arr = coeffs.dot(self.history)
+        r_arr += gamma * x_arr
+        return self.space.element(r_arr.reshape(self.space.shape))
+
+
 def _broydens_direction(s, y, x, hessinv_estimate=None, impl='first'):
     r"""Compute ``Hn^-1(x)`` for Broydens method.
 
@@ -244,7 +463,7 @@ def newtons_method(f, x, line_search=1.0, maxiter=1000, tol=1e-16,
 
 
 def bfgs_method(f, x, line_search=1.0, maxiter=1000, tol=1e-15, num_store=None,
-                hessinv_estimate=None, callback=None):
+                hessinv_estimate=None, callback=None, contiguous=False):
     r"""Quasi-Newton BFGS method to minimize a differentiable function.
 
     Notes
@@ -297,9 +516,20 @@ def bfgs_method(f, x, line_search=1.0, maxiter=1000, tol=1e-15, num_store=None,
         Default: Identity on ``f.domain``
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
+    contiguous : bool, optional
+        If ``True``, the correction factors are stored in one contiguous
+        array, and the search direction is computed from cached inner
+        products in the compact representation of [BNS1994]. This requires
+        ``num_store`` and a real NumPy-based ``f.domain`` with constant
+        weighting, and is fastest for a `ScalingOperator` (or no)
+        ``hessinv_estimate``.
 
     References
     ----------
+    [BNS1994] Byrd, R H, Nocedal, J, and Schnabel, R B. *Representations
+    of quasi-Newton matrices and their use in limited memory methods*.
+    Mathematical Programming, 63 (1994), pp 129--156.
+
     [GNS2009] Griva, I, Nash, S G, and Sofer, A. *Linear and nonlinear
     optimization*. Siam, 2009.
     """
@@ -311,13 +541,15 @@ def bfgs_method(f, x, line_search=1.0, maxiter=1000, tol=1e-15, num_store=None,
     if not callable(line_search):
         line_search = ConstantLineSearch(line_search)
 
-    ys = []
-    ss = []
+    # Correction factors with cached `1 / <y_i, s_i>`, the elements of
+    # discarded factors are reused for the gradient
+    history = _LBFGSHistory(grad.domain, num_store, contiguous)
+    spare = []
 
     grad_x = grad(x)
     for i in range(maxiter):
         # Determine a stepsize using line search
-        search_dir = -_bfgs_direction(ss, ys, grad_x, hessinv_estimate)
+        search_dir = -history.direction(grad_x, hessinv_estimate)
         dir_deriv = search_dir.inner(grad_x)
         if np.abs(dir_deriv) == 0:
             return  # we found an optimum
@@ -328,7 +560,12 @@ def bfgs_method(f, x, line_search=1.0, maxiter=1000, tol=1e-15, num_store=None,
         x_update *= step
         x += x_update
 
-        grad_x, grad_diff = grad(x), grad_x
+        grad_diff = grad_x
+        if spare:
+            grad_x = spare.pop()
+            grad(x, out=grad_x)
+        else:
+            grad_x = grad(x)
         # grad_diff = grad(x) - grad(x_old)
         grad_diff.lincomb(-1, grad_diff, 1, grad_x)
 
@@ -340,17 +577,14 @@ def bfgs_method(f, x, line_search=1.0, maxiter=1000, tol=1e-15, num_store=None,
                 return
             else:
                 # Reset if needed
-                ys = []
-                ss = []
+                history.clear()
+                spare.append(grad_diff)
                 continue
 
         # Update Hessian
-        ys.append(grad_diff)
-        ss.append(x_update)
-        if num_store is not None:
-            # Throw away factors if they are too many.
-            ss = ss[-num_store:]
-            ys = ys[-num_store:]
+        recycled = history.push(x_update, grad_diff, y_inner_s)
+        if recycled is not None:
+            spare.append(recycled[1])
 
         if callback is not None:
             callback(x)
@@ -11,8 +11,10 @@
 from __future__ import absolute_import
 
 from .callback import *
+from .checkpoint import *
 from .steplen import *
 
 __all__ = ()
 __all__ += callback.__all__
+__all__ += checkpoint.__all__
 __all__ += steplen.__all__
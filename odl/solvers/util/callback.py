@@ -13,19 +13,22 @@ from __future__ import absolute_import, division, print_function
 import contextlib
 import copy
 import os
+import threading
 import time
 import warnings
 from builtins import object
 
 import numpy as np
+from future.moves.queue import Queue
 
+from odl.set.space import LinearSpaceElement
 from odl.util import signature_string
 
 __all__ = ('Callback', 'CallbackStore', 'CallbackApply', 'CallbackPrintTiming',
            'CallbackPrintIteration', 'CallbackPrint', 'CallbackPrintNorm',
            'CallbackShow', 'CallbackSaveToDisk', 'CallbackSleep',
            'CallbackShowConvergence', 'CallbackPrintHardwareUsage',
-           'CallbackProgressBar', 'save_animation')
+           'CallbackProgressBar', 'CallbackAsync', 'save_animation')
 
 
 class Callback(object):
@@ -1037,6 +1040,172 @@ class CallbackProgressBar(Callback):
                                    inner_str)
 
 
+class CallbackAsync(Callback):
+
+    """Callback wrapper that processes iterates in a background thread.
+
+    Calling this callback only copies the iterate into a snapshot buffer
+    and hands it over to a worker thread, which calls the wrapped callback
+    on it. Expensive callbacks like `CallbackSaveToDisk`, `CallbackShow`
+    or `CallbackPrintNorm` then run concurrently with the solver.
+
+    At most ``maxsize + 1`` snapshots exist at any time, one being
+    processed and up to ``maxsize`` waiting. If all of them are in use,
+    a call blocks until the worker has finished one, such that memory use
+    stays bounded if the wrapped callback is slower than the solver.
+    Snapshot buffers are reused, hence the wrapped callback must not keep
+    references to the iterates it receives (`CallbackStore` makes copies
+    and is safe to use).
+
+    Exceptions raised by the wrapped callback are re-raised in the
+    calling thread by the next call, `wait` or `close`.
+    """
+
+    def __init__(self, callback, maxsize=1, step=1):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        callback : callable
+            Callback to be run in the background thread.
+        maxsize : positive int, optional
+            Maximum number of snapshots waiting to be processed.
+            The default 1 corresponds to double buffering.
+        step : positive int, optional
+            Number of iterates between snapshots. Prefer this option over
+            the ``step`` option of ``callback`` since it also avoids the
+            copies.
+
+        Examples
+        --------
+        Compute norms in the background and wait for the results after
+        the solver has finished:
+
+        >>> store = CallbackStore() * odl.solvers.L2Norm(odl.rn(3))
+        >>> callback = CallbackAsync(store)
+        >>> x = odl.rn(3).element([3, 4, 0])
+        >>> for i in range(3):
+        ...     callback(x)
+        ...     x *= 2
+        >>> callback.close()
+        >>> store.callback.results
+        [5.0, 10.0, 20.0]
+        """
+        if not isinstance(callback, Callback):
+            callback = CallbackApply(callback)
+        self.callback = callback
+        self.maxsize = int(maxsize)
+        if self.maxsize < 1:
+            raise ValueError('`maxsize` must be positive, got {}'
+                             ''.format(maxsize))
+        self.step = int(step)
+        self.iter = 0
+
+        self.__tasks = None
+        self.__buffers = None
+        self.__thread = None
+        self.__error = None
+
+    def __start(self):
+        """Start the worker thread."""
+        self.__tasks = Queue()
+        self.__buffers = Queue()
+        for _ in range(self.maxsize + 1):
+            self.__buffers.put(None)
+        self.__thread = threading.Thread(target=self.__work,
+                                         name='CallbackAsync')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def __work(self):
+        """Process snapshots until a ``None`` task is received."""
+        while True:
+            snapshot = self.__tasks.get()
+            try:
+                if snapshot is None:
+                    return
+                if self.__error is None:
+                    self.callback(snapshot)
+            except Exception as exc:
+                self.__error = exc
+            finally:
+                if snapshot is not None:
+                    self.__buffers.put(snapshot)
+                self.__tasks.task_done()
+
+    def __raise_error(self):
+        """Re-raise an exception from the worker thread, if any."""
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def __call__(self, result):
+        """Copy ``result`` and schedule the wrapped callback on it."""
+        self.__raise_error()
+        if self.iter % self.step == 0:
+            if self.__thread is None:
+                self.__start()
+            # Blocks if all buffers are in use (backpressure)
+            buffer = self.__buffers.get()
+            self.__tasks.put(_snapshot(result, buffer))
+        self.iter += 1
+
+    def wait(self):
+        """Block until all scheduled iterates have been processed."""
+        if self.__thread is not None:
+            self.__tasks.join()
+        self.__raise_error()
+
+    def close(self):
+        """Process all scheduled iterates and stop the worker thread."""
+        if self.__thread is not None:
+            self.__tasks.put(None)
+            self.__thread.join()
+            self.__thread = self.__tasks = self.__buffers = None
+        self.__raise_error()
+
+    def __enter__(self):
+        """Return ``self`` for use in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Call `close` at the end of a ``with`` statement."""
+        self.close()
+
+    def reset(self):
+        """Stop the worker thread and reset the wrapped callback."""
+        self.close()
+        self.callback.reset()
+        self.iter = 0
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.callback]
+        optargs = [('maxsize', self.maxsize, 1),
+                   ('step', self.step, 1)]
+        inner_str = signature_string(posargs, optargs)
+        return '{}({})'.format(self.__class__.__name__, inner_str)
+
+
+def _snapshot(value, buffer=None):
+    """Return a copy of ``value``, reusing ``buffer`` if possible.
+
+    Space elements are copied into ``buffer`` if it is an element of the
+    same space, sequences are copied item by item.
+    """
+    if isinstance(value, LinearSpaceElement):
+        if buffer is None or buffer not in value.space:
+            buffer = value.space.element()
+        buffer.assign(value)
+        return buffer
+    elif isinstance(value, (list, tuple)):
+        if not isinstance(buffer, list) or len(buffer) != len(value):
+            buffer = [None] * len(value)
+        return [_snapshot(v, b) for v, b in zip(value, buffer)]
+    else:
+        return copy.deepcopy(value)
+
+
 @contextlib.contextmanager
 def save_animation(filename,
                    writer=None,
@@ -0,0 +1,187 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Checkpointing of the iteration state of solvers.
+
+The complete state of a solver, i.e., iterates, auxiliary variables, step
+sizes and random number generator state, is written to a single ``.npz``
+file. The file is first written under a temporary name and then renamed,
+such that an existing checkpoint is never left in a corrupted state if
+the process is killed while writing.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import tempfile
+
+import numpy as np
+
+from odl.set.space import LinearSpaceElement
+
+__all__ = ('save_solver_state', 'load_solver_state', 'restore_solver_state')
+
+
+def _flatten_state(value, key, arrays):
+    """Add ``value`` to ``arrays`` as one or more arrays under ``key``.
+
+    Dictionaries, sequences and product space elements are flattened
+    recursively, with keys of the form ``'key/subkey'``.
+    """
+    if value is None:
+        return
+    elif isinstance(value, dict):
+        for subkey, subvalue in value.items():
+            subkey = str(subkey)
+            if '/' in subkey:
+                raise ValueError("state keys may not contain '/', got {!r}"
+                                 "".format(subkey))
+            _flatten_state(subvalue, key + '/' + subkey if key else subkey,
+                           arrays)
+    elif isinstance(value, LinearSpaceElement) and hasattr(value, 'parts'):
+        for i, part in enumerate(value.parts):
+            _flatten_state(part, '{}/{}'.format(key, i), arrays)
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            _flatten_state(item, '{}/{}'.format(key, i), arrays)
+    else:
+        arr = np.asarray(value)
+        if arr.dtype == object:
+            raise TypeError('cannot store value {!r} of type {} under key '
+                            '{!r}'.format(value, type(value), key))
+        arrays[key] = arr
+
+
+def _unflatten_state(arrays):
+    """Inverse of `_flatten_state`, returning nested dicts and lists."""
+    state = {}
+    for key, arr in arrays.items():
+        subkeys = key.split('/')
+        node = state
+        for subkey in subkeys[:-1]:
+            node = node.setdefault(subkey, {})
+        node[subkeys[-1]] = arr.item() if arr.ndim == 0 else arr
+
+    def to_lists(node):
+        if not isinstance(node, dict):
+            return node
+        node = {k: to_lists(v) for k, v in node.items()}
+        if node and set(node) == {str(i) for i in range(len(node))}:
+            return [node[str(i)] for i in range(len(node))]
+        return node
+
+    return to_lists(state)
+
+
+def save_solver_state(path, state):
+    """Atomically write the state of a solver to a file.
+
+    Parameters
+    ----------
+    path : str
+        File to which the state is written. An existing file is replaced
+        only after the new state has been written completely.
+    state : dict
+        State to be saved. Values can be space elements (including
+        product space elements), arrays, scalars, strings, or (nested)
+        sequences and dicts of those. ``None`` values are skipped.
+
+    See Also
+    --------
+    load_solver_state
+    restore_solver_state
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> x = odl.rn(3).element([1, 2, 3])
+    >>> path = os.path.join(tempfile.mkdtemp(), 'state.npz')
+    >>> save_solver_state(path, {'iteration': 5, 'x': x, 'sigma': [1, 2]})
+    >>> state = load_solver_state(path)
+    >>> state['iteration'], state['sigma']
+    (5, [1, 2])
+    >>> state['x']
+    array([ 1.,  2.,  3.])
+    """
+    arrays = {}
+    _flatten_state(dict(state), '', arrays)
+
+    path = os.path.abspath(str(path))
+    dirname = os.path.dirname(path)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dirname, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_solver_state(path):
+    """Read a solver state written by `save_solver_state`.
+
+    Parameters
+    ----------
+    path : str
+        File from which the state is read.
+
+    Returns
+    -------
+    state : dict
+        The saved state. Space elements are returned as arrays, product
+        space elements and sequences as lists, and scalars as Python
+        scalars.
+    """
+    with np.load(str(path), allow_pickle=False) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    return _unflatten_state(arrays)
+
+
+def restore_solver_state(x, value):
+    """Assign the saved ``value`` to the space element ``x`` in-place.
+
+    Parameters
+    ----------
+    x : `LinearSpaceElement` or sequence of `LinearSpaceElement`
+        Element(s) to which the saved values are written. For product
+        space elements and sequences, the parts are restored recursively.
+    value :
+        Saved value as returned by `load_solver_state`.
+
+    Examples
+    --------
+    >>> x = odl.rn(3).zero()
+    >>> restore_solver_state(x, [1.0, 2.0, 3.0])
+    >>> x
+    rn(3).element([ 1.,  2.,  3.])
+    """
+    if isinstance(x, LinearSpaceElement) and hasattr(x, 'parts'):
+        parts = x.parts
+    elif isinstance(x, (list, tuple)):
+        parts = x
+    else:
+        x[:] = value
+        return
+
+    if len(parts) != len(value):
+        raise ValueError('saved state has {} parts, expected {}'
+                         ''.format(len(value), len(parts)))
+    for part, part_value in zip(parts, value):
+        restore_solver_state(part, part_value)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
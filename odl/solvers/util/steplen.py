@@ -14,7 +14,7 @@ import numpy as np
 
 
 __all__ = ('LineSearch', 'BacktrackingLineSearch', 'ConstantLineSearch',
-           'LineSearchFromIterNum')
+           'LineSearchFromIterNum', 'PrimalDualStepBalancing')
 
 
 class LineSearch(object):
@@ -289,6 +289,99 @@ class LineSearchFromIterNum(LineSearch):
         return step
 
 
+class PrimalDualStepBalancing(object):
+
+    """Adaptive balancing of primal and dual step sizes.
+
+    In primal-dual methods, the ratio of the primal step ``tau`` and the
+    dual step ``sigma`` strongly influences the speed of convergence,
+    while convergence itself only depends on their product. This class
+    implements the residual balancing scheme of [GLY2015]: if the primal
+    residual is much larger than the dual residual, the primal step is
+    increased and the dual step decreased by the same factor, and vice
+    versa. The adaptivity ``alpha`` decays geometrically each time the
+    steps are changed, such that the steps eventually become constant.
+
+    References
+    ----------
+    [GLY2015] Goldstein, T, Li, M, and Yuan, X. *Adaptive primal-dual
+    splitting methods for statistical learning and image processing*.
+    Advances in Neural Information Processing Systems, 2015.
+    """
+
+    def __init__(self, alpha=0.5, eta=0.95, delta=1.5):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        alpha : float, optional
+            Initial adaptivity, required to fulfill ``0 < alpha < 1``.
+            Steps are changed by the factor ``1 / (1 - alpha)``.
+        eta : float, optional
+            Decay of the adaptivity, required to fulfill ``0 < eta < 1``.
+            After each change, ``alpha`` is updated as ``alpha *= eta``.
+        delta : float, optional
+            Tolerated ratio between the residuals, required to fulfill
+            ``delta >= 1``. The steps are only changed if one residual
+            is larger than ``delta`` times the other.
+
+        Examples
+        --------
+        A large primal residual increases the primal step:
+
+        >>> balancing = PrimalDualStepBalancing(alpha=0.5)
+        >>> balancing(primal_residual=10.0, dual_residual=1.0)
+        2.0
+        >>> balancing(primal_residual=1.0, dual_residual=1.0)
+        1.0
+        """
+        self.alpha = float(alpha)
+        self.eta = float(eta)
+        self.delta = float(delta)
+        if not 0 < self.alpha < 1:
+            raise ValueError('`alpha` must be in (0, 1), got {}'
+                             ''.format(alpha))
+        if not 0 < self.eta < 1:
+            raise ValueError('`eta` must be in (0, 1), got {}'.format(eta))
+        if self.delta < 1:
+            raise ValueError('`delta` must be at least 1, got {}'
+                             ''.format(delta))
+        self.__alpha_init = self.alpha
+
+    def __call__(self, primal_residual, dual_residual):
+        """Return the factor by which the step sizes should be changed.
+
+        Parameters
+        ----------
+        primal_residual, dual_residual : float
+            Norms of the primal and dual residuals of the current iterate.
+
+        Returns
+        -------
+        factor : float
+            The primal step should be multiplied and the dual step
+            divided by this factor. It is 1 if the residuals are balanced.
+        """
+        if primal_residual > self.delta * dual_residual:
+            factor = 1 / (1 - self.alpha)
+        elif dual_residual > self.delta * primal_residual:
+            factor = 1 - self.alpha
+        else:
+            return 1.0
+
+        self.alpha *= self.eta
+        return factor
+
+    def reset(self):
+        """Restore the initial adaptivity."""
+        self.alpha = self.__alpha_init
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}(alpha={}, eta={}, delta={})'.format(
+            self.__class__.__name__, self.__alpha_init, self.eta, self.delta)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -17,7 +17,7 @@ import numpy as np
 from odl.util.npy_compat import AVOID_UNNECESSARY_COPY
 
 from odl.set.sets import ComplexNumbers, RealNumbers
-from odl.set.space import LinearSpace, LinearSpaceElement
+from odl.set.space import LinearSpace, LinearSpaceElement, _spaces_equal
 from odl.util import (
     array_str, dtype_str, indent, is_complex_floating_dtype, is_floating_dtype,
     is_numeric_dtype, is_real_dtype, is_real_floating_dtype, safe_int_conv,
@@ -421,7 +421,7 @@ class TensorSpace(LinearSpace):
         >>> False in spc
         False
         """
-        return getattr(other, 'space', None) == self
+        return _spaces_equal(getattr(other, 'space', None), self)
 
     def __eq__(self, other):
         """Return ``self == other``.
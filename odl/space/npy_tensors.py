@@ -12,7 +12,11 @@ from __future__ import absolute_import, division, print_function
 from future.utils import native
 
 import ctypes
+import mmap
+import tempfile
+import threading
 from builtins import object
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import numpy as np
@@ -39,6 +43,68 @@ _BLAS_DTYPES = (np.dtype('float32'), np.dtype('float64'),
 # Define size thresholds to switch implementations
 THRESHOLD_SMALL = 100
 THRESHOLD_MEDIUM = 50000
+# Minimum size for the multithreaded chunked kernels
+THRESHOLD_PARALLEL = 2 ** 18
+
+# Number of entries per chunk in the chunked kernels. A chunk of each of
+# the involved double precision arrays fits into a typical L2 cache.
+CHUNK_SIZE = 2 ** 16
+
+# BLAS routines take sizes as 32-bit integers
+_BLAS_MAX_SIZE = np.iinfo('int32').max
+
+# Number of threads used by spaces created without `num_threads`
+_DEFAULT_NUM_THREADS = 1
+
+# Thread pools of the chunked kernels, one per number of threads
+_EXECUTORS = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def set_default_num_threads(num_threads):
+    """Set the default number of threads of `NumpyTensorSpace` arithmetic.
+
+    The default applies to all spaces created without explicit
+    ``num_threads`` argument, including existing ones.
+
+    Parameters
+    ----------
+    num_threads : positive int or None
+        Number of threads used for arithmetic and reductions of large
+        arrays. For 1, the single-threaded kernels are used. ``None``
+        means the number of CPUs of the system.
+
+    Examples
+    --------
+    >>> from odl.space.npy_tensors import (
+    ...     default_num_threads, set_default_num_threads)
+    >>> space = odl.rn(3)
+    >>> set_default_num_threads(4)
+    >>> space.num_threads
+    4
+    >>> set_default_num_threads(1)
+    >>> default_num_threads()
+    1
+    """
+    global _DEFAULT_NUM_THREADS
+    _DEFAULT_NUM_THREADS = _num_threads_arg(num_threads)
+
+
+def default_num_threads():
+    """Return the default number of threads of `NumpyTensorSpace`."""
+    return _DEFAULT_NUM_THREADS
+
+
+def _num_threads_arg(num_threads):
+    """Return a validated ``num_threads`` argument."""
+    if num_threads is None:
+        import os
+        return os.cpu_count() or 1
+    num_threads, num_threads_in = int(num_threads), num_threads
+    if num_threads != num_threads_in or num_threads < 1:
+        raise ValueError('`num_threads` must be a positive integer, got {!r}'
+                         ''.format(num_threads_in))
+    return num_threads
 
 
 class NumpyTensorSpace(TensorSpace):
@@ -151,6 +217,23 @@ class NumpyTensorSpace(TensorSpace):
             ``dist`` or ``norm``. It also cannot be used in case of
             non-numeric ``dtype``.
 
+        num_threads : positive int, optional
+            Number of threads for linear combinations, products, inner
+            products, norms and distances of large floating point arrays.
+            They are then processed in cache-sized chunks, and reductions
+            are summed pairwise in a fixed order, such that results do
+            not depend on the number of threads.
+            For 1, the single-threaded kernels are used.
+            For ``None``, the value set with `set_default_num_threads`
+            is used (initially 1).
+
+        memmap_dir : str, optional
+            Directory for temporary files backing new elements. If given,
+            `element` without input, `zero` and `one` create elements
+            with `memmap_element`, such that data larger than the memory
+            can be processed. ``None`` means that new elements are kept
+            in memory.
+
         kwargs :
             Further keyword arguments are passed to the weighting
             classes.
@@ -290,6 +373,14 @@ class NumpyTensorSpace(TensorSpace):
 
         self.__use_in_place_ops = kwargs.pop('use_in_place_ops', True)
 
+        num_threads = kwargs.pop('num_threads', None)
+        if num_threads is not None:
+            num_threads = _num_threads_arg(num_threads)
+        self.__num_threads = num_threads
+
+        memmap_dir = kwargs.pop('memmap_dir', None)
+        self.__memmap_dir = None if memmap_dir is None else str(memmap_dir)
+
         # Make sure there are no leftover kwargs
         if kwargs:
             raise TypeError('got unknown keyword arguments {}'.format(kwargs))
@@ -435,6 +526,19 @@ class NumpyTensorSpace(TensorSpace):
                     in_place = NumOperationParadigmSupport.NOT_SUPPORTED,
                     out_of_place = NumOperationParadigmSupport.PREFERRED)
 
+    @property
+    def num_threads(self):
+        """Number of threads used for arithmetic of large arrays."""
+        if self.__num_threads is None:
+            return _DEFAULT_NUM_THREADS
+        else:
+            return self.__num_threads
+
+    @property
+    def memmap_dir(self):
+        """Directory for files backing new elements, or ``None``."""
+        return self.__memmap_dir
+
     @property
     def weighting(self):
         """This space's weighting scheme."""
@@ -524,6 +628,9 @@ class NumpyTensorSpace(TensorSpace):
             raise ValueError("`order` {!r} not understood".format(order))
 
         if inp is None and data_ptr is None:
+            if self.memmap_dir is not None:
+                return self.memmap_element(order=order)
+
             if order is None:
                 arr = np.empty(self.shape, dtype=self.dtype,
                                order=self.default_order)
@@ -565,6 +672,67 @@ class NumpyTensorSpace(TensorSpace):
         else:
             raise TypeError('cannot provide both `inp` and `data_ptr`')
 
+    def memmap_element(self, filename=None, mode='w+', order=None):
+        """Create an element backed by a memory-mapped file.
+
+        The data of the element is a `numpy.memmap`, hence it is read from
+        and written to disk on demand by the operating system. Linear
+        combinations, products, inner products, norms and distances of
+        memory-mapped elements are computed in chunks, without temporary
+        arrays of full size.
+
+        Existing `numpy.memmap` arrays can also be wrapped without copying
+        by `element`.
+
+        Parameters
+        ----------
+        filename : str, optional
+            File to be mapped. For ``None``, an anonymous temporary file in
+            `memmap_dir` (or the default temporary directory) is created,
+            which is filled with zeros and deleted when the element is
+            no longer referenced.
+        mode : {'w+', 'r+', 'c'}, optional
+            Mode in which ``filename`` is opened, see `numpy.memmap`.
+            ``'w+'`` creates or overwrites the file.
+            Not used for temporary files.
+        order : {None, 'C', 'F'}, optional
+            Storage order of the returned element. ``None`` means
+            `default_order`.
+
+        Returns
+        -------
+        element : `NumpyTensor`
+            The new element.
+
+        Examples
+        --------
+        >>> space = odl.rn(3)
+        >>> x = space.memmap_element()
+        >>> x
+        rn(3).element([ 0.,  0.,  0.])
+        >>> x[:] = [1, 2, 3]
+        >>> space.inner(x, space.one())
+        6.0
+        """
+        if order is None:
+            order = self.default_order
+        elif str(order).upper() not in ('C', 'F'):
+            raise ValueError("`order` {!r} not understood".format(order))
+
+        if filename is None:
+            # The file is removed as soon as it is closed, which happens
+            # after the last reference to the memory map is gone
+            with tempfile.TemporaryFile(dir=self.memmap_dir) as fobj:
+                arr = np.memmap(fobj, dtype=self.dtype, mode='w+',
+                                shape=self.shape, order=order)
+        else:
+            if mode not in ('w+', 'r+', 'c'):
+                raise ValueError("`mode` must be 'w+', 'r+' or 'c', got {!r}"
+                                 "".format(mode))
+            arr = np.memmap(filename, dtype=self.dtype, mode=mode,
+                            shape=self.shape, order=order)
+        return self.element_type(self, arr)
+
     def one(self):
         """Return a tensor of all ones.
 
@@ -575,6 +743,10 @@ class NumpyTensorSpace(TensorSpace):
         >>> x
         rn(3).element([ 1.,  1.,  1.])
         """
+        if self.memmap_dir is not None:
+            one = self.memmap_element()
+            one.data.fill(1)
+            return one
         return self.element(np.ones(self.shape, dtype=self.dtype,
                                     order=self.default_order))
     
@@ -588,6 +760,9 @@ class NumpyTensorSpace(TensorSpace):
         >>> x
         rn(3).element([ 0.,  0.,  0.])
         """
+        if self.memmap_dir is not None:
+            # New files are filled with zeros
+            return self.memmap_element()
         return self.element(np.zeros(self.shape, dtype=self.dtype,
                                      order=self.default_order))
     
@@ -676,8 +851,14 @@ class NumpyTensorSpace(TensorSpace):
         >>> space_1_w.dist(x, y)
         7.0
         """
+        weights = self.__chunk_weights(x1, x2)
+        if weights is not None:
+            const, array = weights
+            return float(_const_factor(const, self.exponent) *
+                         _pnorm_chunked(self.exponent, x1.data, x2.data,
+                                        array, self.num_threads))
         return self.weighting.dist(x1, x2)
-    
+
     def _divide(self, x1, x2, out):
         """Compute the entry-wise quotient ``x1 / x2``.
 
@@ -742,8 +923,14 @@ class NumpyTensorSpace(TensorSpace):
         >>> space_w.inner(x, y)
         5.0
         """
+        weights = self.__chunk_weights(x1, x2)
+        if weights is not None and self.exponent == 2.0:
+            const, array = weights
+            inner = const * _inner_chunked(x1.data, x2.data, array,
+                                           self.num_threads)
+            return self.field.element(inner)
         return self.weighting.inner(x1, x2)
-    
+
     def _lincomb(self, a, x1, b, x2, out):
         """Implement the linear combination of ``x1`` and ``x2``.
 
@@ -776,7 +963,10 @@ class NumpyTensorSpace(TensorSpace):
         """
         if self.__use_in_place_ops:
             assert(out is not None)
-            _lincomb_impl(a, x1, b, x2, out)
+            if self.__use_chunks(x1.data, x2.data, out.data):
+                _lincomb_chunked(a, x1, b, x2, out, self.num_threads)
+            else:
+                _lincomb_impl(a, x1, b, x2, out)
         else:
             assert(out is None)
             return self.element(a * x1.data + b * x2.data)
@@ -810,6 +1000,8 @@ class NumpyTensorSpace(TensorSpace):
         """
         if out is None:
             return np.multiply(x1.data, x2.data)
+        elif self.__use_chunks(x1.data, x2.data, out.data):
+            _multiply_chunked(x1.data, x2.data, out.data, self.num_threads)
         else:
             np.multiply(x1.data, x2.data, out=out.data)
 
@@ -849,8 +1041,44 @@ class NumpyTensorSpace(TensorSpace):
         >>> space_1_w.norm(x)
         10.0
         """
+        weights = self.__chunk_weights(x)
+        if weights is not None:
+            const, array = weights
+            return float(_const_factor(const, self.exponent) *
+                         _pnorm_chunked(self.exponent, x.data, None, array,
+                                        self.num_threads))
         return self.weighting.norm(x)
 
+    def __use_chunks(self, *arrays):
+        """Whether to use the chunked kernels for ``arrays``.
+
+        Memory-mapped arrays are always processed in chunks to avoid
+        temporaries of full size.
+        """
+        return (is_floating_dtype(self.dtype) and
+                ((self.num_threads > 1 and self.size >= THRESHOLD_PARALLEL) or
+                 any(_is_memmap(arr) for arr in arrays)) and
+                _flat_arrays(*arrays) is not None)
+
+    def __chunk_weights(self, *tensors):
+        """Return ``(const, array)`` weights for the chunked kernels.
+
+        ``None`` is returned if the chunked kernels are not applicable
+        to ``tensors`` and the weighting of this space.
+        """
+        weighting = self.weighting
+        if type(weighting) is NumpyTensorSpaceConstWeighting:
+            weights = (weighting.const, None)
+        elif type(weighting) is NumpyTensorSpaceArrayWeighting:
+            weights = (1.0, weighting.array)
+        else:
+            return None
+
+        arrays = [x.data for x in tensors]
+        if weights[1] is not None:
+            arrays.append(weights[1])
+        return weights if self.__use_chunks(*arrays) else None
+
     def __repr__(self):
         """Return ``repr(self)``."""
         if self.ndim == 1:
@@ -1158,7 +1386,28 @@ class NumpyTensor(Tensor):
         >>> y is x
         False
         """
+        if self.space.memmap_dir is not None:
+            # Copy directly into the new file instead of via memory
+            copy = self.space.element()
+            copy.data[:] = self.data
+            return copy
         return self.space.element(self.data.copy())
+
+    def set_zero(self):
+        """Set this tensor to zero, regardless of its current entries.
+
+        Returns
+        -------
+        self : `NumpyTensor`
+
+        Examples
+        --------
+        >>> x = odl.rn(3).element([1, np.nan, np.inf])
+        >>> x.set_zero()
+        rn(3).element([ 0.,  0.,  0.])
+        """
+        self.data.fill(0)
+        return self
     
     @imag.setter
     def imag(self, newimag):
@@ -1817,10 +2066,6 @@ def _blas_is_applicable(*args):
     elif not (all(x.flags.f_contiguous for x in args) or
               all(x.flags.c_contiguous for x in args)):
         return False
-    elif any(x.size > np.iinfo('int32').max for x in args):
-        # Temporary fix for 32 bit int overflow in BLAS
-        # TODO: use chunking instead
-        return False
     else:
         return True
 
@@ -1837,6 +2082,12 @@ def _lincomb_impl(a, x1, b, x2, out):
         out.data[:] = a * x1.data + b * x2.data
         return
 
+    elif (size > _BLAS_MAX_SIZE and
+          _blas_is_applicable(x1.data, x2.data, out.data)):
+        # Too large for 32-bit sizes in BLAS, use chunks instead
+        _lincomb_chunked(a, x1, b, x2, out, num_threads=1)
+        return
+
     elif (size < THRESHOLD_MEDIUM or
           not _blas_is_applicable(x1.data, x2.data, out.data)):
 
@@ -1927,6 +2178,182 @@ def _lincomb_impl(a, x1, b, x2, out):
                 axpy(x1_arr, out_arr, size, a)
 
 
+def _is_memmap(arr):
+    """Return ``True`` if ``arr`` is backed by a memory-mapped file."""
+    while arr is not None:
+        if isinstance(arr, (np.memmap, mmap.mmap)):
+            return True
+        arr = getattr(arr, 'base', None)
+    return False
+
+
+class _FlatChunk(object):
+
+    """Chunk of a flat array, usable in place of tensors in kernels."""
+
+    def __init__(self, data):
+        self.data = data
+        self.size = data.size
+
+
+def _flat_arrays(*arrays):
+    """Return flat views of ``arrays`` in a common order, or ``None``.
+
+    ``None`` is returned if the arrays are not all C- or all
+    Fortran-contiguous, since raveling would then make copies.
+    """
+    if all(arr.flags.c_contiguous for arr in arrays):
+        order = 'C'
+    elif all(arr.flags.f_contiguous for arr in arrays):
+        order = 'F'
+    else:
+        return None
+    return [arr.ravel(order) for arr in arrays]
+
+
+def _executor(num_threads):
+    """Return the shared thread pool with ``num_threads`` workers."""
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(num_threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=num_threads)
+            _EXECUTORS[num_threads] = executor
+        return executor
+
+
+def _map_chunks(func, size, num_threads):
+    """Return ``[func(slc) for slc in chunk_slices]`` using threads.
+
+    The range ``[0, size)`` is split into chunks of `CHUNK_SIZE`
+    entries. Each thread processes a contiguous group of chunks, and the
+    results are returned in chunk order, independently of
+    ``num_threads``.
+    """
+    slices = [slice(start, min(start + CHUNK_SIZE, size))
+              for start in range(0, size, CHUNK_SIZE)]
+    num_groups = min(num_threads, len(slices))
+    if num_groups <= 1:
+        return [func(slc) for slc in slices]
+
+    bounds = np.linspace(0, len(slices), num_groups + 1).astype(int)
+
+    def run_group(i):
+        return [func(slc) for slc in slices[bounds[i]:bounds[i + 1]]]
+
+    results = []
+    for group_results in _executor(num_threads).map(run_group,
+                                                    range(num_groups)):
+        results.extend(group_results)
+    return results
+
+
+def _pairwise_sum(values):
+    """Return the sum of ``values``, added pairwise in a fixed order."""
+    values = list(values)
+    if not values:
+        return 0.0
+    while len(values) > 1:
+        summed = [values[i] + values[i + 1]
+                  for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            summed.append(values[-1])
+        values = summed
+    return values[0]
+
+
+def _const_factor(const, p):
+    """Return the factor of a ``const``-weighted ``p``-norm."""
+    if p == 2.0:
+        return np.sqrt(const)
+    elif p == float('inf'):
+        return const
+    else:
+        return const ** (1 / p)
+
+
+def _lincomb_chunked(a, x1, b, x2, out, num_threads):
+    """Chunk-wise implementation of ``out[:] = a * x1 + b * x2``.
+
+    The arrays of all tensors must be raveled by `_flat_arrays`.
+    """
+    flat = dict(zip((id(x1), id(x2), id(out)),
+                    _flat_arrays(x1.data, x2.data, out.data)))
+
+    def lincomb_chunk(slc):
+        # Use one chunk per distinct tensor to preserve aliasing
+        chunks = {key: _FlatChunk(arr[slc]) for key, arr in flat.items()}
+        _lincomb_impl(a, chunks[id(x1)], b, chunks[id(x2)], chunks[id(out)])
+
+    _map_chunks(lincomb_chunk, out.size, num_threads)
+
+
+def _multiply_chunked(x1, x2, out, num_threads):
+    """Chunk-wise implementation of ``out[:] = x1 * x2`` for arrays."""
+    x1, x2, out = _flat_arrays(x1, x2, out)
+
+    def multiply_chunk(slc):
+        np.multiply(x1[slc], x2[slc], out=out[slc])
+
+    _map_chunks(multiply_chunk, out.size, num_threads)
+
+
+def _inner_chunked(x1, x2, w, num_threads):
+    """Chunk-wise inner product of arrays ``x1`` and ``x2``.
+
+    If ``w`` is not ``None``, it is used as array of weights.
+    """
+    if w is None:
+        x1, x2 = _flat_arrays(x1, x2)
+    else:
+        x1, x2, w = _flat_arrays(x1, x2, w)
+    is_real = is_real_dtype(x1.dtype)
+
+    def inner_chunk(slc):
+        x1_chunk = x1[slc] if w is None else x1[slc] * w[slc]
+        if is_real:
+            return np.dot(x1_chunk, x2[slc])
+        else:
+            # x2 as first argument because we want linearity in x1
+            return np.vdot(x2[slc], x1_chunk)
+
+    return _pairwise_sum(_map_chunks(inner_chunk, x1.size, num_threads))
+
+
+def _pnorm_chunked(p, x, y, w, num_threads):
+    """Chunk-wise ``p``-norm of array ``x``, or of ``x - y``.
+
+    If ``w`` is not ``None``, it is used as array of weights. The
+    difference ``x - y`` is only formed per chunk.
+    """
+    arrays = [arr for arr in (x, y, w) if arr is not None]
+    flat = iter(_flat_arrays(*arrays))
+    x = next(flat)
+    y = next(flat) if y is not None else None
+    w = next(flat) if w is not None else None
+
+    def pnorm_chunk(slc):
+        diff = x[slc] if y is None else x[slc] - y[slc]
+        if p == 2.0 and w is None:
+            return np.vdot(diff, diff).real
+        absdiff = np.abs(diff)
+        if p == float('inf'):
+            if w is not None:
+                absdiff *= w[slc]
+            return np.max(absdiff)
+        else:
+            absdiff = np.power(absdiff, p, out=absdiff)
+            if w is None:
+                return np.sum(absdiff)
+            else:
+                return np.dot(absdiff, w[slc])
+
+    partial_results = _map_chunks(pnorm_chunk, x.size, num_threads)
+    if p == float('inf'):
+        return max(partial_results)
+    else:
+        return _pairwise_sum(partial_results) ** (1 / p)
+
+
 def _weighting(weights, exponent):
     """Return a weighting whose type is inferred from the arguments."""
     if np.isscalar(weights):
@@ -2020,7 +2447,7 @@ def _norm_default(x):
     # Lazy import to improve `import odl` time
     import scipy.linalg
 
-    if _blas_is_applicable(x.data):
+    if _blas_is_applicable(x.data) and x.size <= _BLAS_MAX_SIZE:
         nrm2 = scipy.linalg.blas.get_blas_funcs('nrm2', dtype=x.dtype)
         norm = partial(nrm2, n=native(x.size))
     else:
@@ -2149,7 +2576,7 @@ class NumpyTensorSpaceArrayWeighting(ArrayWeighting):
 
     def __hash__(self):
         """Return ``hash(self)``."""
-        return hash((type(self), self.array.tobytes(), self.exponent))
+        return hash((type(self), self.digest, self.exponent))
 
     def inner(self, x1, x2):
         """Return the weighted inner product of ``x1`` and ``x2``.
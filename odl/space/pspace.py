@@ -18,10 +18,12 @@ import numpy as np
 from odl.set import LinearSpace
 from odl.set.space import (LinearSpaceElement,
     SupportedNumOperationParadigms, NumOperationParadigmSupport)
+from odl.space.npy_tensors import (
+    NumpyTensorSpace, NumpyTensorSpaceConstWeighting)
 from odl.space.weighting import (
     ArrayWeighting, ConstWeighting, CustomDist, CustomInner, CustomNorm,
     Weighting)
-from odl.util import indent, is_real_dtype, signature_string
+from odl.util import indent, is_real_dtype, parallel_map, signature_string
 from odl.util.ufuncs import ProductSpaceUfuncs
 
 __all__ = ('ProductSpace',)
@@ -125,6 +127,24 @@ class ProductSpace(LinearSpace):
 
             Cannot be combined with: ``weighting, dist, norm``
 
+        num_threads : positive int, optional
+            Number of threads used to process the components concurrently
+            in arithmetic operations, inner products, norms and distances.
+            Reductions over components are always carried out in the
+            same order, hence results do not depend on this value.
+            ``None`` means serial processing.
+
+        contiguous : bool, optional
+            If ``True``, the data of each element is stored in a single
+            contiguous array of shape ``(n, *shape)``, and the parts
+            of the element are views into this array. Arithmetic
+            operations, inner products, norms and distances are then
+            carried out with one vectorized call, and
+            `ProductSpaceElement.asarray` returns the array without copy.
+            This requires a power space of `NumpyTensorSpace` or
+            `DiscretizedSpace` with ``impl='numpy'``.
+            Default: ``False``
+
         Examples
         --------
         Product of two rn spaces
@@ -135,6 +155,13 @@ class ProductSpace(LinearSpace):
 
         >>> r2x2x2 = ProductSpace(odl.rn(2), 3)
 
+        Powerspace with data in a single array
+
+        >>> r2x2x2 = ProductSpace(odl.rn(2), 3, contiguous=True)
+        >>> x = r2x2x2.one()
+        >>> x.data.shape
+        (3, 2)
+
         Notes
         -----
         Inner product, norm and distance are evaluated by collecting
@@ -200,6 +227,8 @@ class ProductSpace(LinearSpace):
         inner = kwargs.pop('inner', None)
         weighting = kwargs.pop('weighting', None)
         exponent = float(kwargs.pop('exponent', 2.0))
+        num_threads = kwargs.pop('num_threads', None)
+        contiguous = bool(kwargs.pop('contiguous', False))
         if kwargs:
             raise TypeError('got unexpected keyword arguments: {}'
                             ''.format(kwargs))
@@ -228,8 +257,15 @@ class ProductSpace(LinearSpace):
         if not all(spc.field == spaces[0].field for spc in spaces):
             raise ValueError('all spaces must have the same field')
 
+        if num_threads is not None:
+            num_threads = int(num_threads)
+            if num_threads < 1:
+                raise ValueError('`num_threads` must be positive, got {}'
+                                 ''.format(num_threads))
+
         # Assign spaces and field
         self.__spaces = tuple(spaces)
+        self.__num_threads = num_threads
 
         # Cache for efficiency
         self.__is_power_space = all(spc == self.spaces[0]
@@ -275,6 +311,37 @@ class ProductSpace(LinearSpace):
         else:  # all None -> no weighing
             self.__weighting = ProductSpaceConstWeighting(1.0, exponent)
 
+        # Space of the stacked arrays of contiguous elements
+        self.__stacked_space = None
+        self.__stacked_reductions = False
+        if contiguous:
+            tspace = getattr(self.spaces[0], 'tspace',
+                             self.spaces[0]) if len(self) else None
+            if not (self.is_power_space and
+                    isinstance(tspace, NumpyTensorSpace)):
+                raise ValueError('`contiguous=True` requires a power space '
+                                 'of NumPy-based tensor spaces, got {!r}'
+                                 ''.format(self))
+
+            # Inner product, norm and dist can be evaluated on the stacked
+            # arrays if both weightings are constants with equal exponent
+            pweighting = self.weighting
+            tweighting = tspace.weighting
+            self.__stacked_reductions = (
+                type(pweighting) is ProductSpaceConstWeighting and
+                type(tweighting) is NumpyTensorSpaceConstWeighting and
+                pweighting.exponent == tweighting.exponent)
+            if self.__stacked_reductions:
+                self.__stacked_space = NumpyTensorSpace(
+                    self.shape, dtype=tspace.dtype,
+                    weighting=pweighting.const * tweighting.const,
+                    exponent=pweighting.exponent,
+                    num_threads=tspace.num_threads)
+            else:
+                self.__stacked_space = NumpyTensorSpace(
+                    self.shape, dtype=tspace.dtype,
+                    num_threads=tspace.num_threads)
+
     def __len__(self):
         """Return ``len(self)``.
 
@@ -353,6 +420,27 @@ class ProductSpace(LinearSpace):
         """``True`` if all member spaces are equal."""
         return self.__is_power_space
 
+    @property
+    def num_threads(self):
+        """Number of threads for processing components, ``None`` if serial.
+
+        This option does not take part in space comparison.
+        """
+        return self.__num_threads
+
+    @property
+    def is_contiguous(self):
+        """``True`` if elements store their data in a single array.
+
+        This option does not take part in space comparison.
+        """
+        return self.__stacked_space is not None
+
+    def _map_parts(self, func, *parts):
+        """Return ``[func(*args) for args in zip(*parts)]``, in threads."""
+        return parallel_map(lambda args: func(*args), zip(*parts),
+                            self.num_threads)
+
     @property
     def exponent(self):
         """Exponent of the product space norm/dist, ``None`` for custom."""
@@ -453,12 +541,16 @@ class ProductSpace(LinearSpace):
     @property
     def real_space(self):
         """Variant of this space with real dtype."""
-        return ProductSpace(*[space.real_space for space in self.spaces])
+        return ProductSpace(*[space.real_space for space in self.spaces],
+                            num_threads=self.num_threads,
+                            contiguous=self.is_contiguous)
 
     @property
     def complex_space(self):
         """Variant of this space with complex dtype."""
-        return ProductSpace(*[space.complex_space for space in self.spaces])
+        return ProductSpace(*[space.complex_space for space in self.spaces],
+                            num_threads=self.num_threads,
+                            contiguous=self.is_contiguous)
 
     def astype(self, dtype):
         """Return a copy of this space with new ``dtype``.
@@ -487,7 +579,9 @@ class ProductSpace(LinearSpace):
             return self
         else:
             return ProductSpace(*[space.astype(dtype)
-                                  for space in self.spaces])
+                                  for space in self.spaces],
+                                num_threads=self.num_threads,
+                                contiguous=self.is_contiguous)
 
     def element(self, inp=None, cast=True):
         """Create an element in the product space.
@@ -537,11 +631,23 @@ class ProductSpace(LinearSpace):
         """
         # If data is given as keyword arg, prefer it over arg list
         if inp is None:
+            if self.is_contiguous:
+                return self._wrap_stacked(np.empty(self.shape, self.dtype))
             inp = [space.element() for space in self.spaces]
 
-        if inp in self:
+        if (inp in self and
+                (getattr(inp, 'data', None) is not None) ==
+                self.is_contiguous):
+            # Elements with different storage layout are converted below,
+            # since space equality does not take the layout into account
             return inp
 
+        if (self.is_contiguous and isinstance(inp, np.ndarray) and
+                inp.shape == self.shape and inp.dtype == self.dtype and
+                inp.flags.c_contiguous and inp.flags.writeable):
+            # Wrap without copy, like `NumpyTensorSpace.element`
+            return self._wrap_stacked(inp)
+
         if len(inp) != len(self):
             raise ValueError('length of `inp` {} does not match length of '
                              'space {}'.format(len(inp), len(self)))
@@ -557,8 +663,29 @@ class ProductSpace(LinearSpace):
             raise TypeError('input {!r} not a sequence of elements of the '
                             'component spaces'.format(inp))
 
+        if self.is_contiguous:
+            arr = np.empty(self.shape, self.dtype)
+            for i, part in enumerate(parts):
+                arr[i] = part
+            return self._wrap_stacked(arr)
+
         return self.element_type(self, parts)
 
+    def _wrap_stacked(self, arr):
+        """Return a contiguous element whose parts are views into ``arr``."""
+        parts = [space.element(arr[i]) for i, space in enumerate(self.spaces)]
+        return self.element_type(self, parts, data=arr)
+
+    def __stacked(self, *elems):
+        """Return ``elems`` as elements of the stacked space, or ``None``.
+
+        ``None`` is returned if any of ``elems`` is not contiguous.
+        """
+        if (self.__stacked_space is None or
+                any(getattr(x, 'data', None) is None for x in elems)):
+            return None
+        return [self.__stacked_space.element(x.data) for x in elems]
+
     @property
     def examples(self):
         """Return examples from all sub-spaces."""
@@ -593,6 +720,8 @@ class ProductSpace(LinearSpace):
         >>> zero_3 == zero_2x3[1]
         True
         """
+        if self.is_contiguous:
+            return self._wrap_stacked(np.zeros(self.shape, self.dtype))
         return self.element([space.zero() for space in self.spaces])
 
     def one(self):
@@ -621,49 +750,88 @@ class ProductSpace(LinearSpace):
         >>> one_3 == one_2x3[1]
         True
         """
+        if self.is_contiguous:
+            return self._wrap_stacked(np.ones(self.shape, self.dtype))
         return self.element([space.one() for space in self.spaces])
 
     def _lincomb(self, a, x, b, y, out):
         """Linear combination ``out = a*x + b*y``."""
+        if out is None and self.is_contiguous:
+            out = self.element()
+            self._lincomb(a, x, b, y, out)
+            return out
+        stacked = self.__stacked(x, y, out)
+        if stacked is not None:
+            self.__stacked_space._lincomb(a, stacked[0], b, stacked[1],
+                                          stacked[2])
+            return
         if out is None:
-            return self.element([
-                space._lincomb(a, xp, b, yp, out=None)
-                  for space, xp, yp in zip(self.spaces, x.parts, y.parts)])
-        for space, xp, yp, outp in zip(self.spaces, x.parts, y.parts,
-                                       out.parts):
-            space._lincomb(a, xp, b, yp, outp)
+            return self.element(self._map_parts(
+                lambda space, xp, yp: space._lincomb(a, xp, b, yp, out=None),
+                self.spaces, x.parts, y.parts))
+        self._map_parts(
+            lambda space, xp, yp, outp: space._lincomb(a, xp, b, yp, outp),
+            self.spaces, x.parts, y.parts, out.parts)
 
     def _dist(self, x1, x2):
         """Distance between two elements."""
+        if self.__stacked_reductions:
+            stacked = self.__stacked(x1, x2)
+            if stacked is not None:
+                return self.__stacked_space._dist(*stacked)
         return self.weighting.dist(x1, x2)
 
     def _norm(self, x):
         """Norm of an element."""
+        if self.__stacked_reductions:
+            stacked = self.__stacked(x)
+            if stacked is not None:
+                return self.__stacked_space._norm(*stacked)
         return self.weighting.norm(x)
 
     def _inner(self, x1, x2):
         """Inner product of two elements."""
+        if self.__stacked_reductions:
+            stacked = self.__stacked(x1, x2)
+            if stacked is not None:
+                return self.__stacked_space._inner(*stacked)
         return self.weighting.inner(x1, x2)
 
     def _multiply(self, x1, x2, out):
         """Product ``out = x1 * x2``."""
+        if out is None and self.is_contiguous:
+            out = self.element()
+            self._multiply(x1, x2, out)
+            return out
+        stacked = self.__stacked(x1, x2, out)
+        if stacked is not None:
+            self.__stacked_space._multiply(*stacked)
+            return
         if out is None:
-            return self.element([
-                spc._multiply(xp, yp, out=None)
-                  for spc, xp, yp in zip(self.spaces, x1.parts, x2.parts)])
-        for spc, xp, yp, outp in zip(self.spaces, x1.parts, x2.parts,
-                                     out.parts):
-            spc._multiply(xp, yp, outp)
+            return self.element(self._map_parts(
+                lambda spc, xp, yp: spc._multiply(xp, yp, out=None),
+                self.spaces, x1.parts, x2.parts))
+        self._map_parts(
+            lambda spc, xp, yp, outp: spc._multiply(xp, yp, outp),
+            self.spaces, x1.parts, x2.parts, out.parts)
 
     def _divide(self, x1, x2, out):
         """Quotient ``out = x1 / x2``."""
+        if out is None and self.is_contiguous:
+            out = self.element()
+            self._divide(x1, x2, out)
+            return out
+        stacked = self.__stacked(x1, x2, out)
+        if stacked is not None:
+            self.__stacked_space._divide(*stacked)
+            return
         if out is None:
-            return self.element([
-                spc._divide(xp, yp, out=None)
-                  for spc, xp, yp in zip(self.spaces, x1.parts, x2.parts)])
-        for spc, xp, yp, outp in zip(self.spaces, x1.parts, x2.parts,
-                                     out.parts):
-            spc._divide(xp, yp, outp)
+            return self.element(self._map_parts(
+                lambda spc, xp, yp: spc._divide(xp, yp, out=None),
+                self.spaces, x1.parts, x2.parts))
+        self._map_parts(
+            lambda spc, xp, yp, outp: spc._divide(xp, yp, outp),
+            self.spaces, x1.parts, x2.parts, out.parts)
 
     def __eq__(self, other):
         """Return ``self == other``.
@@ -859,16 +1027,27 @@ class ProductSpaceElement(LinearSpaceElement):
 
     """Elements of a `ProductSpace`."""
 
-    def __init__(self, space, parts):
+    def __init__(self, space, parts, data=None):
         """Initialize a new instance."""
         super(ProductSpaceElement, self).__init__(space)
         self.__parts = tuple(parts)
+        self.__data = data
 
     @property
     def parts(self):
         """Parts of this product space element."""
         return self.__parts
 
+    @property
+    def data(self):
+        """Array of shape ``(n, *shape)`` holding the data of all parts.
+
+        The parts are views into this array. For elements that do not
+        use contiguous storage, see `ProductSpace.is_contiguous`, this
+        is ``None``.
+        """
+        return self.__data
+
     @property
     def shape(self):
         """Number of values per axis in ``self``, computed recursively.
@@ -941,9 +1120,27 @@ class ProductSpaceElement(LinearSpaceElement):
     def _assign(self, other, avoid_deep_copy):
         """Assign the values of ``other``, which is assumed to be in the
         same product space, to ``self``."""
+        if self.data is not None:
+            # Parts must remain views into `data`
+            if other.data is not None:
+                self.data[:] = other.data
+            else:
+                for tgt, src in zip(self.parts, other.parts):
+                    tgt.assign(src, avoid_deep_copy=False)
+            return
+
         for tgt, src in zip(self.parts, other.parts):
             tgt.assign(src, avoid_deep_copy=avoid_deep_copy)
 
+    def set_zero(self):
+        """Set this element to zero, regardless of its current values."""
+        if self.data is not None:
+            self.data.fill(0)
+        else:
+            for part in self.parts:
+                part.set_zero()
+        return self
+
     def __len__(self):
         """Return ``len(self)``."""
         return len(self.space)
@@ -1079,6 +1276,9 @@ class ProductSpaceElement(LinearSpaceElement):
 
             self[ind].asarray() == self.asarray()[ind]
 
+        For contiguous elements, the underlying `data` array is returned
+        without copy.
+
         Parameters
         ----------
         out : `numpy.ndarray`, optional
@@ -1103,9 +1303,14 @@ class ProductSpaceElement(LinearSpaceElement):
         if not self.space.is_power_space:
             raise ValueError('cannot use `asarray` if `space.is_power_space` '
                              'is `False`')
+        elif out is None and self.data is not None:
+            return self.data
         else:
             if out is None:
                 out = np.empty(self.shape, self.dtype)
+            elif self.data is not None:
+                out[:] = self.data
+                return out
 
             for i in range(len(self)):
                 out[i] = np.asarray(self[i])
@@ -1690,7 +1895,7 @@ class ProductSpaceArrayWeighting(ArrayWeighting):
                                       ''.format(self.exponent))
 
         inners = np.fromiter(
-            (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
+            x1.space._map_parts(lambda x1i, x2i: x1i.inner(x2i), x1, x2),
             dtype=x1[0].space.dtype, count=len(x1))
 
         inner = np.dot(inners, self.array)
@@ -1717,7 +1922,8 @@ class ProductSpaceArrayWeighting(ArrayWeighting):
             return np.sqrt(norm_squared)
         else:
             norms = np.fromiter(
-                (xi.norm() for xi in x), dtype=np.float64, count=len(x))
+                x.space._map_parts(lambda xi: xi.norm(), x),
+                dtype=np.float64, count=len(x))
             if self.exponent in (1.0, float('inf')):
                 norms *= self.array
             else:
@@ -1798,7 +2004,7 @@ class ProductSpaceConstWeighting(ConstWeighting):
                                       ''.format(self.exponent))
 
         inners = np.fromiter(
-            (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
+            x1.space._map_parts(lambda x1i, x2i: x1i.inner(x2i), x1, x2),
             dtype=x1[0].space.dtype, count=len(x1))
 
         inner = self.const * np.sum(inners)
@@ -1822,7 +2028,8 @@ class ProductSpaceConstWeighting(ConstWeighting):
             return np.sqrt(norm_squared)
         else:
             norms = np.fromiter(
-                (xi.norm() for xi in x), dtype=np.float64, count=len(x))
+                x.space._map_parts(lambda xi: xi.norm(), x),
+                dtype=np.float64, count=len(x))
 
             if self.exponent in (1.0, float('inf')):
                 return (self.const *
@@ -1845,7 +2052,7 @@ class ProductSpaceConstWeighting(ConstWeighting):
             The distance between the elements.
         """
         dnorms = np.fromiter(
-            ((x1i - x2i).norm() for x1i, x2i in zip(x1, x2)),
+            x1.space._map_parts(lambda x1i, x2i: (x1i - x2i).norm(), x1, x2),
             dtype=np.float64, count=len(x1))
 
         if self.exponent == float('inf'):
@@ -10,6 +10,7 @@
 
 from __future__ import print_function, division, absolute_import
 from builtins import object
+import hashlib
 import numpy as np
 
 from odl.space.base_tensors import TensorSpace
@@ -20,6 +21,48 @@ __all__ = ('MatrixWeighting', 'ArrayWeighting', 'ConstWeighting',
            'CustomInner', 'CustomNorm', 'CustomDist')
 
 
+def _content_digest(arrays):
+    """Return a hex digest of dtypes, shapes and contents of ``arrays``.
+
+    The digest is computed with BLAKE2b directly from the array buffers,
+    hence it is stable across processes and does not copy contiguous
+    arrays.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        hasher.update(str(arr.dtype).encode())
+        hasher.update(np.asarray(arr.shape, dtype='int64').tobytes())
+        hasher.update(arr.reshape(-1).view(np.uint8))
+    return hasher.hexdigest()
+
+
+# Attributes holding the arrays of the supported sparse matrix formats
+_SPARSE_ARRAY_ATTRS = ('data', 'indices', 'indptr', 'row', 'col', 'offsets')
+
+
+def _owned(arr):
+    """Return ``arr``, or a copy if it is a view of another NumPy array.
+
+    A view could still be changed through a writeable base after it has
+    been made read-only, hence it is copied.
+    """
+    if isinstance(arr, np.ndarray) and arr.base is not None:
+        return arr.copy()
+    else:
+        return arr
+
+
+def _make_read_only(arrays):
+    """Make ``arrays`` read-only, return ``True`` if possible for all."""
+    arrays = list(arrays)
+    if not all(isinstance(arr, np.ndarray) for arr in arrays):
+        return False
+    for arr in arrays:
+        arr.flags.writeable = False
+    return True
+
+
 class Weighting(object):
 
     """Abstract base class for weighting of finite-dimensional spaces.
@@ -218,11 +261,18 @@ class MatrixWeighting(Weighting):
         self._cache_mat_decomp = bool(kwargs.pop('cache_mat_decomp', False))
         super(MatrixWeighting, self).__init__(impl=impl, exponent=exponent)
 
-        # Check and set matrix
+        # Check and set matrix. Views are copied such that the matrix can
+        # be locked for the cached digest, see `digest`.
         if scipy.sparse.isspmatrix(matrix):
             self._matrix = matrix
+            if any(arr.base is not None for arr in self._matrix_arrays()):
+                self._matrix = matrix.copy()
+                for attr in _SPARSE_ARRAY_ATTRS:
+                    if hasattr(self._matrix, attr):
+                        setattr(self._matrix, attr,
+                                _owned(getattr(self._matrix, attr)))
         else:
-            self._matrix = np.asarray(matrix)
+            self._matrix = _owned(np.asarray(matrix))
             if self._matrix.dtype == object:
                 raise ValueError('invalid matrix {}'.format(matrix))
             elif self._matrix.ndim != 2:
@@ -239,6 +289,8 @@ class MatrixWeighting(Weighting):
             raise NotImplementedError('sparse matrices only supported for '
                                       'exponent 1.0, 2.0 or `inf`')
 
+        self.__digest = None
+
         # Compute the power and decomposition if desired
         self._eigval = self._eigvec = None
         if self.exponent in (1.0, float('inf')):
@@ -260,6 +312,45 @@ class MatrixWeighting(Weighting):
         """Weighting matrix of this inner product."""
         return self._matrix
 
+    def _matrix_arrays(self):
+        """Return the arrays that make up the matrix."""
+        # Lazy import to improve `import odl` time
+        import scipy.sparse
+
+        if scipy.sparse.isspmatrix(self.matrix):
+            return [getattr(self.matrix, attr) for attr in _SPARSE_ARRAY_ATTRS
+                    if hasattr(self.matrix, attr)]
+        else:
+            return [self.matrix]
+
+    @property
+    def digest(self):
+        """Hex digest of the contents of the weighting matrix.
+
+        The digest is computed once with BLAKE2b and then cached. To
+        keep the cached value valid, the matrix arrays are made read-only
+        in the process. The digest is stable across processes.
+
+        Examples
+        --------
+        >>> weighting = MatrixWeighting(np.eye(2), impl='numpy')
+        >>> same = MatrixWeighting(np.eye(2), impl='numpy')
+        >>> weighting.digest == same.digest
+        True
+        >>> weighting.matrix.flags.writeable
+        False
+        """
+        digest = self.__digest
+        if digest is None:
+            # Sparse formats are distinguished by their name
+            fmt = getattr(self.matrix, 'format', 'dense')
+            arrays = self._matrix_arrays()
+            digest = _content_digest(
+                [np.frombuffer(fmt.encode(), dtype='uint8')] + arrays)
+            if _make_read_only(arrays):
+                self.__digest = digest
+        return digest
+
     def is_valid(self):
         """Test if the matrix is positive definite Hermitian.
 
@@ -355,9 +446,7 @@ class MatrixWeighting(Weighting):
 
     def __hash__(self):
         """Return ``hash(self)``."""
-        # TODO: Better hash for matrix?
-        return hash((super(MatrixWeighting, self).__hash__(),
-                     self.matrix.tobytes()))
+        return hash((super(MatrixWeighting, self).__hash__(), self.digest))
 
     def equiv(self, other):
         """Test if other is an equivalent weighting.
@@ -475,6 +564,8 @@ class ArrayWeighting(Weighting):
         array : `array-like`
             Weighting array of inner product, norm and distance.
             Native `Tensor` instances are stored as-is without copying.
+            NumPy arrays are copied only if they are views of another
+            array.
         impl : string
             Specifier for the implementation backend.
         exponent : positive float, optional
@@ -488,16 +579,43 @@ class ArrayWeighting(Weighting):
         array_attrs = ('shape', 'dtype', 'itemsize')
         if (all(hasattr(array, attr) for attr in array_attrs) and
                 not isinstance(array, TensorSpace)):
-            self.__array = array
+            self.__array = _owned(array)
         else:
             raise TypeError('`array` {!r} does not look like a valid array'
                             ''.format(array))
+        self.__digest = None
 
     @property
     def array(self):
         """Weighting array of this instance."""
         return self.__array
 
+    @property
+    def digest(self):
+        """Hex digest of the contents of the weighting array.
+
+        The digest is computed once with BLAKE2b and then cached. To
+        keep the cached value valid, the array is made read-only in the
+        process. Arrays that are not NumPy arrays cannot be locked, and
+        their digest is recomputed in each call. The digest is stable
+        across processes.
+
+        Examples
+        --------
+        >>> weighting = ArrayWeighting(np.array([1.0, 2.0]), impl='numpy')
+        >>> same = ArrayWeighting(np.array([1.0, 2.0]), impl='numpy')
+        >>> weighting.digest == same.digest
+        True
+        >>> weighting.array.flags.writeable
+        False
+        """
+        digest = self.__digest
+        if digest is None:
+            digest = _content_digest([self.array])
+            if _make_read_only([self.array]):
+                self.__digest = digest
+        return digest
+
     def is_valid(self):
         """Return True if the array is a valid weight, i.e. positive."""
         return np.all(np.greater(self.array, 0))
@@ -523,9 +641,7 @@ class ArrayWeighting(Weighting):
 
     def __hash__(self):
         """Return ``hash(self)``."""
-        # TODO: Better hash for array?
-        return hash((super(ArrayWeighting, self).__hash__(),
-                     self.array.tobytes()))
+        return hash((super(ArrayWeighting, self).__hash__(), self.digest))
 
     def equiv(self, other):
         """Return True if other is an equivalent weighting.
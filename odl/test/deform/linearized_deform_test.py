@@ -15,8 +15,10 @@ import pytest
 
 import odl
 from odl.deform import LinDeformFixedDisp, LinDeformFixedTempl
+from odl.deform import linearized
+from odl.discr.discr_utils import per_axis_interpolator
 from odl.space.entry_points import tensor_space_impl
-from odl.util.testutils import simple_fixture
+from odl.util.testutils import all_almost_equal, simple_fixture
 
 # --- pytest fixtures --- #
 
@@ -151,6 +153,47 @@ def inv_deformed_template(x):
     return template_function(disp_x)
 
 
+# --- linear_deform --- #
+
+
+def test_linear_deform_blocks(space, interp, monkeypatch):
+    """Check blockwise deformation against interpolation on all points."""
+    template = space.element(template_function)
+    disp_field = space.real_space.tangent_bundle.element(
+        disp_field_factory(space.ndim))
+
+    # Reference: interpolation on the full point cloud
+    points = space.points()
+    for i, vi in enumerate(disp_field):
+        points[:, i] += vi.asarray().ravel()
+    interpolator = per_axis_interpolator(
+        template, space.grid.coord_vectors, interp)
+    expected = interpolator(points.T).reshape(space.shape)
+
+    # Force several blocks, processed by multiple threads
+    monkeypatch.setattr(linearized, '_BLOCK_SIZE', 20)
+    for num_threads in [None, 3]:
+        result = linearized.linear_deform(
+            template, disp_field, interp, num_threads=num_threads)
+        assert all_almost_equal(result, expected)
+
+    # Non-uniform grid, using the binary search
+    part = odl.nonuniform_partition(
+        *([np.linspace(-1, 1, 20) ** 3] * space.ndim))
+    nonuni_space = odl.DiscretizedSpace(part, odl.rn(part.shape))
+    template = nonuni_space.element(template_function)
+    disp_field = nonuni_space.tangent_bundle.element(
+        disp_field_factory(space.ndim))
+    points = nonuni_space.points()
+    for i, vi in enumerate(disp_field):
+        points[:, i] += vi.asarray().ravel()
+    interpolator = per_axis_interpolator(
+        template, nonuni_space.grid.coord_vectors, interp)
+    expected = interpolator(points.T).reshape(nonuni_space.shape)
+    result = linearized.linear_deform(template, disp_field, interp)
+    assert all_almost_equal(result, expected)
+
+
 # --- LinDeformFixedTempl --- #
 
 
@@ -264,6 +307,28 @@ def test_fixed_disp_call(space, interp):
     assert rlt_err < error_bound(interp)
 
 
+def test_fixed_disp_precompute(space, interp):
+    """Test that precomputed weights give the same result."""
+    template = space.element(template_function)
+    disp_field = space.real_space.tangent_bundle.element(
+        disp_field_factory(space.ndim))
+
+    deform_op = LinDeformFixedDisp(
+        disp_field, templ_space=space, interp=interp
+    )
+    deform_op_pre = LinDeformFixedDisp(
+        disp_field, templ_space=space, interp=interp, precompute=True,
+        num_threads=2
+    )
+    assert deform_op_pre.precompute
+    assert deform_op_pre.inverse.precompute
+    assert all_almost_equal(deform_op_pre(template), deform_op(template))
+
+    out = space.element()
+    deform_op_pre(template, out=out)
+    assert all_almost_equal(out, deform_op(template))
+
+
 def test_fixed_disp_inv(space, interp):
     """Test inverse of lin. deformation with fixed displacement."""
     # Set up template and displacement field
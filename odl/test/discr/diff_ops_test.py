@@ -429,6 +429,80 @@ def test_divergence(space, method, padding):
     assert lhs == pytest.approx(rhs, rel=dtype_tol(space.dtype))
 
 
+def test_gradient_divergence_batch_call(space, method, padding):
+    """Check batched evaluation against evaluation in a loop."""
+    if isinstance(padding, tuple):
+        pad_mode, pad_const = padding
+    else:
+        pad_mode, pad_const = padding, 0
+
+    grad = Gradient(space, method=method, pad_mode=pad_mode,
+                    pad_const=pad_const)
+    div = Divergence(range=space, method=method, pad_mode=pad_mode,
+                     pad_const=pad_const)
+
+    for op in [grad, div]:
+        xs = np.stack([noise_element(op.domain) for _ in range(3)])
+        expected = [op(x) for x in xs]
+        assert all_almost_equal(op.batch_call(xs), expected)
+
+
+@pytest.mark.parametrize('pad_mode', ['constant', 'symmetric',
+                                      'symmetric_adjoint', 'periodic',
+                                      'order0', 'order0_adjoint',
+                                      'order1', 'order1_adjoint',
+                                      'order2', 'order2_adjoint'])
+def test_stencil_slabs(monkeypatch, method, pad_mode):
+    """Check slab-wise evaluation against full arrays."""
+    import odl.discr.diff_ops as diff_ops
+    monkeypatch.setattr(diff_ops, '_SLAB_SIZE', 1)
+
+    space = odl.uniform_discr([0, 0, 0], [1, 1, 1], (13, 6, 5),
+                              num_threads=2)
+    assert len(diff_ops._stencil_slabs(space.shape)) > 2
+    pad_const = 0.5 if pad_mode == 'constant' else 0
+
+    x = noise_element(space)
+    grad = Gradient(space, method=method, pad_mode=pad_mode,
+                    pad_const=pad_const)
+    expected = [finite_diff(x.asarray(), axis=axis, dx=dx, method=method,
+                            pad_mode=pad_mode, pad_const=pad_const)
+                for axis, dx in enumerate(space.cell_sides)]
+    assert all_almost_equal(grad(x), expected)
+
+    contiguous = odl.ProductSpace(space, 3, contiguous=True)
+    out = contiguous.element()
+    grad(x, out=out)
+    assert all_almost_equal(out, expected)
+
+    if pad_mode == 'periodic' and method == 'forward':
+        # Independent check of the wrap-around across slabs
+        expected_0 = (np.roll(x.asarray(), -1, axis=0) -
+                      x.asarray()) / space.cell_sides[0]
+        assert all_almost_equal(grad(x)[0], expected_0)
+
+    div = Divergence(range=space, method=method, pad_mode=pad_mode,
+                     pad_const=pad_const)
+    y = noise_element(div.domain)
+    expected = sum(finite_diff(y[axis].asarray(), axis=axis, dx=dx,
+                               method=method, pad_mode=pad_mode,
+                               pad_const=pad_const)
+                   for axis, dx in enumerate(space.cell_sides))
+    assert all_almost_equal(div(y), expected)
+
+    if pad_mode in ('order1', 'order1_adjoint', 'order2', 'order2_adjoint'):
+        return  # these pad modes not supported for laplacian
+
+    lap = Laplacian(space, pad_mode=pad_mode, pad_const=pad_const)
+    expected = sum(
+        finite_diff(x.asarray(), axis=axis, dx=dx ** 2, method='forward',
+                    pad_mode=pad_mode, pad_const=pad_const) -
+        finite_diff(x.asarray(), axis=axis, dx=dx ** 2, method='backward',
+                    pad_mode=pad_mode, pad_const=pad_const)
+        for axis, dx in enumerate(space.cell_sides))
+    assert all_almost_equal(lap(x), expected)
+
+
 # --- Laplacian --- #
 
 def test_laplacian_init():
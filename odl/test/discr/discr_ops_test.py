@@ -45,6 +45,20 @@ def padding(request):
 # --- ResizingOperator tests --- #
 
 
+def test_resampling_adjoint():
+    """Check the adjoint of `Resampling` with different cell sizes."""
+    coarse_discr = odl.uniform_discr([0, 0], [1, 2], (4, 3))
+    fine_discr = odl.uniform_discr([0, 0], [1, 2], (7, 8))
+    for interp in ['nearest', 'linear', ('linear', 'nearest')]:
+        for dom, ran in [(coarse_discr, fine_discr),
+                         (fine_discr, coarse_discr)]:
+            op = odl.Resampling(dom, ran, interp)
+            x = noise_element(dom)
+            y = noise_element(ran)
+            assert op(x).inner(y) == pytest.approx(x.inner(op.adjoint(y)))
+            assert op.adjoint.adjoint is op
+
+
 def test_resizing_op_init(odl_tspace_impl, padding):
     # Test if the different init patterns run
     impl = odl_tspace_impl
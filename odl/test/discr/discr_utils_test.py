@@ -17,8 +17,8 @@ import pytest
 
 import odl
 from odl.discr.discr_utils import (
-    linear_interpolator, nearest_interpolator, per_axis_interpolator,
-    point_collocation, sampling_function)
+    InterpolationPlan, linear_interpolator, nearest_interpolator,
+    per_axis_interpolator, point_collocation, sampling_function)
 from odl.discr.grid import sparse_meshgrid
 from odl.util.testutils import all_almost_equal, all_equal, simple_fixture
 
@@ -851,6 +851,46 @@ def test_per_axis_interpolation():
     assert all_equal(out, true_mg)
 
 
+def test_interpolation_plan():
+    """Check interpolation plans against the interpolators."""
+    coord_vecs = [[0.125, 0.375, 0.625, 0.875], [0.25, 0.75]]
+    f = np.array([[1, 2],
+                  [3, 4],
+                  [5, 6],
+                  [7, 8]], dtype='float64')
+    pts = np.array([[0.3, 0.6],
+                    [0.1, 0.25],
+                    [1.0, 1.0],
+                    [-0.1, 0.9]]).T
+    mg = sparse_meshgrid([0.3, 1.0, 0.5], [0.4, 0.85])
+
+    for interp in ['linear', 'nearest', ['linear', 'nearest']]:
+        interpolator = per_axis_interpolator(f, coord_vecs, interp)
+        for x in [pts, mg]:
+            plan = InterpolationPlan(coord_vecs, x, interp)
+            expected = interpolator(x)
+            assert plan.shape == expected.shape
+            assert all_almost_equal(plan(f), expected)
+
+            out = np.empty(plan.shape)
+            plan(f, out=out)
+            assert all_almost_equal(out, expected)
+
+            # Adjoint: <A f, g> = <f, A^T g>
+            g = np.random.rand(*plan.shape)
+            assert (np.vdot(plan(f), g) ==
+                    pytest.approx(np.vdot(f, plan.adjoint(g))))
+
+    # Complex values
+    plan = InterpolationPlan(coord_vecs, mg, 'linear')
+    f_cplx = f + 1j * f[::-1]
+    interpolator = per_axis_interpolator(f_cplx, coord_vecs, 'linear')
+    assert all_almost_equal(plan(f_cplx), interpolator(mg))
+    g = np.random.rand(*plan.shape) + 1j * np.random.rand(*plan.shape)
+    assert (np.vdot(g, plan(f_cplx)) ==
+            pytest.approx(np.vdot(plan.adjoint(g), f_cplx)))
+
+
 def test_collocation_interpolation_identity():
     """Check if collocation is left-inverse to interpolation."""
     # Interpolation followed by collocation on the same grid should be
@@ -0,0 +1,157 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for compiled operator expressions."""
+
+from __future__ import division
+
+import numpy as np
+import pytest
+
+import odl
+from odl.operator.compiled import CompiledOperator, compile_operator
+from odl.util.testutils import all_almost_equal, noise_element
+
+
+# --- pytest fixtures --- #
+
+
+@pytest.fixture(scope='module')
+def space():
+    return odl.uniform_discr([0, 0], [1, 1], (4, 5))
+
+
+def expressions(space):
+    """Return a list of operator expressions on ``space``."""
+    ident = odl.IdentityOperator(space)
+    grad = odl.Gradient(space)
+    lap = odl.Laplacian(space)
+    mult = odl.MultiplyOperator(noise_element(space))
+    square = odl.PowerOperator(space, 2)
+    vec = noise_element(space)
+    return [
+        2 * lap + lap * 3 - ident,
+        grad.adjoint * grad + 0.5 * ident,
+        2 * (grad.adjoint * (3 * grad)) + vec,
+        square * (2 * ident) + lap,
+        (2 * square) * (lap + vec),
+        lap * lap - 2 * ident + ident * 3,
+        odl.OperatorPointwiseProduct(lap, 2 * ident + lap),
+        vec * (lap + mult),
+        (lap + ident) * vec,
+        2.0 * mult * square - mult,
+    ]
+
+
+# --- Tests --- #
+
+
+def test_compile_operator_call(space):
+    """Check compiled evaluation against the original expression."""
+    for op in expressions(space):
+        compiled = compile_operator(op)
+        assert isinstance(compiled, CompiledOperator)
+        assert compiled.is_linear == op.is_linear
+        x = noise_element(space)
+        expected = op(x)
+
+        assert all_almost_equal(compiled(x), expected)
+        out = space.element()
+        for _ in range(2):
+            compiled(x, out=out)
+            assert all_almost_equal(out, expected)
+
+        # Aliased input and output
+        compiled(x, out=x)
+        assert all_almost_equal(x, expected)
+
+
+def test_compile_operator_no_allocation(space, monkeypatch):
+    """Check that in-place evaluation does not allocate space elements."""
+    ident = odl.IdentityOperator(space)
+    grad = odl.Gradient(space)
+    op = 2 * (grad.adjoint * grad) - 3 * ident + ident * 0.5
+    compiled = compile_operator(op)
+    assert compiled.num_temporaries == 2
+    x = noise_element(space)
+    out = space.element()
+
+    num_calls = [0]
+
+    def count_allocations(space_type):
+        element = space_type.element
+
+        def counting_element(self, inp=None, *args, **kwargs):
+            # Only count new allocations, not wrapping of existing data
+            if inp is None:
+                num_calls[0] += 1
+            return element(self, inp, *args, **kwargs)
+
+        monkeypatch.setattr(space_type, 'element', counting_element)
+
+    count_allocations(type(space))
+    count_allocations(odl.ProductSpace)
+    compiled(x, out=out)
+    assert num_calls[0] == 0
+    op(x, out=out)
+    assert num_calls[0] > 0
+
+
+def test_compile_operator_adjoint(space):
+    """Check the compiled adjoint of a linear expression."""
+    grad = odl.Gradient(space)
+    op = 2 * grad + grad * 0.5
+    compiled = compile_operator(op)
+    assert compiled.adjoint is compiled.adjoint
+    assert isinstance(compiled.adjoint, CompiledOperator)
+    y = noise_element(op.range)
+    assert all_almost_equal(compiled.adjoint(y), op.adjoint(y))
+    assert compiled.derivative(noise_element(space)) is compiled
+
+
+def test_compile_operator_passthrough():
+    """Check handling of functionals and already compiled operators."""
+    space = odl.rn(3)
+    func = odl.solvers.L2NormSquared(space)
+    assert compile_operator(func) is func
+
+    op = compile_operator(2 * odl.IdentityOperator(space))
+    assert compile_operator(op) is op
+
+    with pytest.raises(TypeError):
+        compile_operator(np.eye(3))
+
+    # Functional nested in an expression
+    ident = odl.IdentityOperator(space)
+    op = odl.FunctionalLeftVectorMult(func, space.one()) + ident
+    x = noise_element(space)
+    assert all_almost_equal(compile_operator(op)(x), op(x))
+
+
+def test_compile_operator_in_solver(space):
+    """Check that compiled operators give the same solver iterates."""
+    grad = odl.Gradient(space)
+    op = odl.BroadcastOperator(odl.IdentityOperator(space), grad)
+    compiled = compile_operator(2 * op)
+    op = 2 * op
+    f = odl.solvers.ZeroFunctional(space)
+    g = odl.solvers.SeparableSum(
+        odl.solvers.L2NormSquared(space).translated(space.one()),
+        odl.solvers.L1Norm(grad.range))
+    tau = sigma = 0.1
+
+    x = space.zero()
+    odl.solvers.pdhg(x, f, g, op, niter=5, tau=tau, sigma=sigma)
+    x_compiled = space.zero()
+    odl.solvers.pdhg(x_compiled, f, g, compiled, niter=5, tau=tau,
+                     sigma=sigma)
+    assert all_almost_equal(x, x_compiled)
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
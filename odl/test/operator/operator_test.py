@@ -402,6 +402,64 @@ def test_linear_operator_composition(dom_eq_ran):
     check_call((op1 * op2).adjoint, y, np.dot(mat2.T, np.dot(mat1.T, yarr)))
 
 
+def test_operator_batch_call():
+    """Check batched evaluation against evaluation in a loop."""
+    A = np.random.rand(4, 3)
+    B = np.random.rand(3, 3)
+    op = MultiplyAndSquareOp(A)
+    lin_op = MatrixOperator(B)
+    xs = np.random.rand(5, 3)
+
+    def loop(op, xs):
+        return np.array([op(x) for x in xs])
+
+    # Default implementation and vectorized overrides, also in combination
+    for test_op in [op, lin_op, 2.5 * lin_op, lin_op * 2.5,
+                    lin_op + lin_op.adjoint, op * lin_op,
+                    MatrixOperator(A.T) * op]:
+        assert all_almost_equal(test_op.batch_call(xs), loop(test_op, xs))
+
+    # Keyword arguments are passed on to the operators of an expression
+    class ScaledOp(Operator):
+
+        """Identity with a ``scale`` keyword argument."""
+
+        def __init__(self):
+            super(ScaledOp, self).__init__(odl.rn(3), odl.rn(3), linear=True)
+
+        def _call(self, x, out, **kwargs):
+            out.lincomb(kwargs.get('scale', 1.0), x)
+
+    scaled_op = ScaledOp()
+    for test_op, factor in [(scaled_op + scaled_op, 6), (2 * scaled_op, 6),
+                            (scaled_op * 2, 6), (scaled_op * scaled_op, 9)]:
+        assert all_almost_equal(test_op.batch_call(xs, scale=3.0),
+                                factor * xs)
+
+    out = np.empty((5, 4))
+    result = op.batch_call(xs, out=out)
+    assert result is out
+    assert all_almost_equal(out, loop(op, xs))
+
+    # Functionals return a 1D array
+    func = SumFunctional(odl.rn(3))
+    assert func.batch_call(xs).shape == (5,)
+    assert all_almost_equal(func.batch_call(xs), xs.sum(axis=1))
+
+    # Empty batch
+    assert op.batch_call(np.empty((0, 3))).shape == (0, 4)
+
+    # Wrong input or output shapes
+    with pytest.raises(OpDomainError):
+        op.batch_call(np.random.rand(5, 4))
+    with pytest.raises(OpDomainError):
+        op.batch_call(np.random.rand(3))
+    with pytest.raises(OpRangeError):
+        op.batch_call(xs, out=np.empty((5, 3)))
+    with pytest.raises(OpRangeError):
+        op.batch_call(xs, out=np.empty((4, 4)))
+
+
 def test_type_errors():
     r3 = odl.rn(3)
     r4 = odl.rn(4)
@@ -955,5 +1013,33 @@ def test_dispatch_call_args_class():
         _dispatch_call_args(cls=WithClassMethod)
 
 
+def test_call_trusted():
+    """Check the unchecked fast path against regular evaluation."""
+    space = odl.uniform_discr([0, 0], [1, 1], [4, 5])
+    grad = odl.Gradient(space)
+    op = 2 * grad.adjoint * grad + odl.IdentityOperator(space)
+    x = noise_element(space)
+
+    expected = op(x)
+    assert all_almost_equal(op._call_trusted(x), expected)
+    out = space.element()
+    assert op._call_trusted(x, out=out) is out
+    assert all_almost_equal(out, expected)
+
+    # Subclasses overriding `__call__` are not bypassed
+    class CountingOp(odl.IdentityOperator):
+        calls = 0
+
+        def __call__(self, x, out=None, **kwargs):
+            CountingOp.calls += 1
+            return super(CountingOp, self).__call__(x, out=out, **kwargs)
+
+    counting = CountingOp(space)
+    (2 * counting)(x)
+    assert CountingOp.calls == 1
+    counting._call_trusted(x)
+    assert CountingOp.calls == 2
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -7,10 +7,12 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import division
+
+import numpy as np
 import pytest
 
 import odl
-from odl.util.testutils import all_almost_equal, simple_fixture
+from odl.util.testutils import all_almost_equal, all_equal, simple_fixture
 
 
 base_op = simple_fixture(
@@ -240,5 +242,103 @@ def test_comp_proj_adjoint_slice():
     assert result == proj.adjoint(x, out=proj.domain.element())
 
 
+def test_pspace_op_num_threads():
+    """Check that parallel evaluation gives the serial results."""
+    space = odl.uniform_discr(0, 1, 10)
+    grad = odl.Gradient(odl.uniform_discr([0, 0], [1, 1], (4, 5)))
+    ops = [odl.ScalingOperator(space, c) for c in (1.0, 2.0, -0.5)]
+
+    matrix = [[ops[0], ops[1], 0],
+              [0, 0, 0],
+              [ops[2], ops[0], ops[1]]]
+    op_serial = odl.ProductSpaceOperator(matrix, range=space ** 3)
+    op_par = odl.ProductSpaceOperator(matrix, range=space ** 3,
+                                      num_threads=3)
+    assert op_par.num_threads == 3
+    assert op_par.adjoint.num_threads == 3
+    x = op_serial.domain.element([space.element(np.random.rand(10))
+                                  for _ in range(3)])
+    out = op_par.range.element()
+    out[1].assign(space.one())
+    op_par(x, out=out)
+    assert all_equal(out, op_serial(x))
+    assert all_equal(op_par(x), op_serial(x))
+
+    bcast = odl.BroadcastOperator(grad, 2 * grad, num_threads=2)
+    red = odl.ReductionOperator(*ops, num_threads=2)
+    diag = odl.DiagonalOperator(*ops, num_threads=2)
+    assert bcast.adjoint.num_threads == 2
+    assert red.adjoint.num_threads == 2
+    assert diag.adjoint.num_threads == 2
+    for op in (bcast, red, diag):
+        serial = type(op)(*op.operators)
+        x = op.domain.element(np.random.rand(*op.domain.shape))
+        assert all_equal(op(x), serial(x))
+        assert all_equal(op.adjoint(op(x)), serial.adjoint(serial(x)))
+
+    with pytest.raises(TypeError):
+        odl.BroadcastOperator(grad, 2, threads=2)
+    with pytest.raises(ValueError):
+        odl.DiagonalOperator(grad, 2, num_threads=0)
+
+
+def test_pspace_op_num_threads_shared_operator():
+    """Check that shared stateful operators are not run concurrently."""
+    import threading
+    import time
+
+    space = odl.rn(5)
+
+    class StatefulOperator(odl.Operator):
+
+        """Operator with a preallocated temporary."""
+
+        def __init__(self):
+            super(StatefulOperator, self).__init__(space, space, linear=True)
+            self.tmp = space.element()
+            self.active = 0
+            self.max_active = 0
+            self.lock = threading.Lock()
+
+        def _call(self, x, out):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            self.tmp.lincomb(2, x)
+            time.sleep(0.01)
+            out.assign(self.tmp)
+            with self.lock:
+                self.active -= 1
+
+    op = StatefulOperator()
+    other = odl.ScalingOperator(space, 3)
+    bcast = odl.BroadcastOperator(op, 2 * op, other, op, num_threads=4)
+    x = space.element(np.arange(5))
+    assert all_equal(bcast(x), [2 * x, 4 * x, 3 * x, 2 * x])
+    assert op.max_active == 1
+
+    diag = odl.DiagonalOperator(op, 4, num_threads=4)
+    y = diag.domain.element([x, 2 * x, 3 * x, 4 * x])
+    assert all_equal(diag(y), 2 * y)
+    assert op.max_active == 1
+
+    # Compiled operators keep their temporaries across calls
+    a = odl.MatrixOperator(np.random.rand(5, 5))
+    compiled = odl.compile_operator(2 * odl.IdentityOperator(space) +
+                                    3 * a.adjoint * a)
+    bcast = odl.BroadcastOperator(compiled, 8, num_threads=8)
+    expected = compiled(x)
+    assert all_almost_equal(bcast(x), [expected] * 8)
+
+    # Distinct operators sharing a temporary
+    tmp = space.element()
+    comps = [odl.OperatorComp(odl.ScalingOperator(space, c),
+                              odl.ScalingOperator(space, 2), tmp=tmp)
+             for c in range(1, 5)]
+    assert odl.operator.pspace_ops._thread_groups(comps) == [[0, 1, 2, 3]]
+    bcast = odl.BroadcastOperator(*comps, num_threads=4)
+    assert all_equal(bcast(x), [2 * c * x for c in range(1, 5)])
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
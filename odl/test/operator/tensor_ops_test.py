@@ -191,6 +191,32 @@ def test_pointwise_norm_weighted(exponent):
     assert all_almost_equal(out, true_norm)
 
 
+def test_pointwise_norm_batch_call(exponent):
+    """Check batched evaluation against evaluation in a loop."""
+    fspace = odl.uniform_discr([0, 0], [1, 1], (2, 3))
+    for vfspace, weighting in [(ProductSpace(fspace, 1), None),
+                               (ProductSpace(fspace, 3), None),
+                               (ProductSpace(fspace, 3), [1.0, 2.0, 3.0])]:
+        pwnorm = PointwiseNorm(vfspace, exponent, weighting=weighting)
+        xs = np.stack([noise_element(vfspace) for _ in range(4)])
+        expected = [pwnorm(x) for x in xs]
+        assert all_almost_equal(pwnorm.batch_call(xs), expected)
+
+
+def test_pointwise_norm_contiguous(exponent):
+    """Check evaluation on contiguous vector fields."""
+    fspace = odl.uniform_discr([0, 0], [1, 1], (2, 3))
+    for weighting in [None, [1.0, 2.0, 3.0]]:
+        vfspace = ProductSpace(fspace, 3)
+        vfspace_cont = ProductSpace(fspace, 3, contiguous=True)
+        pwnorm = PointwiseNorm(vfspace, exponent, weighting=weighting)
+        pwnorm_cont = PointwiseNorm(vfspace_cont, exponent,
+                                    weighting=weighting)
+        x = noise_element(vfspace)
+        assert all_almost_equal(pwnorm_cont(vfspace_cont.element(x)),
+                                pwnorm(x))
+
+
 def test_pointwise_norm_gradient_real(exponent):
     # The operator is not differentiable for exponent 'inf'
     if exponent == float('inf'):
@@ -428,6 +454,12 @@ def test_pointwise_inner_weighted():
     pwinner(func, out=out)
     assert all_almost_equal(out, true_inner)
 
+    # Contiguous vector fields
+    vfspace_cont = ProductSpace(fspace, 3, contiguous=True)
+    pwinner = PointwiseInner(vfspace_cont, vecfield=array, weighting=weight)
+    assert all_almost_equal(pwinner(vfspace_cont.element(testarr)),
+                            true_inner)
+
 
 def test_pointwise_inner_adjoint():
     # 1d
@@ -658,6 +690,19 @@ def test_matrix_op_call(matrix):
     assert all_almost_equal(out, true_result)
 
 
+def test_matrix_op_batch_call(matrix):
+    """Check batched evaluation against evaluation in a loop."""
+    dense_matrix = matrix
+    sparse_matrix = scipy.sparse.coo_matrix(dense_matrix)
+
+    for mat_op in [MatrixOperator(dense_matrix),
+                   MatrixOperator(sparse_matrix),
+                   MatrixOperator(dense_matrix, odl.rn((2, 4, 2)), axis=1)]:
+        xs = np.stack([noise_element(mat_op.domain) for _ in range(3)])
+        expected = [mat_op(x) for x in xs]
+        assert all_almost_equal(mat_op.batch_call(xs), expected)
+
+
 def test_matrix_op_call_explicit():
     """Validate result from call to matrix op against explicit calculation."""
     mat = np.ones((3, 2))
@@ -75,5 +75,22 @@ def test_comparsion(linear_space):
         x > y
 
 
+def test_contains_memoized():
+    """Check that membership checks are memoized per pair of spaces."""
+    from odl.set.space import _SPACE_EQ_CACHE
+
+    space = odl.uniform_discr([0, 0], [1, 1], [3, 4])
+    equal_space = odl.uniform_discr([0, 0], [1, 1], [3, 4])
+    other_space = odl.uniform_discr([0, 0], [1, 2], [3, 4])
+    x = equal_space.zero()
+
+    assert x in space
+    assert (id(equal_space), id(space)) in _SPACE_EQ_CACHE
+    assert x in space
+    assert x not in other_space
+    assert x not in other_space
+    assert _SPACE_EQ_CACHE[id(equal_space), id(other_space)][2] is False
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -24,7 +24,9 @@ import numpy as np
                         'conjugate_gradient_normal',
                         'mlem',
                         'osmlem',
-                        'kaczmarz'])
+                        'kaczmarz',
+                        'sart',
+                        'sirt'])
 def iterative_solver(request):
     """Return a solver given by a name with interface solve(op, x, rhs)."""
     solver_name = request.param
@@ -62,6 +64,13 @@ def iterative_solver(request):
             norm2 = op.adjoint(op(x)).norm() / x.norm()
             odl.solvers.kaczmarz([op, op], x, [rhs, rhs], niter=20,
                                  omega=0.5 / norm2)
+    elif solver_name == 'sart':
+        def solver(op, x, rhs):
+            odl.solvers.sart([op, op], x, [rhs, rhs], niter=20)
+    elif solver_name == 'sirt':
+        def solver(op, x, rhs):
+            odl.solvers.sirt([op, op], x, [rhs, rhs], niter=40,
+                             num_threads=2)
     else:
         raise ValueError('solver not valid')
 
@@ -126,5 +135,92 @@ def test_steepst_descent():
     assert all_almost_equal(x, [1, 1, 1], ndigits=2)
 
 
+def test_osmlem_resume(tmpdir):
+    """Check that resuming from a checkpoint reproduces a full run."""
+    space = odl.uniform_discr(0, 1, 5)
+    op = odl.MultiplyOperator(space.element([1, 2, 3, 4, 5]))
+    data = [op(space.one()), 2 * op(space.one())]
+    path = str(tmpdir.join('osmlem.npz'))
+
+    x_full = space.one()
+    odl.solvers.osmlem([op, op], x_full, data, niter=6)
+
+    x = space.one()
+    odl.solvers.osmlem([op, op], x, data, niter=3, checkpoint=path)
+
+    x_resumed = space.one()
+    odl.solvers.osmlem([op, op], x_resumed, data, niter=6,
+                       resume_from=path)
+    assert np.array_equal(x_resumed, x_full)
+
+
+def test_subset_cache():
+    """Check that subset normalizations are cached per operator."""
+    space = odl.uniform_discr(0, 1, 5)
+    op = odl.MultiplyOperator(space.element([1, 2, 3, 4, 5]))
+
+    sens = odl.solvers.subset_sensitivities([op])[0]
+    assert all_almost_equal(sens, op.adjoint(op.range.one()))
+    assert odl.solvers.subset_sensitivities([op])[0] is sens
+    assert odl.solvers.subset_row_sums([op])[0] is (
+        odl.solvers.subset_row_sums([op])[0])
+
+    odl.solvers.clear_subset_cache([op])
+    assert odl.solvers.subset_sensitivities([op])[0] is not sens
+
+
+@pytest.mark.parametrize('block_size', [1, 2, 4])
+def test_sart_threads(block_size):
+    """Check that block-parallel SART does not depend on the threads."""
+    ops = [odl.MatrixOperator(np.random.rand(3, 6)) for _ in range(4)]
+    true = ops[0].domain.element(np.random.rand(6))
+    rhs = [opi(true) for opi in ops]
+
+    x_serial = ops[0].domain.zero()
+    odl.solvers.sart(ops, x_serial, rhs, niter=5, block_size=block_size)
+
+    x_threaded = ops[0].domain.zero()
+    odl.solvers.sart(ops, x_threaded, rhs, niter=5, block_size=block_size,
+                     num_threads=4)
+    assert all_almost_equal(x_threaded, x_serial)
+
+
+def test_sart_threads_shared_state():
+    """Check that subsets sharing a temporary are not run concurrently."""
+    import time
+
+    space = odl.rn(5)
+
+    class SlowDoubling(odl.Operator):
+
+        """Self-adjoint operator ``x -> 2 * x`` that yields the GIL."""
+
+        def __init__(self):
+            super(SlowDoubling, self).__init__(space, space, linear=True)
+
+        def _call(self, x, out):
+            out.lincomb(2, x)
+            time.sleep(0.01)
+
+        @property
+        def adjoint(self):
+            return self
+
+    # The compositions share the temporary between the two factors
+    inner = SlowDoubling()
+    tmp = space.element()
+    ops = [odl.OperatorComp(odl.ScalingOperator(space, c), inner, tmp=tmp)
+           for c in range(1, 5)]
+    true = space.element(np.arange(1, 6))
+    rhs = [opi(true) for opi in ops]
+
+    x_serial = space.zero()
+    odl.solvers.sirt(ops, x_serial, rhs, niter=3)
+
+    x_threaded = space.zero()
+    odl.solvers.sirt(ops, x_threaded, rhs, niter=3, num_threads=4)
+    assert all_almost_equal(x_threaded, x_serial)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -12,7 +12,7 @@ from __future__ import division
 import odl
 from odl.solvers import admm_linearized, Callback
 
-from odl.util.testutils import all_almost_equal, noise_element
+from odl.util.testutils import all_almost_equal, all_equal, noise_element
 
 
 def test_admm_lin_input_handling():
@@ -72,5 +72,37 @@ def test_admm_lin_l1():
     assert all_almost_equal(x, data_1, ndigits=2)
 
 
+def test_admm_lin_tol_and_step_balancing():
+    """Check early stopping and penalty balancing against a long run."""
+    space = odl.rn(5)
+    L = odl.IdentityOperator(space)
+    data = noise_element(space)
+    f = odl.solvers.L2NormSquared(space).translated(data)
+    g = 0.5 * odl.solvers.L1Norm(space)
+
+    x_ref = space.zero()
+    admm_linearized(x_ref, f, g, L, tau=0.5, sigma=1.0, niter=1000)
+
+    for step_balancing in [None, True]:
+        x = space.zero()
+        residuals = []
+        admm_linearized(x, f, g, L, tau=0.5, sigma=1.0, niter=1000,
+                        tol=1e-8, step_balancing=step_balancing,
+                        residuals=residuals)
+        assert len(residuals) < 1000
+        assert max(residuals[-1]) <= 1e-8
+        assert all_almost_equal(x, x_ref, ndigits=6)
+
+    # A step balancing instance starts from scratch in every run
+    balancing = odl.solvers.PrimalDualStepBalancing()
+    results = []
+    for _ in range(2):
+        x = space.zero()
+        admm_linearized(x, f, g, L, tau=0.5, sigma=1.0, niter=50,
+                        step_balancing=balancing)
+        results.append(x)
+    assert all_equal(results[0], results[1])
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
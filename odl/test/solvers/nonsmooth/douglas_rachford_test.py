@@ -95,6 +95,32 @@ def test_primal_dual_l1():
     assert all_almost_equal(x, data_1, ndigits=2)
 
 
+def test_primal_dual_tol():
+    """Check early stopping against a long run."""
+    space = odl.rn(5)
+    L = [odl.IdentityOperator(space)]
+    data = space.element([1.0, -2.0, 0.25, 3.0, -0.5])
+    f = odl.solvers.L2NormSquared(space).translated(data)
+    g = [0.5 * odl.solvers.L1Norm(space)]
+
+    x_ref = space.zero()
+    douglas_rachford_pd(x_ref, f, g, L, tau=1.0, sigma=[1.0], niter=500)
+
+    x = space.zero()
+    residuals = []
+    douglas_rachford_pd(x, f, g, L, tau=1.0, sigma=[1.0], niter=500,
+                        tol=1e-8, residuals=residuals)
+    assert len(residuals) < 100
+    assert max(residuals[-1]) <= 1e-8
+    assert all_almost_equal(x, x_ref, LOW_ACCURACY)
+
+    # Step balancing is not offered since the residuals are not the
+    # primal-dual residuals
+    with pytest.raises(TypeError):
+        douglas_rachford_pd(x, f, g, L, tau=1.0, sigma=[1.0], niter=1,
+                            step_balancing=True)
+
+
 def test_primal_dual_no_operator():
     """Verify that the correct value is returned when there is no operator.
 
@@ -155,5 +181,42 @@ def test_primal_dual_with_li():
     assert float(x) <= upper_lim + 10 ** -LOW_ACCURACY
 
 
+def test_primal_dual_resume(tmpdir):
+    """Check that resuming from a checkpoint reproduces a full run."""
+    space = odl.uniform_discr(0, 1, 10)
+    lin_ops = [odl.IdentityOperator(space), odl.Gradient(space)]
+    g = [odl.solvers.L1Norm(space), odl.solvers.L1Norm(lin_ops[1].range)]
+    f = odl.solvers.L2NormSquared(space).translated(noise_element(space))
+    path = str(tmpdir.join('dr.npz'))
+
+    def lam(k):
+        return 1.0 + 0.5 / (k + 1)
+
+    # Fixed step sizes, since the default ones are computed from randomized
+    # operator norm estimates that differ between runs
+    # tau * sum(sigma_i * ||L_i||^2) = 1 * (1 + 2e-3 * 400) < 4
+    steps = dict(tau=1.0, sigma=[1.0, 2e-3])
+
+    x_full = space.zero()
+    douglas_rachford_pd(x_full, f, g, lin_ops, niter=10, lam=lam, **steps)
+
+    x = space.zero()
+    douglas_rachford_pd(x, f, g, lin_ops, niter=5, lam=lam, checkpoint=path,
+                        **steps)
+
+    x_resumed = space.zero()
+    douglas_rachford_pd(x_resumed, f, g, lin_ops, niter=10, lam=lam,
+                        resume_from=path, **steps)
+    assert (x_resumed.asarray() == x_full.asarray()).all()
+
+    # The last checkpoint of the first run is written after 4 iterations,
+    # its primal iterate is the result of that run
+    assert odl.solvers.load_solver_state(path)['iteration'] == 4
+    x_resumed = space.zero()
+    douglas_rachford_pd(x_resumed, f, g, lin_ops, niter=4, lam=lam,
+                        resume_from=path, **steps)
+    assert (x_resumed.asarray() == x.asarray()).all()
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
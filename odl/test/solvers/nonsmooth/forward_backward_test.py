@@ -125,6 +125,27 @@ def test_forward_backward_with_lin_ops():
     assert all_almost_equal(x, x_global_min, ndigits=LOW_ACCURACY)
 
 
+def test_forward_backward_tol():
+    """Check early stopping against the explicit solution."""
+    space = odl.rn(10)
+    alpha = 0.1
+    b = noise_element(space)
+
+    lin_ops = [alpha * odl.IdentityOperator(space)]
+    g = [odl.solvers.L2NormSquared(space)]
+    f = odl.solvers.ZeroFunctional(space)
+    h = odl.solvers.L2NormSquared(space).translated(b)
+    x_global_min = b / (1 + alpha ** 2)
+
+    x = noise_element(space)
+    residuals = []
+    forward_backward_pd(x, f, g, lin_ops, h, tau=0.5, sigma=[1.0],
+                        niter=500, tol=1e-8, residuals=residuals)
+    assert len(residuals) < 500
+    assert max(residuals[-1]) <= 1e-8
+    assert all_almost_equal(x, x_global_min, ndigits=LOW_ACCURACY)
+
+
 def test_forward_backward_with_li():
     """Test for the forward-backward solver with infimal convolution.
 
@@ -10,10 +10,11 @@
 
 from __future__ import division
 import numpy as np
+import pytest
 
 import odl
 from odl.solvers import pdhg
-from odl.util.testutils import all_almost_equal
+from odl.util.testutils import all_almost_equal, all_equal
 
 # Places for the accepted error when comparing results
 PLACES = 8
@@ -103,6 +104,117 @@ def test_pdhg_simple_space():
          callback=odl.solvers.CallbackPrintIteration())
 
 
+def test_pdhg_resume(tmpdir):
+    """Check that resuming from a checkpoint reproduces a full run."""
+    space = odl.uniform_discr(0, 1, DATA.size)
+    op = odl.BroadcastOperator(odl.IdentityOperator(space),
+                               odl.Gradient(space))
+    f = odl.solvers.L2NormSquared(space).translated(DATA)
+    g = odl.solvers.SeparableSum(odl.solvers.L1Norm(space),
+                                 odl.solvers.L1Norm(op.range[1]))
+    path = str(tmpdir.join('pdhg.npz'))
+
+    x_full = space.zero()
+    pdhg(x_full, f, g, op, niter=10, tau=TAU, sigma=SIGMA, gamma_primal=0.1)
+
+    x = space.zero()
+    pdhg(x, f, g, op, niter=4, tau=TAU, sigma=SIGMA, gamma_primal=0.1,
+         checkpoint=path, checkpoint_step=2)
+    assert odl.solvers.load_solver_state(path)['iteration'] == 4
+
+    x_resumed = space.zero()
+    pdhg(x_resumed, f, g, op, niter=10, tau=TAU, sigma=SIGMA,
+         gamma_primal=0.1, resume_from=path)
+    assert np.array_equal(x_resumed, x_full)
+
+
+def test_pdhg_tol_and_step_balancing():
+    """Check early stopping and step balancing against a long run."""
+    space = odl.uniform_discr(0, 1, DATA.size)
+    op = odl.IdentityOperator(space)
+    f = odl.solvers.L2NormSquared(space).translated(DATA)
+    g = 0.5 * odl.solvers.L1Norm(space)
+
+    x_ref = space.zero()
+    pdhg(x_ref, f, g, op, niter=500, tau=TAU, sigma=SIGMA)
+
+    num_iters = []
+    for step_balancing in [None, True]:
+        x = space.zero()
+        residuals = []
+        pdhg(x, f, g, op, niter=500, tau=TAU, sigma=SIGMA, tol=1e-8,
+             step_balancing=step_balancing, residuals=residuals)
+        assert len(residuals) < 100
+        assert max(residuals[-1]) <= 1e-8
+        assert all_almost_equal(x, x_ref, ndigits=6)
+        num_iters.append(len(residuals))
+
+    # Balancing on the primal-dual residuals should not slow down
+    assert num_iters[1] <= num_iters[0]
+
+    # Balancing changes the step sizes, which is not compatible with
+    # acceleration
+    with pytest.raises(ValueError):
+        pdhg(space.zero(), f, g, op, niter=1, tau=TAU, sigma=SIGMA,
+             gamma_primal=0.1, step_balancing=True)
+
+
+def test_pdhg_residuals_linear():
+    """Check that linear residuals need no extra operator evaluations."""
+    space = odl.rn(5)
+    matrix = odl.MatrixOperator(np.random.rand(5, 5))
+
+    class CountingOperator(odl.Operator):
+
+        """Wrapper of ``matrix`` that counts its evaluations."""
+
+        def __init__(self, linear):
+            super(CountingOperator, self).__init__(space, space,
+                                                   linear=linear)
+            self.calls = 0
+
+        def _call(self, x, out):
+            self.calls += 1
+            matrix(x, out=out)
+
+        def derivative(self, point):
+            return matrix
+
+        @property
+        def adjoint(self):
+            return matrix.adjoint
+
+    f = odl.solvers.L2NormSquared(space).translated(np.arange(5))
+    g = odl.solvers.L1Norm(space)
+    tau, sigma = odl.solvers.pdhg_stepsize(matrix)
+
+    op = CountingOperator(linear=True)
+    pdhg(space.zero(), f, g, op, niter=20, tau=tau, sigma=sigma)
+    assert op.calls == 20
+
+    op = CountingOperator(linear=True)
+    residuals = []
+    pdhg(space.zero(), f, g, op, niter=20, tau=tau, sigma=sigma,
+         residuals=residuals)
+    assert op.calls == 21
+
+    # The derivative based residuals of the nonlinear case agree
+    residuals_nonlin = []
+    pdhg(space.zero(), f, g, CountingOperator(linear=False), niter=20,
+         tau=tau, sigma=sigma, residuals=residuals_nonlin)
+    assert all_almost_equal(residuals, residuals_nonlin)
+
+    # A step balancing instance starts from scratch in every run
+    balancing = odl.solvers.PrimalDualStepBalancing()
+    results = []
+    for _ in range(2):
+        x = space.zero()
+        pdhg(x, f, g, matrix, niter=20, tau=tau, sigma=sigma,
+             step_balancing=balancing)
+        results.append(x)
+    assert all_equal(results[0], results[1])
+
+
 def test_pdhg_product_space():
     """Test the PDHG algorithm using a product space operator."""
 
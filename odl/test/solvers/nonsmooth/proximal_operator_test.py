@@ -17,10 +17,10 @@ from odl.solvers.nonsmooth.proximal_operators import (
     combine_proximals, proximal_const_func,
     proximal_box_constraint, proximal_nonnegativity,
     proximal_convex_conj_l1, proximal_convex_conj_l1_l2,
-    proximal_l2,
+    proximal_l1_l2, proximal_l2,
     proximal_convex_conj_l2_squared,
     proximal_convex_conj_kl, proximal_convex_conj_kl_cross_entropy)
-from odl.util.testutils import all_almost_equal
+from odl.util.testutils import all_almost_equal, noise_element
 
 
 # Places for the accepted error when comparing results
@@ -392,6 +392,44 @@ def test_proximal_convconj_l1_product_space():
     assert all_almost_equal(x_verify, x_opt)
 
 
+def test_proximal_l1_l2_pointwise_sigma_and_aliasing():
+    """Group L1-L2 proximals with pointwise step size and aliased output."""
+    base = odl.uniform_discr([0, 0], [1, 1], (5, 4))
+    sigma = base.element(np.linspace(0.1, 1, base.size).reshape(base.shape))
+    lam = 2
+
+    for contiguous in [False, True]:
+        space = odl.ProductSpace(base, 2, contiguous=contiguous)
+        x = noise_element(space)
+        x_arr = x.asarray()
+
+        for g in [None, noise_element(space)]:
+            g_arr = 0 if g is None else g.asarray()
+            for sig in [0.5, sigma]:
+                sig_arr = sig if np.isscalar(sig) else sig.asarray()
+
+                # Convex conjugate: lam * d / max(lam, |d|), d = x - sig * g
+                prox = proximal_convex_conj_l1_l2(space, lam=lam, g=g)(sig)
+                diff = x_arr - sig_arr * g_arr
+                norm = np.sqrt(np.sum(diff ** 2, axis=0))
+                expected = lam * diff / np.maximum(lam, norm)
+                assert all_almost_equal(prox(x), expected, HIGH_ACC)
+                out = x.copy()
+                prox(out, out=out)
+                assert all_almost_equal(out, expected, HIGH_ACC)
+
+                # Shrinkage: x - d / max(|d| / (sig * lam), 1), d = x - g
+                prox = proximal_l1_l2(space, lam=lam, g=g)(sig)
+                diff = x_arr - g_arr
+                norm = np.sqrt(np.sum(diff ** 2, axis=0))
+                expected = x_arr - diff / np.maximum(norm / (sig_arr * lam),
+                                                     1)
+                assert all_almost_equal(prox(x), expected, HIGH_ACC)
+                out = x.copy()
+                prox(out, out=out)
+                assert all_almost_equal(out, expected, HIGH_ACC)
+
+
 def test_proximal_convconj_kl_simple_space():
     """Test for proximal factory for the convex conjugate of KL divergence."""
 
@@ -9,9 +9,12 @@
 """Test for the smooth solvers."""
 
 from __future__ import division
+import numpy as np
 import pytest
 import odl
 from odl.operator import OpNotImplementedError
+from odl.solvers.smooth.newton import _bfgs_direction, _LBFGSHistory
+from odl.util.testutils import all_almost_equal, noise_element
 
 
 nonlinear_cg_beta = odl.util.testutils.simple_fixture('nonlinear_cg_beta',
@@ -112,6 +115,58 @@ def test_lbfgs_solver(functional_and_linesearch):
     assert functional(x) < 1e-3
 
 
+def test_lbfgs_solver_contiguous(functional_and_linesearch):
+    """Test limited memory BFGS with contiguous history storage."""
+    functional, line_search = functional_and_linesearch
+
+    x = functional.domain.one()
+    odl.solvers.bfgs_method(functional, x, tol=1e-3,
+                            line_search=line_search, num_store=5,
+                            contiguous=True)
+
+    assert functional(x) < 1e-3
+
+
+@pytest.mark.parametrize('contiguous', [False, True])
+def test_lbfgs_history(contiguous):
+    """Test the ring buffer of L-BFGS correction factors."""
+    space = odl.uniform_discr(0, 1, 10)
+    num_store = 3
+    history = _LBFGSHistory(space, num_store, contiguous=contiguous)
+
+    ss, ys = [], []
+    for _ in range(5):
+        s = noise_element(space)
+        y = 2 * s + 0.1 * noise_element(space)
+        ss.append(s.copy())
+        ys.append(y.copy())
+        history.push(s, y, y.inner(s))
+
+    assert len(history) == num_store
+    x = noise_element(space)
+    for hessinv_estimate in [None, odl.ScalingOperator(space, 0.5),
+                             odl.MultiplyOperator(1 + space.one())]:
+        expected = _bfgs_direction(ss[-num_store:], ys[-num_store:], x,
+                                   hessinv_estimate)
+        result = history.direction(x, hessinv_estimate)
+        assert all_almost_equal(result, expected)
+
+    history.clear()
+    assert len(history) == 0
+    assert all_almost_equal(history.direction(x), x)
+
+
+def test_lbfgs_history_contiguous_unsupported():
+    """Test that contiguous storage is rejected where it does not apply."""
+    with pytest.raises(ValueError):
+        _LBFGSHistory(odl.rn(3), num_store=None, contiguous=True)
+    with pytest.raises(ValueError):
+        _LBFGSHistory(odl.rn(3) ** 2, num_store=3, contiguous=True)
+    with pytest.raises(ValueError):
+        _LBFGSHistory(odl.rn(3, weighting=np.arange(1, 4)), num_store=3,
+                      contiguous=True)
+
+
 def test_broydens_method(broyden_impl, functional_and_linesearch):
     """Test the ``broydens_method`` quasi-Newton solver."""
     functional, line_search = functional_and_linesearch
@@ -0,0 +1,84 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for solver callbacks."""
+
+from __future__ import division
+
+import threading
+import time
+
+import pytest
+
+import odl
+from odl.solvers import CallbackAsync, CallbackStore
+from odl.util.testutils import all_equal
+
+
+def test_callback_async_order_and_snapshots():
+    """Check that iterates are processed in order and copied."""
+    space = odl.ProductSpace(odl.rn(3), 2)
+    store = CallbackStore()
+    callback = CallbackAsync(store, maxsize=2)
+
+    x = space.one()
+    for i in range(5):
+        callback(x)
+        x *= 2
+    callback.wait()
+
+    assert len(store) == 5
+    for i, xi in enumerate(store):
+        assert all_equal(xi, space.one() * 2 ** i)
+
+    callback.reset()
+    assert len(store) == 0
+    with CallbackAsync(store, step=2) as callback:
+        for i in range(5):
+            callback(x)
+    assert len(store) == 3
+
+
+def test_callback_async_backpressure():
+    """Check that the number of pending snapshots is bounded."""
+    release = threading.Event()
+    processed = []
+
+    def slow(x):
+        release.wait()
+        processed.append(x.copy())
+
+    callback = CallbackAsync(slow, maxsize=1)
+    x = odl.rn(2).zero()
+    callback(x)
+    callback(x)
+    blocked = threading.Thread(target=callback, args=(x,))
+    blocked.start()
+    time.sleep(0.05)
+    assert blocked.is_alive()  # both buffers in use
+
+    release.set()
+    blocked.join()
+    callback.close()
+    assert len(processed) == 3
+
+
+def test_callback_async_error():
+    """Check that errors are re-raised in the calling thread."""
+    def fail(x):
+        raise ZeroDivisionError
+
+    callback = CallbackAsync(fail)
+    callback(odl.rn(2).zero())
+    with pytest.raises(ZeroDivisionError):
+        callback.wait()
+    callback.close()
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
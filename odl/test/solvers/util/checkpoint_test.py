@@ -0,0 +1,68 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for checkpointing of solver states."""
+
+from __future__ import division
+
+import os
+
+import numpy as np
+import pytest
+
+import odl
+from odl.solvers.util.checkpoint import (
+    load_solver_state, restore_solver_state, save_solver_state)
+from odl.util.testutils import all_equal, noise_element
+
+
+def test_save_load_solver_state(tmpdir):
+    """Check that states round-trip exactly."""
+    pspace = odl.ProductSpace(odl.uniform_discr(0, 1, 5), odl.rn(3))
+    x = noise_element(pspace)
+    y = noise_element(odl.rn(4))
+    np.random.seed(1)
+    rng_state = np.random.get_state()
+
+    path = str(tmpdir.join('sub', 'state.npz'))
+    save_solver_state(path, {'iteration': 3, 'x': x, 'y': [y, y],
+                             'tau': 0.1, 'sigma': (0.2, 0.3),
+                             'rng': rng_state, 'unused': None})
+    # Only the final file remains, no temporaries
+    assert os.listdir(os.path.dirname(path)) == ['state.npz']
+
+    state = load_solver_state(path)
+    assert state['iteration'] == 3
+    assert state['tau'] == 0.1
+    assert state['sigma'] == [0.2, 0.3]
+    assert 'unused' not in state
+
+    x2, y2 = pspace.zero(), odl.rn(4).zero()
+    restore_solver_state(x2, state['x'])
+    restore_solver_state(y2, state['y'][1])
+    assert all_equal(x2, x)
+    assert all_equal(y2, y)
+
+    np.random.set_state(tuple(state['rng']))
+    values = np.random.rand(3)
+    np.random.set_state(rng_state)
+    assert all_equal(values, np.random.rand(3))
+
+    # Overwriting an existing checkpoint
+    save_solver_state(path, {'iteration': 4})
+    assert load_solver_state(path) == {'iteration': 4}
+
+    with pytest.raises(TypeError):
+        save_solver_state(path, {'x': object()})
+    assert load_solver_state(path) == {'iteration': 4}
+    with pytest.raises(ValueError):
+        restore_solver_state(x2, state['y'] + state['y'])
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -66,5 +66,26 @@ def test_line_search_from_iternum():
         assert steplen == 1 / (n + 1)
 
 
+def test_primal_dual_step_balancing():
+    """Test the residual balancing of PrimalDualStepBalancing."""
+    balancing = odl.solvers.PrimalDualStepBalancing(alpha=0.5, eta=0.5,
+                                                    delta=2.0)
+
+    # Balanced residuals leave the steps and the adaptivity unchanged
+    assert balancing(1.0, 1.5) == 1.0
+    assert balancing.alpha == 0.5
+
+    # Dominating primal residual increases the primal step
+    assert balancing(10.0, 1.0) == 2.0
+    assert balancing.alpha == 0.25
+
+    # Dominating dual residual decreases the primal step
+    assert balancing(1.0, 10.0) == 0.75
+    assert balancing.alpha == 0.125
+
+    balancing.reset()
+    assert balancing.alpha == 0.5
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -476,6 +476,108 @@ def test_custom_funcs():
         odl.ProductSpace(r2, r3, inner=custom_inner, weighting=2.0)
 
 
+def test_num_threads(exponent):
+    """Check that parallel processing of parts gives serial results."""
+    spaces = [odl.uniform_discr(0, 1, 10), odl.rn(5), odl.rn(7)]
+    weightings = [None, 2.0, np.array([1.0, 2.0, 3.0])]
+    for weighting in weightings:
+        if exponent < 1 and weighting is not None:
+            continue
+        serial = odl.ProductSpace(*spaces, exponent=exponent,
+                                  weighting=weighting)
+        parallel = odl.ProductSpace(*spaces, exponent=exponent,
+                                    weighting=weighting, num_threads=3)
+        assert parallel.num_threads == 3
+        assert serial.num_threads is None
+        assert parallel == serial
+        assert hash(parallel) == hash(serial)
+
+        _, [x, y] = noise_elements(serial, 2)
+        xp, yp = parallel.element(x.copy()), parallel.element(y.copy())
+        if exponent == 2.0:
+            assert parallel.inner(xp, yp) == serial.inner(x, y)
+        assert parallel.norm(xp) == serial.norm(x)
+        assert parallel.dist(xp, yp) == serial.dist(x, y)
+
+        out_p = parallel.element()
+        parallel.lincomb(2, xp, -1, yp, out=out_p)
+        assert all_equal(out_p, serial.lincomb(2, x, -1, y))
+        assert all_equal(parallel.lincomb(2, xp, -1, yp),
+                         serial.lincomb(2, x, -1, y))
+        assert all_equal(xp * yp, x * y)
+        parallel.divide(xp, yp, out=out_p)
+        assert all_equal(out_p, x / y)
+
+    space = odl.ProductSpace(odl.rn(3, dtype='float32'), 4, num_threads=2)
+    assert space.complex_space.num_threads == 2
+    assert space.real_space.num_threads == 2
+    assert space.astype('float64').num_threads == 2
+
+    with pytest.raises(ValueError):
+        odl.ProductSpace(odl.rn(3), 2, num_threads=0)
+
+
+def test_contiguous(exponent):
+    """Check contiguous storage against storage in separate parts."""
+    for base in [odl.uniform_discr(0, 1, 10, exponent=exponent),
+                 odl.rn((2, 3), exponent=exponent),
+                 odl.rn((2, 3))]:
+        for weighting in [None, 2.0, np.array([1.0, 2.0, 3.0])]:
+            if exponent < 1 and weighting is not None:
+                continue
+            sep = odl.ProductSpace(base, 3, exponent=exponent,
+                                   weighting=weighting)
+            cont = odl.ProductSpace(base, 3, exponent=exponent,
+                                    weighting=weighting, contiguous=True)
+            assert cont.is_contiguous
+            assert not sep.is_contiguous
+            assert cont == sep
+            assert hash(cont) == hash(sep)
+
+            _, [x, y] = noise_elements(sep, 2)
+            xc, yc = cont.element(x), cont.element(y)
+            assert xc.data.shape == cont.shape
+            assert all(np.shares_memory(xc.data, p) for p in xc.parts)
+            assert xc.asarray() is xc.data
+            assert all_equal(xc, x)
+
+            if exponent == 2.0:
+                assert cont.inner(xc, yc) == pytest.approx(sep.inner(x, y))
+            assert cont.norm(xc) == pytest.approx(sep.norm(x))
+            assert cont.dist(xc, yc) == pytest.approx(sep.dist(x, y))
+
+            out = cont.element()
+            cont.lincomb(2, xc, -1, yc, out=out)
+            assert out.data is not None
+            assert all_almost_equal(out, sep.lincomb(2, x, -1, y))
+            assert all_almost_equal(cont.lincomb(2, xc, -1, yc),
+                                    sep.lincomb(2, x, -1, y))
+            assert all_almost_equal(xc * yc, x * y)
+            cont.divide(xc, yc, out=out)
+            assert all_almost_equal(out, x / y)
+
+            # Mixing with non-contiguous elements falls back to part-wise
+            # evaluation
+            assert all_almost_equal(cont.lincomb(1, x, 1, yc), x + y)
+
+            out.assign(yc)
+            assert all_equal(out, y)
+            assert all(np.shares_memory(out.data, p) for p in out.parts)
+
+    space = odl.ProductSpace(odl.rn(3), 2, contiguous=True)
+    assert all_equal(space.zero().data, np.zeros((2, 3)))
+    assert all_equal(space.one().data, np.ones((2, 3)))
+    arr = np.arange(6, dtype=float).reshape((2, 3))
+    assert space.element(arr).data is arr
+    assert space.complex_space.is_contiguous
+    assert space.astype('float32').is_contiguous
+
+    with pytest.raises(ValueError):
+        odl.ProductSpace(odl.rn(2), odl.rn(3), contiguous=True)
+    with pytest.raises(ValueError):
+        odl.ProductSpace(odl.ProductSpace(odl.rn(2), 2), 2, contiguous=True)
+
+
 def test_power_RxR():
     H = odl.rn(2)
     HxH = odl.ProductSpace(H, 2)
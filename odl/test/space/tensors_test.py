@@ -12,6 +12,7 @@ from __future__ import division
 
 import operator
 import sys
+from itertools import product
 
 import numpy as np
 import pytest
@@ -1107,6 +1108,41 @@ def test_array_weighting_equals(odl_tspace_impl):
     assert weighting_arr != weighting_other_exp
 
 
+def test_array_weighting_digest(odl_tspace_impl):
+    """Test the cached content digest used for hashing."""
+    impl = odl_tspace_impl
+    space = odl.rn(5, impl=impl)
+    weight_arr = _pos_array(space)
+
+    weighting_cls = _weighting_cls(impl, 'array')
+    weighting = weighting_cls(weight_arr)
+    weighting_copy = weighting_cls(weight_arr.copy())
+    weighting_other = weighting_cls(weight_arr + 1)
+
+    assert weighting.digest == weighting_copy.digest
+    assert weighting.digest != weighting_other.digest
+    assert hash(weighting) == hash(weighting_copy)
+
+    # The array is locked such that the cached digest stays valid. Views
+    # are copied since they could be changed through their base.
+    assert weighting.array is weight_arr
+    assert not weighting.array.flags.writeable
+    with pytest.raises(ValueError):
+        weighting.array[0] = 0
+    base = weight_arr.copy()
+    weighting_view = weighting_cls(base[:])
+    digest = weighting_view.digest
+    assert base.flags.writeable
+    base[0] += 1
+    assert weighting_view.digest == digest
+    assert hash(weighting_view) == hash(weighting)
+
+    # Weighted spaces with equal weights hash equally
+    wspace = odl.rn(5, impl=impl, weighting=weight_arr.copy())
+    wspace_copy = odl.rn(5, impl=impl, weighting=weight_arr.copy())
+    assert hash(wspace) == hash(wspace_copy)
+
+
 def test_array_weighting_equiv(odl_tspace_impl):
     """Test the equiv method of Numpy array weightings."""
     impl = odl_tspace_impl
@@ -1790,5 +1826,134 @@ def test_ufunc_reduction_docs_notempty(odl_tspace_impl):
         assert reduction.__doc__.splitlines()[0] != ''
 
 
+def test_chunked_kernels(exponent, monkeypatch):
+    """Check multithreaded chunked kernels against single-threaded ones."""
+    monkeypatch.setattr(odl.space.npy_tensors, 'THRESHOLD_PARALLEL', 10)
+    monkeypatch.setattr(odl.space.npy_tensors, 'CHUNK_SIZE', 7)
+    shape = (9, 10)
+    weights = [1.0, 0.5, _pos_array(odl.rn(shape))]
+
+    for dtype, weighting in product(['float64', 'complex128'], weights):
+        spaces = [odl.tensor_space(shape, dtype,
+                                   weighting=weighting, exponent=exponent,
+                                   num_threads=num_threads)
+                  for num_threads in (1, 2, 3)]
+        assert [space.num_threads for space in spaces] == [1, 2, 3]
+        assert spaces[0] == spaces[1] == spaces[2]
+        [xarr, yarr], [x1, y1] = noise_elements(spaces[0], 2)
+        x2, y2 = spaces[1].element(xarr), spaces[1].element(yarr)
+        x3, y3 = spaces[2].element(xarr), spaces[2].element(yarr)
+
+        # Reductions agree with the serial ones and do not depend on the
+        # number of threads
+        results = [(x.norm(), x.dist(y)) for x, y in
+                   ((x1, y1), (x2, y2), (x3, y3))]
+        if exponent == 2.0:
+            results = [res + (x.inner(y),) for res, x, y in
+                       zip(results, (x1, x2, x3), (y1, y2, y3))]
+        assert all_almost_equal(results[0], results[1])
+        assert results[1] == results[2]
+
+    # Arithmetic, including aliased arguments
+    space = spaces[2]
+    x, y = space.element(xarr.copy()), space.element(yarr.copy())
+    out = space.element()
+    space.lincomb(2, x, -1, y, out=out)
+    assert all_almost_equal(out, 2 * xarr - yarr)
+    space.lincomb(2, x, 3, x, out=x)
+    assert all_almost_equal(x, 5 * xarr)
+    space.lincomb(1, y, 0.5, x, out=x)
+    assert all_almost_equal(x, yarr + 2.5 * xarr)
+    space.multiply(x, y, out=out)
+    assert all_almost_equal(out, (yarr + 2.5 * xarr) * yarr)
+
+    # Non-contiguous data falls back to the serial kernels
+    x = space.element(np.asfortranarray(xarr))
+    space.lincomb(1, x, 1, y, out=out)
+    assert all_almost_equal(out, xarr + yarr)
+
+
+def test_default_num_threads():
+    """Check the global default for the number of threads."""
+    from odl.space.npy_tensors import (
+        default_num_threads, set_default_num_threads)
+
+    space = odl.rn(3)
+    space_1 = odl.rn(3, num_threads=1)
+    assert space.num_threads == default_num_threads() == 1
+    try:
+        set_default_num_threads(2)
+        assert space.num_threads == 2
+        assert space_1.num_threads == 1
+    finally:
+        set_default_num_threads(1)
+
+    with pytest.raises(ValueError):
+        odl.rn(3, num_threads=0)
+    with pytest.raises(ValueError):
+        set_default_num_threads(1.5)
+
+
+def test_memmap_element(tmpdir, monkeypatch):
+    """Check memory-mapped elements and their chunk-wise arithmetic."""
+    import odl.space.npy_tensors as npy_tensors
+    monkeypatch.setattr(npy_tensors, 'CHUNK_SIZE', 7)
+    num_chunked_calls = [0]
+    map_chunks = npy_tensors._map_chunks
+
+    def counting_map_chunks(*args):
+        num_chunked_calls[0] += 1
+        return map_chunks(*args)
+
+    monkeypatch.setattr(npy_tensors, '_map_chunks', counting_map_chunks)
+
+    shape = (5, 6)
+    for weighting in [None, 0.5, noise_array(odl.rn(shape)) ** 2]:
+        space = odl.rn(shape, weighting=weighting)
+        arrays = [noise_array(space) for _ in range(3)]
+        xs = [space.memmap_element() for _ in range(3)]
+        for x, arr in zip(xs, arrays):
+            x[:] = arr
+            assert isinstance(x.data, np.memmap)
+        x, y, z = xs
+        x_mem, y_mem, z_mem = [space.element(arr.copy()) for arr in arrays]
+
+        assert space.inner(x, y) == pytest.approx(space.inner(x_mem, y_mem))
+        assert space.norm(x) == pytest.approx(space.norm(x_mem))
+        assert space.dist(x, y) == pytest.approx(space.dist(x_mem, y_mem))
+        space.lincomb(2, x, -1, y, out=z)
+        space.lincomb(2, x_mem, -1, y_mem, out=z_mem)
+        assert all_almost_equal(z, z_mem)
+        space.lincomb(1, z, 3, z, out=z)
+        assert all_almost_equal(z, 4 * z_mem)
+        space.multiply(x, y, out=z)
+        assert all_almost_equal(z, x_mem * y_mem)
+        assert num_chunked_calls[0] == 6
+        num_chunked_calls[0] = 0
+
+    # Existing memory maps are wrapped without copy
+    space = odl.rn(shape)
+    filename = str(tmpdir.join('data.bin'))
+    arr = np.memmap(filename, dtype=space.dtype, mode='w+', shape=shape)
+    x = space.element(arr)
+    x[:] = 1
+    assert np.shares_memory(x.data, arr)
+    del x, arr
+    x = space.memmap_element(filename, mode='r+')
+    assert all_equal(x, space.one())
+    with pytest.raises(ValueError):
+        space.memmap_element(filename, mode='r')
+
+    # Spaces with `memmap_dir` create memory-mapped elements
+    space = odl.uniform_discr([0, 0], [1, 1], shape, memmap_dir=str(tmpdir))
+    assert space.tspace.memmap_dir == str(tmpdir)
+    for elem in [space.element(), space.zero(), space.one(),
+                 space.one().copy(), space.zero() + space.one()]:
+        assert isinstance(elem.tensor.data, np.memmap)
+    assert all_equal(space.zero(), np.zeros(shape))
+    assert all_equal(space.one().copy(), np.ones(shape))
+    assert space.one().norm() == pytest.approx(1.0)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -0,0 +1,133 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test filtered back-projection with cached filters and angle slabs."""
+
+from __future__ import division
+
+import numpy as np
+import pytest
+
+import odl
+from odl.tomo.analytic.filtered_back_projection import _fbp_filter_kernel
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
+
+# --- pytest fixtures --- #
+
+
+geometry_type = simple_fixture(
+    'geometry_type', ['par2d', 'cone2d', 'par3d', 'cone3d', 'helical'])
+padding = simple_fixture('padding', [True, False])
+
+
+def make_ray_trafo(geometry_type):
+    """Return a small ray transform with the NumPy back-end."""
+    if geometry_type in ('par2d', 'cone2d'):
+        reco_space = odl.uniform_discr([-4, -5], [4, 5], (8, 10))
+        apart = odl.uniform_partition(0, 2 * np.pi, 10)
+        dpart = odl.uniform_partition(-8, 8, 12)
+        if geometry_type == 'par2d':
+            geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        else:
+            geom = odl.tomo.FanBeamGeometry(apart, dpart, src_radius=20,
+                                            det_radius=10)
+    else:
+        reco_space = odl.uniform_discr([-4, -5, -3], [4, 5, 3], (8, 10, 6))
+        apart = odl.uniform_partition(0, 2 * np.pi, 10)
+        dpart = odl.uniform_partition([-8, -6], [8, 6], (12, 9))
+        if geometry_type == 'par3d':
+            geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart)
+        elif geometry_type == 'cone3d':
+            geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=20,
+                                             det_radius=10)
+        else:
+            geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=20,
+                                             det_radius=10, pitch=2)
+
+    return odl.tomo.RayTransform(reco_space, geom, impl='numpy')
+
+
+# --- Tests --- #
+
+
+def test_fbp_filter_op(geometry_type, padding):
+    """Check slab-wise filtering and self-adjointness of the filter."""
+    ray_trafo = make_ray_trafo(geometry_type)
+    filter_op = odl.tomo.fbp_filter_op(ray_trafo, padding=padding)
+    assert filter_op.slabs == [(0, 10)]
+    slab_filter_op = odl.tomo.fbp_filter_op(ray_trafo, padding=padding,
+                                            slab_size=3)
+    assert slab_filter_op.slabs == [(0, 3), (3, 6), (6, 9), (9, 10)]
+
+    x = noise_element(ray_trafo.range)
+    y = noise_element(ray_trafo.range)
+    expected = filter_op(x)
+    assert all_almost_equal(slab_filter_op(x), expected)
+    assert filter_op.adjoint is filter_op
+    assert filter_op(x).inner(y) == pytest.approx(x.inner(filter_op(y)))
+
+    # Repeated calls reuse the padded buffer, also in-place
+    assert all_almost_equal(slab_filter_op(x), expected)
+    slab_filter_op(x, out=x)
+    assert all_almost_equal(x, expected)
+
+    with pytest.raises(ValueError):
+        odl.tomo.fbp_filter_op(ray_trafo, slab_size=0)
+
+
+def test_fbp_filter_kernel_cache():
+    """Check that equal filters share their cached kernel."""
+    ray_trafo = make_ray_trafo('par2d')
+    filter_op1 = odl.tomo.fbp_filter_op(ray_trafo, filter_type='Hann')
+    filter_op2 = odl.tomo.fbp_filter_op(ray_trafo, filter_type='Hann',
+                                        slab_size=2)
+    assert all_almost_equal(filter_op1.kernel, filter_op2.kernel)
+
+    kernel = _fbp_filter_kernel([24], [1.0], [1.0], 'Hann', 0.5, True)
+    assert kernel.shape == (13,)
+    assert not kernel.flags.writeable
+    assert _fbp_filter_kernel([24], [1.0], [1.0], 'Hann', 0.5, True) is kernel
+    assert _fbp_filter_kernel([24], [1.0], [1.0], 'Hann', 0.6,
+                              True) is not kernel
+
+    # Ram-Lak is the ramp |xi| on the DFT frequencies
+    kernel = _fbp_filter_kernel([8], [0.5], [1.0], 'Ram-Lak', 1.0, False)
+    assert all_almost_equal(kernel,
+                            2 * np.pi * np.abs(np.fft.fftfreq(8, 0.5)))
+
+
+def test_fbp_op_slabs(geometry_type, padding):
+    """Check that slab-wise back-projection gives the same result."""
+    ray_trafo = make_ray_trafo(geometry_type)
+    fbp = odl.tomo.fbp_op(ray_trafo, padding=padding)
+    assert fbp.slab_ray_trafos is None
+    slab_fbp = odl.tomo.fbp_op(ray_trafo, padding=padding, slab_size=4)
+    assert len(slab_fbp.slab_ray_trafos) == 3
+
+    x = noise_element(ray_trafo.range)
+    expected = ray_trafo.adjoint(fbp.filter_op(x))
+    assert all_almost_equal(fbp(x), expected)
+    assert all_almost_equal(slab_fbp(x), expected)
+
+    y = noise_element(ray_trafo.domain)
+    assert all_almost_equal(slab_fbp.adjoint(y),
+                            fbp.filter_op(ray_trafo(y)))
+
+
+def test_fbp_reconstruction():
+    """Check that FBP approximately inverts the ray transform."""
+    space = odl.uniform_discr([-20, -20], [20, 20], (64, 64))
+    geometry = odl.tomo.parallel_beam_geometry(space, num_angles=90)
+    ray_trafo = odl.tomo.RayTransform(space, geometry, impl='numpy')
+    phantom = odl.phantom.shepp_logan(space, modified=True)
+    fbp = odl.tomo.fbp_op(ray_trafo, slab_size=16)
+    assert fbp(ray_trafo(phantom)).dist(phantom) < 0.35 * phantom.norm()
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
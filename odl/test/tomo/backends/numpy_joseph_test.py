@@ -0,0 +1,157 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test pure NumPy Joseph back-end."""
+
+from __future__ import division
+
+import numpy as np
+import pytest
+
+import odl
+from odl.tomo.backends.numpy_joseph import (
+    NumpyJosephMatrixImpl, joseph_back_projector, joseph_forward_projector,
+    joseph_system_matrix)
+from odl.util.testutils import all_equal, simple_fixture
+
+# --- pytest fixtures --- #
+
+
+geometry_type = simple_fixture(
+    'geometry_type', ['par2d', 'cone2d', 'par3d', 'cone3d', 'helical']
+)
+
+
+def make_geometry(geometry_type):
+    """Return a small geometry and reconstruction space."""
+    if geometry_type in ('par2d', 'cone2d'):
+        reco_space = odl.uniform_discr([-4, -5], [4, 5], (8, 10),
+                                       dtype='float32')
+        apart = odl.uniform_partition(0, 2 * np.pi, 8)
+        dpart = odl.uniform_partition(-8, 8, 12)
+        if geometry_type == 'par2d':
+            geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        else:
+            geom = odl.tomo.FanBeamGeometry(apart, dpart, src_radius=20,
+                                            det_radius=10)
+    else:
+        reco_space = odl.uniform_discr([-4, -5, -3], [4, 5, 3], (8, 10, 6),
+                                       dtype='float32')
+        apart = odl.uniform_partition(0, 2 * np.pi, 8)
+        dpart = odl.uniform_partition([-8, -6], [8, 6], (12, 9))
+        if geometry_type == 'par3d':
+            geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart)
+        elif geometry_type == 'cone3d':
+            geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=20,
+                                             det_radius=10)
+        else:
+            geom = odl.tomo.ConeBeamGeometry(apart, dpart, src_radius=20,
+                                             det_radius=10, pitch=2)
+
+    return reco_space, geom
+
+
+# --- Tests --- #
+
+
+def test_joseph_projector(geometry_type):
+    """NumPy forward and back projection for the supported geometries."""
+    reco_space, geom = make_geometry(geometry_type)
+    phantom = odl.phantom.cuboid(reco_space)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='numpy')
+    proj_space = ray_trafo.range
+
+    # Forward evaluation
+    proj_data = joseph_forward_projector(phantom, geom, proj_space)
+    assert proj_data.shape == proj_space.shape
+    assert proj_data.norm() > 0
+
+    # Backward evaluation
+    backproj = joseph_back_projector(proj_data, geom, reco_space)
+    assert backproj.shape == reco_space.shape
+    assert backproj.norm() > 0
+
+    # The adjoint is exactly matched
+    inner_proj = proj_data.inner(proj_data)
+    inner_vol = backproj.inner(phantom)
+    assert inner_vol == pytest.approx(inner_proj, rel=1e-5)
+
+
+def test_joseph_threads_deterministic(geometry_type):
+    """The result does not depend on the number of threads."""
+    reco_space, geom = make_geometry(geometry_type)
+    phantom = odl.phantom.cuboid(reco_space)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='numpy')
+
+    proj_1 = ray_trafo(phantom, num_threads=1)
+    proj_3 = ray_trafo(phantom, num_threads=3)
+    assert all_equal(proj_1, proj_3)
+
+    backproj_1 = ray_trafo.adjoint(proj_1, num_threads=1)
+    backproj_3 = ray_trafo.adjoint(proj_1, num_threads=3)
+    assert np.allclose(backproj_1, backproj_3, rtol=1e-6)
+
+
+def test_joseph_line_integral():
+    """Rays along the coordinate axes give exact line integrals."""
+    reco_space = odl.uniform_discr([-1, -1], [1, 1], (4, 4))
+    apart = odl.nonuniform_partition([0, np.pi / 2])
+    dpart = odl.uniform_partition(-1, 1, 4)
+    geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='numpy')
+
+    proj = ray_trafo(reco_space.one())
+    assert all_equal(proj, 2 * np.ones((2, 4)))
+
+
+def test_joseph_matrix_impl(geometry_type):
+    """The matrix backend matches the matrix-free backend."""
+    reco_space, geom = make_geometry(geometry_type)
+    phantom = odl.phantom.cuboid(reco_space)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='numpy')
+    ray_trafo_mat = odl.tomo.RayTransform(reco_space, geom,
+                                          impl='numpy_matrix')
+
+    proj = ray_trafo(phantom)
+    proj_mat = ray_trafo_mat(phantom)
+    assert np.allclose(proj, proj_mat, rtol=1e-5, atol=1e-5)
+
+    backproj = ray_trafo.adjoint(proj)
+    backproj_mat = ray_trafo_mat.adjoint(proj)
+    assert np.allclose(backproj, backproj_mat, rtol=1e-5, atol=1e-5)
+
+    # The matrix is cached with the geometry
+    matrix = joseph_system_matrix(geom, reco_space)
+    assert joseph_system_matrix(geom, reco_space) is matrix
+    assert matrix.shape == (geom.partition.size, reco_space.size)
+
+
+def test_joseph_matrix_disk_cache(tmpdir):
+    """The system matrix is stored on disk and memory-mapped."""
+    reco_space, geom = make_geometry('par2d')
+    phantom = odl.phantom.cuboid(reco_space)
+    cache_dir = str(tmpdir)
+
+    proj_space = odl.tomo.RayTransform(reco_space, geom).range
+    impl = NumpyJosephMatrixImpl(geom, reco_space, proj_space, num_threads=2,
+                                 cache_dir=cache_dir)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl=impl)
+    proj = ray_trafo(phantom)
+    assert len(tmpdir.listdir()) == 1
+
+    # A fresh geometry loads the stored matrix instead of assembling it
+    _, geom_new = make_geometry('par2d')
+    matrix = joseph_system_matrix(geom_new, reco_space, cache_dir=cache_dir)
+    assert not matrix.data.flags.writeable  # read-only memory map
+    assert len(tmpdir.listdir()) == 1
+    assert np.allclose(matrix.dot(phantom.asarray().ravel()),
+                       proj.asarray().ravel())
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -28,6 +28,7 @@ impl = simple_fixture(
     name='impl',
     params=[pytest.param('astra_cpu', marks=skip_if_no_astra),
             pytest.param('astra_cuda', marks=skip_if_no_astra_cuda),
+            'numpy',
             pytest.param('skimage', marks=skip_if_no_skimage)]
 )
 
@@ -100,6 +101,15 @@ projectors.extend(
                       'cone3d astra_cuda random',
                       'helical astra_cuda uniform'])
 )
+projectors.extend(
+    ['par2d numpy uniform',
+     'par2d numpy half_uniform',
+     'par2d numpy nonuniform',
+     'par2d numpy random',
+     'cone2d numpy uniform',
+     'cone2d numpy nonuniform',
+     'cone2d numpy random']
+)
 projectors.extend(
     (pytest.param(proj_cfg, marks=skip_if_no_skimage)
      for proj_cfg in ['par2d skimage uniform',
@@ -107,7 +117,8 @@ projectors.extend(
 )
 
 projector_ids = [
-    " geom='{}' - impl='{}' - angles='{}' ".format(*p.values[0].split())
+    " geom='{}' - impl='{}' - angles='{}' ".format(
+        *getattr(p, 'values', [p])[0].split())
     for p in projectors
 ]
 
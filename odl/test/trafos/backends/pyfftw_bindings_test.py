@@ -7,11 +7,16 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import division
+import os
+import weakref
+
 import numpy as np
 import pytest
 
 import odl
-from odl.trafos.backends import pyfftw_call, PYFFTW_AVAILABLE
+from odl.trafos.backends import (
+    clear_fftw_plan_cache, fftw_plan_cache_info, pyfftw_call,
+    set_fftw_wisdom_file, PYFFTW_AVAILABLE)
 from odl.util import (
     is_real_dtype, complex_dtype)
 from odl.util.testutils import (
@@ -21,6 +26,9 @@ from odl.util.testutils import (
 pytestmark = pytest.mark.skipif(not PYFFTW_AVAILABLE,
                                 reason='`pyfftw` backend not available')
 
+if PYFFTW_AVAILABLE:
+    import pyfftw
+
 
 # --- pytest fixtures --- #
 
@@ -385,5 +393,74 @@ def test_pyfftw_call_backward_with_plan():
         assert all_almost_equal(idft_arr, true_idft)
 
 
+def test_pyfftw_call_plan_cache():
+    """Check reuse of cached plans for repeated transforms."""
+    clear_fftw_plan_cache()
+    shape = (6, 8)
+    arr = _random_array(shape, dtype='complex128')
+    true_dft = np.fft.fftn(arr)
+
+    out = np.empty(shape, dtype='complex128')
+    pyfftw_call(arr, out, planning_effort='measure')
+    assert fftw_plan_cache_info() == {'hits': 0, 'misses': 1, 'size': 1}
+
+    # Same arguments reuse the plan
+    out[:] = 0
+    pyfftw_call(arr, out, planning_effort='measure')
+    assert all_almost_equal(out, true_dft)
+    assert fftw_plan_cache_info()['hits'] == 1
+
+    # Higher effort replaces the plan, lower effort reuses it
+    pyfftw_call(arr, out, planning_effort='patient')
+    pyfftw_call(arr, out, planning_effort='measure')
+    assert fftw_plan_cache_info() == {'hits': 2, 'misses': 2, 'size': 1}
+
+    # Other arguments create new plans, 'estimate' plans are not cached
+    pyfftw_call(arr, out, direction='backward', planning_effort='measure')
+    pyfftw_call(arr, out, planning_effort='measure', use_plan_cache=False)
+    pyfftw_call(arr, out, planning_effort='estimate')
+    assert fftw_plan_cache_info() == {'hits': 2, 'misses': 3, 'size': 2}
+
+    # The cache does not keep the arrays of previous calls alive
+    tmp_out = np.empty(shape, dtype='complex128')
+    tmp_out_ref = weakref.ref(tmp_out)
+    pyfftw_call(arr, tmp_out, planning_effort='measure')
+    assert fftw_plan_cache_info()['hits'] == 3
+    del tmp_out
+    assert tmp_out_ref() is None
+
+    # Plans whose wisdom is gone are created anew
+    pyfftw.forget_wisdom()
+    out[:] = 0
+    pyfftw_call(arr, out, planning_effort='measure')
+    assert all_almost_equal(out, true_dft)
+    assert fftw_plan_cache_info() == {'hits': 3, 'misses': 4, 'size': 2}
+
+    clear_fftw_plan_cache()
+    assert fftw_plan_cache_info()['size'] == 0
+
+
+def test_pyfftw_wisdom_file(tmpdir):
+    """Check automatic export and import of FFTW wisdom."""
+    wisdom_file = str(tmpdir.join('wisdom.pkl'))
+    clear_fftw_plan_cache()
+    set_fftw_wisdom_file(wisdom_file)
+    try:
+        arr = _random_array((12, 10), dtype='float64')
+        out = np.empty((12, 6), dtype='complex128')
+        pyfftw_call(arr, out, halfcomplex=True, planning_effort='measure')
+        assert os.path.exists(wisdom_file)
+
+        # Import in a "new process"
+        pyfftw.forget_wisdom()
+        set_fftw_wisdom_file(wisdom_file)
+        clear_fftw_plan_cache()
+        pyfftw_call(arr, out, halfcomplex=True, planning_effort='measure')
+        assert all_almost_equal(out, np.fft.rfftn(arr))
+        assert pyfftw.export_wisdom() != ((b'',) * 3)
+    finally:
+        set_fftw_wisdom_file(None)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
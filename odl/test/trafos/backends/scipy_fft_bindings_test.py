@@ -0,0 +1,109 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+
+import numpy as np
+import pytest
+
+import odl
+from odl.trafos.backends import SCIPY_FFT_AVAILABLE, scipy_fft_call
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+pytestmark = pytest.mark.skipif(not SCIPY_FFT_AVAILABLE,
+                                reason='`scipy.fft` backend not available')
+
+
+# --- pytest fixtures --- #
+
+
+direction = simple_fixture('direction', ['forward', 'backward'])
+axes = simple_fixture('axes', [None, 0, (0, -1)])
+workers = simple_fixture('workers', [None, 1, 2])
+
+
+# --- Helper functions --- #
+
+
+def _np_axes(axes, ndim):
+    """Return ``axes`` as tuple usable in NumPy FFT functions."""
+    if axes is None:
+        return tuple(range(ndim))
+    else:
+        return odl.util.normalized_axes_tuple(axes, ndim)
+
+
+# --- Tests --- #
+
+
+def test_scipy_fft_call_c2c(direction, axes, workers):
+    """Check complex transforms against NumPy."""
+    shape = (4, 3, 5)
+    arr = np.random.rand(*shape) + 1j * np.random.rand(*shape)
+    np_axes = _np_axes(axes, arr.ndim)
+    if direction == 'forward':
+        expected = np.fft.fftn(arr, axes=np_axes)
+    else:
+        expected = np.fft.ifftn(arr, axes=np_axes)
+        expected_unnormalized = expected * np.prod(
+            np.take(shape, np_axes))
+
+    out = np.empty_like(arr)
+    result = scipy_fft_call(arr, out, direction=direction, axes=axes,
+                            workers=workers, normalise_idft=True)
+    assert result is out
+    assert all_almost_equal(out, expected)
+
+    if direction == 'backward':
+        scipy_fft_call(arr, out, direction=direction, axes=axes,
+                       workers=workers)
+        assert all_almost_equal(out, expected_unnormalized)
+
+    # In-place with overwritten input
+    arr_copy = arr.copy()
+    scipy_fft_call(arr_copy, arr_copy, direction=direction, axes=axes,
+                   workers=workers, normalise_idft=True, overwrite_x=True)
+    assert all_almost_equal(arr_copy, expected)
+
+
+def test_scipy_fft_call_halfcomplex(axes):
+    """Check real-to-halfcomplex transforms and their inverse."""
+    shape = (4, 3, 6)
+    arr = np.random.rand(*shape)
+    np_axes = _np_axes(axes, arr.ndim)
+    expected = np.fft.rfftn(arr, axes=np_axes)
+
+    out = np.empty(expected.shape, dtype=complex)
+    scipy_fft_call(arr, out, halfcomplex=True, axes=axes)
+    assert all_almost_equal(out, expected)
+
+    back = np.empty_like(arr)
+    scipy_fft_call(out, back, direction='backward', halfcomplex=True,
+                   axes=axes, normalise_idft=True)
+    assert all_almost_equal(back, arr)
+
+    # Real input in full complex transforms is cast
+    out = np.empty(shape, dtype=complex)
+    scipy_fft_call(arr, out, axes=axes)
+    assert all_almost_equal(out, np.fft.fftn(arr, axes=np_axes))
+
+
+def test_scipy_fft_call_bad_input():
+    """Check errors for invalid arguments."""
+    arr = np.zeros((4, 4), dtype=complex)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, arr.copy(), halfcomplex=True)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, np.zeros((4, 3), dtype=complex),
+                       direction='backward', halfcomplex=True)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, arr.copy(), direction='sideways')
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
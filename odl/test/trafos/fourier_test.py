@@ -29,6 +29,9 @@ from odl.util.testutils import simple_fixture
 impl = simple_fixture(
     'impl',
     [pytest.param('numpy'),
+     pytest.param('scipy', marks=pytest.mark.skipif(
+         not odl.trafos.SCIPY_FFT_AVAILABLE,
+         reason='scipy.fft not available')),
      pytest.param('pyfftw', marks=skip_if_no_pyfftw)]
 )
 exponent = simple_fixture('exponent', [2.0, 1.0, float('inf'), 1.5])
@@ -492,6 +495,25 @@ def test_fourier_trafo_call(impl, odl_floating_dtype):
     assert np.allclose(ift(ft(one)), one)
 
 
+def test_fourier_trafo_batch_call(sign):
+    """Check batched evaluation against evaluation in a loop."""
+    space = odl.uniform_discr([0, 0], [1, 2], (4, 6))
+    cspace = space.complex_space
+
+    ops = [DiscreteFourierTransform(space, sign=sign),
+           FourierTransform(cspace, sign=sign, shift=False),
+           FourierTransform(cspace, sign=sign, axes=1)]
+    if sign == '-':
+        ops += [DiscreteFourierTransform(space, halfcomplex=True),
+                FourierTransform(space, halfcomplex=True)]
+    ops += [op.inverse for op in ops]
+
+    for op in ops:
+        xs = np.stack([noise_element(op.domain) for _ in range(3)])
+        expected = [op(x) for x in xs]
+        assert all_almost_equal(op.batch_call(xs), expected)
+
+
 def test_fourier_trafo_charfun_1d():
     # Characteristic function of [0, 1], its Fourier transform is
     # given by exp(-1j * y / 2) * sinc(y/2)
@@ -633,6 +655,15 @@ def test_fourier_trafo_inverse(impl, sign):
             assert all_almost_equal(ft.inverse(ft(char_rect)), discr_rect)
             assert all_almost_equal(ft.adjoint(ft(char_rect)), discr_rect)
 
+            if halfcomplex:
+                continue  # shift is required in half-complex transforms
+
+            # Without shift, the C2R inverse has a complex intermediate
+            # result also for a subset of the axes
+            ft = FourierTransform(discr, sign=sign, impl=impl, axes=axes,
+                                  halfcomplex=halfcomplex, shift=False)
+            assert all_almost_equal(ft.inverse(ft(char_rect)), discr_rect)
+
 
 def test_fourier_trafo_hat_1d():
     # Hat function as used in linear interpolation. It is not so
@@ -0,0 +1,178 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the buffer pool of temporaries."""
+
+from __future__ import division
+
+import threading
+
+import numpy as np
+import pytest
+
+import odl
+from odl.util.buffer_pool import (
+    BufferPool, acquire_element, active_buffer_pool, release_element)
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
+
+solver = simple_fixture(
+    'solver',
+    ['pdhg', 'douglas_rachford_pd', 'forward_backward_pd', 'admm_linearized',
+     'conjugate_gradient_normal'])
+
+
+def test_buffer_pool_acquire_release():
+    """Check reuse of released elements and statistics."""
+    space = odl.uniform_discr(0, 1, 10)
+    pspace = odl.ProductSpace(space, 2)
+    pool = BufferPool()
+
+    x = pool.acquire(space)
+    assert x in space
+    y = pool.acquire(pspace)
+    assert y in pspace
+    assert pool.stats['misses'] == 2
+    assert pool.stats['current_bytes'] == 3 * 80
+
+    pool.release(x)
+    pool.release(y)
+    assert pool.stats['free_bytes'] == 3 * 80
+    assert pool.acquire(space) is x
+    assert pool.acquire(pspace) is y
+    assert pool.stats['hits'] == 2
+    assert pool.stats['free_bytes'] == 0
+
+    # Equal spaces share their buffers
+    pool.release(x)
+    assert pool.acquire(odl.uniform_discr(0, 1, 10)) is x
+
+    pool.release(x)
+    with pool.borrow(space) as tmp:
+        assert tmp is x
+    assert pool.stats['free_bytes'] == 80
+    assert pool.stats['peak_bytes'] == 3 * 80
+
+    pool.clear()
+    assert pool.stats['free_bytes'] == 0
+    assert pool.stats['current_bytes'] == 2 * 80
+    pool.reset_stats()
+    assert pool.stats['hits'] == pool.stats['misses'] == 0
+    assert pool.stats['peak_bytes'] == 2 * 80
+
+
+def test_buffer_pool_max_bytes():
+    """Check that released elements beyond the limit are dropped."""
+    space = odl.rn(10)
+    pool = BufferPool(max_bytes=100)
+    x = pool.acquire(space)
+    y = pool.acquire(space)
+    pool.release(x)
+    pool.release(y)
+    assert pool.stats['free_bytes'] == 80
+    assert pool.stats['current_bytes'] == 80
+
+    with pytest.raises(ValueError):
+        BufferPool(max_bytes=-1)
+
+
+def test_buffer_pool_active():
+    """Check activation of pools in ``with`` blocks and threads."""
+    space = odl.rn(3)
+    assert active_buffer_pool() is None
+
+    # Without pool, temporaries are plain new elements
+    x = acquire_element(space)
+    assert x in space
+    release_element(x)
+
+    pool1 = BufferPool()
+    pool2 = BufferPool()
+    with pool1:
+        assert active_buffer_pool() is pool1
+        with pool2:
+            assert active_buffer_pool() is pool2
+            release_element(acquire_element(space))
+        assert active_buffer_pool() is pool1
+
+        # Other threads have their own active pools
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(active_buffer_pool()))
+        thread.start()
+        thread.join()
+        assert result == [None]
+
+    assert active_buffer_pool() is None
+    assert pool1.stats['misses'] == 0
+    assert pool2.stats['misses'] == 1
+
+
+def test_acquired_element_set_zero():
+    """Check that ``set_zero`` does not depend on arbitrary contents."""
+    rn = odl.rn(3)
+    spaces = [rn, odl.uniform_discr(0, 1, 3), rn ** 2,
+              odl.ProductSpace(rn, odl.rn(2))]
+    for space in spaces:
+        x = acquire_element(space)
+        x.assign(space.one())
+        x *= np.nan
+        x.set_zero()
+        assert x == space.zero()
+        release_element(x)
+
+
+def test_buffer_pool_solvers(solver):
+    """Check steady-state reuse and unchanged results in solvers."""
+    space = odl.uniform_discr([0, 0], [1, 1], (8, 8))
+    grad = odl.Gradient(space)
+    data = noise_element(space)
+    l2 = odl.solvers.L2NormSquared(space).translated(data)
+    l1 = odl.solvers.L1Norm(grad.range)
+    ident = odl.IdentityOperator(space)
+
+    def run(x):
+        if solver == 'pdhg':
+            op = odl.BroadcastOperator(ident, grad)
+            g = odl.solvers.SeparableSum(l2, 0.1 * l1)
+            odl.solvers.pdhg(x, odl.solvers.ZeroFunctional(space), g, op,
+                             niter=3, tau=0.1, sigma=0.1)
+        elif solver == 'douglas_rachford_pd':
+            odl.solvers.douglas_rachford_pd(
+                x, l2, [0.1 * l1], [grad], niter=3, tau=0.5, sigma=[0.1])
+        elif solver == 'forward_backward_pd':
+            odl.solvers.forward_backward_pd(
+                x, odl.solvers.ZeroFunctional(space), [0.1 * l1], [grad],
+                h=l2, niter=3, tau=0.1, sigma=[0.1])
+        elif solver == 'admm_linearized':
+            odl.solvers.admm_linearized(
+                x, l2, 0.1 * l1, grad, tau=0.1, sigma=1.0, niter=3)
+        elif solver == 'conjugate_gradient_normal':
+            odl.solvers.conjugate_gradient_normal(
+                ident + 0.1 * grad.adjoint * grad, x, data, niter=3)
+
+    x_ref = space.zero()
+    run(x_ref)
+
+    pool = BufferPool()
+    with pool:
+        x = space.zero()
+        run(x)
+        misses = pool.stats['misses']
+        peak_bytes = pool.stats['peak_bytes']
+        assert misses > 0
+        x.set_zero()
+        run(x)
+
+    assert all_almost_equal(x, x_ref)
+    assert pool.stats['misses'] == misses
+    assert pool.stats['peak_bytes'] == peak_bytes
+    assert pool.stats['hits'] > 0
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -0,0 +1,58 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the evaluation of blocks in threads."""
+
+from __future__ import division
+
+import threading
+
+import pytest
+
+import odl
+from odl.util.buffer_pool import BufferPool, active_buffer_pool
+from odl.util.parallel import parallel_map
+
+
+def test_parallel_map_order():
+    """Check result order, nesting and exceptions."""
+    result = parallel_map(lambda i: i * 2, range(10), num_threads=4)
+    assert result == [i * 2 for i in range(10)]
+    assert parallel_map(lambda i: i, [], num_threads=4) == []
+
+    # Nested calls run serially in the worker
+    def nested(i):
+        return (threading.current_thread().name,
+                parallel_map(lambda j: threading.current_thread().name,
+                             range(3), num_threads=4))
+
+    for name, inner_names in parallel_map(nested, range(4), num_threads=2):
+        assert inner_names == [name] * 3
+
+    def fail(i):
+        if i == 3:
+            raise ZeroDivisionError
+        return i
+
+    with pytest.raises(ZeroDivisionError):
+        parallel_map(fail, range(5), num_threads=2)
+
+
+def test_parallel_map_buffer_pool():
+    """Check that workers use the active buffer pool of the caller."""
+    pool = BufferPool()
+    with pool:
+        pools = parallel_map(lambda i: active_buffer_pool(), range(4),
+                             num_threads=2)
+    assert pools == [pool] * 4
+    assert parallel_map(lambda i: active_buffer_pool(), range(4),
+                        num_threads=2) == [None] * 4
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -8,14 +8,39 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import print_function, division, absolute_import
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
 import numpy as np
 
-from odl.discr import ResizingOperator
-from odl.trafos import FourierTransform, PYFFTW_AVAILABLE
+from odl.discr import DiscretizedSpace
+from odl.operator import Operator
+from odl.space.weighting import ConstWeighting
+from odl.tomo.operators.ray_trafo import RayTransform
+from odl.trafos.backends import SCIPY_FFT_AVAILABLE
+from odl.util import indent, is_real_dtype, real_dtype, signature_string
+from odl.util.buffer_pool import acquire_element, release_element
+
+__all__ = ('fbp_op', 'fbp_filter_op', 'FBPFilterOperator', 'FBPOperator',
+           'tam_danielson_window', 'parker_weighting')
+
 
+# Maximum number of cached filter kernels
+FBP_FILTER_CACHE_SIZE = 16
 
-__all__ = ('fbp_op', 'fbp_filter_op', 'tam_danielson_window',
-           'parker_weighting')
+# Approximate number of entries of a padded sinogram slab for the default
+# slab size
+FBP_SLAB_SIZE = 2 ** 22
+
+_FBP_FILTER_CACHE = OrderedDict()
+_FBP_FILTER_CACHE_LOCK = threading.Lock()
+
+# Ray transform back-ends whose back-projection only depends on the
+# weighting constant of the projection space, not on the full angle range.
+# For those, the back-projection can be split into angle slabs.
+_SLAB_RAY_TRAFO_IMPLS = ('astra_cpu', 'astra_cuda', 'numpy', 'numpy_matrix')
 
 
 def _axis_in_detector(geometry):
@@ -101,6 +126,151 @@ def _fbp_filter(norm_freq, filter_type, frequency_scaling):
     return filt
 
 
+def _fbp_filter_axes(ray_trafo):
+    """Return the axes and directions in which the FBP filter acts.
+
+    Returns
+    -------
+    axes : tuple of int
+        Axes of ``ray_trafo.range`` along which the filter is applied.
+    directions : `numpy.ndarray`
+        Components of the filter direction along ``axes``.
+    """
+    if ray_trafo.domain.ndim == 2:
+        return (1,), np.array([1.0])
+    elif ray_trafo.domain.ndim == 3:
+        # Filter in the rotation direction, only in the axes that are
+        # actually used
+        rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
+        used_axes = (rot_dir != 0)
+        axes = tuple(i + 1 for i in range(2) if used_axes[i])
+        return axes, rot_dir[used_axes]
+    else:
+        raise NotImplementedError('FBP only implemented in 2d and 3d')
+
+
+def _fbp_padded_len(n):
+    """Return the zero-padded FFT length for ``n`` detector pixels.
+
+    Circular convolution with at least ``2 * n - 1`` points is free of
+    wrap-around. The length is chosen even, such that the DFT frequencies
+    contain the zero and the Nyquist frequency, and fast for the FFT.
+    """
+    if not SCIPY_FFT_AVAILABLE:
+        return 2 * n
+
+    # Lazy import to improve `import odl` time
+    import scipy.fft
+    padded_len = scipy.fft.next_fast_len(2 * n - 1, real=True)
+    while padded_len % 2 == 1:
+        padded_len = scipy.fft.next_fast_len(padded_len + 1, real=True)
+    return padded_len
+
+
+def _fbp_filter_kernel(shape, cell_sides, directions, filter_type,
+                       frequency_scaling, halfcomplex):
+    """Return the frequency response of an FBP filter, cached.
+
+    The response is the filter multiplied with the maximum frequency
+    magnitude, sampled on the DFT frequencies of an array with ``shape``.
+    The frequency magnitude is ``|sum(directions[i] * xi[i])|``, where
+    ``xi[i]`` are the frequencies along axis ``i``.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        (Padded) size of the filtered axes.
+    cell_sides : sequence of float
+        Cell sizes of the filtered axes.
+    directions : sequence of float
+        Components of the filter direction.
+    filter_type, frequency_scaling :
+        See `_fbp_filter`.
+    halfcomplex : bool
+        If ``True``, only use the nonnegative frequencies in the last axis,
+        as in the real-to-complex FFT.
+
+    Returns
+    -------
+    kernel : `numpy.ndarray`
+        Read-only array of filter values. Its shape is ``shape``, or
+        ``shape[-1] // 2 + 1`` in the last axis if ``halfcomplex=True``.
+    """
+    key = (tuple(int(n) for n in shape),
+           tuple(float(s) for s in cell_sides),
+           tuple(float(c) for c in directions),
+           filter_type, float(frequency_scaling), bool(halfcomplex))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable callable `filter_type`, don't cache
+        key = None
+
+    if key is not None:
+        with _FBP_FILTER_CACHE_LOCK:
+            kernel = _FBP_FILTER_CACHE.get(key)
+            if kernel is not None:
+                _FBP_FILTER_CACHE.move_to_end(key)
+                return kernel
+
+    ndim = len(shape)
+    abs_freq = 0
+    for i, (n, cell_side, c) in enumerate(zip(shape, cell_sides,
+                                              directions)):
+        if halfcomplex and i == ndim - 1:
+            freq = np.fft.rfftfreq(n, cell_side)
+        else:
+            freq = np.fft.fftfreq(n, cell_side)
+        bcast_shape = [1] * ndim
+        bcast_shape[i] = freq.size
+        abs_freq = abs_freq + (2 * np.pi * c) * freq.reshape(bcast_shape)
+
+    abs_freq = np.abs(abs_freq)
+    max_freq = np.max(abs_freq)
+    kernel = _fbp_filter(abs_freq / max_freq, filter_type, frequency_scaling)
+    kernel *= max_freq
+    kernel.setflags(write=False)
+
+    if key is not None:
+        with _FBP_FILTER_CACHE_LOCK:
+            _FBP_FILTER_CACHE[key] = kernel
+            while len(_FBP_FILTER_CACHE) > FBP_FILTER_CACHE_SIZE:
+                _FBP_FILTER_CACHE.popitem(last=False)
+
+    return kernel
+
+
+def _fbp_fft(arr, axes, halfcomplex):
+    """Return the forward DFT of ``arr`` along ``axes``."""
+    if SCIPY_FFT_AVAILABLE:
+        # Lazy import to improve `import odl` time
+        import scipy.fft
+        fft = scipy.fft.rfftn if halfcomplex else scipy.fft.fftn
+        return fft(arr, axes=axes, workers=_fbp_fft_workers(arr))
+    else:
+        fft = np.fft.rfftn if halfcomplex else np.fft.fftn
+        return fft(arr, axes=axes)
+
+
+def _fbp_ifft(arr, shape, axes, halfcomplex):
+    """Return the inverse DFT of ``arr``, destroying ``arr``."""
+    if SCIPY_FFT_AVAILABLE:
+        # Lazy import to improve `import odl` time
+        import scipy.fft
+        ifft = scipy.fft.irfftn if halfcomplex else scipy.fft.ifftn
+        return ifft(arr, s=shape, axes=axes, workers=_fbp_fft_workers(arr),
+                    overwrite_x=True)
+    else:
+        ifft = np.fft.irfftn if halfcomplex else np.fft.ifftn
+        return ifft(arr, s=shape, axes=axes)
+
+
+def _fbp_fft_workers(arr):
+    """Return the number of FFT threads for ``arr``."""
+    # Trade-off wrt threading overhead, as in `pyfftw_call`
+    return 1 if arr.size <= 4096 else -1
+
+
 def tam_danielson_window(ray_trafo, smoothing_width=0.05, n_pi=1):
     """Create Tam-Danielson window from a `RayTransform`.
 
@@ -310,8 +480,352 @@ def parker_weighting(ray_trafo, q=0.25):
         np.broadcast_to(S_sum * scale, ray_trafo.range.shape))
 
 
+class FBPFilterOperator(Operator):
+
+    """Filtering step of the filtered back-projection.
+
+    The filter is a convolution along the detector, implemented by a
+    multiplication with the frequency response of the filter after an FFT.
+    The frequency response is computed once per detector shape, filter type,
+    frequency scaling and padding, and cached for all operators.
+
+    The sinogram is processed in slabs of `slab_size` angles, and only one
+    slab is zero padded at a time. The padded buffer is reused in
+    subsequent calls.
+
+    See Also
+    --------
+    fbp_filter_op : Create an instance of this operator.
+    FBPOperator : Filtered back-projection using this filter.
+    """
+
+    def __init__(self, ray_trafo, padding=True, filter_type='Ram-Lak',
+                 frequency_scaling=1.0, slab_size=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ray_trafo : `RayTransform`
+            The ray transform whose data should be filtered.
+        padding : bool, optional
+            If the data should be zero padded along the detector.
+        filter_type : optional
+            Type of the filter, see `fbp_filter_op`.
+        frequency_scaling : float, optional
+            Relative cutoff frequency for the filter.
+        slab_size : positive int, optional
+            Number of angles that are filtered at once.
+            Default: about `FBP_SLAB_SIZE` entries per padded slab.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        >>> geometry = odl.tomo.parallel_beam_geometry(space, num_angles=20)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geometry, impl='numpy')
+        >>> filter_op = odl.tomo.FBPFilterOperator(ray_trafo, slab_size=8)
+        >>> filter_op.slabs
+        [(0, 8), (8, 16), (16, 20)]
+        """
+        space = ray_trafo.range
+        super(FBPFilterOperator, self).__init__(
+            domain=space, range=space, linear=True)
+
+        self.__ray_trafo = ray_trafo
+        self.__padding = bool(padding)
+        self.__filter_type = filter_type
+        self.__frequency_scaling = float(frequency_scaling)
+
+        axes, directions = _fbp_filter_axes(ray_trafo)
+        self.__axes = axes
+        self.__halfcomplex = is_real_dtype(space.dtype)
+
+        padded_shape = list(space.shape)
+        if self.padding:
+            for i in axes:
+                padded_shape[i] = _fbp_padded_len(space.shape[i])
+        self.__padded_shape = tuple(padded_shape)
+
+        if slab_size is None:
+            slab_size = FBP_SLAB_SIZE // int(np.prod(padded_shape[1:]))
+            slab_size = max(slab_size, 1)
+        else:
+            slab_size = int(slab_size)
+            if slab_size < 1:
+                raise ValueError('`slab_size` must be positive, got {}'
+                                 ''.format(slab_size))
+        self.__slab_size = min(slab_size, space.shape[0])
+
+        kernel = _fbp_filter_kernel(
+            [padded_shape[i] for i in axes], space.cell_sides[list(axes)],
+            directions, filter_type, frequency_scaling, self.__halfcomplex)
+
+        # Scaling of the filter
+        geometry = ray_trafo.geometry
+        alen = geometry.motion_params.length
+        scale = 1 / (2 * alen)
+        if ray_trafo.domain.ndim == 3 and hasattr(geometry, 'src_radius'):
+            # Add scaling for cone-beam case
+            scale *= (geometry.src_radius
+                      / (geometry.src_radius + geometry.det_radius))
+
+            if geometry.pitch != 0:
+                # In helical geometry the whole volume is not in each
+                # projection and we need to use another weighting.
+                # Ideally each point in the volume effects only
+                # the projections in a half rotation, so we assume that that
+                # is the case.
+                scale *= alen / np.pi
+
+        if not space.is_weighted:
+            # Compensate for potentially unweighted range of the ray transform
+            scale *= space.cell_volume
+
+        if not ray_trafo.domain.is_weighted:
+            # Compensate for potentially unweighted domain of the ray
+            # transform
+            scale /= ray_trafo.domain.cell_volume
+
+        bcast_shape = [1] * space.ndim
+        for i, n in zip(axes, kernel.shape):
+            bcast_shape[i] = n
+        self.__kernel = (kernel * scale).astype(
+            real_dtype(space.dtype)).reshape(bcast_shape)
+
+        self.__buffer = None
+        self.__buffer_lock = threading.Lock()
+
+    @property
+    def ray_trafo(self):
+        """Ray transform whose data is filtered."""
+        return self.__ray_trafo
+
+    @property
+    def padding(self):
+        """``True`` if the data is zero padded along the detector."""
+        return self.__padding
+
+    @property
+    def filter_type(self):
+        """Type of the filter."""
+        return self.__filter_type
+
+    @property
+    def frequency_scaling(self):
+        """Relative cutoff frequency of the filter."""
+        return self.__frequency_scaling
+
+    @property
+    def slab_size(self):
+        """Number of angles that are filtered at once."""
+        return self.__slab_size
+
+    @property
+    def slabs(self):
+        """List of ``(start, stop)`` angle index ranges of the slabs."""
+        num_angles = self.domain.shape[0]
+        return [(start, min(start + self.slab_size, num_angles))
+                for start in range(0, num_angles, self.slab_size)]
+
+    @property
+    def kernel(self):
+        """Scaled frequency response of the filter.
+
+        The array can be broadcast against the DFT of a padded slab.
+        """
+        return self.__kernel
+
+    @contextmanager
+    def _padded_buffer(self):
+        """Context manager yielding the zero padded slab buffer."""
+        shape = (self.slab_size,) + self.__padded_shape[1:]
+        if not self.__buffer_lock.acquire(False):
+            # Buffer in use in another thread
+            yield np.zeros(shape, dtype=self.domain.dtype)
+            return
+
+        try:
+            if self.__buffer is None:
+                self.__buffer = np.zeros(shape, dtype=self.domain.dtype)
+            yield self.__buffer
+        finally:
+            self.__buffer_lock.release()
+
+    def _filter_slab(self, x_arr, out_arr):
+        """Filter the slab ``x_arr`` and write the result to ``out_arr``."""
+        fft_shape = [self.__padded_shape[i] for i in self.__axes]
+        interior = ((slice(None),) +
+                    tuple(slice(0, n) for n in self.domain.shape[1:]))
+        if self.padding:
+            with self._padded_buffer() as buf:
+                # Only the interior is ever written, the rest stays zero
+                buf = buf[:len(x_arr)]
+                buf[interior] = x_arr
+                x_hat = _fbp_fft(buf, self.__axes, self.__halfcomplex)
+        else:
+            x_hat = _fbp_fft(x_arr, self.__axes, self.__halfcomplex)
+
+        x_hat *= self.kernel
+        result = _fbp_ifft(x_hat, fft_shape, self.__axes, self.__halfcomplex)
+        out_arr[:] = result[interior]
+
+    def _call(self, x, out):
+        """Filter ``x`` slab by slab and write the result to ``out``."""
+        x_arr = x.asarray()
+        out_arr = out.asarray()
+        for start, stop in self.slabs:
+            self._filter_slab(x_arr[start:stop], out_arr[start:stop])
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, which is the operator itself.
+
+        The filter is a real and even function of the frequency, hence
+        the convolution is self-adjoint.
+        """
+        return self
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.ray_trafo]
+        optargs = [('padding', self.padding, True),
+                   ('filter_type', self.filter_type, 'Ram-Lak'),
+                   ('frequency_scaling', self.frequency_scaling, 1.0)]
+        inner_str = signature_string(posargs, optargs, sep=',\n')
+        return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
+
+
+class FBPOperator(Operator):
+
+    """Filtered back-projection operator.
+
+    The sinogram is filtered with an `FBPFilterOperator` and back-projected
+    in slabs of angles. For ray transform back-ends that support it,
+    each filtered slab is back-projected with a ray transform restricted
+    to the angles of the slab, hence the peak memory is about two volumes
+    plus one padded slab instead of two full sinograms.
+
+    See Also
+    --------
+    fbp_op : Create an instance of this operator.
+    """
+
+    def __init__(self, ray_trafo, padding=True, filter_type='Ram-Lak',
+                 frequency_scaling=1.0, slab_size=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ray_trafo : `RayTransform`
+            The ray transform whose approximate inverse should be computed.
+        padding, filter_type, frequency_scaling, slab_size : optional
+            Parameters of the `FBPFilterOperator`.
+        """
+        super(FBPOperator, self).__init__(
+            domain=ray_trafo.range, range=ray_trafo.domain, linear=True)
+        self.__ray_trafo = ray_trafo
+        self.__filter_op = FBPFilterOperator(
+            ray_trafo, padding, filter_type, frequency_scaling, slab_size)
+        self.__slab_ray_trafos = None
+
+    @property
+    def ray_trafo(self):
+        """Ray transform whose approximate inverse is computed."""
+        return self.__ray_trafo
+
+    @property
+    def filter_op(self):
+        """Filtering step of this operator."""
+        return self.__filter_op
+
+    @property
+    def slab_ray_trafos(self):
+        """Ray transforms restricted to the angle slabs, or ``None``.
+
+        This is ``None`` if there is only one slab, or if the back-projection
+        of ``ray_trafo`` cannot be split into slabs.
+        """
+        if self.__slab_ray_trafos is None:
+            self.__slab_ray_trafos = _slab_ray_trafos(
+                self.ray_trafo, self.filter_op.slabs)
+        return self.__slab_ray_trafos or None
+
+    def _call(self, x, out):
+        """Filter and back-project ``x`` slab by slab."""
+        ray_trafos = self.slab_ray_trafos
+        if ray_trafos is None:
+            filtered = acquire_element(self.domain)
+            self.filter_op(x, out=filtered)
+            self.ray_trafo.adjoint(filtered, out=out)
+            release_element(filtered)
+            return
+
+        x_arr = x.asarray()
+        slab_shape = (self.filter_op.slab_size,) + self.domain.shape[1:]
+        slab_arr = np.empty(slab_shape, dtype=self.domain.dtype)
+        tmp = None
+        for (start, stop), slab_ray_trafo in zip(self.filter_op.slabs,
+                                                 ray_trafos):
+            filtered = slab_arr[:stop - start]
+            self.filter_op._filter_slab(x_arr[start:stop], filtered)
+            filtered = slab_ray_trafo.range.element(filtered)
+            if tmp is None:
+                slab_ray_trafo.adjoint(filtered, out=out)
+                tmp = acquire_element(self.range)
+            else:
+                slab_ray_trafo.adjoint(filtered, out=tmp)
+                out += tmp
+        release_element(tmp)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator."""
+        return self.filter_op.adjoint * self.ray_trafo
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        filter_op = self.filter_op
+        posargs = [self.ray_trafo]
+        optargs = [('padding', filter_op.padding, True),
+                   ('filter_type', filter_op.filter_type, 'Ram-Lak'),
+                   ('frequency_scaling', filter_op.frequency_scaling, 1.0)]
+        inner_str = signature_string(posargs, optargs, sep=',\n')
+        return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
+
+
+def _slab_ray_trafos(ray_trafo, slabs):
+    """Return ray transforms for angle slabs, or an empty list.
+
+    The slab ray transforms share the weighting of ``ray_trafo.range``,
+    such that the sum of their back-projections is the back-projection of
+    ``ray_trafo``. An empty list is returned if that cannot be ensured.
+    """
+    proj_space = ray_trafo.range
+    if (len(slabs) == 1 or
+            ray_trafo.impl not in _SLAB_RAY_TRAFO_IMPLS or
+            not isinstance(proj_space.weighting, ConstWeighting)):
+        return []
+
+    try:
+        geometries = [ray_trafo.geometry[start:stop]
+                      for start, stop in slabs]
+    except (TypeError, NotImplementedError):
+        # Geometry cannot be sliced
+        return []
+
+    ray_trafos = []
+    for geometry in geometries:
+        tspace = proj_space.tspace_type(
+            geometry.partition.shape, weighting=proj_space.weighting.const,
+            dtype=proj_space.dtype)
+        slab_space = DiscretizedSpace(geometry.partition, tspace)
+        ray_trafos.append(
+            RayTransform(ray_trafo.domain, geometry, impl=ray_trafo.impl,
+                         proj_space=slab_space))
+    return ray_trafos
+
+
 def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
-                  frequency_scaling=1.0):
+                  frequency_scaling=1.0, slab_size=None):
     """Create a filter operator for FBP from a `RayTransform`.
 
     Parameters
@@ -353,129 +867,26 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
         The normalized frequencies are rescaled so that they fit into the range
         [0, frequency_scaling]. Any frequency above ``frequency_scaling`` is
         set to zero.
+    slab_size : positive int, optional
+        Number of angles that are filtered at once. Only one slab is
+        zero padded at a time, hence smaller slabs need less memory.
+        Default: about `FBP_SLAB_SIZE` entries per padded slab.
 
     Returns
     -------
-    filter_op : `Operator`
+    filter_op : `FBPFilterOperator`
         Filtering operator for FBP based on ``ray_trafo``.
 
     See Also
     --------
     tam_danielson_window : Windowing for helical data
     """
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
-    alen = ray_trafo.geometry.motion_params.length
-
-    if ray_trafo.domain.ndim == 2:
-        # Define ramp filter
-        def fourier_filter(x):
-            abs_freq = np.abs(x[1])
-            norm_freq = abs_freq / np.max(abs_freq)
-            filt = _fbp_filter(norm_freq, filter_type, frequency_scaling)
-            scaling = 1 / (2 * alen)
-            return filt * np.max(abs_freq) * scaling
-
-        # Define (padded) fourier transform
-        if padding:
-            # Define padding operator
-            ran_shp = (ray_trafo.range.shape[0],
-                       ray_trafo.range.shape[1] * 2 - 1)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
-
-            fourier = FourierTransform(resizing.range, axes=1, impl=impl)
-            fourier = fourier * resizing
-        else:
-            fourier = FourierTransform(ray_trafo.range, axes=1, impl=impl)
-
-    elif ray_trafo.domain.ndim == 3:
-        # Find the direction that the filter should be taken in
-        rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
-
-        # Find what axes should be used in the fourier transform
-        used_axes = (rot_dir != 0)
-        if used_axes[0] and not used_axes[1]:
-            axes = [1]
-        elif not used_axes[0] and used_axes[1]:
-            axes = [2]
-        else:
-            axes = [1, 2]
-
-        # Add scaling for cone-beam case
-        if hasattr(ray_trafo.geometry, 'src_radius'):
-            scale = (ray_trafo.geometry.src_radius
-                     / (ray_trafo.geometry.src_radius
-                        + ray_trafo.geometry.det_radius))
-
-            if ray_trafo.geometry.pitch != 0:
-                # In helical geometry the whole volume is not in each
-                # projection and we need to use another weighting.
-                # Ideally each point in the volume effects only
-                # the projections in a half rotation, so we assume that that
-                # is the case.
-                scale *= alen / (np.pi)
-        else:
-            scale = 1.0
-
-        # Define ramp filter
-        def fourier_filter(x):
-            # If axis is aligned to a coordinate axis, save some memory and
-            # time by using broadcasting
-            if not used_axes[0]:
-                abs_freq = np.abs(rot_dir[1] * x[2])
-            elif not used_axes[1]:
-                abs_freq = np.abs(rot_dir[0] * x[1])
-            else:
-                abs_freq = np.abs(rot_dir[0] * x[1] + rot_dir[1] * x[2])
-            norm_freq = abs_freq / np.max(abs_freq)
-            filt = _fbp_filter(norm_freq, filter_type, frequency_scaling)
-            scaling = scale * np.max(abs_freq) / (2 * alen)
-            return filt * scaling
-
-        # Define (padded) fourier transform
-        if padding:
-            # Define padding operator
-            if used_axes[0]:
-                padded_shape_u = ray_trafo.range.shape[1] * 2 - 1
-            else:
-                padded_shape_u = ray_trafo.range.shape[1]
-
-            if used_axes[1]:
-                padded_shape_v = ray_trafo.range.shape[2] * 2 - 1
-            else:
-                padded_shape_v = ray_trafo.range.shape[2]
-
-            ran_shp = (ray_trafo.range.shape[0],
-                       padded_shape_u,
-                       padded_shape_v)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
-
-            fourier = FourierTransform(resizing.range, axes=axes, impl=impl)
-            fourier = fourier * resizing
-        else:
-            fourier = FourierTransform(ray_trafo.range, axes=axes, impl=impl)
-    else:
-        raise NotImplementedError('FBP only implemented in 2d and 3d')
-
-    # Create ramp in the detector direction
-    ramp_function = fourier.range.element(fourier_filter)
-
-    weight = 1
-    if not ray_trafo.range.is_weighted:
-        # Compensate for potentially unweighted range of the ray transform
-        weight *= ray_trafo.range.cell_volume
-
-    if not ray_trafo.domain.is_weighted:
-        # Compensate for potentially unweighted domain of the ray transform
-        weight /= ray_trafo.domain.cell_volume
-
-    ramp_function *= weight
-
-    # Create ramp filter via the convolution formula with fourier transforms
-    return fourier.inverse * ramp_function * fourier
+    return FBPFilterOperator(ray_trafo, padding, filter_type,
+                             frequency_scaling, slab_size)
 
 
 def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
-           frequency_scaling=1.0):
+           frequency_scaling=1.0, slab_size=None):
     """Create filtered back-projection operator from a `RayTransform`.
 
     The filtered back-projection is an approximate inverse to the ray
@@ -520,10 +931,14 @@ def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
         The normalized frequencies are rescaled so that they fit into the range
         [0, frequency_scaling]. Any frequency above ``frequency_scaling`` is
         set to zero.
+    slab_size : positive int, optional
+        Number of angles that are filtered and back-projected at once.
+        Smaller slabs need less memory.
+        Default: about `FBP_SLAB_SIZE` entries per padded slab.
 
     Returns
     -------
-    fbp_op : `Operator`
+    fbp_op : `FBPOperator`
         Approximate inverse operator of ``ray_trafo``.
 
     See Also
@@ -531,8 +946,8 @@ def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
     tam_danielson_window : Windowing for helical data.
     parker_weighting : Windowing for overcomplete fan-beam data.
     """
-    return ray_trafo.adjoint * fbp_filter_op(ray_trafo, padding, filter_type,
-                                             frequency_scaling)
+    return FBPOperator(ray_trafo, padding, filter_type, frequency_scaling,
+                       slab_size)
 
 
 if __name__ == '__main__':
@@ -13,6 +13,7 @@ from __future__ import absolute_import
 from .astra_cpu import *
 from .astra_cuda import *
 from .astra_setup import *
+from .numpy_joseph import *
 from .skimage_radon import *
 from .util import *
 
@@ -20,5 +21,6 @@ __all__ = ()
 __all__ += astra_cpu.__all__
 __all__ += astra_cuda.__all__
 __all__ += astra_setup.__all__
+__all__ += numpy_joseph.__all__
 __all__ += util.__all__
 __all__ += skimage_radon.__all__
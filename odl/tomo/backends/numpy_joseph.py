@@ -0,0 +1,708 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Pure NumPy ray transform backend based on Joseph's method.
+
+Each ray is sampled once per voxel slice along its dominant axis, and the
+volume is linearly interpolated in the remaining axes. Since the ray sums
+are linear in the volume values, the back-projection scatters the same
+weights to the same voxels, resulting in an exactly matched adjoint.
+
+The computations are vectorized over rays and split into chunks of angles
+that are distributed across a pool of threads.
+
+Alternatively, the projector can be assembled once into a sparse system
+matrix, which is cached with the geometry and optionally on disk. Forward
+and back-projection then reduce to sparse matrix-vector products over
+blocks of rows.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import hashlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse
+
+from odl.discr import DiscretizedSpace, DiscretizedSpaceElement
+from odl.tomo.backends.util import _add_default_complex_impl
+from odl.tomo.geometry import Geometry
+
+__all__ = (
+    'joseph_forward_projector',
+    'joseph_back_projector',
+    'joseph_system_matrix',
+)
+
+
+# Maximum number of ray samples processed in one vectorized step
+MAX_CHUNK_SAMPLES = 2 ** 16
+
+
+def _check_vol_space(vol_space, geometry):
+    """Raise if ``vol_space`` cannot be handled by the Joseph projector."""
+    if not isinstance(vol_space, DiscretizedSpace):
+        raise TypeError(
+            '`vol_space` must be a `DiscretizedSpace` instance, got {!r}'
+            ''.format(vol_space)
+        )
+    if vol_space.impl != 'numpy':
+        raise TypeError(
+            "`vol_space.impl` must be 'numpy', got {!r}"
+            "".format(vol_space.impl)
+        )
+    if not vol_space.is_uniform:
+        raise ValueError('`vol_space` must be uniformly discretized')
+    if vol_space.ndim != geometry.ndim:
+        raise ValueError(
+            'dimensions {} of reconstruction space and {} of geometry '
+            'do not match'.format(vol_space.ndim, geometry.ndim)
+        )
+
+
+def _num_threads(num_threads):
+    """Return the number of threads to use, defaulting to all cores."""
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+    num_threads = int(num_threads)
+    if num_threads < 1:
+        raise ValueError(
+            '`num_threads` must be positive, got {}'.format(num_threads)
+        )
+    return num_threads
+
+
+def _ray_params(geometry, start, stop):
+    """Return detector points and directions for a range of angles.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry defining the rays.
+    start, stop : int
+        Range of (flat) indices into ``geometry.motion_grid``.
+
+    Returns
+    -------
+    points, dirs : `numpy.ndarray`
+        Arrays of shape ``(num_rays, ndim)`` containing the detector points
+        and the unit vectors pointing from the detector points to the
+        source. The rays are ordered as in the projection data.
+    """
+    mpts = geometry.motion_grid.points()[start:stop]
+    dpts = geometry.det_grid.points()
+    if geometry.motion_params.ndim == 1:
+        mparam = mpts[:, 0][:, None]
+    else:
+        mparam = tuple(mpts[:, i][:, None] for i in range(mpts.shape[1]))
+    if geometry.det_params.ndim == 1:
+        dparam = dpts[:, 0][None, :]
+    else:
+        dparam = tuple(dpts[:, i][None, :] for i in range(dpts.shape[1]))
+
+    points = geometry.det_point_position(mparam, dparam)
+    dirs = np.broadcast_to(geometry.det_to_src(mparam, dparam), points.shape)
+
+    points = points.reshape(-1, geometry.ndim)
+    dirs = dirs.reshape(-1, geometry.ndim)
+    dirs = dirs / np.linalg.norm(dirs, axis=1, keepdims=True)
+    return points, dirs
+
+
+def _joseph_chunks(geometry, vol_space, start, stop,
+                   max_samples=MAX_CHUNK_SAMPLES):
+    """Yield interpolation indices and weights for a range of angles.
+
+    The indices refer to the flattened volume padded with one zero on each
+    side along each axis, such that out-of-bounds interpolation nodes
+    do not require special treatment.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry defining the rays.
+    vol_space : `DiscretizedSpace`
+        Uniformly discretized reconstruction space.
+    start, stop : int
+        Range of (flat) indices into ``geometry.motion_grid``.
+    max_samples : positive int, optional
+        Maximum number of ray samples per chunk.
+
+    Yields
+    ------
+    rays : `numpy.ndarray`
+        Flat indices of the rays in the projection data, shape ``(R,)``.
+    idx : `numpy.ndarray`
+        Flat indices into the padded volume, shape ``(R, K, C)``, where
+        ``K`` is the number of samples per ray and ``C = 2 ** (ndim - 1)``
+        the number of interpolation nodes per sample.
+    weights : `numpy.ndarray`
+        Interpolation weights multiplied with the sample spacing, same
+        shape as ``idx``.
+    """
+    ndim = vol_space.ndim
+    shape = np.array(vol_space.shape)
+    padded_strides = np.append(1, np.cumprod(shape[:0:-1] + 2))[::-1]
+
+    points, dirs = _ray_params(geometry, start, stop)
+    num_det = geometry.det_grid.size
+
+    # Convert to index coordinates where voxel centers are at the integers
+    points = (points - vol_space.min_pt) / vol_space.cell_sides - 0.5
+    dirs = dirs / vol_space.cell_sides
+    main_axis = np.argmax(np.abs(dirs), axis=1)
+
+    for axis in range(ndim):
+        rays_axis = np.flatnonzero(main_axis == axis)
+        if rays_axis.size == 0:
+            continue
+
+        k = np.arange(shape[axis])
+        chunk_size = max(1, max_samples // k.size)
+        for i in range(0, rays_axis.size, chunk_size):
+            rays = rays_axis[i:i + chunk_size]
+            pt = points[rays]
+            dir = dirs[rays]
+
+            # Ray parameters at the voxel slices along the main axis,
+            # and the arc length of one step
+            t = (k[None, :] - pt[:, axis, None]) / dir[:, axis, None]
+            step = 1 / np.abs(dir[:, axis])
+
+            base = (k + 1) * padded_strides[axis]
+            offsets = [0]
+            weights = [np.broadcast_to(step[:, None], t.shape)]
+            for j in range(ndim):
+                if j == axis:
+                    continue
+
+                coord = pt[:, j, None] + t * dir[:, j, None]
+                ilow = np.floor(coord)
+                w_high = coord - ilow
+                valid = (ilow >= -1) & (ilow <= shape[j] - 1)
+                w_high = np.where(valid, w_high, 0)
+                w_low = np.where(valid, 1 - w_high, 0)
+                ilow = np.clip(ilow, -1, shape[j] - 1).astype(int) + 1
+
+                base = base + ilow * padded_strides[j]
+                offsets = (offsets
+                           + [off + padded_strides[j] for off in offsets])
+                weights = ([w * w_low for w in weights]
+                           + [w * w_high for w in weights])
+
+            idx = base[..., None] + np.array(offsets)
+            yield (start * num_det + rays,
+                   idx,
+                   np.stack(weights, axis=-1))
+
+
+def _partition_angles(geometry, num_threads):
+    """Return contiguous index ranges into the motion grid, one per thread."""
+    bounds = np.linspace(0, geometry.motion_grid.size, num_threads + 1)
+    bounds = np.round(bounds).astype(int)
+    return [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def _angle_blocks(geometry, start, stop):
+    """Split a range of angles into blocks of manageable size."""
+    block = max(1, MAX_CHUNK_SAMPLES // geometry.det_grid.size)
+    for lo in range(start, stop, block):
+        yield lo, min(lo + block, stop)
+
+
+def _run_threaded(func, tasks, num_threads):
+    """Run ``func`` on each task, using a pool if there are several tasks."""
+    if num_threads == 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [executor.submit(func, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def joseph_forward_projector(vol_data, geometry, proj_space, out=None,
+                             num_threads=None):
+    """Run a Joseph-type forward projection using NumPy.
+
+    Parameters
+    ----------
+    vol_data : `DiscretizedSpaceElement`
+        Volume data to which the forward projector is applied.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    proj_space : `DiscretizedSpace`
+        Space to which the calling operator maps.
+    out : ``proj_space`` element, optional
+        Element of the projection space to which the result is written. If
+        ``None``, an element in ``proj_space`` is created.
+    num_threads : positive int, optional
+        Number of threads among which the angles are distributed.
+        Default: number of CPU cores
+
+    Returns
+    -------
+    out : ``proj_space`` element
+        Projection data resulting from the application of the projector.
+        If ``out`` was provided, the returned object is a reference to it.
+    """
+    if not isinstance(vol_data, DiscretizedSpaceElement):
+        raise TypeError(
+            'volume data {!r} is not a `DiscretizedSpaceElement` instance'
+            ''.format(vol_data)
+        )
+    if not isinstance(geometry, Geometry):
+        raise TypeError(
+            'geometry {!r} is not a Geometry instance'.format(geometry)
+        )
+    _check_vol_space(vol_data.space, geometry)
+    if out is None:
+        out = proj_space.element()
+    elif out not in proj_space:
+        raise TypeError(
+            '`out` {} is neither None nor a `DiscretizedSpaceElement` '
+            'instance'.format(out)
+        )
+
+    padded = np.pad(vol_data.asarray(), 1, mode='constant').ravel()
+    result = np.empty(geometry.partition.size, dtype=proj_space.dtype)
+
+    def project(start, stop):
+        for lo, hi in _angle_blocks(geometry, start, stop):
+            for rays, idx, weights in _joseph_chunks(
+                    geometry, vol_data.space, lo, hi):
+                result[rays] = np.einsum('rkc,rkc->r', padded[idx], weights)
+
+    num_threads = _num_threads(num_threads)
+    _run_threaded(project, _partition_angles(geometry, num_threads),
+                  num_threads)
+
+    out[:] = result.reshape(proj_space.shape)
+    return out
+
+
+def joseph_back_projector(proj_data, geometry, vol_space, out=None,
+                          num_threads=None):
+    """Run a Joseph-type back-projection using NumPy.
+
+    The back-projection is the exact adjoint of
+    `joseph_forward_projector` with respect to the inner products of
+    the projection and reconstruction spaces.
+
+    Parameters
+    ----------
+    proj_data : `DiscretizedSpaceElement`
+        Projection data to which the back-projector is applied.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    vol_space : `DiscretizedSpace`
+        Space to which the calling operator maps.
+    out : ``vol_space`` element, optional
+        Element of the reconstruction space to which the result is written.
+        If ``None``, an element in ``vol_space`` is created.
+    num_threads : positive int, optional
+        Number of threads among which the angles are distributed. Each
+        thread accumulates into a private copy of the volume, and the
+        copies are summed in a fixed order.
+        Default: number of CPU cores
+
+    Returns
+    -------
+    out : ``vol_space`` element
+        Reconstruction data resulting from the application of the backward
+        projector. If ``out`` was provided, the returned object is a
+        reference to it.
+    """
+    if not isinstance(proj_data, DiscretizedSpaceElement):
+        raise TypeError(
+            'projection data {!r} is not a `DiscretizedSpaceElement` '
+            'instance'.format(proj_data)
+        )
+    if not isinstance(geometry, Geometry):
+        raise TypeError(
+            'geometry {!r} is not a Geometry instance'.format(geometry)
+        )
+    _check_vol_space(vol_space, geometry)
+    if out is None:
+        out = vol_space.element()
+    elif out not in vol_space:
+        raise TypeError(
+            '`out` {} is neither None nor a `DiscretizedSpaceElement` '
+            'instance'.format(out)
+        )
+
+    proj_arr = proj_data.asarray().ravel()
+    padded_shape = tuple(n + 2 for n in vol_space.shape)
+
+    def back_project(start, stop):
+        padded = np.zeros(int(np.prod(padded_shape)), dtype=vol_space.dtype)
+        for lo, hi in _angle_blocks(geometry, start, stop):
+            for rays, idx, weights in _joseph_chunks(
+                    geometry, vol_space, lo, hi):
+                weights *= proj_arr[rays][:, None, None]
+                # Scatter-add restricted to the range of touched indices,
+                # which is much faster than `np.add.at`
+                lo, hi = idx.min(), idx.max() + 1
+                padded[lo:hi] += np.bincount(
+                    (idx - lo).ravel(), weights.ravel(), minlength=hi - lo)
+        return padded
+
+    num_threads = _num_threads(num_threads)
+    parts = _run_threaded(back_project,
+                          _partition_angles(geometry, num_threads),
+                          num_threads)
+    padded = parts[0]
+    for part in parts[1:]:
+        padded += part
+
+    inner = (slice(1, -1),) * vol_space.ndim
+    out[:] = padded.reshape(padded_shape)[inner]
+
+    # Weight the adjoint by appropriate weights
+    scaling_factor = float(proj_data.space.weighting.const)
+    scaling_factor /= float(vol_space.weighting.const)
+    out *= scaling_factor
+
+    return out
+
+
+def _matrix_digest(geometry, vol_space):
+    """Return a hex digest identifying the system matrix of a setup.
+
+    The digest is computed from the actual ray parameters and the volume
+    discretization, hence it is stable across processes.
+    """
+    points, dirs = _ray_params(geometry, 0, geometry.motion_grid.size)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(b'joseph-v1')
+    hasher.update(np.ascontiguousarray(points, dtype=float).tobytes())
+    hasher.update(np.ascontiguousarray(dirs, dtype=float).tobytes())
+    hasher.update(np.asarray(geometry.partition.shape).tobytes())
+    hasher.update(np.asarray(vol_space.shape).tobytes())
+    hasher.update(np.asarray(vol_space.min_pt, dtype=float).tobytes())
+    hasher.update(np.asarray(vol_space.max_pt, dtype=float).tobytes())
+    hasher.update(str(vol_space.real_dtype).encode())
+    return hasher.hexdigest()
+
+
+def _assemble_matrix(geometry, vol_space):
+    """Assemble the Joseph projector as a CSR matrix."""
+    shape = np.array(vol_space.shape)
+    padded_shape = tuple(shape + 2)
+    rows, cols, vals = [], [], []
+    for rays, idx, weights in _joseph_chunks(
+            geometry, vol_space, 0, geometry.motion_grid.size):
+        ray_idx = np.broadcast_to(rays[:, None, None], idx.shape)
+        nonzero = weights != 0
+        ray_idx = ray_idx[nonzero]
+        idx = idx[nonzero]
+        weights = weights[nonzero]
+
+        # Drop nodes in the zero padding and map to unpadded indices
+        multi_idx = np.unravel_index(idx, padded_shape)
+        inside = np.all(
+            [(i >= 1) & (i <= n) for i, n in zip(multi_idx, shape)], axis=0)
+        rows.append(ray_idx[inside])
+        cols.append(np.ravel_multi_index(
+            tuple(i[inside] - 1 for i in multi_idx), tuple(shape)))
+        vals.append(weights[inside])
+
+    matrix = scipy.sparse.coo_matrix(
+        (np.concatenate(vals).astype(vol_space.real_dtype),
+         (np.concatenate(rows), np.concatenate(cols))),
+        shape=(geometry.partition.size, vol_space.size))
+    matrix = matrix.tocsr()
+    matrix.sum_duplicates()
+    return matrix
+
+
+def _load_matrix(path, shape):
+    """Load a cached CSR matrix, memory-mapping its arrays."""
+    arrays = [np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+              for name in ('data', 'indices', 'indptr')]
+    return scipy.sparse.csr_matrix(tuple(arrays), shape=shape, copy=False)
+
+
+def _save_matrix(matrix, path):
+    """Save a CSR matrix as raw arrays, atomically replacing ``path``."""
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(dir=parent, prefix='.tmp_')
+    try:
+        for name in ('data', 'indices', 'indptr'):
+            np.save(os.path.join(tmp_path, name + '.npy'),
+                    getattr(matrix, name))
+        os.rename(tmp_path, path)
+    except OSError:
+        # Another process may have stored the same matrix concurrently
+        if not os.path.isdir(path):
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def joseph_system_matrix(geometry, vol_space, cache_dir=None):
+    """Return the Joseph projector of a setup as a sparse matrix.
+
+    The matrix is stored in ``geometry.implementation_cache`` and reused
+    for subsequent calls with the same ``vol_space``. If ``cache_dir`` is
+    given, the matrix is additionally stored there as raw ``.npy`` files
+    and loaded with ``mmap_mode='r'``, such that several processes using
+    the same setup share one copy of the data via the page cache.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    vol_space : `DiscretizedSpace`
+        Uniformly discretized reconstruction space.
+    cache_dir : str, optional
+        Directory for the on-disk cache. Subdirectories are named by
+        a digest of the ray parameters and the volume discretization.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+        Matrix of shape ``(geometry.partition.size, vol_space.size)``
+        mapping the flattened volume to the flattened projection data.
+        Weightings of the spaces are not taken into account.
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr([-1, -1], [1, 1], (2, 2))
+    >>> geometry = odl.tomo.Parallel2dGeometry(
+    ...     odl.nonuniform_partition([0, np.pi / 2]),
+    ...     odl.uniform_partition(-1, 1, 2))
+    >>> matrix = joseph_system_matrix(geometry, space)
+    >>> matrix.shape
+    (4, 4)
+    >>> np.allclose(matrix.toarray(), [[1, 1, 0, 0],
+    ...                                [0, 0, 1, 1],
+    ...                                [1, 0, 1, 0],
+    ...                                [0, 1, 0, 1]])
+    True
+    """
+    if not isinstance(geometry, Geometry):
+        raise TypeError(
+            'geometry {!r} is not a Geometry instance'.format(geometry)
+        )
+    _check_vol_space(vol_space, geometry)
+    vol_space = vol_space.real_space
+
+    cache = geometry.implementation_cache.setdefault('numpy_joseph', {})
+    matrix = cache.get(vol_space, None)
+    if matrix is not None:
+        return matrix
+
+    shape = (geometry.partition.size, vol_space.size)
+    if cache_dir is None:
+        matrix = _assemble_matrix(geometry, vol_space)
+    else:
+        path = os.path.join(
+            cache_dir, 'joseph_' + _matrix_digest(geometry, vol_space))
+        if not os.path.isdir(path):
+            _save_matrix(_assemble_matrix(geometry, vol_space), path)
+        matrix = _load_matrix(path, shape)
+
+    cache[vol_space] = matrix
+    return matrix
+
+
+def _row_blocks(matrix, num_blocks):
+    """Split a CSR matrix into blocks of rows without copying the data."""
+    bounds = np.linspace(0, matrix.shape[0], num_blocks + 1)
+    bounds = np.round(bounds).astype(int)
+    blocks = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if hi == lo:
+            continue
+        start, stop = matrix.indptr[lo], matrix.indptr[hi]
+        block = scipy.sparse.csr_matrix(
+            (matrix.data[start:stop], matrix.indices[start:stop],
+             matrix.indptr[lo:hi + 1] - start),
+            shape=(hi - lo, matrix.shape[1]), copy=False)
+        blocks.append((lo, hi, block))
+    return blocks
+
+
+class NumpyJosephImpl:
+    """Pure NumPy implementation of `RayTransform` using Joseph's method."""
+
+    def __init__(self, geometry, vol_space, proj_space, num_threads=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        geometry : `Geometry`
+            Geometry defining the tomographic setup.
+        vol_space : `DiscretizedSpace`
+            Reconstruction space, the space of the images to be forward
+            projected. It must be uniformly discretized.
+        proj_space : `DiscretizedSpace`
+            Projection space, the space of the result.
+        num_threads : positive int, optional
+            Number of threads used for projection and back-projection.
+            Default: number of CPU cores
+        """
+        if not isinstance(geometry, Geometry):
+            raise TypeError(
+                '`geometry` must be a `Geometry` instance, got {!r}'
+                ''.format(geometry)
+            )
+        if not isinstance(proj_space, DiscretizedSpace):
+            raise TypeError(
+                '`proj_space` must be a `DiscretizedSpace` instance, got {!r}'
+                ''.format(proj_space)
+            )
+        _check_vol_space(vol_space, geometry)
+
+        self.geometry = geometry
+        self.num_threads = _num_threads(num_threads)
+        self._vol_space = vol_space
+        self._proj_space = proj_space
+
+    @property
+    def vol_space(self):
+        return self._vol_space
+
+    @property
+    def proj_space(self):
+        return self._proj_space
+
+    @_add_default_complex_impl
+    def call_forward(self, x, out=None, **kwargs):
+        kwargs.setdefault('num_threads', self.num_threads)
+        return joseph_forward_projector(
+            x, self.geometry, self.proj_space.real_space, out, **kwargs
+        )
+
+    @_add_default_complex_impl
+    def call_backward(self, x, out=None, **kwargs):
+        kwargs.setdefault('num_threads', self.num_threads)
+        return joseph_back_projector(
+            x, self.geometry, self.vol_space.real_space, out, **kwargs
+        )
+
+
+class NumpyJosephMatrixImpl:
+    """`RayTransform` implementation using a precomputed system matrix.
+
+    The Joseph projector is assembled once per geometry and reconstruction
+    space, see `joseph_system_matrix`. Evaluation consists of sparse
+    matrix-vector products over blocks of rows that are distributed across
+    threads. This is well suited for small and medium problems that are
+    evaluated many times with the same setup.
+    """
+
+    def __init__(self, geometry, vol_space, proj_space, num_threads=None,
+                 cache_dir=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        geometry : `Geometry`
+            Geometry defining the tomographic setup.
+        vol_space : `DiscretizedSpace`
+            Reconstruction space, the space of the images to be forward
+            projected. It must be uniformly discretized.
+        proj_space : `DiscretizedSpace`
+            Projection space, the space of the result.
+        num_threads : positive int, optional
+            Number of threads used for the matrix-vector products.
+            Default: number of CPU cores
+        cache_dir : str, optional
+            Directory in which the system matrix is stored, such that it
+            can be shared among processes. By default, the matrix is only
+            kept in memory.
+        """
+        if not isinstance(geometry, Geometry):
+            raise TypeError(
+                '`geometry` must be a `Geometry` instance, got {!r}'
+                ''.format(geometry)
+            )
+        if not isinstance(proj_space, DiscretizedSpace):
+            raise TypeError(
+                '`proj_space` must be a `DiscretizedSpace` instance, got {!r}'
+                ''.format(proj_space)
+            )
+        _check_vol_space(vol_space, geometry)
+
+        self.geometry = geometry
+        self.num_threads = _num_threads(num_threads)
+        self.cache_dir = cache_dir
+        self._vol_space = vol_space
+        self._proj_space = proj_space
+        self.__blocks = None
+
+    @property
+    def vol_space(self):
+        return self._vol_space
+
+    @property
+    def proj_space(self):
+        return self._proj_space
+
+    @property
+    def matrix(self):
+        """System matrix of the forward projection, created on demand."""
+        return joseph_system_matrix(self.geometry, self.vol_space,
+                                    self.cache_dir)
+
+    def _blocks(self):
+        """Return the row blocks of the system matrix."""
+        if self.__blocks is None:
+            self.__blocks = _row_blocks(self.matrix, self.num_threads)
+        return self.__blocks
+
+    @_add_default_complex_impl
+    def call_forward(self, x, out=None, **kwargs):
+        if out is None:
+            out = self.proj_space.real_space.element()
+
+        x_arr = x.asarray().ravel()
+        result = np.empty(self.proj_space.size,
+                          dtype=self.proj_space.real_dtype)
+
+        def matvec(lo, hi, block):
+            result[lo:hi] = block.dot(x_arr)
+
+        _run_threaded(matvec, self._blocks(), self.num_threads)
+        out[:] = result.reshape(self.proj_space.shape)
+        return out
+
+    @_add_default_complex_impl
+    def call_backward(self, x, out=None, **kwargs):
+        if out is None:
+            out = self.vol_space.real_space.element()
+
+        x_arr = x.asarray().ravel()
+
+        def rmatvec(lo, hi, block):
+            return block.T.dot(x_arr[lo:hi])
+
+        parts = _run_threaded(rmatvec, self._blocks(), self.num_threads)
+        result = parts[0]
+        for part in parts[1:]:
+            result += part
+
+        out[:] = result.reshape(self.vol_space.shape)
+
+        # Weight the adjoint by appropriate weights
+        scaling_factor = float(x.space.weighting.const)
+        scaling_factor /= float(self.vol_space.weighting.const)
+        out *= scaling_factor
+        return out
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+
+    run_doctests()
@@ -21,6 +21,8 @@ from odl.tomo.backends import (
     ASTRA_AVAILABLE, ASTRA_CUDA_AVAILABLE, SKIMAGE_AVAILABLE)
 from odl.tomo.backends.astra_cpu import AstraCpuImpl
 from odl.tomo.backends.astra_cuda import AstraCudaImpl
+from odl.tomo.backends.numpy_joseph import (
+    NumpyJosephImpl, NumpyJosephMatrixImpl)
 from odl.tomo.backends.skimage_radon import SkImageImpl
 from odl.tomo.geometry import Geometry
 from odl.util import is_string
@@ -30,6 +32,8 @@ from odl.util import is_string
 RAY_TRAFO_IMPLS = OrderedDict()
 if SKIMAGE_AVAILABLE:
     RAY_TRAFO_IMPLS['skimage'] = SkImageImpl
+RAY_TRAFO_IMPLS['numpy_matrix'] = NumpyJosephMatrixImpl
+RAY_TRAFO_IMPLS['numpy'] = NumpyJosephImpl
 if ASTRA_AVAILABLE:
     RAY_TRAFO_IMPLS['astra_cpu'] = AstraCpuImpl
 if ASTRA_CUDA_AVAILABLE:
@@ -55,11 +59,18 @@ class RayTransform(Operator):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
+        impl : str, optional
             Implementation back-end for the transform. Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
+            - ``'numpy'``: Joseph's method in pure NumPy, multithreaded,
+              2D or 3D with uniformly discretized reconstruction space.
+            - ``'numpy_matrix'``: same as ``'numpy'``, but using a sparse
+              system matrix that is computed once and cached in
+              `Geometry.implementation_cache`. To share the matrix between
+              processes via an on-disk cache, pass an instance of
+              `NumpyJosephMatrixImpl` with ``cache_dir`` as ``impl``.
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
 
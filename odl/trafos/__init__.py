@@ -11,11 +11,11 @@
 from __future__ import absolute_import
 
 from . import backends, util
-from .backends import PYFFTW_AVAILABLE, PYWT_AVAILABLE
+from .backends import PYFFTW_AVAILABLE, PYWT_AVAILABLE, SCIPY_FFT_AVAILABLE
 from .fourier import *
 from .wavelet import *
 
 __all__ = ()
 __all__ += fourier.__all__
 __all__ += wavelet.__all__
-__all__ += ("PYFFTW_AVAILABLE", "PYWT_AVAILABLE")
+__all__ += ("PYFFTW_AVAILABLE", "PYWT_AVAILABLE", "SCIPY_FFT_AVAILABLE")
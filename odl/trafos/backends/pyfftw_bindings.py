@@ -14,7 +14,10 @@ Fourier transforms.
 """
 
 from __future__ import print_function, division, absolute_import
+from collections import OrderedDict
 from multiprocessing import cpu_count
+import os
+import threading
 import numpy as np
 from packaging.version import parse as parse_version
 import warnings
@@ -33,7 +36,28 @@ else:
 from odl.util import (
     is_real_dtype, dtype_repr, complex_dtype, normalized_axes_tuple)
 
-__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE')
+__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE', 'clear_fftw_plan_cache',
+           'fftw_plan_cache_info', 'set_fftw_wisdom_file')
+
+
+# Process-wide cache of FFTW plans, see `pyfftw_call`. Only the planning
+# effort is stored per plan, the plan itself is re-created from the FFTW
+# wisdom, such that the cache does not keep any arrays alive.
+_PLAN_CACHE = OrderedDict()
+_PLAN_CACHE_LOCK = threading.Lock()
+_PLAN_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# Maximum number of cached plans, least recently used ones are dropped
+PLAN_CACHE_SIZE = 32
+
+# Ranks of planning efforts, a plan can replace one of lower rank
+_PLANNING_EFFORT_RANKS = {
+    'estimate': 0, 'measure': 1, 'patient': 2, 'exhaustive': 3}
+
+# File for automatic import and export of FFTW wisdom, see
+# `set_fftw_wisdom_file`
+_WISDOM_FILE = os.environ.get('ODL_FFTW_WISDOM_FILE') or None
+_WISDOM_LOADED = False
 
 
 def pyfftw_call(array_in, array_out, direction='forward', axes=None,
@@ -102,6 +126,15 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         it is ignored.
     export_wisdom : filename or file handle, optional
         File to append the accumulated FFTW wisdom to
+    use_plan_cache : bool, optional
+        If ``True``, take the plan from the process-wide plan cache if
+        ``fftw_plan`` is not given, or add a newly created plan to it.
+        Plans are cached per input and output shape, strides, data type
+        and alignment, and per ``axes``, ``halfcomplex``, ``direction``
+        and ``threads``. A cached plan is replaced if a higher
+        ``planning_effort`` is requested. Plans with planning effort
+        ``'estimate'`` are cheap to create and not cached.
+        Default: ``True``
 
     Returns
     -------
@@ -128,6 +161,14 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
       use ``'estimate'``.
     * If a plan is provided via the ``fftw_plan`` parameter, no copy
       is needed internally.
+    * If a wisdom file is configured with `set_fftw_wisdom_file`, its
+      wisdom is imported before the first transform, and the accumulated
+      wisdom is written to it whenever a new plan with a planning effort
+      other than ``'estimate'`` has been created.
+    * The plan cache only records which plans have been created. A
+      cached plan is re-created from the FFTW wisdom for each call,
+      which does not measure again. Hence, the cache does not keep
+      references to the arrays of previous calls.
     """
     import pickle
 
@@ -152,13 +193,14 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
     normalise_idft = kwargs.pop('normalise_idft', False)
     wimport = kwargs.pop('import_wisdom', '')
     wexport = kwargs.pop('export_wisdom', '')
+    use_plan_cache = kwargs.pop('use_plan_cache', True)
+
+    _load_wisdom_file()
 
     # Cast input to complex if necessary
-    array_in_copied = False
     if is_real_dtype(array_in.dtype) and not halfcomplex:
         # Need to cast array_in to complex dtype
         array_in = array_in.astype(complex_dtype(array_in.dtype))
-        array_in_copied = True
 
     # Do consistency checks on the arguments
     _pyfftw_check_args(array_in, array_out, axes, halfcomplex, direction)
@@ -176,34 +218,56 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         if wisdom:
             pyfftw.import_wisdom(wisdom)
 
-    # Copy input array if it hasn't been done yet and the planner is likely
-    # to destroy it. If we already have a plan, we don't have to worry.
+    # Planning may overwrite the input, also if it is our own complex copy,
+    # hence a scratch array is used for planning in that case. If we
+    # already have a plan, we don't have to worry.
     planner_destroys = _pyfftw_destroys_input(
         [planning_effort], direction, halfcomplex, array_in.ndim)
-    must_copy_array_in = fftw_plan_in is None and planner_destroys
-
-    if must_copy_array_in and not array_in_copied:
-        plan_arr_in = np.empty_like(array_in)
+    copy_for_planning = fftw_plan_in is None and planner_destroys
+    if copy_for_planning:
         flags = [_flag_odl_to_pyfftw(planning_effort), 'FFTW_DESTROY_INPUT']
     else:
-        plan_arr_in = array_in
         flags = [_flag_odl_to_pyfftw(planning_effort)]
 
-    if fftw_plan_in is None:
-        if threads is None:
-            if plan_arr_in.size <= 4096:  # Trade-off wrt threading overhead
-                threads = 1
-            else:
-                threads = cpu_count()
+    if threads is None:
+        if array_in.size <= 4096:  # Trade-off wrt threading overhead
+            threads = 1
+        else:
+            threads = cpu_count()
 
-        fftw_plan = pyfftw.FFTW(
+    def new_plan():
+        """Return a new plan for the given arguments."""
+        if copy_for_planning:
+            plan_arr_in = np.empty_like(array_in)
+        else:
+            plan_arr_in = array_in
+        return pyfftw.FFTW(
             plan_arr_in, array_out, direction=_flag_odl_to_pyfftw(direction),
             flags=flags, planning_timelimit=planning_timelimit,
             threads=threads, axes=axes)
-    else:
+
+    def wisdom_plan(cached_effort):
+        """Return a plan from the wisdom for ``cached_effort``."""
+        # The planner does not touch the arrays in this mode
+        return pyfftw.FFTW(
+            array_in, array_out, direction=_flag_odl_to_pyfftw(direction),
+            flags=([_flag_odl_to_pyfftw(cached_effort)] + flags[1:] +
+                   ['FFTW_WISDOM_ONLY']),
+            threads=threads, axes=axes)
+
+    if fftw_plan_in is not None:
         fftw_plan = fftw_plan_in
+    elif use_plan_cache and planning_effort != 'estimate':
+        key = _plan_cache_key(array_in, array_out, axes, halfcomplex,
+                              direction, threads, flags[1:])
+        fftw_plan = _cached_plan(key, planning_effort, wisdom_plan)
+        if fftw_plan is None:
+            fftw_plan = new_plan()
+            _cache_plan(key, planning_effort)
+    else:
+        fftw_plan = new_plan()
 
-    if not normalise_idft and direction=='forward':
+    if not normalise_idft and direction == 'forward':
         fftw_plan(array_in, array_out, normalise_idft=True)
     else:
         fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
@@ -218,6 +282,144 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
     return fftw_plan
 
 
+def set_fftw_wisdom_file(filename):
+    """Set the file for automatic import and export of FFTW wisdom.
+
+    FFTW wisdom stores the results of planning, such that new processes
+    can create optimal plans without measuring again. The wisdom from
+    ``filename`` is imported before the next transform, and the wisdom
+    accumulated in this process is written to it whenever `pyfftw_call`
+    creates a new plan with a planning effort other than ``'estimate'``.
+
+    The initial value is taken from the ``ODL_FFTW_WISDOM_FILE``
+    environment variable.
+
+    Parameters
+    ----------
+    filename : str or None
+        Path of the wisdom file. It does not need to exist. ``None``
+        disables the automatic import and export.
+    """
+    global _WISDOM_FILE, _WISDOM_LOADED
+    _WISDOM_FILE = None if filename is None else str(filename)
+    _WISDOM_LOADED = False
+
+
+def clear_fftw_plan_cache():
+    """Remove all plans from the process-wide plan cache of `pyfftw_call`.
+
+    The accumulated FFTW wisdom is kept, use ``pyfftw.forget_wisdom`` to
+    discard it as well.
+    """
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE.clear()
+        _PLAN_CACHE_STATS['hits'] = _PLAN_CACHE_STATS['misses'] = 0
+
+
+def fftw_plan_cache_info():
+    """Return statistics of the process-wide plan cache of `pyfftw_call`.
+
+    Returns
+    -------
+    info : dict
+        Dictionary with entries ``'hits'``, ``'misses'`` and ``'size'``
+        (the number of cached plans).
+    """
+    with _PLAN_CACHE_LOCK:
+        info = dict(_PLAN_CACHE_STATS)
+        info['size'] = len(_PLAN_CACHE)
+    return info
+
+
+def _plan_cache_key(array_in, array_out, axes, halfcomplex, direction,
+                    threads, extra_flags):
+    """Return the plan cache key for the given arguments."""
+    alignment = pyfftw.simd_alignment
+    return (array_in.shape, array_in.strides, array_in.dtype,
+            array_in.ctypes.data % alignment == 0,
+            array_out.shape, array_out.strides, array_out.dtype,
+            array_out.ctypes.data % alignment == 0,
+            tuple(axes), bool(halfcomplex), direction, threads,
+            tuple(extra_flags))
+
+
+def _cached_plan(key, planning_effort, wisdom_plan):
+    """Return a plan re-created from the cache, or ``None``.
+
+    ``None`` is also returned if the cached plan was created with lower
+    planning effort than ``planning_effort``, or if its wisdom has been
+    discarded in the meantime. The plan is created by calling
+    ``wisdom_plan`` with the cached planning effort.
+    """
+    with _PLAN_CACHE_LOCK:
+        cached_effort = _PLAN_CACHE.get(key)
+        if (cached_effort is None or
+                _PLANNING_EFFORT_RANKS.get(cached_effort, 0) <
+                _PLANNING_EFFORT_RANKS.get(planning_effort, 0)):
+            _PLAN_CACHE_STATS['misses'] += 1
+            return None
+        _PLAN_CACHE.move_to_end(key)
+
+    try:
+        fftw_plan = wisdom_plan(cached_effort)
+    except RuntimeError:
+        # No wisdom for this plan, e.g., after `pyfftw.forget_wisdom`
+        with _PLAN_CACHE_LOCK:
+            _PLAN_CACHE_STATS['misses'] += 1
+        return None
+
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE_STATS['hits'] += 1
+    return fftw_plan
+
+
+def _cache_plan(key, planning_effort):
+    """Record a new plan with ``planning_effort`` in the cache."""
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[key] = planning_effort
+        _PLAN_CACHE.move_to_end(key)
+        while len(_PLAN_CACHE) > PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+
+    _save_wisdom_file()
+
+
+def _load_wisdom_file():
+    """Import wisdom from the configured file once per file."""
+    global _WISDOM_LOADED
+    if _WISDOM_LOADED or _WISDOM_FILE is None:
+        return
+    import pickle
+
+    _WISDOM_LOADED = True
+    try:
+        with open(_WISDOM_FILE, 'rb') as wfile:
+            wisdom = pickle.load(wfile)
+    except (IOError, EOFError, pickle.UnpicklingError):
+        return
+    pyfftw.import_wisdom(wisdom)
+
+
+def _save_wisdom_file():
+    """Write the accumulated wisdom to the configured file, if any."""
+    if _WISDOM_FILE is None:
+        return
+    import pickle
+    import tempfile
+
+    # Write to a temporary file first such that concurrent processes
+    # never read a partially written file
+    dirname = os.path.dirname(os.path.abspath(_WISDOM_FILE))
+    fd, tmp_name = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as wfile:
+            pickle.dump(pyfftw.export_wisdom(), wfile)
+        os.replace(tmp_name, _WISDOM_FILE)
+    except BaseException:
+        os.remove(tmp_name)
+        raise
+
+
 def _flag_pyfftw_to_odl(flag):
     return flag.lstrip('FFTW_').lower()
 
@@ -0,0 +1,165 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Bindings to the ``scipy.fft`` back-end for Fourier transforms.
+
+The `scipy.fft <https://docs.scipy.org/doc/scipy/reference/fft.html>`_
+module (SciPy 1.4 and newer) implements multithreaded FFTs, with real
+input support and optional in-place destruction of the input.
+"""
+
+from __future__ import print_function, division, absolute_import
+from functools import partial
+from multiprocessing import cpu_count
+
+from odl.util import complex_dtype, is_real_dtype, normalized_axes_tuple
+
+
+def _scipy_fft_available():
+    """Return ``True`` if ``scipy.fft`` can be imported."""
+    # Avoid importing `scipy.fft` to improve `import odl` time
+    from importlib.util import find_spec
+    try:
+        return find_spec('scipy.fft') is not None
+    except ImportError:
+        return False
+
+
+SCIPY_FFT_AVAILABLE = _scipy_fft_available()
+
+__all__ = ('scipy_fft_call', 'SCIPY_FFT_AVAILABLE')
+
+
+def scipy_fft_call(array_in, array_out, direction='forward', axes=None,
+                   halfcomplex=False, **kwargs):
+    """Calculate the DFT with ``scipy.fft``.
+
+    The transforms are the same as in `pyfftw_call`, i.e., the forward
+    transform calculates the sum::
+
+        f_hat[k] = sum_j( f[j] * exp(-2*pi*1j * j*k/N) )
+
+    and in the backward transform, the sign of the exponential argument
+    is flipped. No normalization is applied unless ``normalise_idft=True``
+    is given.
+
+    Parameters
+    ----------
+    array_in : `numpy.ndarray`
+        Array to be transformed.
+    array_out : `numpy.ndarray`
+        Output array storing the transformed values, may be aliased
+        with ``array_in``.
+    direction : {'forward', 'backward'}, optional
+        Direction of the transform.
+    axes : int or sequence of ints, optional
+        Dimensions along which to take the transform. ``None`` means
+        using all axes and is equivalent to ``np.arange(ndim)``.
+    halfcomplex : bool, optional
+        If ``True``, calculate only the negative frequency part along the
+        last axis. If ``False``, calculate the full complex FFT.
+        This option can only be used with real input data in the forward
+        and real output data in the backward direction.
+
+    Other Parameters
+    ----------------
+    workers : int, optional
+        Number of threads to use. Negative values count from the number
+        of CPUs, i.e., ``-1`` means all CPUs. ``threads`` is accepted as
+        an alias.
+        Default: Number of CPUs if the number of data points is larger
+        than 4096, else 1.
+    overwrite_x : bool, optional
+        If ``True``, the contents of ``array_in`` may be destroyed,
+        which can save a copy in the FFT library.
+        Default: ``False``
+    normalise_idft : bool, optional
+        If ``True``, the result of the backward transform is divided by
+        ``N``, the total number of points in ``array_in[axes]``. This
+        ensures that the IDFT is the true inverse of the forward DFT.
+        Default: ``False``
+
+    Returns
+    -------
+    array_out : `numpy.ndarray`
+        The transformed array, a reference to the input parameter.
+
+    Examples
+    --------
+    >>> x = np.array([1.0, 2.0, 0.0, -1.0])
+    >>> out = np.empty(3, dtype=complex)
+    >>> scipy_fft_call(x, out, halfcomplex=True, workers=1)
+    array([ 2.+0.j,  1.-3.j,  0.+0.j])
+    >>> y = np.empty(4)
+    >>> scipy_fft_call(out, y, direction='backward', halfcomplex=True,
+    ...                normalise_idft=True)
+    array([ 1.,  2.,  0., -1.])
+    """
+    # Lazy import to improve `import odl` time
+    import scipy.fft
+
+    if axes is None:
+        axes = tuple(range(array_in.ndim))
+    axes = normalized_axes_tuple(axes, array_in.ndim)
+
+    direction = str(direction).lower()
+    if direction not in ('forward', 'backward'):
+        raise ValueError('`direction` {!r} not understood'.format(direction))
+
+    workers = kwargs.pop('workers', kwargs.pop('threads', None))
+    overwrite_x = bool(kwargs.pop('overwrite_x', False))
+    normalise_idft = bool(kwargs.pop('normalise_idft', False))
+    if workers is None:
+        # Trade-off wrt threading overhead, as in `pyfftw_call`
+        workers = 1 if array_in.size <= 4096 else cpu_count()
+
+    if halfcomplex:
+        if direction == 'forward' and not is_real_dtype(array_in.dtype):
+            raise ValueError('expected real input for half-complex forward '
+                             'transform, got dtype {}'.format(array_in.dtype))
+        if direction == 'backward' and not is_real_dtype(array_out.dtype):
+            raise ValueError('expected real output for half-complex '
+                             'backward transform, got dtype {}'
+                             ''.format(array_out.dtype))
+    elif not is_real_dtype(array_out.dtype) and is_real_dtype(array_in.dtype):
+        # Full complex transform of real input, cast once to avoid a
+        # second copy in the FFT library
+        array_in = array_in.astype(complex_dtype(array_in.dtype))
+        overwrite_x = True
+
+    # With norm='forward', the backward transform is not normalized, which
+    # is the convention of this function unless `normalise_idft` is set.
+    if direction == 'forward':
+        norm = 'backward'
+    else:
+        norm = 'backward' if normalise_idft else 'forward'
+
+    if halfcomplex and direction == 'forward':
+        fft_func = scipy.fft.rfftn
+    elif halfcomplex:
+        # Need to specify the shape since it cannot be inferred from input
+        fft_func = partial(scipy.fft.irfftn,
+                           s=[array_out.shape[i] for i in axes])
+    elif direction == 'forward':
+        fft_func = scipy.fft.fftn
+    else:
+        fft_func = scipy.fft.ifftn
+
+    result = fft_func(array_in, axes=axes, norm=norm, workers=workers,
+                      overwrite_x=overwrite_x)
+    if is_real_dtype(array_out.dtype) and not is_real_dtype(result.dtype):
+        # Full complex transform with real output, discard imaginary part
+        result = result.real
+    if result is not array_out:
+        array_out[:] = result
+    return array_out
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -19,6 +19,8 @@ from odl.operator import Operator
 from odl.set import ComplexNumbers, RealNumbers
 from odl.trafos.backends.pyfftw_bindings import (
     PYFFTW_AVAILABLE, _flag_pyfftw_to_odl, pyfftw_call)
+from odl.trafos.backends.scipy_fft_bindings import (
+    SCIPY_FFT_AVAILABLE, scipy_fft_call)
 from odl.trafos.util import (
     dft_postprocess_data, dft_preprocess_data, reciprocal_grid,
     reciprocal_space)
@@ -32,6 +34,9 @@ __all__ = ('DiscreteFourierTransform', 'DiscreteFourierTransformInverse',
 
 _SUPPORTED_FOURIER_IMPLS = ('numpy',)
 _DEFAULT_FOURIER_IMPL = 'numpy'
+if SCIPY_FFT_AVAILABLE:
+    _SUPPORTED_FOURIER_IMPLS += ('scipy',)
+    _DEFAULT_FOURIER_IMPL = 'scipy'
 if PYFFTW_AVAILABLE:
     _SUPPORTED_FOURIER_IMPLS += ('pyfftw',)
     _DEFAULT_FOURIER_IMPL = 'pyfftw'
@@ -76,9 +81,10 @@ class DiscreteFourierTransformBase(Operator):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw', ``None``}, optional
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
             Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
         """
         if not isinstance(domain, DiscretizedSpace):
@@ -173,6 +179,8 @@ class DiscreteFourierTransformBase(Operator):
         # TODO: Implement zero padding
         if self.impl == 'numpy':
             out[:] = self._call_numpy(x.asarray())
+        elif self.impl == 'scipy':
+            out[:] = self._call_scipy(x.asarray(), out.asarray(), **kwargs)
         else:
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
 
@@ -234,6 +242,31 @@ class DiscreteFourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` using scipy.fft.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Input array to be transformed
+        out : `numpy.ndarray`
+            Output array storing the result
+        workers : int, optional
+            Number of threads to use. See `scipy_fft_call` for the
+            default. ``threads`` is accepted as an alias.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform. The returned object is a reference
+            to the input parameter ``out``.
+        """
+        direction = 'forward' if self.sign == '-' else 'backward'
+        return scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex, normalise_idft=False,
+            workers=kwargs.get('workers', kwargs.get('threads')))
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
 
@@ -286,7 +319,7 @@ class DiscreteFourierTransformBase(Operator):
         effort = flags[0] if flags else 'measure'
 
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=False)
@@ -299,6 +332,10 @@ class DiscreteFourierTransformBase(Operator):
         If the implementation of this operator is not ``'pyfftw'``, this
         method should not be called.
 
+        Plans created in transforms are cached process-wide by
+        `pyfftw_call` anyway, so this method is only needed to give this
+        operator its own plan, e.g., with a specific planning effort.
+
         Parameters
         ----------
         planning_effort : str, optional
@@ -413,9 +450,10 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The ``'pyfftw'`` backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
+            Backend for the FFT implementation. The 'pyfftw' backend
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -467,6 +505,22 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
                 return (np.prod(np.take(self.domain.shape, self.axes)) *
                         np.fft.ifftn(x, axes=self.axes))
 
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``.
+
+        The transform is computed with Numpy over the `axes` of all stacked
+        inputs in a single FFT call, independently of `impl`.
+        """
+        axes = [a + 1 for a in self.axes]
+        if self.halfcomplex:
+            out[:] = np.fft.rfftn(x, axes=axes)
+        elif self.sign == '-':
+            out[:] = np.fft.fftn(x, axes=axes)
+        else:
+            # Need to undo Numpy IFFT scaling
+            out[:] = np.fft.ifftn(x, axes=axes)
+            out *= np.prod(np.take(self.domain.shape, self.axes))
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
 
@@ -493,7 +547,7 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         effort = flags[0] if flags else 'measure'
 
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=False)
@@ -506,7 +560,7 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         sign = '+' if self.sign == '-' else '-'
         return DiscreteFourierTransformInverse(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl)
 
 
 class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
@@ -566,9 +620,10 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             ``floor(N[i]/2) + 1`` in this axis ``i``.
             Otherwise, domain and range have the same shape. If
             ``range`` is a complex space, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
             Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -623,6 +678,25 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
                 return (np.fft.fftn(x, axes=self.axes) /
                         np.prod(np.take(self.domain.shape, self.axes)))
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` using scipy.fft.
+
+        See Also
+        --------
+        DiscreteFourierTransformBase._call_scipy
+        """
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex, normalise_idft=True,
+            workers=kwargs.get('workers', kwargs.get('threads')))
+
+        # Normalization is only done for 'backward'
+        if self.sign == '-':
+            out /= np.prod(np.take(self.domain.shape, self.axes))
+
+        return out
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
 
@@ -671,11 +745,23 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             pass
         effort = flags[0] if flags else 'measure'
 
+        if self.halfcomplex and len(self.axes) > 1:
+            # FFTW destroys the input of multi-dimensional HC2R transforms
+            x = x.copy()
+
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
-            x, out, direction=direction, axes=self.axes,
+        if is_real_dtype(out.dtype) and not self.halfcomplex:
+            # C2R: FFTW needs a complex output array, the imaginary part
+            # is discarded afterwards
+            fft_arr = np.empty(out.shape, dtype=complex_dtype(out.dtype))
+        else:
+            fft_arr = out
+        pyfftw_call(
+            x, fft_arr, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=True)
+        if fft_arr is not out:
+            out[:] = fft_arr.real
 
         # Need to normalize for 'forward', pyfftw before version 0.13
         # does not offer a way to do this.
@@ -690,7 +776,7 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         sign = '-' if self.sign == '+' else '+'
         return DiscreteFourierTransform(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl)
 
 
 class FourierTransformBase(Operator):
@@ -739,9 +825,10 @@ class FourierTransformBase(Operator):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
             Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -907,6 +994,9 @@ class FourierTransformBase(Operator):
         # TODO: Implement zero padding
         if self.impl == 'numpy':
             out[:] = self._call_numpy(x.asarray())
+        elif self.impl == 'scipy':
+            # 0-overhead assignment if asarray() does not copy
+            out[:] = self._call_scipy(x.asarray(), out.asarray(), **kwargs)
         else:
             # 0-overhead assignment if asarray() does not copy
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
@@ -926,6 +1016,27 @@ class FourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` for scipy back-end.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Array representing the function to be transformed
+        out : `numpy.ndarray`
+            Array to which the output is written
+        workers : int, optional
+            Number of threads to use. See `scipy_fft_call` for the
+            default. ``threads`` is accepted as an alias.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform. The returned object is a reference
+            to the input parameter ``out``.
+        """
+        raise NotImplementedError('abstract method')
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` for pyfftw back-end.
 
@@ -1054,6 +1165,10 @@ class FourierTransformBase(Operator):
         If the implementation of this operator is not 'pyfftw', this
         method should not be called.
 
+        Plans created in transforms are cached process-wide by
+        `pyfftw_call` anyway, so this method is only needed to give this
+        operator its own plan, e.g., with a specific planning effort.
+
         Parameters
         ----------
         planning_effort : str, optional
@@ -1192,9 +1307,10 @@ class FourierTransform(FourierTransformBase):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
             Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1256,6 +1372,7 @@ class FourierTransform(FourierTransformBase):
         """
         super(FourierTransform, self).__init__(
             inverse=False, domain=domain, range=range, impl=impl, **kwargs)
+        self.__batch_factors = None
 
     def _preprocess(self, x, out=None):
         """Return the pre-processed version of ``x``.
@@ -1338,6 +1455,70 @@ class FourierTransform(FourierTransformBase):
         self._postprocess(out, out=out)
         return out
 
+    def _batch_factors(self):
+        """Return the cached pre- and post-processing factor arrays.
+
+        Both processing steps are point-wise multiplications, hence they
+        can be represented by the result of applying them to arrays of
+        ones and broadcast against a batch of inputs.
+        """
+        if self.__batch_factors is None:
+            pre = dft_preprocess_data(
+                np.ones(self.domain.shape, dtype=self.domain.dtype),
+                shift=self.shifts, axes=self.axes, sign=self.sign)
+            post = np.ones(self.range.shape, dtype=self.range.dtype)
+            dft_postprocess_data(
+                post, real_grid=self.domain.grid, recip_grid=self.range.grid,
+                shift=self.shifts, axes=self.axes, sign=self.sign,
+                interp='nearest', op='multiply', out=post)
+            self.__batch_factors = (pre, post)
+        return self.__batch_factors
+
+    def _batch_call(self, x, out, **kwargs):
+        """Implement ``self.batch_call(x, out)``.
+
+        The transform is computed with Numpy over the `axes` of all stacked
+        inputs in a single FFT call, independently of `impl`. Pre- and
+        post-processing are applied by broadcasting cached factors.
+        """
+        pre, post = self._batch_factors()
+        preproc = x * pre
+        axes = [a + 1 for a in self.axes]
+        if self.halfcomplex:
+            res = np.fft.rfftn(preproc, axes=axes)
+        elif self.sign == '-':
+            res = np.fft.fftn(preproc, axes=axes)
+        else:
+            res = np.fft.ifftn(preproc, axes=axes)
+            # Undo the Numpy IFFT normalization
+            res *= np.prod(np.take(self.domain.shape, self.axes))
+        np.multiply(res, post, out=out)
+
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` for scipy back-end.
+
+        See Also
+        --------
+        FourierTransformBase._call_scipy
+        """
+        # Pre-processing before calculating the sums, in-place for C2C and R2C
+        if self.halfcomplex:
+            preproc = self._preprocess(x)
+        else:
+            # out is preproc in this case
+            preproc = self._preprocess(x, out=out)
+
+        # The pre-processed array is a temporary or `out`, hence the FFT
+        # may overwrite it
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            preproc, out, direction=direction, halfcomplex=self.halfcomplex,
+            axes=self.axes, normalise_idft=False, overwrite_x=True,
+            workers=kwargs.get('workers', kwargs.get('threads')))
+
+        # Post-processing accounting for shift, scaling and interpolation
+        return self._postprocess(out, out=out)
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` for pyfftw back-end.
 
@@ -1378,11 +1559,11 @@ class FourierTransform(FourierTransformBase):
             preproc = self._preprocess(x, out=out)
             assert is_complex_floating_dtype(preproc.dtype)
 
-        # The actual call to the FFT library. We store the plan for re-use.
+        # The actual call to the FFT library, plans are cached for re-use.
         # The FFT is calculated in-place, except if the range is real and
         # we don't use halfcomplex.
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        pyfftw_call(
             preproc, out, direction=direction, halfcomplex=self.halfcomplex,
             axes=self.axes, normalise_idft=False, **kwargs)
 
@@ -1432,9 +1613,10 @@ class FourierTransformInverse(FourierTransformBase):
             domain is determined from ``range`` and the other parameters.
             The exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
             Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+            is fastest but requires the ``pyfftw`` package. The 'scipy'
+            backend uses multiple threads from ``scipy.fft``.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1583,6 +1765,49 @@ class FourierTransformInverse(FourierTransformBase):
         else:
             return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` for scipy back-end.
+
+        See Also
+        --------
+        FourierTransformBase._call_scipy
+        """
+        # Pre-processing in IFT = post-processing in FT, in-place for C2C
+        if self.range.field == ComplexNumbers():
+            # preproc is out in this case
+            preproc = self._preprocess(x, out=out)
+        else:
+            preproc = self._preprocess(x)
+
+        # The pre-processed array is a temporary or `out`, hence the FFT
+        # may overwrite it
+        direction = 'forward' if self.sign == '-' else 'backward'
+        if self.range.field == RealNumbers() and not self.halfcomplex:
+            # C2R: the FFT is C2C, and the imaginary part is discarded in
+            # the post-processing
+            fft_arr = preproc
+        else:
+            fft_arr = out
+        scipy_fft_call(
+            preproc, fft_arr, direction=direction,
+            halfcomplex=self.halfcomplex, axes=self.axes,
+            normalise_idft=True, overwrite_x=True,
+            workers=kwargs.get('workers', kwargs.get('threads')))
+
+        # Normalization is only done for 'backward'
+        if self.sign == '-':
+            fft_arr /= np.prod(np.take(self.domain.shape, self.axes))
+
+        # Post-processing in IFT = pre-processing in FT. For C2R, this is
+        # done in-place in the complex array, and the real part is copied
+        # to `out` afterwards, as in `_call_numpy`.
+        if fft_arr is out:
+            self._postprocess(fft_arr, out=out)
+        else:
+            self._postprocess(fft_arr, out=fft_arr)
+            out[:] = fft_arr.real
+        return out
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` for pyfftw back-end.
 
@@ -1623,19 +1848,19 @@ class FourierTransformInverse(FourierTransformBase):
         else:
             preproc = self._preprocess(x)
 
-        # The actual call to the FFT library. We store the plan for re-use.
+        # The actual call to the FFT library, plans are cached for re-use.
         direction = 'forward' if self.sign == '-' else 'backward'
         if self.range.field == RealNumbers() and not self.halfcomplex:
             # Need to use a complex array as out if we do C2R since the
             # FFT has to be C2C
-            self._fftw_plan = pyfftw_call(
+            pyfftw_call(
                 preproc, preproc, direction=direction,
                 halfcomplex=self.halfcomplex, axes=self.axes,
                 normalise_idft=True, **kwargs)
             fft_arr = preproc
         else:
             # Only here we can use out directly
-            self._fftw_plan = pyfftw_call(
+            pyfftw_call(
                 preproc, out, direction=direction,
                 halfcomplex=self.halfcomplex, axes=self.axes,
                 normalise_idft=True, **kwargs)
@@ -10,20 +10,24 @@
 
 from __future__ import absolute_import
 
+from .buffer_pool import *
 from .graphics import *
 from .normalize import *
 from .npy_compat import *
 from .numerics import *
+from .parallel import *
 from .testutils import *
 from .utility import *
 from .vectorization import *
 from .sparse import *
 
 __all__ = ()
+__all__ += buffer_pool.__all__
 __all__ += graphics.__all__
 __all__ += normalize.__all__
 __all__ += npy_compat.__all__
 __all__ += numerics.__all__
+__all__ += parallel.__all__
 __all__ += testutils.__all__
 __all__ += utility.__all__
 __all__ += vectorization.__all__
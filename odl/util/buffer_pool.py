@@ -0,0 +1,253 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Pool of reusable space elements for temporaries.
+
+Solvers and operator expressions need temporary space elements in each
+call. For large spaces, allocating them anew dominates the runtime of
+repeated calls. A `BufferPool` keeps returned elements per space and hands
+them out again on request.
+
+Code that needs a temporary uses `acquire_element` and `release_element`.
+They draw from the innermost pool activated with a ``with pool:`` block in
+the current thread, or fall back to `LinearSpace.element` if no pool is
+active.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+__all__ = (
+    'BufferPool',
+    'active_buffer_pool',
+    'acquire_element',
+    'release_element',
+)
+
+
+_ACTIVE_POOLS = threading.local()
+
+
+def _active_pool_stack():
+    """Return the stack of active pools of the current thread."""
+    try:
+        return _ACTIVE_POOLS.stack
+    except AttributeError:
+        _ACTIVE_POOLS.stack = []
+        return _ACTIVE_POOLS.stack
+
+
+def _space_nbytes(space):
+    """Return the number of bytes of an element of ``space``, or 0."""
+    if hasattr(space, 'spaces'):
+        return sum(_space_nbytes(spc) for spc in space.spaces)
+    try:
+        return int(np.prod(space.shape)) * np.dtype(space.dtype).itemsize
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+class BufferPool(object):
+
+    """Pool of reusable space elements keyed by space.
+
+    Elements are taken from the pool with `acquire` and handed back with
+    `release`. Returned elements are reused for later requests from the
+    same space, hence their contents are arbitrary.
+
+    Using the pool in a ``with`` block makes it the active pool of the
+    current thread, which is used by `acquire_element` and
+    `release_element`, e.g., in solvers and operator expressions.
+
+    Examples
+    --------
+    >>> space = odl.rn(3)
+    >>> pool = odl.util.BufferPool()
+    >>> with pool.borrow(space) as tmp:
+    ...     tmp.assign(space.one())
+    >>> with pool.borrow(space) as tmp:  # reuses the buffer
+    ...     pass
+    >>> pool.stats['hits'], pool.stats['misses'], pool.stats['peak_bytes']
+    (1, 1, 24)
+    """
+
+    def __init__(self, max_bytes=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum number of bytes kept in returned elements. Elements
+            released beyond this limit are dropped. ``None`` means no limit.
+        """
+        if max_bytes is not None:
+            max_bytes = int(max_bytes)
+            if max_bytes < 0:
+                raise ValueError('`max_bytes` must be nonnegative, got {}'
+                                 ''.format(max_bytes))
+        self.__max_bytes = max_bytes
+        self.__free = {}
+        self.__free_bytes = 0
+        self.__lock = threading.Lock()
+        self.__current_bytes = 0
+        self.reset_stats()
+
+    @property
+    def max_bytes(self):
+        """Maximum number of bytes kept in returned elements."""
+        return self.__max_bytes
+
+    @property
+    def stats(self):
+        """Usage statistics of this pool as a dictionary.
+
+        The entries are
+
+        - ``'hits'``: number of requests served by a returned element,
+        - ``'misses'``: number of requests that allocated a new element,
+        - ``'current_bytes'``: bytes allocated by the pool and not yet
+          dropped,
+        - ``'peak_bytes'``: maximum of ``'current_bytes'``,
+        - ``'free_bytes'``: bytes held in returned elements.
+        """
+        with self.__lock:
+            return {'hits': self.__hits,
+                    'misses': self.__misses,
+                    'current_bytes': self.__current_bytes,
+                    'peak_bytes': self.__peak_bytes,
+                    'free_bytes': self.__free_bytes}
+
+    def reset_stats(self):
+        """Reset hit and miss counters, and peak bytes to current bytes."""
+        self.__hits = 0
+        self.__misses = 0
+        self.__peak_bytes = self.__current_bytes
+
+    def acquire(self, space):
+        """Return an element of ``space``, reusing a returned one if possible.
+
+        Parameters
+        ----------
+        space : `LinearSpace`
+            Space of the requested element.
+
+        Returns
+        -------
+        element : ``space`` element
+            Element with arbitrary contents.
+        """
+        with self.__lock:
+            free = self.__free.get(space)
+            if free:
+                self.__hits += 1
+                elem = free.pop()
+                self.__free_bytes -= _space_nbytes(space)
+                return elem
+            self.__misses += 1
+            self.__add_bytes(_space_nbytes(space))
+
+        return space.element()
+
+    def release(self, element):
+        """Return ``element`` to the pool for later reuse.
+
+        The caller must not use ``element`` afterwards.
+        """
+        space = element.space
+        nbytes = _space_nbytes(space)
+        with self.__lock:
+            if (self.max_bytes is not None and
+                    self.__free_bytes + nbytes > self.max_bytes):
+                # Drop the element
+                self.__current_bytes -= nbytes
+                return
+            self.__free.setdefault(space, []).append(element)
+            self.__free_bytes += nbytes
+
+    @contextmanager
+    def borrow(self, space):
+        """Context manager yielding a temporary element of ``space``.
+
+        The element is released when the context is left.
+        """
+        elem = self.acquire(space)
+        try:
+            yield elem
+        finally:
+            self.release(elem)
+
+    def clear(self):
+        """Drop all returned elements."""
+        with self.__lock:
+            self.__current_bytes -= self.__free_bytes
+            self.__free.clear()
+            self.__free_bytes = 0
+
+    def __add_bytes(self, nbytes):
+        """Account for ``nbytes`` newly owned bytes."""
+        self.__current_bytes += nbytes
+        self.__peak_bytes = max(self.__peak_bytes, self.__current_bytes)
+
+    def __enter__(self):
+        """Make this pool the active pool of the current thread."""
+        _active_pool_stack().append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Deactivate this pool."""
+        _active_pool_stack().pop()
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        if self.max_bytes is None:
+            return '{}()'.format(self.__class__.__name__)
+        else:
+            return '{}(max_bytes={})'.format(self.__class__.__name__,
+                                             self.max_bytes)
+
+
+def active_buffer_pool():
+    """Return the active `BufferPool` of the current thread, or ``None``."""
+    stack = _active_pool_stack()
+    return stack[-1] if stack else None
+
+
+def acquire_element(space):
+    """Return a temporary element of ``space``.
+
+    The element is taken from the active `BufferPool` if there is one,
+    otherwise it is created with ``space.element()``. Its contents are
+    arbitrary.
+    """
+    pool = active_buffer_pool()
+    if pool is None:
+        return space.element()
+    else:
+        return pool.acquire(space)
+
+
+def release_element(*elements):
+    """Return temporary elements to the active `BufferPool`, if any.
+
+    Without active pool, this function does nothing.
+    """
+    pool = active_buffer_pool()
+    if pool is not None:
+        for elem in elements:
+            # Skip, e.g., scalars from field "elements"
+            if hasattr(elem, 'space'):
+                pool.release(elem)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -0,0 +1,106 @@
+# Copyright 2014-2020 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Evaluation of independent blocks in a shared thread pool.
+
+Product spaces and operators on them consist of independent blocks whose
+evaluation typically releases the GIL in NumPy, BLAS or FFT libraries.
+`parallel_map` evaluates such blocks concurrently and returns the results
+in block order, such that reductions over them can be carried out in a
+fixed order, independently of the number of threads.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from odl.util.buffer_pool import active_buffer_pool
+
+__all__ = ('parallel_map',)
+
+
+_BLOCK_EXECUTORS = {}
+_BLOCK_EXECUTORS_LOCK = threading.Lock()
+_WORKER_STATE = threading.local()
+
+
+def _block_executor(num_threads):
+    """Return the shared thread pool with ``num_threads`` workers."""
+    with _BLOCK_EXECUTORS_LOCK:
+        executor = _BLOCK_EXECUTORS.get(num_threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=num_threads)
+            _BLOCK_EXECUTORS[num_threads] = executor
+        return executor
+
+
+def _in_worker():
+    """Return ``True`` if called from a `parallel_map` worker thread."""
+    return getattr(_WORKER_STATE, 'active', False)
+
+
+def parallel_map(func, iterable, num_threads=None):
+    """Return ``[func(item) for item in iterable]``, evaluated in threads.
+
+    The results are returned in the order of ``iterable``, independently
+    of the number of threads and the order of completion.
+
+    Parameters
+    ----------
+    func : callable
+        Function to be called with each item of ``iterable``.
+    iterable : iterable
+        Items to map over.
+    num_threads : positive int, optional
+        Number of worker threads. For ``None`` or 1, the items are
+        processed serially in the calling thread.
+
+    Returns
+    -------
+    results : list
+        Results of ``func`` for each item.
+
+    Notes
+    -----
+    - Calls from inside a worker, e.g., for nested product spaces, are
+      evaluated serially to avoid exhausting the pool.
+    - The active `BufferPool` of the calling thread is also active in
+      the workers.
+    - Exceptions raised by ``func`` are re-raised in the calling thread.
+
+    Examples
+    --------
+    >>> parallel_map(lambda x: x ** 2, range(5), num_threads=2)
+    [0, 1, 4, 9, 16]
+    """
+    items = list(iterable)
+    if num_threads is None or num_threads <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    if _in_worker():
+        return [func(item) for item in items]
+
+    num_threads = int(num_threads)
+    pool = active_buffer_pool()
+
+    def run(item):
+        _WORKER_STATE.active = True
+        try:
+            if pool is None:
+                return func(item)
+            with pool:
+                return func(item)
+        finally:
+            _WORKER_STATE.active = False
+
+    return list(_block_executor(num_threads).map(run, items))
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()